@@ -10,10 +10,15 @@ import asyncio
 import logging
 
 from core.logger import LoggerConfiguration
+from embedding.bootstrap.configuration.configuration import (
+    EmbeddingConfiguration,
+)
 from embedding.bootstrap.initializer import EmbeddingInitializer
 from embedding.orchestrators.registry import EmbeddingOrchestratorRegistry
 from embedding.vector_stores.core.exceptions import CollectionExistsException
 from embedding.vector_stores.registry import VectorStoreValidatorRegistry
+from extraction.bootstrap.configuration.configuration import SyncMode
+from extraction.datasources.core.checkpoint import CheckpointStore
 
 
 async def run(
@@ -35,11 +40,22 @@ async def run(
     try:
         validator.validate()
     except CollectionExistsException as e:
-        logger.info(
-            f"Collection '{e.collection_name}' already exists. "
-            "Skipping embedding process."
-        )
-        return
+        if configuration.extraction.sync_mode == SyncMode.INCREMENTAL:
+            logger.info(
+                f"Collection '{e.collection_name}' already exists. "
+                "Updating it incrementally."
+            )
+        elif _has_checkpoint(configuration):
+            logger.info(
+                f"Collection '{e.collection_name}' already exists. "
+                "Resuming interrupted embedding process."
+            )
+        else:
+            logger.info(
+                f"Collection '{e.collection_name}' already exists. "
+                "Skipping embedding process."
+            )
+            return
 
     logger.info("Starting embedding process.")
     orchestrator = EmbeddingOrchestratorRegistry.get(
@@ -50,5 +66,24 @@ async def run(
     logger.info("Embedding process finished.")
 
 
+def _has_checkpoint(configuration: EmbeddingConfiguration) -> bool:
+    """
+    Check whether an interrupted full refresh run left a checkpoint behind.
+
+    Args:
+        configuration: Embedding configuration
+
+    Returns:
+        bool: True if the run can be resumed
+    """
+    checkpoint_store = CheckpointStore.from_configuration(configuration)
+    if checkpoint_store is None:
+        return False
+    try:
+        return checkpoint_store.has_checkpoints()
+    finally:
+        checkpoint_store.close()
+
+
 if __name__ == "__main__":
     asyncio.run(run())
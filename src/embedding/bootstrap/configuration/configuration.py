@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import Field, ValidationInfo, field_validator
 
@@ -21,9 +21,12 @@ class EmbeddingOrchestratorName(str, Enum):
 
     Currently supports:
     - BASIC: The default basic orchestration strategy
+    - PIPELINE: Extraction, splitting and embedding run as concurrent stages
+      connected by bounded queues
     """
 
     BASIC = "basic"
+    PIPELINE = "pipeline"
 
 
 class EmbedderName(str, Enum):
@@ -32,9 +35,12 @@ class EmbedderName(str, Enum):
 
     Currently supports:
     - BASIC: The default basic embedder
+    - PIPELINED: Embedder writing to the vector store while embedding the
+      next batches
     """
 
     BASIC = "basic"
+    PIPELINED = "pipelined"
 
 
 class _EmbeddingConfiguration(BaseConfiguration):
@@ -60,6 +66,45 @@ class _EmbeddingConfiguration(BaseConfiguration):
         EmbedderName.BASIC,
         description="The name of the embedder to use for embedding.",
     )
+    embedder_write_workers: int = Field(
+        1,
+        ge=1,
+        description="Number of node batches written to the vector store concurrently by the pipelined embedder.",
+    )
+    embedder_max_pending_writes: int = Field(
+        2,
+        ge=1,
+        description="Maximum number of embedded node batches waiting for or being written to the vector store by the pipelined embedder. Embedding blocks once the limit is reached.",
+    )
+    embedding_cache_path: Optional[str] = Field(
+        None,
+        description="Path of the SQLite database caching embeddings by embedding model and embedded text, so unchanged nodes are not embedded again. Caching is disabled if None.",
+    )
+    embedding_cache_max_size_in_mb: Optional[float] = Field(
+        1024.0,
+        gt=0.0,
+        description="Maximum size of the cached embeddings in megabytes, least recently used embeddings are evicted beyond it. The size is unlimited if None.",
+    )
+    pipeline_queue_size: int = Field(
+        16,
+        ge=1,
+        description="Maximum number of documents, node lists or node batches buffered between two stages of the pipeline orchestrator.",
+    )
+    pipeline_split_workers: int = Field(
+        1,
+        ge=1,
+        description="Number of documents split concurrently by the pipeline orchestrator.",
+    )
+    pipeline_embed_workers: int = Field(
+        1,
+        ge=1,
+        description="Number of node batches embedded and saved concurrently by the pipeline orchestrator.",
+    )
+    pipeline_stats_interval: Optional[float] = Field(
+        30.0,
+        gt=0.0,
+        description="Interval in seconds at which the pipeline orchestrator logs its queue depths. Nothing is logged if None.",
+    )
 
     @field_validator("vector_store")
     @classmethod
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Type
+from typing import Any, Optional, Type
 
 from pydantic import Field, ValidationInfo, field_validator
 
@@ -39,6 +39,15 @@ class EmbeddingModelConfiguration(BaseConfigurationWithSecrets):
         description="The name of the tokenizer used by the embedding model.",
     )
     batch_size: int = Field(64, description="The batch size for embedding.")
+    max_request_size_in_tokens: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum number of tokens of the texts embedded in one request. Nodes are packed into batches by the token count of their embed texts up to this limit. Batches are limited by `batch_size` only if None.",
+    )
+    batch_sort_by_length: bool = Field(
+        False,
+        description="Whether nodes are sorted by token count before being packed into batches, so nodes of similar length share a batch.",
+    )
 
     splitter: Any = Field(
         None, description="The splitter configuration for the embedding model."
@@ -15,6 +15,10 @@ class BaseEmbedder(ABC):
 
     This class provides core functionality for embedding text nodes,
     with derived classes implementing specific embedding strategies.
+
+    Attributes:
+        skip_existing_nodes: Whether nodes already stored in the vector store
+            are skipped, set when an interrupted run is resumed
     """
 
     def __init__(
@@ -34,6 +38,7 @@ class BaseEmbedder(ABC):
         self.configuration = configuration
         self.embedding_model = embedding_model
         self.vector_store = vector_store
+        self.skip_existing_nodes = False
 
     @abstractmethod
     def embed(self, nodes: List[TextNode]) -> None:
@@ -50,6 +55,19 @@ class BaseEmbedder(ABC):
         """
         pass
 
+    @abstractmethod
+    def embed_batch(self, nodes: List[TextNode]) -> None:
+        """Generate embeddings for a batch of nodes and persist them.
+
+        Unlike `embed`, nodes are processed immediately instead of being
+        buffered, so callers batching nodes themselves control the batch
+        size. May be called from several threads at once.
+
+        Args:
+            nodes: Batch of text nodes to embed
+        """
+        pass
+
     @abstractmethod
     def embed_flush(self) -> None:
         """Process and generate embeddings for any remaining nodes.
@@ -61,3 +79,12 @@ class BaseEmbedder(ABC):
             unembedded in the buffer
         """
         pass
+
+    def delete(self, document_ids: List[str]) -> None:
+        """Remove the nodes of documents from the vector store.
+
+        Args:
+            document_ids: IDs of the source documents whose nodes are removed
+        """
+        for document_id in document_ids:
+            self.vector_store.delete(ref_doc_id=document_id)
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Type
+from typing import List, Optional, Type
 
 from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.core.schema import MetadataMode, TextNode
@@ -11,6 +11,8 @@ from embedding.bootstrap.configuration.configuration import (
     EmbeddingConfiguration,
 )
 from embedding.embedders.base_embedder import BaseEmbedder
+from embedding.embedders.core.batcher import EmbeddingBatcher
+from embedding.embedders.core.cache import EmbeddingCache
 from embedding.embedding_models.registry import EmbeddingModelRegistry
 from embedding.vector_stores.registry import VectorStoreRegistry
 
@@ -19,7 +21,15 @@ class BasicEmbedder(BaseEmbedder):
     """Implementation of text node embedding operations.
 
     Handles batch embedding generation and vector store persistence
-    for text nodes.
+    for text nodes. Nodes are packed into batches by the batcher, by node
+    count and, if the embedding model limits the request size, by the tokens
+    of their embed texts. With `skip_existing_nodes`, nodes already stored in the
+    vector store, e.g. by an interrupted run, are neither embedded nor saved
+    again.
+
+    With an embedding cache, nodes whose embedded text was embedded before by
+    the same model take their embedding from the cache, and only the other
+    nodes of a batch are passed to the model.
     """
 
     def __init__(
@@ -27,6 +37,8 @@ class BasicEmbedder(BaseEmbedder):
         configuration: EmbeddingConfiguration,
         embedding_model: BaseEmbedding,
         vector_store: VectorStore,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        batcher: Optional[EmbeddingBatcher] = None,
         logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
     ):
         """Initialize BasicEmbedder with model and storage.
@@ -35,19 +47,24 @@ class BasicEmbedder(BaseEmbedder):
             configuration: Configuration for embedding process
             embedding_model: Model to generate embeddings
             vector_store: Storage for embedding vectors
+            embedding_cache: Cache of previously generated embeddings,
+                caching is disabled if None
+            batcher: Component packing nodes into batches, batches are
+                limited by the configured batch size only if None
             logger: Logger instance for tracking operations
         """
         super().__init__(configuration, embedding_model, vector_store)
+        self.embedding_cache = embedding_cache
+        self.batcher = batcher or EmbeddingBatcher(
+            batch_size=configuration.embedding.embedding_model.batch_size
+        )
         self.logger = logger
-        self.batch_size = configuration.embedding.embedding_model.batch_size
-        self.current_nodes_batch = []
 
     def embed(self, nodes: List[TextNode]) -> None:
         """Generate embeddings for text nodes in batches.
 
-        Adds nodes to the current batch and processes complete batches
-        when the batch size threshold is reached. Nodes are embedded
-        and then saved to the vector store.
+        Adds nodes to the batcher and processes the batches it completed.
+        Nodes are embedded and then saved to the vector store.
 
         Args:
             nodes: Collection of text nodes to embed
@@ -55,45 +72,122 @@ class BasicEmbedder(BaseEmbedder):
         Note:
             Modifies nodes in-place by setting embedding attribute
         """
-        self.current_nodes_batch.extend(nodes)
+        for batch in self.batcher.add(nodes):
+            self._process_batch(batch)
+
+    def embed_flush(self) -> None:
+        """Process any nodes still pending in the batcher.
+
+        Ensures all nodes that haven't filled a batch are embedded and
+        saved to the vector store. Should be called after processing all
+        documents to avoid losing the final incomplete batch.
+        """
+        for batch in self.batcher.flush():
+            self._process_batch(batch)
+        if self.embedding_cache:
+            self.logger.info(
+                f"Embedding cache: {self.embedding_cache.hits} hits, "
+                f"{self.embedding_cache.misses} misses "
+                f"({self.embedding_cache.hit_rate:.1%} hit rate), "
+                f"{self.embedding_cache.evictions} evictions."
+            )
+
+    def embed_batch(self, nodes: List[TextNode]) -> None:
+        """Embed a batch of nodes and save them to the vector store.
+
+        The batch is split further if it exceeds the request size of the
+        embedding model.
 
-        while len(self.current_nodes_batch) >= self.batch_size:
-            batch = self.current_nodes_batch[: self.batch_size]
+        Args:
+            nodes: Batch of text nodes to embed
+        """
+        for batch in self.batcher.pack(nodes):
+            self._process_batch(batch)
+
+    def _process_batch(self, nodes: List[TextNode]) -> None:
+        """Embed a packed batch of nodes and save them to the vector store.
+
+        Args:
+            nodes: Batch of text nodes to embed
+        """
+        batch = self._drop_existing_nodes(nodes)
+        if batch:
             self._embed_nodes_batch(batch)
             self._save_nodes_batch(batch)
-            self.current_nodes_batch = self.current_nodes_batch[
-                self.batch_size :
-            ]
 
-    def embed_flush(self) -> None:
-        """Process any remaining nodes in the current batch.
+    def _drop_existing_nodes(self, nodes: List[TextNode]) -> List[TextNode]:
+        """Drop nodes already stored in the vector store.
+
+        Skipping is turned off if the vector store cannot look up nodes by
+        their IDs.
+
+        Args:
+            nodes: Batch of nodes to embed
 
-        Ensures all nodes that haven't reached the batch size threshold
-        are embedded and saved to the vector store before clearing the batch.
-        Should be called after processing all documents to avoid losing
-        the final incomplete batch.
+        Returns:
+            List[TextNode]: Nodes not stored yet, all nodes if skipping is off
         """
-        if self.current_nodes_batch:
-            self._embed_nodes_batch(self.current_nodes_batch)
-            self._save_nodes_batch(self.current_nodes_batch)
-            self.current_nodes_batch = []
+        if not self.skip_existing_nodes or not nodes:
+            return nodes
+
+        try:
+            existing_nodes = self.vector_store.get_nodes(
+                node_ids=[node.id_ for node in nodes]
+            )
+        except NotImplementedError:
+            self.logger.warning(
+                "Vector store cannot look up nodes, embedding all nodes."
+            )
+            self.skip_existing_nodes = False
+            return nodes
+
+        existing_node_ids = {node.id_ for node in existing_nodes}
+        if existing_node_ids:
+            self.logger.info(
+                f"Skipping {len(existing_node_ids)} nodes already stored."
+            )
+        return [node for node in nodes if node.id_ not in existing_node_ids]
 
     def _embed_nodes_batch(self, nodes: List[TextNode]) -> None:
         """Generate embeddings for a batch of text nodes.
 
         Extracts content from each node, generates embeddings using the embedding model,
-        and assigns the resulting embeddings back to each node.
+        and assigns the resulting embeddings back to each node. Embeddings
+        found in the cache are reused, the remaining nodes are embedded in a
+        single model call and their embeddings are cached.
 
         Args:
             nodes: Batch of nodes to generate embeddings for
         """
-        self.logger.info(f"Embedding batch of {len(nodes)} nodes.")
         nodes_contents = [
             node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes
         ]
-        nodes_embeddings = self.embedding_model.get_text_embedding_batch(
-            nodes_contents,
+        nodes_embeddings = (
+            self.embedding_cache.get_many(nodes_contents)
+            if self.embedding_cache
+            else [None] * len(nodes)
+        )
+        missing_indexes = [
+            i
+            for i, embedding in enumerate(nodes_embeddings)
+            if embedding is None
+        ]
+        self.logger.info(
+            f"Embedding batch of {len(nodes)} nodes, "
+            f"{len(nodes) - len(missing_indexes)} cached."
         )
+        if missing_indexes:
+            missing_contents = [nodes_contents[i] for i in missing_indexes]
+            missing_embeddings = self.embedding_model.get_text_embedding_batch(
+                missing_contents,
+            )
+            if self.embedding_cache:
+                self.embedding_cache.put_many(
+                    missing_contents, missing_embeddings
+                )
+            for i, embedding in zip(missing_indexes, missing_embeddings):
+                nodes_embeddings[i] = embedding
+
         for node, node_embedding in zip(nodes, nodes_embeddings):
             node.embedding = node_embedding
 
@@ -140,4 +234,6 @@ class BasicEmbedderFactory(Factory):
             configuration=configuration,
             embedding_model=embedding_model,
             vector_store=vector_store,
+            embedding_cache=EmbeddingCache.from_configuration(configuration),
+            batcher=EmbeddingBatcher.from_configuration(embedding_model_config),
         )
@@ -0,0 +1,206 @@
+import logging
+from typing import Callable, List, Optional, Tuple
+
+from llama_index.core.schema import MetadataMode, TextNode
+
+from core.logger import LoggerConfiguration
+from embedding.bootstrap.configuration.embedding_model_configuration import (
+    EmbeddingModelConfiguration,
+)
+from embedding.embedding_models.registry import (
+    EmbeddingModelTokenCounterRegistry,
+)
+
+
+class EmbeddingBatcher:
+    """Packs nodes into batches sent to the embedding model in one request.
+
+    A batch holds at most `batch_size` nodes. With `max_batch_size_in_tokens`,
+    nodes are packed greedily until the tokens of their embed texts, metadata
+    included, would exceed the limit, so small nodes share a request and
+    large ones never overflow it. A node exceeding the limit on its own is
+    sent alone.
+
+    With `sort_by_length`, the nodes packed at once are sorted by token
+    count, so nodes of similar length share a batch, which reduces padding
+    for locally run models.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_batch_size_in_tokens: Optional[int] = None,
+        count_tokens_func: Optional[Callable[[List[str]], List[int]]] = None,
+        sort_by_length: bool = False,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ):
+        """Initialize the batcher.
+
+        Args:
+            batch_size: Maximum number of nodes per batch
+            max_batch_size_in_tokens: Maximum number of tokens per batch,
+                batches are limited by node count only if None
+            count_tokens_func: Function returning the token count of each
+                text of a batch, required for the token limit
+            sort_by_length: Whether nodes are sorted by token count before
+                being packed
+            logger: Logger instance for reporting oversized nodes
+        """
+        if max_batch_size_in_tokens is not None and count_tokens_func is None:
+            raise ValueError(
+                "`count_tokens_func` is required to limit batches by tokens."
+            )
+
+        self.batch_size = batch_size
+        self.max_batch_size_in_tokens = max_batch_size_in_tokens
+        self.count_tokens_func = count_tokens_func
+        self.sort_by_length = sort_by_length
+        self.logger = logger
+        self.pending_nodes: List[Tuple[TextNode, int]] = []
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: EmbeddingModelConfiguration
+    ) -> "EmbeddingBatcher":
+        """Create the batcher configured for an embedding model.
+
+        Args:
+            configuration: Configuration of the embedding model
+
+        Returns:
+            EmbeddingBatcher: Batcher limiting batches by tokens if the model
+            configures a request size
+        """
+        count_tokens_func = (
+            EmbeddingModelTokenCounterRegistry.get(
+                configuration.provider
+            ).create(configuration)
+            if configuration.max_request_size_in_tokens is not None
+            else None
+        )
+        return cls(
+            batch_size=configuration.batch_size,
+            max_batch_size_in_tokens=configuration.max_request_size_in_tokens,
+            count_tokens_func=count_tokens_func,
+            sort_by_length=configuration.batch_sort_by_length,
+        )
+
+    def add(self, nodes: List[TextNode]) -> List[List[TextNode]]:
+        """Add nodes and take the batches that cannot grow anymore.
+
+        The last batch stays pending unless it holds `batch_size` nodes, as
+        subsequently added nodes may still fit into it.
+
+        Args:
+            nodes: Nodes to add
+
+        Returns:
+            List[List[TextNode]]: Complete batches
+        """
+        self.pending_nodes.extend(self._with_token_counts(nodes))
+        batches = self._pack(self.pending_nodes)
+        if batches and len(batches[-1]) < self.batch_size:
+            self.pending_nodes = batches.pop()
+        else:
+            self.pending_nodes = []
+        return [self._get_nodes(batch) for batch in batches]
+
+    def flush(self) -> List[List[TextNode]]:
+        """Take all pending nodes as batches.
+
+        Returns:
+            List[List[TextNode]]: Batches of the pending nodes
+        """
+        batches = self._pack(self.pending_nodes)
+        self.pending_nodes = []
+        return [self._get_nodes(batch) for batch in batches]
+
+    def pack(self, nodes: List[TextNode]) -> List[List[TextNode]]:
+        """Pack nodes into batches without touching the pending nodes.
+
+        Safe to call from several threads at once.
+
+        Args:
+            nodes: Nodes to pack
+
+        Returns:
+            List[List[TextNode]]: Batches of the nodes
+        """
+        batches = self._pack(self._with_token_counts(nodes))
+        return [self._get_nodes(batch) for batch in batches]
+
+    def _with_token_counts(
+        self, nodes: List[TextNode]
+    ) -> List[Tuple[TextNode, int]]:
+        """Pair nodes with the token counts of their embed texts.
+
+        Args:
+            nodes: Nodes to count the tokens of
+
+        Returns:
+            List[Tuple[TextNode, int]]: Nodes with their token counts, 0 if
+            batches are not limited by tokens
+        """
+        if self.max_batch_size_in_tokens is None or not nodes:
+            return [(node, 0) for node in nodes]
+
+        token_counts = self.count_tokens_func(
+            [
+                node.get_content(metadata_mode=MetadataMode.EMBED)
+                for node in nodes
+            ]
+        )
+        for node, token_count in zip(nodes, token_counts):
+            if token_count > self.max_batch_size_in_tokens:
+                self.logger.warning(
+                    f"Node {node.id_} has {token_count} tokens, exceeding the "
+                    f"request size of {self.max_batch_size_in_tokens} tokens."
+                )
+        return list(zip(nodes, token_counts))
+
+    def _pack(
+        self, sized_nodes: List[Tuple[TextNode, int]]
+    ) -> List[List[Tuple[TextNode, int]]]:
+        """Greedily pack nodes into batches within the node and token limits.
+
+        Args:
+            sized_nodes: Nodes with their token counts
+
+        Returns:
+            List[List[Tuple[TextNode, int]]]: Batches of nodes with their
+            token counts
+        """
+        if self.sort_by_length:
+            sized_nodes = sorted(sized_nodes, key=lambda item: item[1])
+
+        batches = []
+        batch, batch_size_in_tokens = [], 0
+        for node, token_count in sized_nodes:
+            if batch and (
+                len(batch) >= self.batch_size
+                or (
+                    self.max_batch_size_in_tokens is not None
+                    and batch_size_in_tokens + token_count
+                    > self.max_batch_size_in_tokens
+                )
+            ):
+                batches.append(batch)
+                batch, batch_size_in_tokens = [], 0
+            batch.append((node, token_count))
+            batch_size_in_tokens += token_count
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _get_nodes(batch: List[Tuple[TextNode, int]]) -> List[TextNode]:
+        """Drop the token counts of a batch.
+
+        Args:
+            batch: Nodes with their token counts
+
+        Returns:
+            List[TextNode]: Nodes of the batch
+        """
+        return [node for node, _ in batch]
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import List, Optional
+
+from embedding.bootstrap.configuration.configuration import (
+    EmbeddingConfiguration,
+)
+
+
+class EmbeddingCache:
+    """Persistent cache of embeddings backed by SQLite.
+
+    Embeddings are keyed by a hash of the embedding model provider, the model
+    name and the embedded text, so a text is embedded again only if it or the
+    model changed, and caches of different models can share a database.
+
+    The size of the cache is the size of the stored embeddings. Once it
+    exceeds `max_size_in_bytes`, the least recently used embeddings are
+    evicted. Hits and misses are counted for the lifetime of the instance.
+    """
+
+    LOOKUP_CHUNK_SIZE = 500
+    EVICTION_CHUNK_SIZE = 256
+
+    def __init__(
+        self,
+        path: str,
+        provider: str,
+        model_name: str,
+        max_size_in_bytes: Optional[int] = None,
+    ):
+        """Initialize the cache, creating the database if it does not exist.
+
+        Args:
+            path: Path of the SQLite database file
+            provider: Provider of the embedding model
+            model_name: Name of the embedding model
+            max_size_in_bytes: Maximum size of the stored embeddings,
+                unlimited if None
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_size_in_bytes = max_size_in_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._key_prefix = f"{provider}\0{model_name}\0".encode("utf-8")
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key BLOB PRIMARY KEY,
+                embedding BLOB NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS embeddings_last_used
+                ON embeddings (last_used);
+            """
+        )
+        self._connection.commit()
+        (self.size_in_bytes,) = self._connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(embedding)), 0) FROM embeddings"
+        ).fetchone()
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: EmbeddingConfiguration
+    ) -> Optional["EmbeddingCache"]:
+        """Create the cache configured for the embedding model.
+
+        Args:
+            configuration: Embedding configuration
+
+        Returns:
+            Optional[EmbeddingCache]: The cache or None if caching is disabled
+        """
+        embedding_configuration = configuration.embedding
+        if embedding_configuration.embedding_cache_path is None:
+            return None
+
+        max_size_in_mb = embedding_configuration.embedding_cache_max_size_in_mb
+        return cls(
+            path=embedding_configuration.embedding_cache_path,
+            provider=embedding_configuration.embedding_model.provider.value,
+            model_name=embedding_configuration.embedding_model.name,
+            max_size_in_bytes=(
+                int(max_size_in_mb * 1024 * 1024)
+                if max_size_in_mb is not None
+                else None
+            ),
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked up texts found in the cache, 0 before lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Look up the embeddings of texts.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            List[Optional[List[float]]]: Embedding of each text, None for
+            texts not in the cache
+        """
+        keys = [self._get_key(text) for text in texts]
+        with self._lock:
+            embeddings = {}
+            for start in range(0, len(keys), self.LOOKUP_CHUNK_SIZE):
+                chunk = keys[start : start + self.LOOKUP_CHUNK_SIZE]
+                for key, blob in self._connection.execute(
+                    "SELECT key, embedding FROM embeddings "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ):
+                    embeddings[key] = array("d", blob).tolist()
+            if embeddings:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in embeddings],
+                )
+                self._connection.commit()
+
+            results = [embeddings.get(key) for key in keys]
+            hits = sum(result is not None for result in results)
+            self.hits += hits
+            self.misses += len(results) - hits
+        return results
+
+    def put_many(self, texts: List[str], embeddings: List[List[float]]) -> None:
+        """Store the embeddings of texts, evicting embeddings beyond the size limit.
+
+        Args:
+            texts: Embedded texts
+            embeddings: Embedding of each text
+        """
+        now = time.time()
+        with self._lock:
+            for text, embedding in zip(texts, embeddings):
+                blob = array("d", embedding).tobytes()
+                cursor = self._connection.execute(
+                    "INSERT OR IGNORE INTO embeddings (key, embedding, last_used) "
+                    "VALUES (?, ?, ?)",
+                    (self._get_key(text), blob, now),
+                )
+                if cursor.rowcount:
+                    self.size_in_bytes += len(blob)
+            self._evict()
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def _evict(self) -> None:
+        """Evict least recently used embeddings until the size limit is met."""
+        if self.max_size_in_bytes is None:
+            return
+
+        while self.size_in_bytes > self.max_size_in_bytes:
+            rows = self._connection.execute(
+                "SELECT key, LENGTH(embedding) FROM embeddings "
+                "ORDER BY last_used LIMIT ?",
+                (self.EVICTION_CHUNK_SIZE,),
+            ).fetchall()
+            if not rows:
+                self.size_in_bytes = 0
+                return
+
+            evicted_keys = []
+            for key, size in rows:
+                if self.size_in_bytes <= self.max_size_in_bytes:
+                    break
+                evicted_keys.append((key,))
+                self.size_in_bytes -= size
+            self._connection.executemany(
+                "DELETE FROM embeddings WHERE key = ?", evicted_keys
+            )
+            self.evictions += len(evicted_keys)
+
+    def _get_key(self, text: str) -> bytes:
+        """Hash the embedding model and a text into a cache key.
+
+        Args:
+            text: Embedded text
+
+        Returns:
+            bytes: BLAKE2b digest of the model provider, model name and text
+        """
+        return hashlib.blake2b(
+            self._key_prefix + text.encode("utf-8"), digest_size=16
+        ).digest()
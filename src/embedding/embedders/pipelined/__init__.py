@@ -0,0 +1,17 @@
+from embedding.bootstrap.configuration.configuration import EmbedderName
+from embedding.embedders.pipelined.embedder import PipelinedEmbedderFactory
+from embedding.embedders.registry import EmbedderRegistry
+
+
+def register() -> None:
+    """
+    Registers the pipelined embedder with the embedder registry.
+
+    This function adds the PipelinedEmbedderFactory to the EmbedderRegistry
+    under the PIPELINED embedder name, making it available for use
+    throughout the application.
+    """
+    EmbedderRegistry.register(
+        EmbedderName.PIPELINED,
+        PipelinedEmbedderFactory,
+    )
@@ -0,0 +1,180 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional, Type
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores.types import VectorStore
+
+from core import Factory
+from core.logger import LoggerConfiguration
+from embedding.bootstrap.configuration.configuration import (
+    EmbeddingConfiguration,
+)
+from embedding.embedders.basic.embedder import (
+    BasicEmbedder,
+    BasicEmbedderFactory,
+)
+from embedding.embedders.core.batcher import EmbeddingBatcher
+from embedding.embedders.core.cache import EmbeddingCache
+
+
+class PipelinedEmbedder(BasicEmbedder):
+    """Embedder overlapping embedding generation with vector store writes.
+
+    Embedded batches are written to the vector store by background write
+    workers while the next batch is embedded, so neither the embedding model
+    nor the vector store waits for the other. At most `max_pending_writes`
+    batches are waiting for or being written at a time; embedding the next
+    batch blocks until a write completes, which bounds the memory held by
+    embedded but unsaved nodes.
+
+    A failed write is raised by the next call to `embed`, `embed_batch` or
+    `embed_flush`. Nodes are only guaranteed to be saved once `embed_flush`
+    returned, which also shuts down the write workers until the next write.
+    """
+
+    def __init__(
+        self,
+        configuration: EmbeddingConfiguration,
+        embedding_model: BaseEmbedding,
+        vector_store: VectorStore,
+        write_workers: int = 1,
+        max_pending_writes: int = 2,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        batcher: Optional[EmbeddingBatcher] = None,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ):
+        """Initialize PipelinedEmbedder with model, storage and write workers.
+
+        Args:
+            configuration: Configuration for embedding process
+            embedding_model: Model to generate embeddings
+            vector_store: Storage for embedding vectors
+            write_workers: Number of batches written concurrently
+            max_pending_writes: Maximum number of batches waiting for or
+                being written to the vector store
+            embedding_cache: Cache of previously generated embeddings,
+                caching is disabled if None
+            batcher: Component packing nodes into batches, batches are
+                limited by the configured batch size only if None
+            logger: Logger instance for tracking operations
+        """
+        super().__init__(
+            configuration=configuration,
+            embedding_model=embedding_model,
+            vector_store=vector_store,
+            embedding_cache=embedding_cache,
+            batcher=batcher,
+            logger=logger,
+        )
+        self.write_workers = write_workers
+        self.write_executor: Optional[ThreadPoolExecutor] = None
+        self.pending_writes_slots = threading.BoundedSemaphore(
+            max_pending_writes
+        )
+        self.pending_writes: List[Future] = []
+        self.pending_writes_lock = threading.Lock()
+
+    def _process_batch(self, nodes: List[TextNode]) -> None:
+        """Embed a packed batch of nodes and schedule writing it to the vector store.
+
+        Blocks while `max_pending_writes` batches are pending.
+
+        Args:
+            nodes: Batch of text nodes to embed
+
+        Raises:
+            Exception: Error of a previously scheduled write that failed
+        """
+        self._raise_failed_writes()
+        batch = self._drop_existing_nodes(nodes)
+        if batch:
+            self._embed_nodes_batch(batch)
+            self._submit_write(batch)
+
+    def embed_flush(self) -> None:
+        """Process remaining nodes, wait until all writes completed and shut down the write workers.
+
+        Raises:
+            Exception: Error of the first scheduled write that failed
+        """
+        try:
+            super().embed_flush()
+        finally:
+            with self.pending_writes_lock:
+                pending_writes = list(self.pending_writes)
+            wait(pending_writes)
+            if self.write_executor is not None:
+                self.write_executor.shutdown()
+                self.write_executor = None
+        self._raise_failed_writes()
+
+    def _submit_write(self, nodes: List[TextNode]) -> None:
+        """Schedule writing an embedded batch to the vector store.
+
+        Args:
+            nodes: Batch of embedded nodes to save
+        """
+        if self.write_executor is None:
+            self.write_executor = ThreadPoolExecutor(
+                max_workers=self.write_workers,
+                thread_name_prefix="vector-store-writer",
+            )
+        self.pending_writes_slots.acquire()
+        try:
+            future = self.write_executor.submit(self._save_nodes_batch, nodes)
+        except BaseException:
+            self.pending_writes_slots.release()
+            raise
+        future.add_done_callback(lambda _: self.pending_writes_slots.release())
+        with self.pending_writes_lock:
+            self.pending_writes.append(future)
+
+    def _raise_failed_writes(self) -> None:
+        """Forget completed writes and raise the error of a failed one.
+
+        Raises:
+            Exception: Error of the first completed write that failed
+        """
+        with self.pending_writes_lock:
+            completed_writes = [
+                future for future in self.pending_writes if future.done()
+            ]
+            self.pending_writes = [
+                future for future in self.pending_writes if not future.done()
+            ]
+
+        for future in completed_writes:
+            future.result()
+
+
+class PipelinedEmbedderFactory(Factory):
+    _configuration_class: Type = EmbeddingConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: EmbeddingConfiguration
+    ) -> PipelinedEmbedder:
+        """Creates a configured PipelinedEmbedder instance.
+
+        Initializes embedding model and vector store components like the
+        basic embedder factory and configures the write workers.
+
+        Args:
+            configuration: Settings for embedding process configuration
+
+        Returns:
+            PipelinedEmbedder: Configured embedder instance ready for document processing
+        """
+        basic_embedder = BasicEmbedderFactory.create(configuration)
+        return PipelinedEmbedder(
+            configuration=configuration,
+            embedding_model=basic_embedder.embedding_model,
+            vector_store=basic_embedder.vector_store,
+            write_workers=configuration.embedding.embedder_write_workers,
+            max_pending_writes=configuration.embedding.embedder_max_pending_writes,
+            embedding_cache=basic_embedder.embedding_cache,
+            batcher=basic_embedder.batcher,
+        )
@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Callable, List
+
+from transformers import AutoTokenizer, PreTrainedTokenizerBase
+
+
+@lru_cache(maxsize=None)
+def load_tokenizer(tokenizer_name: str) -> PreTrainedTokenizerBase:
+    """Load a tokenizer once for the tokenizer and token counter factories.
+
+    Args:
+        tokenizer_name: Name of the tokenizer on the HuggingFace Hub.
+
+    Returns:
+        PreTrainedTokenizerBase: The loaded tokenizer.
+    """
+    return AutoTokenizer.from_pretrained(tokenizer_name)
+
+
+def create_token_counter(
+    tokenizer_name: str,
+) -> Callable[[List[str]], List[int]]:
+    """Create a function counting the tokens of a batch of texts.
+
+    Texts are counted with a single call to the tokenizer, which fast
+    tokenizers encode in Rust, without creating token strings.
+
+    Args:
+        tokenizer_name: Name of the tokenizer on the HuggingFace Hub.
+
+    Returns:
+        Callable[[List[str]], List[int]]: A function returning the number
+        of tokens of each text of a batch, special tokens excluded as in
+        `tokenize`.
+    """
+    tokenizer = load_tokenizer(tokenizer_name)
+
+    def count_tokens(texts: List[str]) -> List[int]:
+        if not texts:
+            return []
+        encodings = tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            verbose=False,
+        )
+        return [len(input_ids) for input_ids in encodings["input_ids"]]
+
+    return count_tokens
@@ -7,10 +7,12 @@ from embedding.embedding_models.hugging_face.configuration import (
 )
 from embedding.embedding_models.hugging_face.embedding_model import (
     HuggingFaceEmbeddingModelFactory,
+    HuggingFaceEmbeddingModelTokenCounterFactory,
     HuggingFaceEmbeddingModelTokenizerFactory,
 )
 from embedding.embedding_models.registry import (
     EmbeddingModelRegistry,
+    EmbeddingModelTokenCounterRegistry,
     EmbeddingModelTokenizerRegistry,
 )
 
@@ -23,6 +25,7 @@ def register():
     - Configuration class with the configuration registry
     - Model factory with the embedding model registry
     - Tokenizer factory with the tokenizer registry
+    - Token counter factory with the token counter registry
     """
     EmbeddingModelConfigurationRegistry.register(
         EmbeddingModelProviderName.HUGGING_FACE,
@@ -36,3 +39,7 @@ def register():
         EmbeddingModelProviderName.HUGGING_FACE,
         HuggingFaceEmbeddingModelTokenizerFactory,
     )
+    EmbeddingModelTokenCounterRegistry.register(
+        EmbeddingModelProviderName.HUGGING_FACE,
+        HuggingFaceEmbeddingModelTokenCounterFactory,
+    )
@@ -1,9 +1,12 @@
-from typing import Callable, Type
+from typing import Callable, List, Type
 
 from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-from transformers import AutoTokenizer
 
 from core import SingletonFactory
+from embedding.embedding_models.core.tokenizer import (
+    create_token_counter,
+    load_tokenizer,
+)
 from embedding.embedding_models.hugging_face.configuration import (
     HuggingFaceEmbeddingModelConfiguration,
 )
@@ -60,6 +63,30 @@ class HuggingFaceEmbeddingModelTokenizerFactory(SingletonFactory):
         Returns:
             Callable: A tokenize function from the configured tokenizer.
         """
-        return AutoTokenizer.from_pretrained(
-            configuration.tokenizer_name
-        ).tokenize
+        return load_tokenizer(configuration.tokenizer_name).tokenize
+
+
+class HuggingFaceEmbeddingModelTokenCounterFactory(SingletonFactory):
+    """Factory for creating token counting functions for HuggingFace models.
+
+    Counts tokens with the HuggingFace tokenizer of the model, see
+    `create_token_counter`.
+    """
+
+    _configuration_class: Type = HuggingFaceEmbeddingModelConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: HuggingFaceEmbeddingModelConfiguration
+    ) -> Callable[[List[str]], List[int]]:
+        """Creates a token counting function based on provided configuration.
+
+        Args:
+            configuration: HuggingFace embedding model configuration.
+
+        Returns:
+            Callable[[List[str]], List[int]]: A function returning the number
+            of tokens of each text of a batch, special tokens excluded as in
+            `tokenize`.
+        """
+        return create_token_counter(configuration.tokenizer_name)
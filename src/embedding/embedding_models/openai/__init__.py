@@ -7,10 +7,12 @@ from embedding.embedding_models.openai.configuration import (
 )
 from embedding.embedding_models.openai.embedding_model import (
     OpenAIEmbeddingModelFactory,
+    OpenAIEmbeddingModelTokenCounterFactory,
     OpenAIEmbeddingModelTokenizerFactory,
 )
 from embedding.embedding_models.registry import (
     EmbeddingModelRegistry,
+    EmbeddingModelTokenCounterRegistry,
     EmbeddingModelTokenizerRegistry,
 )
 
@@ -23,6 +25,7 @@ def register():
     1. OpenAIEmbeddingModelConfiguration with the EmbeddingModelConfigurationRegistry
     2. OpenAIEmbeddingModelFactory with the EmbeddingModelRegistry
     3. OpenAIEmbeddingModelTokenizerFactory with the EmbeddingModelTokenizerRegistry
+    4. OpenAIEmbeddingModelTokenCounterFactory with the EmbeddingModelTokenCounterRegistry
 
     These registrations enable the system to create and use OpenAI embedding models
     when the OpenAI provider is specified in configuration.
@@ -36,3 +39,7 @@ def register():
     EmbeddingModelTokenizerRegistry.register(
         EmbeddingModelProviderName.OPENAI, OpenAIEmbeddingModelTokenizerFactory
     )
+    EmbeddingModelTokenCounterRegistry.register(
+        EmbeddingModelProviderName.OPENAI,
+        OpenAIEmbeddingModelTokenCounterFactory,
+    )
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import ConfigDict, Field, SecretStr
 
@@ -38,27 +38,11 @@ class OpenAIEmbeddingModelConfiguration(EmbeddingModelConfiguration):
     provider: Literal[EmbeddingModelProviderName.OPENAI] = Field(
         ..., description="The provider of the embedding model."
     )
-    max_request_size_in_tokens: int = Field(
+    max_request_size_in_tokens: Optional[int] = Field(
         8191,
-        description="Maximum size of the request in tokens.",
+        ge=1,
+        description="Maximum number of tokens of the texts embedded in one request.",
     )
     secrets: Secrets = Field(
         None, description="The secrets for the language model."
     )
-
-    def model_post_init(self, __context: dict):
-        """
-        Post-initialization processing for the model configuration.
-
-        Calculates the appropriate batch size based on the maximum request size
-        and the configured text splitter's chunk size if a splitter is defined.
-
-        Args:
-            __context: Context information provided by Pydantic during initialization
-        """
-        super().model_post_init(__context)
-        if self.splitter:
-            self.batch_size = (
-                self.max_request_size_in_tokens
-                // self.splitter.chunk_size_in_tokens
-            )
@@ -1,4 +1,4 @@
-from typing import Callable, Type
+from typing import Callable, List, Type
 
 import tiktoken
 from llama_index.embeddings.openai import OpenAIEmbedding
@@ -59,3 +59,34 @@ class OpenAIEmbeddingModelTokenizerFactory(SingletonFactory):
             Callable: A tokenizer function that converts text to token IDs.
         """
         return tiktoken.encoding_for_model(configuration.tokenizer_name).encode
+
+
+class OpenAIEmbeddingModelTokenCounterFactory(SingletonFactory):
+    """Factory for creating OpenAI token counting functions.
+
+    This factory creates singleton instances of functions counting the tokens
+    of a batch of texts with tiktoken, encoding the batch in parallel native
+    threads.
+    """
+
+    _configuration_class: Type = OpenAIEmbeddingModelConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: OpenAIEmbeddingModelConfiguration
+    ) -> Callable[[List[str]], List[int]]:
+        """Creates a token counting function based on provided configuration.
+
+        Args:
+            configuration: OpenAI embedding model configuration.
+
+        Returns:
+            Callable[[List[str]], List[int]]: A function returning the number
+            of tokens of each text of a batch.
+        """
+        encoding = tiktoken.encoding_for_model(configuration.tokenizer_name)
+
+        def count_tokens(texts: List[str]) -> List[int]:
+            return [len(tokens) for tokens in encoding.encode_batch(texts)]
+
+        return count_tokens
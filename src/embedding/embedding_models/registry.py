@@ -35,3 +35,19 @@ class EmbeddingModelTokenizerRegistry(Registry):
     """
 
     _key_class: Type = EmbeddingModelProviderName
+
+
+class EmbeddingModelTokenCounterRegistry(Registry):
+    """
+    Registry for embedding model token counters that maps provider names to their respective counters.
+
+    Token counters take a batch of texts and return the number of tokens of
+    each text, as counted by the tokenizer of the embedding model. Unlike
+    tokenizers, they encode the whole batch at once and return only lengths,
+    which makes them the cheaper choice for size checks.
+
+    Attributes:
+        _key_class: The class type used as keys in the registry, set to EmbeddingModelProviderName enum.
+    """
+
+    _key_class: Type = EmbeddingModelProviderName
@@ -4,6 +4,7 @@ from embedding.bootstrap.configuration.embedding_model_configuration import (
 )
 from embedding.embedding_models.registry import (
     EmbeddingModelRegistry,
+    EmbeddingModelTokenCounterRegistry,
     EmbeddingModelTokenizerRegistry,
 )
 from embedding.embedding_models.voyage.configuration import (
@@ -11,6 +12,7 @@ from embedding.embedding_models.voyage.configuration import (
 )
 from embedding.embedding_models.voyage.embedding_model import (
     VoyageEmbeddingModelFactory,
+    VoyageEmbeddingModelTokenCounterFactory,
     VoyageEmbeddingModelTokenizerFactory,
 )
 
@@ -19,10 +21,11 @@ def register():
     """
     Registers Voyage embedding model components with the appropriate registries.
 
-    This function performs three registrations:
+    This function performs four registrations:
     1. Registers VoyageEmbeddingModelConfiguration with the configuration registry
     2. Registers VoyageEmbeddingModelFactory with the model registry
     3. Registers VoyageEmbeddingModelTokenizerFactory with the tokenizer registry
+    4. Registers VoyageEmbeddingModelTokenCounterFactory with the token counter registry
 
     This enables the system to use Voyage embedding models when VOYAGE is specified
     as the embedding model provider.
@@ -36,3 +39,7 @@ def register():
     EmbeddingModelTokenizerRegistry.register(
         EmbeddingModelProviderName.VOYAGE, VoyageEmbeddingModelTokenizerFactory
     )
+    EmbeddingModelTokenCounterRegistry.register(
+        EmbeddingModelProviderName.VOYAGE,
+        VoyageEmbeddingModelTokenCounterFactory,
+    )
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import ConfigDict, Field, SecretStr
 
@@ -35,6 +35,11 @@ class VoyageEmbeddingModelConfiguration(EmbeddingModelConfiguration):
     provider: Literal[EmbeddingModelProviderName.VOYAGE] = Field(
         ..., description="The provider of the embedding model."
     )
+    max_request_size_in_tokens: Optional[int] = Field(
+        120000,
+        ge=1,
+        description="Maximum number of tokens of the texts embedded in one request.",
+    )
     secrets: Secrets = Field(
         None, description="The secrets for the language model."
     )
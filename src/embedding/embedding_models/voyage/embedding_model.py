@@ -1,9 +1,12 @@
-from typing import Callable, Type
+from typing import Callable, List, Type
 
 from llama_index.embeddings.voyageai import VoyageEmbedding
-from transformers import AutoTokenizer
 
 from core import SingletonFactory
+from embedding.embedding_models.core.tokenizer import (
+    create_token_counter,
+    load_tokenizer,
+)
 from embedding.embedding_models.voyage.configuration import (
     VoyageEmbeddingModelConfiguration,
 )
@@ -60,6 +63,30 @@ class VoyageEmbeddingModelTokenizerFactory(SingletonFactory):
         Returns:
             Callable: A tokenizer function that can be used to tokenize input text.
         """
-        return AutoTokenizer.from_pretrained(
-            configuration.tokenizer_name
-        ).tokenize
+        return load_tokenizer(configuration.tokenizer_name).tokenize
+
+
+class VoyageEmbeddingModelTokenCounterFactory(SingletonFactory):
+    """Factory for creating token counting functions for Voyage embedding models.
+
+    Counts tokens with the HuggingFace tokenizer of the model, see
+    `create_token_counter`.
+    """
+
+    _configuration_class: Type = VoyageEmbeddingModelConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: VoyageEmbeddingModelConfiguration
+    ) -> Callable[[List[str]], List[int]]:
+        """Creates a token counting function based on provided configuration.
+
+        Args:
+            configuration: Voyage embedding model configuration.
+
+        Returns:
+            Callable[[List[str]], List[int]]: A function returning the number
+            of tokens of each text of a batch, special tokens excluded as in
+            `tokenize`.
+        """
+        return create_token_counter(configuration.tokenizer_name)
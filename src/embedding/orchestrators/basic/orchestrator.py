@@ -1,12 +1,17 @@
-from typing import Type
+from typing import AsyncIterator, Optional, Type
 
 from core import Factory
 from embedding.bootstrap.configuration.configuration import (
     EmbeddingConfiguration,
 )
+from embedding.embedders.base_embedder import BaseEmbedder
 from embedding.embedders.registry import EmbedderRegistry
 from embedding.orchestrators.base_orchestrator import BaseEmbeddingOrchestrator
+from embedding.splitters.base_splitter import BaseSplitter
 from embedding.splitters.registry import SplitterRegistry
+from extraction.bootstrap.configuration.configuration import SyncMode
+from extraction.datasources.core.document import BaseDocument
+from extraction.orchestrators.base_orchestator import BaseDatasourceOrchestrator
 from extraction.orchestrators.registry import DatasourceOrchestratorRegistry
 
 
@@ -18,8 +23,43 @@ class BasicEmbeddingOrchestrator(BaseEmbeddingOrchestrator):
     1. Fetches documents from a datasource
     2. Splits documents into nodes
     3. Embeds those nodes
+
+    In incremental sync mode, only new or changed documents are fetched and
+    nodes of deleted or replaced documents are removed afterwards.
+
+    In full refresh mode with a checkpoint interval, the embedded nodes are
+    flushed and the progress of the datasources is checkpointed periodically.
+    An interrupted run then resumes from its last checkpoint, skipping nodes
+    already stored in the vector store.
     """
 
+    def __init__(
+        self,
+        datasource_orchestrator: BaseDatasourceOrchestrator,
+        splitter: BaseSplitter,
+        embedder: BaseEmbedder,
+        sync_mode: SyncMode = SyncMode.FULL_REFRESH,
+        checkpoint_interval: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the orchestrator.
+
+        Args:
+            datasource_orchestrator: Orchestrator for extracting data from sources
+            splitter: Component responsible for splitting documents into nodes
+            embedder: Component that generates embeddings for nodes
+            sync_mode: Whether to fetch all documents or only changed ones
+            checkpoint_interval: Number of documents after which a checkpoint
+                is saved in full refresh mode, checkpointing is disabled if None
+        """
+        super().__init__(
+            datasource_orchestrator=datasource_orchestrator,
+            splitter=splitter,
+            embedder=embedder,
+        )
+        self.sync_mode = sync_mode
+        self.checkpoint_interval = checkpoint_interval
+
     async def embed(self) -> None:
         """
         Execute the embedding process.
@@ -28,12 +68,82 @@ class BasicEmbeddingOrchestrator(BaseEmbeddingOrchestrator):
         splits them into nodes using the configured splitter,
         and embeds those nodes with the configured embedder.
         Finally flushes any remaining embeddings.
+
+        In incremental sync mode, nodes of deleted or replaced documents are
+        then removed and the sync state is committed. With checkpointing, the
+        checkpoint is cleared once all documents are embedded.
         """
-        async for doc in self.datasource_orchestrator.full_refresh_sync():
+        documents = self._start_sync()
+
+        document_count = 0
+        async for doc in documents:
             nodes = self.splitter.split(doc)
             self.embedder.embed(nodes)
+            document_count += 1
+            if self._is_checkpoint_due(document_count):
+                self.embedder.embed_flush()
+                self.datasource_orchestrator.save_checkpoint()
         self.embedder.embed_flush()
 
+        self._finish_sync()
+
+    @property
+    def checkpointing(self) -> bool:
+        """Whether checkpoints are saved periodically."""
+        return (
+            self.sync_mode == SyncMode.FULL_REFRESH
+            and self.checkpoint_interval is not None
+        )
+
+    def _start_sync(self) -> AsyncIterator[BaseDocument]:
+        """
+        Start fetching documents in the configured sync mode.
+
+        When resuming an interrupted checkpointed run, the embedder skips
+        nodes already stored in the vector store.
+
+        Returns:
+            AsyncIterator[BaseDocument]: Documents to embed
+        """
+        if self.sync_mode == SyncMode.INCREMENTAL:
+            return self.datasource_orchestrator.incremental_sync()
+
+        if self.checkpointing and self.datasource_orchestrator.has_checkpoint():
+            self.embedder.skip_existing_nodes = True
+        return self.datasource_orchestrator.full_refresh_sync()
+
+    def _is_checkpoint_due(self, document_count: int) -> bool:
+        """
+        Check whether a checkpoint is saved after a number of documents.
+
+        Args:
+            document_count: Number of documents fetched so far
+
+        Returns:
+            bool: True if checkpointing and the interval is reached
+        """
+        return (
+            self.checkpointing
+            and document_count % self.checkpoint_interval == 0
+        )
+
+    def _finish_sync(self) -> None:
+        """
+        Finish the sync once all documents are embedded and flushed.
+
+        Clears the checkpoint in checkpointed runs. In incremental sync mode,
+        removes nodes of deleted or replaced documents and commits the sync
+        state.
+        """
+        if self.checkpointing:
+            self.datasource_orchestrator.clear_checkpoint()
+
+        if self.sync_mode == SyncMode.INCREMENTAL:
+            self.embedder.delete(
+                self.datasource_orchestrator.deleted_document_ids
+            )
+            self.datasource_orchestrator.commit_sync_state()
+
 
 class BasicEmbeddingOrchestratorFactory(Factory):
     """
@@ -82,4 +192,10 @@ class BasicEmbeddingOrchestratorFactory(Factory):
             datasource_orchestrator=datasource_orchestrator,
             splitter=splitter,
             embedder=embedder,
+            sync_mode=configuration.extraction.sync_mode,
+            checkpoint_interval=(
+                configuration.extraction.checkpoint_interval
+                if configuration.extraction.checkpoint_path
+                else None
+            ),
         )
@@ -0,0 +1,20 @@
+from embedding.bootstrap.configuration.configuration import (
+    EmbeddingOrchestratorName,
+)
+from embedding.orchestrators.pipeline.orchestrator import (
+    PipelineEmbeddingOrchestratorFactory,
+)
+from embedding.orchestrators.registry import EmbeddingOrchestratorRegistry
+
+
+def register() -> None:
+    """
+    Registers the PipelineEmbeddingOrchestratorFactory with the EmbeddingOrchestratorRegistry.
+
+    This function adds the pipeline embedding orchestrator to the registry under the
+    PIPELINE orchestrator name, making it available for use throughout the application.
+    """
+    EmbeddingOrchestratorRegistry.register(
+        EmbeddingOrchestratorName.PIPELINE,
+        PipelineEmbeddingOrchestratorFactory,
+    )
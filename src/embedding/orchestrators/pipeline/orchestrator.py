@@ -0,0 +1,308 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Type
+
+from llama_index.core.schema import TextNode
+
+from core import Factory
+from core.logger import LoggerConfiguration
+from embedding.bootstrap.configuration.configuration import (
+    EmbeddingConfiguration,
+)
+from embedding.embedders.base_embedder import BaseEmbedder
+from embedding.orchestrators.basic.orchestrator import (
+    BasicEmbeddingOrchestrator,
+    BasicEmbeddingOrchestratorFactory,
+)
+from embedding.splitters.base_splitter import BaseSplitter
+from extraction.bootstrap.configuration.configuration import SyncMode
+from extraction.datasources.core.document import BaseDocument
+from extraction.orchestrators.base_orchestator import BaseDatasourceOrchestrator
+
+# Marks the end of the items of an upstream worker
+_DONE = None
+# Asks the batching stage to emit its incomplete batch
+_FLUSH = object()
+
+
+class PipelineEmbeddingOrchestrator(BasicEmbeddingOrchestrator):
+    """
+    Orchestrator running extraction, splitting and embedding concurrently.
+
+    Each stage runs as its own workers connected by bounded queues:
+    1. An extraction worker fetches documents from the datasource
+    2. Split workers split documents into nodes in threads
+    3. A batching worker groups nodes into batches of `batch_size`
+    4. Embed workers embed and save batches in threads
+
+    A full queue blocks the stage feeding it, so a slow stage throttles the
+    stages before it instead of buffering unboundedly, and the throughput
+    approaches that of the slowest stage. The queue in front of the slowest
+    stage stays full while the ones after it stay empty, which
+    `get_queue_depths` and the periodic stats log make visible.
+
+    Sync modes and checkpoints behave as in the basic orchestrator. Before
+    a checkpoint is saved, the pipeline is drained, so all documents fetched
+    so far are embedded and saved.
+    """
+
+    def __init__(
+        self,
+        datasource_orchestrator: BaseDatasourceOrchestrator,
+        splitter: BaseSplitter,
+        embedder: BaseEmbedder,
+        batch_size: int,
+        sync_mode: SyncMode = SyncMode.FULL_REFRESH,
+        checkpoint_interval: Optional[int] = None,
+        queue_size: int = 16,
+        split_workers: int = 1,
+        embed_workers: int = 1,
+        stats_interval: Optional[float] = 30.0,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ) -> None:
+        """
+        Initialize the orchestrator.
+
+        Args:
+            datasource_orchestrator: Orchestrator for extracting data from sources
+            splitter: Component responsible for splitting documents into nodes
+            embedder: Component that generates embeddings for nodes
+            batch_size: Number of nodes per batch passed to the embedder
+            sync_mode: Whether to fetch all documents or only changed ones
+            checkpoint_interval: Number of documents after which a checkpoint
+                is saved in full refresh mode, checkpointing is disabled if None
+            queue_size: Maximum number of items buffered between two stages
+            split_workers: Number of documents split concurrently
+            embed_workers: Number of batches embedded concurrently
+            stats_interval: Interval in seconds at which queue depths are
+                logged, nothing is logged if None
+            logger: Logger instance for logging pipeline stats
+        """
+        super().__init__(
+            datasource_orchestrator=datasource_orchestrator,
+            splitter=splitter,
+            embedder=embedder,
+            sync_mode=sync_mode,
+            checkpoint_interval=checkpoint_interval,
+        )
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.split_workers = split_workers
+        self.embed_workers = embed_workers
+        self.stats_interval = stats_interval
+        self.logger = logger
+        self.document_queue: Optional[asyncio.Queue] = None
+        self.node_queue: Optional[asyncio.Queue] = None
+        self.batch_queue: Optional[asyncio.Queue] = None
+        self.extracted_document_count = 0
+        self.split_document_count = 0
+        self.embedded_node_count = 0
+
+    async def embed(self) -> None:
+        """
+        Execute the embedding process with concurrent stages.
+
+        If a stage fails, the other stages are cancelled and the error is
+        raised. Nodes of deleted documents are removed and the checkpoint is
+        cleared only once all stages finished.
+        """
+        documents = self._start_sync()
+        self.document_queue = asyncio.Queue(self.queue_size)
+        self.node_queue = asyncio.Queue(self.queue_size)
+        self.batch_queue = asyncio.Queue(self.queue_size)
+        self.extracted_document_count = 0
+        self.split_document_count = 0
+        self.embedded_node_count = 0
+
+        workers = [
+            self._extract(documents),
+            *(self._split() for _ in range(self.split_workers)),
+            self._batch(),
+            *(self._embed() for _ in range(self.embed_workers)),
+        ]
+        monitor = (
+            asyncio.ensure_future(self._log_stats_periodically())
+            if self.stats_interval is not None
+            else None
+        )
+        try:
+            await self._run(workers)
+        finally:
+            if monitor is not None:
+                monitor.cancel()
+        self.embedder.embed_flush()
+        self._log_stats()
+
+        self._finish_sync()
+
+    def get_queue_depths(self) -> Dict[str, int]:
+        """
+        Get the number of items waiting in front of each stage.
+
+        Returns:
+            Dict[str, int]: Depth of the queues of the split, batch and embed
+            stages, empty before the pipeline started
+        """
+        if self.document_queue is None:
+            return {}
+        return {
+            "split": self.document_queue.qsize(),
+            "batch": self.node_queue.qsize(),
+            "embed": self.batch_queue.qsize(),
+        }
+
+    async def _run(self, workers: List) -> None:
+        """
+        Run the workers until all finished or one failed.
+
+        Args:
+            workers: Coroutines of the stage workers
+        """
+        tasks = [asyncio.ensure_future(worker) for worker in workers]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _extract(self, documents: AsyncIterator[BaseDocument]) -> None:
+        """
+        Feed fetched documents to the split workers.
+
+        Args:
+            documents: Documents fetched from the datasource
+        """
+        async for document in documents:
+            await self.document_queue.put(document)
+            self.extracted_document_count += 1
+            if self._is_checkpoint_due(self.extracted_document_count):
+                await self._drain()
+                self.embedder.embed_flush()
+                self.datasource_orchestrator.save_checkpoint()
+
+        for _ in range(self.split_workers):
+            await self.document_queue.put(_DONE)
+
+    async def _split(self) -> None:
+        """Split documents into nodes and pass them to the batch worker."""
+        while True:
+            document = await self.document_queue.get()
+            if document is _DONE:
+                await self.node_queue.put(_DONE)
+                self.document_queue.task_done()
+                return
+
+            nodes = await asyncio.to_thread(self.splitter.split, document)
+            await self.node_queue.put(nodes)
+            self.split_document_count += 1
+            self.document_queue.task_done()
+
+    async def _batch(self) -> None:
+        """Group nodes into batches and pass them to the embed workers."""
+        nodes: List[TextNode] = []
+        running_split_workers = self.split_workers
+        while running_split_workers:
+            item = await self.node_queue.get()
+            if item is _DONE:
+                running_split_workers -= 1
+            elif item is _FLUSH:
+                if nodes:
+                    await self.batch_queue.put(nodes)
+                    nodes = []
+            else:
+                nodes.extend(item)
+                while len(nodes) >= self.batch_size:
+                    await self.batch_queue.put(nodes[: self.batch_size])
+                    nodes = nodes[self.batch_size :]
+            self.node_queue.task_done()
+
+        if nodes:
+            await self.batch_queue.put(nodes)
+        for _ in range(self.embed_workers):
+            await self.batch_queue.put(_DONE)
+
+    async def _embed(self) -> None:
+        """Embed and save batches of nodes."""
+        while True:
+            batch = await self.batch_queue.get()
+            if batch is _DONE:
+                self.batch_queue.task_done()
+                return
+
+            await asyncio.to_thread(self.embedder.embed_batch, batch)
+            self.embedded_node_count += len(batch)
+            self.batch_queue.task_done()
+
+    async def _drain(self) -> None:
+        """Wait until all documents fetched so far are embedded and saved."""
+        await self.document_queue.join()
+        await self.node_queue.put(_FLUSH)
+        await self.node_queue.join()
+        await self.batch_queue.join()
+
+    async def _log_stats_periodically(self) -> None:
+        """Log the pipeline stats every `stats_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self._log_stats()
+
+    def _log_stats(self) -> None:
+        """Log the progress of each stage and the depths of the queues."""
+        depths = ", ".join(
+            f"{stage} {depth}/{self.queue_size}"
+            for stage, depth in self.get_queue_depths().items()
+        )
+        self.logger.info(
+            f"Pipeline: {self.extracted_document_count} documents extracted, "
+            f"{self.split_document_count} split, "
+            f"{self.embedded_node_count} nodes embedded. "
+            f"Queued before stage: {depths}."
+        )
+
+
+class PipelineEmbeddingOrchestratorFactory(Factory):
+    """
+    Factory for creating PipelineEmbeddingOrchestrator instances.
+
+    Creates the datasource orchestrator, splitter and embedder like the
+    basic orchestrator factory and configures the pipeline stages.
+    """
+
+    _configuration_class: Type = EmbeddingConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: EmbeddingConfiguration
+    ) -> PipelineEmbeddingOrchestrator:
+        """
+        Create a configured PipelineEmbeddingOrchestrator instance.
+
+        Args:
+            configuration: Complete embedding configuration containing
+                           datasource, splitter, embedder and pipeline
+                           specifications
+
+        Returns:
+            A configured PipelineEmbeddingOrchestrator ready for use
+
+        Raises:
+            ValueError: If splitter configuration is missing
+        """
+        basic_orchestrator = BasicEmbeddingOrchestratorFactory.create(
+            configuration
+        )
+        embedding_configuration = configuration.embedding
+        return PipelineEmbeddingOrchestrator(
+            datasource_orchestrator=basic_orchestrator.datasource_orchestrator,
+            splitter=basic_orchestrator.splitter,
+            embedder=basic_orchestrator.embedder,
+            batch_size=embedding_configuration.embedding_model.batch_size,
+            sync_mode=basic_orchestrator.sync_mode,
+            checkpoint_interval=basic_orchestrator.checkpoint_interval,
+            queue_size=embedding_configuration.pipeline_queue_size,
+            split_workers=embedding_configuration.pipeline_split_workers,
+            embed_workers=embedding_configuration.pipeline_embed_workers,
+            stats_interval=embedding_configuration.pipeline_stats_interval,
+        )
@@ -1,5 +1,7 @@
+import threading
 import uuid
-from typing import Callable, Generic, List, Type
+from collections import OrderedDict
+from typing import Callable, Generic, List, Optional, Tuple, Type
 
 from llama_index.core.node_parser import MarkdownNodeParser, SentenceSplitter
 from llama_index.core.schema import TextNode
@@ -8,7 +10,10 @@ from core import Factory
 from embedding.bootstrap.configuration.embedding_model_configuration import (
     EmbeddingModelConfiguration,
 )
-from embedding.embedding_models.registry import EmbeddingModelTokenizerRegistry
+from embedding.embedding_models.registry import (
+    EmbeddingModelTokenCounterRegistry,
+    EmbeddingModelTokenizerRegistry,
+)
 from embedding.splitters.base_splitter import BaseSplitter
 from embedding.splitters.basic_markdown.configuration import (
     BasicMarkdownSplitterConfiguration,
@@ -22,13 +27,23 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
     Splits markdown content into nodes based on document structure and
     token limits. Supports node merging and splitting to maintain
     consistent chunk sizes.
+
+    Token counts are carried alongside the nodes, so each text is tokenized
+    once. With a token counting function, the texts of a document are
+    counted in batches, which avoids building a list of tokens per text.
+    The count of merged nodes is the sum of the counts of their parts,
+    which for subword tokenizers is an upper bound of the count of the
+    merged text, so merged nodes never exceed the chunk size.
     """
 
+    TOKEN_COUNT_CACHE_SIZE = 4096
+
     def __init__(
         self,
         chunk_size_in_tokens: int,
         chunk_overlap_in_tokens: int,
         tokenize_func: Callable,
+        count_tokens_func: Optional[Callable[[List[str]], List[int]]] = None,
     ):
         """Initialize markdown splitter.
 
@@ -36,9 +51,14 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
             chunk_size_in_tokens: Maximum tokens per chunk
             chunk_overlap_in_tokens: Token overlap between chunks
             tokenize_func: Function to tokenize text for token counting
+            count_tokens_func: Function returning the token count of each
+                text of a batch, counts are taken from `tokenize_func` if None
         """
         self.chunk_size_in_tokens = chunk_size_in_tokens
         self.tokenize_func = tokenize_func
+        self.count_tokens_func = count_tokens_func
+        self._token_counts: OrderedDict[str, int] = OrderedDict()
+        self._token_counts_lock = threading.Lock()
 
         self.markdown_node_parser = MarkdownNodeParser()
         self.sentence_splitter = SentenceSplitter(
@@ -52,7 +72,9 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
 
         Split markdown document by markdown tags, then adjusts node sizes
         through splitting large nodes and merging small nodes to optimize
-        for the target chunk size.
+        for the target chunk size. Node IDs are derived from the document ID
+        and the position of the node, so splitting a document again yields
+        the nodes already stored for it.
 
         Args:
             document: Markdown document to be processed
@@ -63,14 +85,55 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
         document_nodes = self.markdown_node_parser.get_nodes_from_documents(
             [document]
         )
-        document_nodes = self._split_big_nodes(document_nodes)
-        document_nodes = self._merge_small_nodes(document_nodes)
+        sized_nodes = self._split_big_nodes(document_nodes)
+        document_nodes = self._merge_small_nodes(sized_nodes)
 
+        for i, document_node in enumerate(document_nodes):
+            document_node.id_ = str(
+                uuid.uuid5(uuid.NAMESPACE_URL, f"{document.id_}/{i}")
+            )
         return document_nodes
 
+    def _count_tokens(self, texts: List[str]) -> List[int]:
+        """Count the tokens of texts, memoized per splitter.
+
+        Counts of the least recently counted texts are dropped beyond
+        `TOKEN_COUNT_CACHE_SIZE` texts. Texts not memoized are counted in a
+        single batch.
+
+        Args:
+            texts: Texts to count the tokens of
+
+        Returns:
+            List[int]: Number of tokens of each text
+        """
+        counts = {}
+        with self._token_counts_lock:
+            for text in texts:
+                if text in self._token_counts:
+                    self._token_counts.move_to_end(text)
+                    counts[text] = self._token_counts[text]
+        missing_texts = [
+            text for text in dict.fromkeys(texts) if text not in counts
+        ]
+        if missing_texts:
+            if self.count_tokens_func:
+                missing_counts = self.count_tokens_func(missing_texts)
+            else:
+                missing_counts = [
+                    len(self.tokenize_func(text)) for text in missing_texts
+                ]
+            counts.update(zip(missing_texts, missing_counts))
+            with self._token_counts_lock:
+                self._token_counts.update(zip(missing_texts, missing_counts))
+                while len(self._token_counts) > self.TOKEN_COUNT_CACHE_SIZE:
+                    self._token_counts.popitem(last=False)
+
+        return [counts[text] for text in texts]
+
     def _split_big_nodes(
         self, document_nodes: List[TextNode]
-    ) -> List[TextNode]:
+    ) -> List[Tuple[TextNode, int]]:
         """Split oversized nodes into smaller chunks.
 
         Identifies nodes exceeding the token limit and processes them
@@ -81,19 +144,29 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
             document_nodes: Collection of nodes to process
 
         Returns:
-            List[TextNode]: Processed nodes within token size limits
+            List[Tuple[TextNode, int]]: Processed nodes within token size
+            limits with their token counts
         """
         new_document_nodes = []
+        document_node_sizes = self._count_tokens(
+            [document_node.text for document_node in document_nodes]
+        )
 
-        for document_node in document_nodes:
-            text = document_node.text
-            document_node_size = len(self.tokenize_func(text))
-
+        for document_node, document_node_size in zip(
+            document_nodes, document_node_sizes
+        ):
             if document_node_size > self.chunk_size_in_tokens:
                 document_sub_nodes = self._split_big_node(document_node)
-                new_document_nodes.extend(document_sub_nodes)
+                new_document_nodes.extend(
+                    zip(
+                        document_sub_nodes,
+                        self._count_tokens(
+                            [sub_node.text for sub_node in document_sub_nodes]
+                        ),
+                    )
+                )
             else:
-                new_document_nodes.append(document_node)
+                new_document_nodes.append((document_node, document_node_size))
 
         return new_document_nodes
 
@@ -102,7 +175,7 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
 
         Uses sentence boundary detection to create semantically meaningful
         smaller chunks from a large node, preserving metadata from the
-        original node.
+        original node. Sub-nodes get their IDs once the document is split.
 
         Args:
             document_node: Node exceeding token size limit
@@ -116,42 +189,44 @@ class BasicMarkdownSplitter(BaseSplitter, Generic[DocType]):
 
         for sub_text in sub_texts:
             sub_node = document_node.model_copy()
-            sub_node.id_ = str(uuid.uuid4())
             sub_node.text = sub_text
             sub_nodes.append(sub_node)
 
         return sub_nodes
 
     def _merge_small_nodes(
-        self, document_nodes: List[TextNode]
+        self, document_nodes: List[Tuple[TextNode, int]]
     ) -> List[TextNode]:
         """Merge adjacent small nodes into larger chunks.
 
         Combines consecutive nodes when their combined token count remains
         under the maximum limit, optimizing for fewer, larger chunks
-        while respecting token boundaries.
+        while respecting token boundaries. Token counts are added up
+        instead of tokenizing merged texts again, and texts are joined once
+        per merged node.
 
         Args:
-            document_nodes: Collection of nodes to potentially merge
+            document_nodes: Collection of nodes to potentially merge with
+                their token counts
 
         Returns:
             List[TextNode]: Optimized collection with merged nodes
         """
         new_document_nodes = []
-        current_node = document_nodes[0]
-
-        for node in document_nodes[1:]:
-            current_text = current_node.text
-            current_node_size = len(self.tokenize_func(current_text))
-            node_text = node.text
-            node_size = len(self.tokenize_func(node_text))
+        current_node, current_node_size = document_nodes[0]
+        current_texts = [current_node.text]
 
+        for node, node_size in document_nodes[1:]:
             if current_node_size + node_size <= self.chunk_size_in_tokens:
-                current_node.text += node.text
+                current_texts.append(node.text)
+                current_node_size += node_size
             else:
+                current_node.text = "".join(current_texts)
                 new_document_nodes.append(current_node)
-                current_node = node
+                current_node, current_node_size = node, node_size
+                current_texts = [node.text]
 
+        current_node.text = "".join(current_texts)
         new_document_nodes.append(current_node)
         return new_document_nodes
 
@@ -194,8 +269,13 @@ class BasicMarkdownSplitterFactory(Factory):
             configuration.provider
         ).create(configuration)
 
+        count_tokens_func = EmbeddingModelTokenCounterRegistry.get(
+            configuration.provider
+        ).create(configuration)
+
         return BasicMarkdownSplitter(
             chunk_size_in_tokens=configuration.splitter.chunk_size_in_tokens,
             chunk_overlap_in_tokens=configuration.splitter.chunk_overlap_in_tokens,
             tokenize_func=tokenizer_func,
+            count_tokens_func=count_tokens_func,
         )
@@ -0,0 +1,54 @@
+"""
+This script is the entry point for the extraction-only process.
+It extracts documents from all configured datasources and writes them to a
+snapshot, which the snapshot datasource streams back to the embedding
+process without crawling the datasources again. All documents are
+extracted regardless of the configured sync mode.
+To run the script, execute the following command from the root directory of the project:
+
+> python src/extract.py
+"""
+
+import asyncio
+import logging
+
+from core.logger import LoggerConfiguration
+from extraction.bootstrap.initializer import ExtractionInitializer
+from extraction.datasources.snapshot.writer import SnapshotWriter
+from extraction.orchestrators.registry import DatasourceOrchestratorRegistry
+
+
+async def run(
+    logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+):
+    """
+    Execute the extraction process.
+
+    Args:
+        logger: Logger instance for logging messages
+    """
+    initializer = ExtractionInitializer()
+    configuration = initializer.get_configuration()
+
+    orchestrator = DatasourceOrchestratorRegistry.get(
+        configuration.extraction.orchestrator_name
+    ).create(configuration)
+    if orchestrator.has_checkpoint():
+        logger.error(
+            "A checkpoint of an interrupted embedding process is present. "
+            "Resume it with the embedding process before extracting."
+        )
+        return
+
+    snapshot_path = configuration.extraction.snapshot_path
+    logger.info(f"Starting extraction process into {snapshot_path}.")
+    with SnapshotWriter(snapshot_path) as writer:
+        async for document in orchestrator.full_refresh_sync():
+            writer.write(document)
+    logger.info(
+        f"Extraction process finished with {writer.document_count} documents."
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
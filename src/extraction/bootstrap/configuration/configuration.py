@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, List
+from typing import Any, List, Optional
 
 from pydantic import Field, ValidationInfo, field_validator
 
@@ -15,6 +15,20 @@ class OrchestratorName(str, Enum):
     """
 
     BASIC = "basic"
+    CONCURRENT = "concurrent"
+
+
+class SyncMode(str, Enum):
+    """
+    Enum representing the available sync modes.
+
+    - FULL_REFRESH: Extracts all content on every run
+    - INCREMENTAL: Extracts only content that is new or changed since the
+      last run and propagates deletions, based on a sync state store
+    """
+
+    FULL_REFRESH = "full_refresh"
+    INCREMENTAL = "incremental"
 
 
 class _ExtractionConfiguration(BaseConfiguration):
@@ -26,6 +40,34 @@ class _ExtractionConfiguration(BaseConfiguration):
     orchestrator_name: OrchestratorName = Field(
         OrchestratorName.BASIC, description="The orchestrator name."
     )
+    sync_mode: SyncMode = Field(
+        SyncMode.FULL_REFRESH, description="The sync mode."
+    )
+    sync_state_path: str = Field(
+        "data/sync_state.sqlite",
+        description="Path of the SQLite database storing the state of incremental syncs.",
+    )
+    checkpoint_path: Optional[str] = Field(
+        None,
+        description="Path of the SQLite database storing checkpoints of full refresh runs, which an interrupted run resumes from. Checkpointing is disabled if None.",
+    )
+    checkpoint_interval: int = Field(
+        500,
+        ge=1,
+        description="Number of documents after which embedded nodes are flushed and a checkpoint is saved.",
+    )
+    snapshot_path: str = Field(
+        "data/snapshot.jsonl.gz",
+        description="Path of the snapshot of extracted documents written by `extract.py` and read back by the snapshot datasource.",
+    )
+    max_concurrent_datasources: Optional[int] = Field(
+        None,
+        description="Maximum number of datasources processed at the same time by the concurrent orchestrator. All datasources run concurrently if None.",
+    )
+    datasource_queue_size: int = Field(
+        16,
+        description="Maximum number of documents buffered per datasource by the concurrent orchestrator.",
+    )
     datasources: List[Any] = Field(
         ...,
         description="Datasources configuration. Types are dynamically validated against configurations registered in `DatasourceConfigurationRegistry`.",
@@ -17,6 +17,7 @@ class DatasourceName(str, Enum):
     - CONFLUENCE: Atlassian Confluence wiki pages and spaces
     - NOTION: Notion databases, pages, and blocks
     - PDF: PDF documents from file system or URLs
+    - SNAPSHOT: Documents written by a previous extraction-only run
     """
 
     CONFLUENCE = "confluence"
@@ -24,6 +25,35 @@ class DatasourceName(str, Enum):
     PDF = "pdf"
     BUNDESTAG = "bundestag"
     HACKERNEWS = "hackernews"
+    SNAPSHOT = "snapshot"
+
+
+class HttpCacheMode(str, Enum):
+    """
+    Modes of the on-disk HTTP response cache of datasource clients.
+
+    - OFF: Requests are sent without caching
+    - RECORD: Requests are sent, revalidating recorded responses with their
+      ETag or Last-Modified header, and successful responses are recorded
+    - REPLAY: Responses are served from the cache only, without network access
+    """
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class ProcessingExecutorType(str, Enum):
+    """
+    Pools available for parsing, cleaning and splitting source objects.
+
+    - THREAD: Thread pool, suited for parsers releasing the GIL or sharing
+      unpicklable state
+    - PROCESS: Process pool, requiring picklable parsers, cleaners and splitters
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
 
 
 # Configuration
@@ -42,6 +72,86 @@ class DatasourceConfiguration(BaseConfigurationWithSecrets, ABC):
     export_limit: Optional[int] = Field(
         None, description="The export limit for the data source."
     )
+    processing_executor: ProcessingExecutorType = Field(
+        ProcessingExecutorType.THREAD,
+        description="Pool used to parse, clean and split source objects if more than one processing worker is configured.",
+    )
+    processing_max_workers: int = Field(
+        1,
+        description="Number of workers parsing, cleaning and splitting source objects. With 1, objects are processed on the event loop.",
+    )
+    processing_max_in_flight: Optional[int] = Field(
+        None,
+        description="Maximum number of source objects being processed or waiting to be yielded. Defaults to twice the number of processing workers.",
+    )
+    processing_ordered: bool = Field(
+        True,
+        description="Whether documents are yielded in the order of their source objects or as soon as they are processed.",
+    )
+    deduplication_threshold: Optional[float] = Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="Estimated Jaccard similarity of word shingles from which a cleaned document is dropped as a near-duplicate of a previous one. Near-duplicates are kept if None.",
+    )
+    deduplication_signature_size: int = Field(
+        128,
+        ge=1,
+        le=65536,
+        description="Number of MinHash values per document signature. Larger signatures estimate the similarity more accurately.",
+    )
+    deduplication_shingle_size: int = Field(
+        5,
+        ge=1,
+        description="Number of consecutive words per shingle compared by the near-duplicate detection.",
+    )
+    deduplication_index_path: Optional[str] = Field(
+        None,
+        description="SQLite database persisting document signatures across syncs. Signatures are kept in memory for a single run if None.",
+    )
+    http_cache_mode: HttpCacheMode = Field(
+        HttpCacheMode.OFF,
+        description="Mode of the HTTP response cache of the data source client.",
+    )
+    http_cache_path: str = Field(
+        "data/http_cache",
+        description="Directory storing the HTTP responses recorded by data source clients.",
+    )
+    http_timeout: float = Field(
+        30.0,
+        gt=0.0,
+        description="Timeout in seconds for connecting to and reading from the data source API.",
+    )
+    http_max_connections_per_host: int = Field(
+        10,
+        ge=1,
+        description="Default number of keep-alive connections kept per host by data source clients.",
+    )
+    http_max_retries: int = Field(
+        3,
+        ge=0,
+        description="Maximum number of retries of requests failing with connection errors, timeouts or transient status codes.",
+    )
+    http_backoff_base: float = Field(
+        0.5,
+        ge=0.0,
+        description="Maximal delay in seconds before the first retry, doubled for every further retry. Delays are drawn uniformly up to this bound.",
+    )
+    http_backoff_max: float = Field(
+        30.0,
+        ge=0.0,
+        description="Upper bound in seconds of retry delays. Requests are not retried if the server asks to wait longer with a Retry-After header.",
+    )
+    http_circuit_breaker_threshold: Optional[int] = Field(
+        5,
+        ge=1,
+        description="Number of consecutive failed requests to a host after which further requests fail immediately. Circuit breaking is disabled if None.",
+    )
+    http_circuit_breaker_reset_timeout: float = Field(
+        30.0,
+        ge=0.0,
+        description="Number of seconds after which a single trial request is sent to a host whose circuit is open.",
+    )
 
 
 class DatasourceConfigurationRegistry(ConfigurationRegistry):
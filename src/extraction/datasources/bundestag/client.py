@@ -1,7 +1,18 @@
-from typing import Any, Iterator, Optional, Type
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
 from urllib.parse import quote
 
-from apiclient import APIClient, retry_request
+from apiclient import APIClient
 from apiclient.exceptions import ResponseParseError
 from pydantic import BaseModel, ValidationError, model_validator
 
@@ -10,6 +21,11 @@ from core.logger import LoggerConfiguration
 from extraction.datasources.bundestag.configuration import (
     BundestagMineDatasourceConfiguration,
 )
+from extraction.datasources.bundestag.speaker_cache import SpeakerCache
+from extraction.datasources.core.http_transport import HttpTransport
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class Speaker(BaseModel):
@@ -49,7 +65,7 @@ class BundestagSpeech(BaseModel):
         return self
 
 
-# TODO: eventually refactor this to use async, HTTPX and tenacity
+# TODO: eventually refactor this to use async and HTTPX
 class BundestagMineClient(APIClient):
     """
     API Client for the bundestag-mine.de API.
@@ -58,6 +74,30 @@ class BundestagMineClient(APIClient):
     BASE_URL = "https://bundestag-mine.de/api/DashboardController"
     logger = LoggerConfiguration.get_logger(__name__)
 
+    def __init__(
+        self,
+        max_workers: int = 1,
+        speaker_cache: Optional[SpeakerCache[Speaker]] = None,
+        http_transport: Optional[HttpTransport] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the BundestagMine client.
+
+        Args:
+            max_workers: Number of protocols and agenda items processed
+                concurrently by `fetch_all_speeches`, 1 crawls sequentially
+            speaker_cache: Cache used to resolve each speaker only once
+            http_transport: Transport creating the HTTP session, defaults
+                to one with retries and without cache
+        """
+        super().__init__(**kwargs)
+        self.max_workers = max(1, max_workers)
+        self.speaker_cache = speaker_cache or SpeakerCache(Speaker)
+
+        http_transport = http_transport or HttpTransport()
+        self.set_session(http_transport.create_session(self.max_workers))
+
     def safe_get(self, path: str) -> Optional[Any]:
         """
         Perform a GET request, raise for HTTP errors, parse JSON, check API status.
@@ -178,7 +218,6 @@ class BundestagMineClient(APIClient):
             )
             return None
 
-    @retry_request
     def get_speeches(
         self,
         protocol: Protocol,
@@ -225,26 +264,195 @@ class BundestagMineClient(APIClient):
                     f"Failed to validate speech: {speech}. Error: {e}"
                 )
 
-    def fetch_all_speeches(self) -> Iterator[BundestagSpeech]:
+    def get_speaker(self, speaker_id: str) -> Optional[Speaker]:
+        """
+        Resolves speaker data through the speaker cache.
+
+        Args:
+            speaker_id (str): The ID of the speaker.
+
+        Returns:
+            Optional[Speaker]: Speaker data as a Pydantic model, or None if it could not be resolved.
+        """
+        return self.speaker_cache.get_or_fetch(
+            speaker_id, self.get_speaker_data
+        )
+
+    def fetch_all_speeches(
+        self,
+        start_protocol_id: Optional[str] = None,
+        start_agenda_item_id: Optional[str] = None,
+    ) -> Iterator[BundestagSpeech]:
         """
         Fetches all speeches by iterating through protocols and their agenda items.
 
+        With `max_workers` greater than 1, agenda items of upcoming protocols and
+        speeches of upcoming agenda items are fetched concurrently while the
+        results are still yielded in protocol and agenda item order.
+
+        Args:
+            start_protocol_id (Optional[str]): ID of the protocol to start from,
+                skipping the protocols before it.
+            start_agenda_item_id (Optional[str]): ID of the agenda item of the
+                start protocol to start from, skipping the agenda items before it.
+
         Returns:
             Iterator[BundestagSpeech]: An iterator of valid speeches as Pydantic models.
         """
-        for protocol in self.get_protocols():
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="bundestag-crawler",
+            )
+            if self.max_workers > 1
+            else None
+        )
+
+        try:
+            agenda_items = self._iter_agenda_items(
+                executor, start_protocol_id, start_agenda_item_id
+            )
+            for speeches in self._map_ordered(
+                executor,
+                lambda args: self._fetch_agenda_item_speeches(*args),
+                agenda_items,
+            ):
+                yield from speeches
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self.speaker_cache.save()
+
+    def _iter_agenda_items(
+        self,
+        executor: Optional[Executor],
+        start_protocol_id: Optional[str] = None,
+        start_agenda_item_id: Optional[str] = None,
+    ) -> Iterator[tuple[Protocol, AgendaItem]]:
+        """
+        Yields all agenda items together with their protocol.
+
+        Args:
+            executor: Executor used to fetch agenda items of several protocols
+                concurrently, None to fetch them sequentially
+            start_protocol_id: ID of the protocol to start from
+            start_agenda_item_id: ID of the agenda item of the start protocol
+                to start from
+
+        Returns:
+            Iterator[tuple[Protocol, AgendaItem]]: Agenda items in protocol order.
+        """
+        protocols = self._skip_to(
+            list(self.get_protocols()), start_protocol_id, "protocol"
+        )
+        for protocol, agenda_items in self._map_ordered(
+            executor,
+            lambda protocol: (
+                protocol,
+                list(self.get_agenda_items(protocol.id)),
+            ),
+            protocols,
+        ):
             self.logger.info(f"Processing protocol {protocol.id}")
+            if protocol.id == start_protocol_id:
+                agenda_items = self._skip_to(
+                    agenda_items, start_agenda_item_id, "agenda item"
+                )
+            for agenda_item in agenda_items:
+                yield protocol, agenda_item
+
+    def _skip_to(
+        self,
+        items: List[Any],
+        start_id: Optional[str],
+        item_type: str,
+    ) -> List[Any]:
+        """
+        Drops the items before the one with the given ID.
+
+        Args:
+            items: Protocols or agenda items
+            start_id: ID of the item to start from, None to keep all items
+            item_type: Name of the item type used in log messages
+
+        Returns:
+            List[Any]: Items from the start item on, all items if it is not found.
+        """
+        if start_id is None:
+            return items
+
+        for i, item in enumerate(items):
+            if item.id == start_id:
+                return items[i:]
+
+        self.logger.warning(
+            f"Start {item_type} {start_id} not found, starting from the first one."
+        )
+        return items
+
+    def _fetch_agenda_item_speeches(
+        self, protocol: Protocol, agenda_item: AgendaItem
+    ) -> List[BundestagSpeech]:
+        """
+        Fetches speeches of an agenda item and attaches their speakers.
+
+        Speeches whose speaker cannot be resolved are skipped.
+
+        Args:
+            protocol (Protocol): The protocol of the agenda item.
+            agenda_item (AgendaItem): The agenda item.
+
+        Returns:
+            List[BundestagSpeech]: Speeches with speaker data.
+        """
+        speeches = []
+        for speech in self.get_speeches(
+            protocol=protocol,
+            agenda_item=agenda_item,
+        ):
+            speaker = self.get_speaker(speech.speakerId)
+            if speaker:
+                speech.speaker = speaker
+                speeches.append(speech)
+        return speeches
+
+    def _map_ordered(
+        self,
+        executor: Optional[Executor],
+        func: Callable[[T], R],
+        items: Iterable[T],
+    ) -> Iterator[R]:
+        """
+        Applies `func` to `items` keeping a bounded window of tasks in flight.
+
+        Results are yielded in input order. The input iterable is only advanced
+        as the window frees up, so the crawl never runs far ahead of the consumer.
+
+        Args:
+            executor: Executor running the tasks, None to run them inline
+            func: Function applied to every item
+            items: Input items
+
+        Returns:
+            Iterator[R]: Results in input order.
+        """
+        if executor is None:
+            yield from map(func, items)
+            return
 
-            for agenda_item in self.get_agenda_items(protocol.id):
+        window = deque()
+        items = iter(items)
+        for item in items:
+            window.append(executor.submit(func, item))
+            if len(window) >= self.max_workers:
+                break
 
-                for speech in self.get_speeches(
-                    protocol=protocol,
-                    agenda_item=agenda_item,
-                ):
-                    speaker = self.get_speaker_data(speech.speakerId)
-                    if speaker:
-                        speech.speaker = speaker
-                        yield speech
+        while window:
+            result = window.popleft().result()
+            for item in items:
+                window.append(executor.submit(func, item))
+                break
+            yield result
 
 
 class BundestagMineClientFactory(SingletonFactory):
@@ -270,4 +478,13 @@ class BundestagMineClientFactory(SingletonFactory):
         Returns:
             A configured BundestagMine client instance ready for API interactions.
         """
-        return BundestagMineClient()
+        speaker_cache = SpeakerCache(
+            Speaker,
+            max_size=configuration.speaker_cache_size,
+            path=configuration.speaker_cache_path,
+        )
+        return BundestagMineClient(
+            max_workers=configuration.max_workers,
+            speaker_cache=speaker_cache,
+            http_transport=HttpTransport.from_configuration(configuration),
+        )
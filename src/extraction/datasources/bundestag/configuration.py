@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field
 
@@ -13,3 +13,15 @@ class BundestagMineDatasourceConfiguration(DatasourceConfiguration):
         ...,
         description="Identifier specifying this configuration is for the Bundestag datasource",
     )
+    max_workers: int = Field(
+        4,
+        description="Number of protocols and agenda items crawled concurrently, 1 crawls sequentially",
+    )
+    speaker_cache_size: int = Field(
+        4096,
+        description="Maximum number of speakers kept in the in-memory cache",
+    )
+    speaker_cache_path: Optional[str] = Field(
+        None,
+        description="Path of the JSON file persisting resolved speakers between runs. If not set, speakers are only cached in memory",
+    )
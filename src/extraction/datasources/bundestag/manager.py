@@ -10,7 +10,9 @@ from extraction.datasources.bundestag.parser import (
 from extraction.datasources.bundestag.reader import (
     BundestagMineDatasourceReaderFactory,
 )
+from extraction.datasources.core.deduplication import Deduplicator
 from extraction.datasources.core.manager import BasicDatasourceManager
+from extraction.datasources.core.processing import ProcessingStage
 
 
 class BundestagMineDatasourceManagerFactory(Factory):
@@ -46,4 +48,6 @@ class BundestagMineDatasourceManagerFactory(Factory):
             configuration=configuration,
             reader=reader,
             parser=parser,
+            processing_stage=ProcessingStage.from_configuration(configuration),
+            deduplicator=Deduplicator.from_configuration(configuration),
         )
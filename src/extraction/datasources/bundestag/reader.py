@@ -1,11 +1,13 @@
+import asyncio
 import logging
-from typing import AsyncIterator
+from typing import AsyncIterator, Dict, Iterator, Optional, Set
 
 from core import Factory
 from core.logger import LoggerConfiguration
 from extraction.datasources.bundestag.client import (
     BundestagMineClient,
     BundestagMineClientFactory,
+    BundestagSpeech,
 )
 from extraction.datasources.bundestag.configuration import (
     BundestagMineDatasourceConfiguration,
@@ -16,7 +18,9 @@ from extraction.datasources.core.reader import BaseReader
 class BundestagMineDatasourceReader(BaseReader):
     """Reader for extracting speeches from the BundestagMine API.
 
-    Implements document extraction from the Bundestag speeches.
+    Implements document extraction from the Bundestag speeches. The cursor
+    of the reader holds the protocol and agenda item of the last read speech,
+    so a resumed read starts from that agenda item.
     """
 
     def __init__(
@@ -36,6 +40,8 @@ class BundestagMineDatasourceReader(BaseReader):
         self.export_limit = configuration.export_limit
         self.client = client
         self.logger = logger
+        self.last_speech: Optional[BundestagSpeech] = None
+        self.resumed_cursor: Optional[Dict[str, str]] = None
 
     async def read_all_async(
         self,
@@ -43,6 +49,8 @@ class BundestagMineDatasourceReader(BaseReader):
         """Asynchronously fetch all speeches from BundestagMine.
 
         Yields each speech as a dictionary containing its content and metadata.
+        The client fetches speeches with blocking requests, so it is advanced
+        and closed in a worker thread to keep the event loop responsive.
 
         Returns:
             AsyncIterator[dict]: An async iterator of page dictionaries containing
@@ -51,18 +59,104 @@ class BundestagMineDatasourceReader(BaseReader):
         self.logger.info(
             f"Reading speeches from BundestagMine with limit {self.export_limit}"
         )
-        speech_iterator = self.client.fetch_all_speeches()
+        start = self.resumed_cursor or {}
+        self.resumed_cursor = None
+        speech_iterator = iter(
+            self.client.fetch_all_speeches(
+                start_protocol_id=start.get("protocol_id"),
+                start_agenda_item_id=start.get("agenda_item_id"),
+            )
+        )
         yield_counter = 0
+        next_speech: Optional[asyncio.Future] = None
+
+        try:
+            while True:
+                next_speech = asyncio.ensure_future(
+                    asyncio.to_thread(next, speech_iterator, None)
+                )
+                speech = await asyncio.shield(next_speech)
+                next_speech = None
+                if speech is None:
+                    return
+                if self._limit_reached(yield_counter, self.export_limit):
+                    return
+
+                self.logger.info(
+                    f"Fetched Bundestag speech {yield_counter}/{self.export_limit}."
+                )
+                yield_counter += 1
+                self.last_speech = speech
+                yield speech
+        finally:
+            await self._close_speech_iterator(speech_iterator, next_speech)
+
+    @staticmethod
+    async def _close_speech_iterator(
+        speech_iterator: Iterator[BundestagSpeech],
+        next_speech: Optional[asyncio.Future],
+    ) -> None:
+        """Close the speech iterator of the client in a worker thread.
+
+        Closing runs the cleanup of the client, which waits for in-flight
+        requests and saves the speaker cache. A speech still being fetched
+        by a cancelled read is awaited first, as a running generator
+        cannot be closed.
 
-        for speech in speech_iterator:
-            if self._limit_reached(yield_counter, self.export_limit):
-                return
+        Args:
+            speech_iterator: Iterator of the speeches fetched by the client
+            next_speech: Fetch of the next speech still running, if any
+        """
+        if next_speech is not None:
+            await asyncio.wait([next_speech])
+            if not next_speech.cancelled():
+                next_speech.exception()
 
-            self.logger.info(
-                f"Fetched Bundestag speech {yield_counter}/{self.export_limit}."
-            )
-            yield_counter += 1
-            yield speech
+        close = getattr(speech_iterator, "close", None)
+        if close is not None:
+            await asyncio.to_thread(close)
+
+    def get_object_id(self, speech: BundestagSpeech) -> str:
+        """Identify a Bundestag speech by its ID.
+
+        Args:
+            speech: Bundestag speech
+
+        Returns:
+            str: ID of the speech
+        """
+        return speech.id
+
+    def get_checkpoint(self) -> Optional[Dict[str, str]]:
+        """Get the protocol and agenda item of the last read speech.
+
+        Returns:
+            Optional[Dict[str, str]]: IDs of the protocol and agenda item,
+            None if no speech was read
+        """
+        if self.last_speech is None:
+            return None
+        return {
+            "protocol_id": self.last_speech.protocol.id,
+            "agenda_item_id": self.last_speech.agendaItem.id,
+        }
+
+    def resume(
+        self,
+        cursor: Optional[Dict[str, str]],
+        processed_object_ids: Set[str],
+    ) -> None:
+        """Start the next read from the agenda item of the last read speech.
+
+        Speeches of that agenda item processed before the interruption are
+        read again and skipped by the manager.
+
+        Args:
+            cursor: Protocol and agenda item of the last read speech
+            processed_object_ids: IDs of the speeches processed before the
+                interruption
+        """
+        self.resumed_cursor = cursor
 
 
 class BundestagMineDatasourceReaderFactory(Factory):
@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from core.logger import LoggerConfiguration
+
+SpeakerT = TypeVar("SpeakerT", bound=BaseModel)
+
+
+class SpeakerCache(Generic[SpeakerT]):
+    """
+    Thread-safe cache of Bundestag speakers.
+
+    Speakers are kept in an in-process LRU and, if a path is given, in an
+    on-disk JSON store that survives between runs. Concurrent lookups of the
+    same speaker ID are coalesced so each ID is fetched at most once.
+    """
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(
+        self,
+        speaker_class: Type[SpeakerT],
+        max_size: int = 4096,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize the speaker cache.
+
+        Args:
+            speaker_class: Pydantic model used to restore speakers from disk
+            max_size: Maximum number of speakers kept in memory
+            path: Optional path of the JSON file used as on-disk store
+        """
+        self.speaker_class = speaker_class
+        self.max_size = max_size
+        self.path = path
+        self._memory: "OrderedDict[str, Optional[SpeakerT]]" = OrderedDict()
+        self._disk: Dict[str, dict] = self._load_disk_store()
+        self._disk_dirty = False
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def get_or_fetch(
+        self,
+        speaker_id: str,
+        fetch: Callable[[str], Optional[SpeakerT]],
+    ) -> Optional[SpeakerT]:
+        """
+        Return the cached speaker or resolve it with `fetch`.
+
+        Failed lookups are remembered in memory for the lifetime of the cache,
+        but are not persisted to disk.
+
+        Args:
+            speaker_id: The ID of the speaker
+            fetch: Callable fetching the speaker on a cache miss
+
+        Returns:
+            Optional[SpeakerT]: The speaker or None if it could not be resolved
+        """
+        found, speaker = self._get(speaker_id)
+        if found:
+            return speaker
+
+        with self._get_key_lock(speaker_id):
+            found, speaker = self._get(speaker_id)
+            if found:
+                return speaker
+
+            speaker = fetch(speaker_id)
+            self._put(speaker_id, speaker)
+
+        with self._lock:
+            self._key_locks.pop(speaker_id, None)
+
+        return speaker
+
+    def save(self) -> None:
+        """
+        Persist speakers fetched since the last save to the on-disk store.
+        """
+        if not self.path:
+            return
+
+        with self._lock:
+            if not self._disk_dirty:
+                return
+            data = dict(self._disk)
+            self._disk_dirty = False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+        self.logger.debug(f"Saved {len(data)} speakers to {self.path}")
+
+    def _get(self, speaker_id: str) -> tuple[bool, Optional[SpeakerT]]:
+        with self._lock:
+            if speaker_id in self._memory:
+                self._memory.move_to_end(speaker_id)
+                return True, self._memory[speaker_id]
+
+            speaker_data = self._disk.get(speaker_id)
+
+        if speaker_data is None:
+            return False, None
+
+        try:
+            speaker = self.speaker_class.model_validate(speaker_data)
+        except ValidationError:
+            return False, None
+
+        self._put(speaker_id, speaker, persist=False)
+        return True, speaker
+
+    def _put(
+        self,
+        speaker_id: str,
+        speaker: Optional[SpeakerT],
+        persist: bool = True,
+    ) -> None:
+        with self._lock:
+            self._memory[speaker_id] = speaker
+            self._memory.move_to_end(speaker_id)
+            while len(self._memory) > self.max_size:
+                self._memory.popitem(last=False)
+
+            if persist and self.path and speaker is not None:
+                self._disk[speaker_id] = speaker.model_dump()
+                self._disk_dirty = True
+
+    def _get_key_lock(self, speaker_id: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(speaker_id, threading.Lock())
+
+    def _load_disk_store(self) -> Dict[str, dict]:
+        if not self.path or not os.path.isfile(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"Failed to load speaker cache from {self.path}: {e}"
+            )
+            return {}
+
+        if not isinstance(data, dict):
+            self.logger.warning(f"Ignoring malformed speaker cache {self.path}")
+            return {}
+
+        return data
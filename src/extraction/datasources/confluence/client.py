@@ -6,6 +6,7 @@ from core import SingletonFactory
 from extraction.datasources.confluence.configuration import (
     ConfluenceDatasourceConfiguration,
 )
+from extraction.datasources.core.http_transport import HttpTransport
 
 
 class ConfluenceClientFactory(SingletonFactory):
@@ -29,11 +30,25 @@ class ConfluenceClientFactory(SingletonFactory):
             configuration: Configuration object containing Confluence connection details
                           including base URL, username, and password.
 
+        The connection pool is sized to the reader's worker count, so that
+        concurrently read spaces do not wait for free connections. Failed
+        requests are retried by the shared HTTP transport and responses go
+        through the HTTP cache if one is configured.
+
         Returns:
             A configured Confluence client instance ready for API interactions.
         """
+        session = HttpTransport.from_configuration(
+            configuration
+        ).create_session(
+            max(
+                configuration.max_workers,
+                configuration.http_max_connections_per_host,
+            )
+        )
         return Confluence(
             url=configuration.base_url,
             username=configuration.secrets.username.get_secret_value(),
             password=configuration.secrets.password.get_secret_value(),
+            session=session,
         )
@@ -39,6 +39,18 @@ class ConfluenceDatasourceConfiguration(DatasourceConfiguration):
         ...,
         description="Identifier specifying this configuration is for a Confluence datasource",
     )
+    max_workers: int = Field(
+        4,
+        description="Number of Confluence spaces whose pages are fetched concurrently",
+    )
+    page_size: int = Field(
+        50,
+        description="Number of spaces or pages requested per Confluence API call",
+    )
+    parser_max_workers: int = Field(
+        1,
+        description="Number of worker threads converting Confluence HTML to markdown off the event loop",
+    )
     secrets: Secrets = Field(
         None,
         description="Authentication credentials required to access the Confluence instance",
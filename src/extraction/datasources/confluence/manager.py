@@ -10,7 +10,9 @@ from extraction.datasources.confluence.parser import (
 from extraction.datasources.confluence.reader import (
     ConfluenceDatasourceReaderFactory,
 )
+from extraction.datasources.core.deduplication import Deduplicator
 from extraction.datasources.core.manager import BasicDatasourceManager
+from extraction.datasources.core.processing import ProcessingStage
 
 
 class ConfluenceDatasourceManagerFactory(Factory):
@@ -47,4 +49,10 @@ class ConfluenceDatasourceManagerFactory(Factory):
         """
         reader = ConfluenceDatasourceReaderFactory.create(configuration)
         parser = ConfluenceDatasourceParserFactory.create(configuration)
-        return BasicDatasourceManager(configuration, reader, parser)
+        return BasicDatasourceManager(
+            configuration=configuration,
+            reader=reader,
+            parser=parser,
+            processing_stage=ProcessingStage.from_configuration(configuration),
+            deduplicator=Deduplicator.from_configuration(configuration),
+        )
@@ -1,7 +1,7 @@
-import tempfile
-from typing import Type
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional, Type
 
-from markitdown import MarkItDown
+from markitdown.converters import HtmlConverter
 
 from core import Factory
 from extraction.datasources.confluence.configuration import (
@@ -13,20 +13,38 @@ from extraction.datasources.core.parser import BaseParser
 
 
 class ConfluenceDatasourceParser(BaseParser[ConfluenceDocument]):
+    """Parser converting the HTML body of Confluence pages to markdown.
+
+    The executor is not pickled, so a parser sent to a process pool parses
+    inline in the worker process.
+    """
 
     def __init__(
         self,
         configuration: ConfluenceDatasourceConfiguration,
-        parser: MarkItDown = MarkItDown(),
+        parser: HtmlConverter = HtmlConverter(),
+        executor: Optional[Executor] = None,
     ):
         """Initialize the Confluence parser with the provided configuration.
 
         Args:
             configuration: Configuration object containing Confluence connection details
-            parser: MarkItDown instance for converting HTML to markdown
+            parser: MarkItDown HTML converter for converting HTML to markdown
+            executor: Executor running the conversion off the event loop
         """
         self.configuration = configuration
         self.parser = parser
+        self.executor = executor
+
+    def __getstate__(self) -> dict:
+        """Get the state of the parser without its executor.
+
+        Returns:
+            dict: Attributes of the parser
+        """
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
 
     def parse(self, page: ConfluencePage) -> ConfluenceDocument:
         """Parse a Confluence page into a document.
@@ -42,8 +60,8 @@ class ConfluenceDatasourceParser(BaseParser[ConfluenceDocument]):
         return ConfluenceDocument(text=markdown, metadata=metadata)
 
     def _get_page_markdown(self, page: ConfluencePage) -> str:
-        """Extract markdown content from a Confluence page. Because of MarkItDown,
-        we need to write the HTML content to a temporary file and then convert it to markdown.
+        """Extract markdown content from a Confluence page. The HTML body is
+        converted in memory.
 
         Args:
             page: Confluence page details
@@ -55,12 +73,7 @@ class ConfluenceDatasourceParser(BaseParser[ConfluenceDocument]):
         if not html_content:
             return ""
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".html") as temp_file:
-            temp_file.write(html_content)
-            temp_file.flush()
-            return self.parser.convert(
-                temp_file.name, file_extension=".html"
-            ).text_content
+        return self.parser.convert_string(html_content).markdown
 
     @staticmethod
     def _extract_metadata(page: ConfluencePage, base_url: str) -> dict:
@@ -97,10 +110,22 @@ class ConfluenceDatasourceParserFactory(Factory):
     ) -> ConfluenceDatasourceParser:
         """Creates a Confluence parser instance.
 
+        The parser gets an executor only if pages are not parsed in a
+        processing stage, which runs the conversion off the event loop itself.
+
         Args:
             configuration: Configuration object containing Confluence connection details
 
         Returns:
             ConfluenceDatasourceParser: Configured Confluence parser instance
         """
-        return ConfluenceDatasourceParser(configuration)
+        if configuration.processing_max_workers > 1:
+            return ConfluenceDatasourceParser(configuration)
+
+        return ConfluenceDatasourceParser(
+            configuration,
+            executor=ThreadPoolExecutor(
+                max_workers=configuration.parser_max_workers,
+                thread_name_prefix="confluence-parser",
+            ),
+        )
@@ -1,5 +1,15 @@
+import asyncio
 import logging
-from typing import AsyncIterator, Dict, Iterator
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from atlassian import Confluence
 from pydantic import BaseModel, Field
@@ -54,7 +64,10 @@ class ConfluenceDatasourceReader(BaseReader):
     """Reader for extracting documents from Confluence spaces.
 
     Implements document extraction from Confluence spaces, handling pagination
-    and export limits.
+    and export limits. The cursor of the reader holds the completed spaces and
+    the number of pages read from every other space, pages of a space being
+    read in order. Pages added to or removed from a space before the cursor
+    shift the pages read after resuming.
     """
 
     def __init__(
@@ -72,8 +85,13 @@ class ConfluenceDatasourceReader(BaseReader):
         """
         super().__init__()
         self.export_limit = configuration.export_limit
+        self.max_workers = configuration.max_workers
+        self.page_size = configuration.page_size
         self.client = client
         self.logger = logger
+        self.completed_spaces: Set[str] = set()
+        self.space_offsets: Dict[str, int] = {}
+        self.listing_failed = False
 
     async def read_all_async(
         self,
@@ -81,7 +99,9 @@ class ConfluenceDatasourceReader(BaseReader):
         """Asynchronously fetch all documents from Confluence.
 
         Retrieves pages from all global spaces in Confluence, respecting the export limit.
-        Yields each page as a ConfluencePage containing its content and metadata.
+        Up to `max_workers` spaces are read concurrently and their pages are merged
+        into a single stream in the order they arrive. Spaces whose pages cannot
+        be fetched are skipped, making the listing incomplete.
 
         Returns:
             AsyncIterator[ConfluencePage]: An async iterator of Confluence pages.
@@ -89,60 +109,205 @@ class ConfluenceDatasourceReader(BaseReader):
         self.logger.info(
             f"Reading pages from Confluence with limit {self.export_limit}"
         )
-        response = self.client.get_all_spaces(space_type="global")
-        spaces = [Space.model_validate(space) for space in response["results"]]
+        self.listing_failed = False
+        spaces = [
+            space
+            for space in await asyncio.to_thread(self._get_all_spaces)
+            if space.key not in self.completed_spaces
+        ]
+        if not spaces:
+            return
+
+        queue = asyncio.Queue(maxsize=self.max_workers * self.page_size)
+        spaces_iterator = iter(spaces)
+        workers = [
+            asyncio.create_task(self._read_spaces(spaces_iterator, queue))
+            for _ in range(min(self.max_workers, len(spaces)))
+        ]
+        running_workers = len(workers)
         yield_counter = 0
 
-        for space in spaces:
-            for page in self._get_all_pages(space.key):
+        try:
+            while running_workers:
+                item = await queue.get()
+                if item is None:
+                    running_workers -= 1
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+
+                space_key, page = item
+                if page is None:
+                    self.completed_spaces.add(space_key)
+                    self.space_offsets.pop(space_key, None)
+                    continue
+
                 if self._limit_reached(yield_counter, self.export_limit):
                     return
 
                 self.logger.info(
                     f"Fetched Confluence page {yield_counter}/{self.export_limit}."
                 )
+                self.space_offsets[space_key] = (
+                    self.space_offsets.get(space_key, 0) + 1
+                )
                 yield_counter += 1
                 yield page
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-    def _get_all_pages(self, space: str) -> Iterator[ConfluencePage]:
-        """Fetch all pages from a specific Confluence space.
+    def get_object_id(self, page: ConfluencePage) -> str:
+        """Identify a Confluence page by its ID.
 
-        Handles pagination internally to retrieve all pages from the specified space,
-        up to the optional limit. Pages include body content and update history.
+        Args:
+            page: Confluence page
+
+        Returns:
+            str: ID of the page
+        """
+        return page.id
+
+    def get_object_fingerprint(self, page: ConfluencePage) -> str:
+        """Fingerprint a Confluence page by the time of its last update.
 
         Args:
-            space: Space key to fetch pages from
-            limit: Maximum number of pages to fetch (None for unlimited)
+            page: Confluence page
 
         Returns:
-            Iterator[ConfluencePage]: Iterator of Confluence pages with content and metadata
+            str: Timestamp of the last update of the page
         """
-        start = 0
-        params = {
-            "space": space,
-            "start": start,
-            "status": None,
-            "expand": "body.view,history.lastUpdated",
+        return page.history.lastUpdated.when
+
+    def lists_all_objects(self) -> bool:
+        """Check whether all pages were yielded by the last read.
+
+        Returns:
+            bool: False if pages of a space could not be fetched
+        """
+        return not self.listing_failed
+
+    def get_checkpoint(self) -> Dict[str, Any]:
+        """Get the spaces and pages read so far.
+
+        Returns:
+            Dict[str, Any]: Keys of the completed spaces and number of pages
+            read from every other space
+        """
+        return {
+            "completed_spaces": sorted(self.completed_spaces),
+            "space_offsets": dict(self.space_offsets),
         }
 
+    def resume(
+        self,
+        cursor: Optional[Dict[str, Any]],
+        processed_object_ids: Set[str],
+    ) -> None:
+        """Skip the completed spaces and pages read before an interruption.
+
+        Args:
+            cursor: Cursor returned by `get_checkpoint`
+            processed_object_ids: IDs of the pages processed before the
+                interruption, skipped by the manager
+        """
+        if cursor is None:
+            return
+        self.completed_spaces = set(cursor["completed_spaces"])
+        self.space_offsets = dict(cursor["space_offsets"])
+
+    async def _read_spaces(
+        self, spaces: Iterator[Space], queue: asyncio.Queue
+    ) -> None:
+        """Read pages of spaces taken from a shared iterator into a queue.
+
+        Blocking API calls run in worker threads. Pages are put into the queue
+        together with the key of their space, followed by the key and None once
+        the space is completed. Unexpected errors are put into the queue so that
+        the consumer can re-raise them. Puts None into the queue once the worker
+        is done.
+
+        Args:
+            spaces: Iterator of spaces shared by all workers
+            queue: Queue receiving the fetched pages
+        """
         try:
-            while True:
-                pages_raw = self.client.get_all_pages_from_space(**params)
-                pages = [
-                    ConfluencePage.model_validate(page) for page in pages_raw
-                ]
-                if not pages:
-                    return
+            for space in spaces:
+                start = self.space_offsets.get(space.key, 0)
+                while start is not None:
+                    pages, start = await asyncio.to_thread(
+                        self._get_pages_batch, space.key, start
+                    )
+                    for page in pages:
+                        await queue.put((space.key, page))
+                await queue.put((space.key, None))
+        except Exception as e:
+            await queue.put(e)
+        await queue.put(None)
+
+    def _get_all_spaces(self) -> List[Space]:
+        """Fetch all global spaces from Confluence.
+
+        Handles pagination internally to retrieve every page of spaces.
+
+        Returns:
+            List[Space]: All global spaces
+        """
+        spaces = []
+        start = 0
+
+        while True:
+            response = self.client.get_all_spaces(
+                start=start, limit=self.page_size, space_type="global"
+            )
+            results = response.get("results", [])
+            spaces.extend(Space.model_validate(space) for space in results)
 
-                for page in pages:
-                    yield page
+            # Confluence may cap the requested limit, so only an empty batch or
+            # a missing next link marks the last batch of spaces
+            links = response.get("_links")
+            if not results or (links is not None and "next" not in links):
+                break
+            start += len(results)
 
-                start += len(pages)
-                params["start"] = start
+        self.logger.info(f"Found {len(spaces)} Confluence spaces.")
+        return spaces
+
+    def _get_pages_batch(
+        self, space: str, start: int
+    ) -> Tuple[List[ConfluencePage], Optional[int]]:
+        """Fetch a single batch of pages from a specific Confluence space.
+
+        Args:
+            space: Space key to fetch pages from
+            start: Offset of the first page of the batch
+
+        Returns:
+            Tuple containing:
+                - Pages of the batch
+                - Offset of the next batch, None if the space is exhausted
+        """
+        try:
+            pages_raw = self.client.get_all_pages_from_space(
+                space=space,
+                start=start,
+                limit=self.page_size,
+                status=None,
+                expand="body.view,history.lastUpdated",
+            )
         except HTTPError as e:
             self.logger.warning(
                 f"Error while fetching Confluence pages from {space}: {e}"
             )
+            self.listing_failed = True
+            return [], None
+
+        pages = [ConfluencePage.model_validate(page) for page in pages_raw]
+        if not pages:
+            return pages, None
+
+        return pages, start + len(pages)
 
 
 class ConfluenceDatasourceReaderFactory(Factory):
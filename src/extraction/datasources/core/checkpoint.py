@@ -0,0 +1,250 @@
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from core.logger import LoggerConfiguration
+from extraction.bootstrap.configuration.configuration import (
+    ExtractionConfiguration,
+)
+
+
+class Checkpoint(NamedTuple):
+    """Progress of a datasource recorded by an interrupted run."""
+
+    cursor: Optional[Dict[str, Any]]
+    object_ids: Set[str]
+
+
+class CheckpointProgress(NamedTuple):
+    """Snapshot of the progress of a datasource within a run."""
+
+    source: str
+    object_count: int
+    cursor: Optional[Dict[str, Any]]
+
+
+class CheckpointStore:
+    """Persistent checkpoints of full refresh runs backed by SQLite.
+
+    Records per datasource the cursor of its reader and the IDs of the
+    source objects whose documents are persisted, so an interrupted run can
+    resume where it stopped. Checkpoints are kept in their own database, as
+    they are committed while a run is in progress, and are cleared once the
+    run is finished.
+    """
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(self, path: str):
+        """Initialize the store, creating the database if it does not exist.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                source TEXT PRIMARY KEY,
+                cursor TEXT
+            );
+            CREATE TABLE IF NOT EXISTS checkpoint_objects (
+                source TEXT NOT NULL,
+                object_id TEXT NOT NULL,
+                PRIMARY KEY (source, object_id)
+            );
+            """
+        )
+        self._connection.commit()
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: ExtractionConfiguration
+    ) -> Optional["CheckpointStore"]:
+        """Open the checkpoint store of the extraction.
+
+        Args:
+            configuration: Settings for extraction process configuration
+
+        Returns:
+            Optional[CheckpointStore]: The store or None if checkpointing
+            is disabled
+        """
+        if configuration.extraction.checkpoint_path is None:
+            return None
+        return cls(configuration.extraction.checkpoint_path)
+
+    def has_checkpoints(self) -> bool:
+        """Check whether an interrupted run left checkpoints behind.
+
+        Returns:
+            bool: True if any datasource has a checkpoint
+        """
+        row = self._connection.execute(
+            "SELECT 1 FROM checkpoints LIMIT 1"
+        ).fetchone()
+        return row is not None
+
+    def load(self, source: str) -> Checkpoint:
+        """Load the checkpoint of a datasource.
+
+        Args:
+            source: Key of the datasource
+
+        Returns:
+            Checkpoint: The checkpoint, without cursor and object IDs if the
+            datasource has none
+        """
+        row = self._connection.execute(
+            "SELECT cursor FROM checkpoints WHERE source = ?", (source,)
+        ).fetchone()
+        object_ids = {
+            object_id
+            for (object_id,) in self._connection.execute(
+                "SELECT object_id FROM checkpoint_objects WHERE source = ?",
+                (source,),
+            )
+        }
+        cursor = json.loads(row[0]) if row and row[0] else None
+        if row:
+            self.logger.info(
+                f"Resuming {source} after {len(object_ids)} processed objects."
+            )
+        return Checkpoint(cursor=cursor, object_ids=object_ids)
+
+    def save(
+        self,
+        source: str,
+        cursor: Optional[Dict[str, Any]],
+        object_ids: Iterable[str],
+    ) -> None:
+        """Record the progress of a datasource.
+
+        Args:
+            source: Key of the datasource
+            cursor: Reader cursor to resume from
+            object_ids: IDs of objects processed since the previous save
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO checkpoints (source, cursor) VALUES (?, ?)",
+            (source, json.dumps(cursor) if cursor is not None else None),
+        )
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO checkpoint_objects (source, object_id) "
+            "VALUES (?, ?)",
+            [(source, object_id) for object_id in object_ids],
+        )
+
+    def clear(self) -> None:
+        """Remove the checkpoints of all datasources."""
+        self._connection.execute("DELETE FROM checkpoints")
+        self._connection.execute("DELETE FROM checkpoint_objects")
+
+    def commit(self) -> None:
+        """Persist all changes since the last commit."""
+        self._connection.commit()
+        self.logger.debug(f"Committed checkpoints to {self.path}")
+
+    def close(self) -> None:
+        """Close the database connection, discarding uncommitted changes."""
+        self._connection.close()
+
+
+class CheckpointTracker:
+    """Progress of a datasource within a checkpointed run.
+
+    The manager starts every object read from the reader together with the
+    reader cursor after it and completes it before yielding its last
+    document. Objects may complete out of order, so the cursor only advances
+    past objects read before all incomplete ones. Objects processed by the
+    interrupted run are skipped.
+    """
+
+    def __init__(self, source: str, checkpoint: Checkpoint):
+        """Initialize the tracker.
+
+        Args:
+            source: Key of the datasource
+            checkpoint: Checkpoint of the interrupted run to resume from
+        """
+        self.source = source
+        self.cursor = checkpoint.cursor
+        self.processed_object_ids = checkpoint.object_ids
+        self.completed_object_ids: List[str] = []
+        self._started: Dict[int, tuple] = {}
+        self._completed: Set[int] = set()
+        self._next_token = 0
+        self._next_uncompleted_token = 0
+
+    def is_processed(self, object_id: Optional[str]) -> bool:
+        """Check whether the interrupted run processed an object.
+
+        Args:
+            object_id: ID of the object
+
+        Returns:
+            bool: True if the documents of the object are persisted
+        """
+        return object_id is not None and object_id in self.processed_object_ids
+
+    def start(
+        self, object_id: Optional[str], cursor: Optional[Dict[str, Any]]
+    ) -> int:
+        """Start tracking an object read from the reader.
+
+        Args:
+            object_id: ID of the object, None if the reader cannot identify it
+            cursor: Reader cursor after the object
+
+        Returns:
+            int: Token completing the object
+        """
+        token = self._next_token
+        self._next_token += 1
+        self._started[token] = (object_id, cursor)
+        return token
+
+    def get_object_id(self, token: int) -> Optional[str]:
+        """Get the ID of a started object.
+
+        Args:
+            token: Token returned by `start`
+
+        Returns:
+            Optional[str]: ID of the object
+        """
+        return self._started[token][0]
+
+    def complete(self, token: int) -> None:
+        """Mark an object as processed once all its documents are yielded.
+
+        Args:
+            token: Token returned by `start`
+        """
+        object_id, _ = self._started[token]
+        if object_id is not None:
+            self.completed_object_ids.append(object_id)
+        self._completed.add(token)
+
+        while self._next_uncompleted_token in self._completed:
+            self._completed.remove(self._next_uncompleted_token)
+            _, cursor = self._started.pop(self._next_uncompleted_token)
+            if cursor is not None:
+                self.cursor = cursor
+            self._next_uncompleted_token += 1
+
+    def get_progress(self) -> CheckpointProgress:
+        """Take a snapshot of the progress.
+
+        Returns:
+            CheckpointProgress: Number of completed objects and cursor
+        """
+        return CheckpointProgress(
+            self.source, len(self.completed_object_ids), self.cursor
+        )
@@ -0,0 +1,363 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from array import array
+from typing import List, Optional, Set, Tuple
+
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceConfiguration,
+)
+
+
+class MinHasher:
+    """MinHash signatures of document texts.
+
+    Texts are split into lowercased word shingles, and a single hash of each
+    shingle both assigns it to one of the signature positions and orders it
+    within that position (one permutation hashing). The signature holds the
+    minimum of each position, so the fraction of equal positions in two
+    signatures estimates the Jaccard similarity of the shingle sets, at the
+    cost of one hash per shingle instead of one per shingle and position.
+    Empty positions are filled from the next non-empty position, marked
+    with their distance to it, so short texts can be compared as well.
+
+    Signatures are deterministic for a given seed, so they can be computed
+    in worker processes and compared with signatures persisted by previous
+    syncs.
+    """
+
+    HASH_SIZE = 6
+    WORD_RE = re.compile(r"\w+")
+
+    def __init__(
+        self, signature_size: int = 128, shingle_size: int = 5, seed: int = 1
+    ):
+        """Initialize the hasher.
+
+        Args:
+            signature_size: Number of signature positions, at most 65536
+            shingle_size: Number of consecutive words per shingle
+            seed: Seed of the shingle hash function
+        """
+        self.signature_size = signature_size
+        self.shingle_size = shingle_size
+        self._key = seed.to_bytes(8, "little")
+
+    def get_signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to compute the signature of
+
+        Returns:
+            Optional[Tuple[int, ...]]: The signature or None if the text
+            contains no words
+        """
+        words = self.WORD_RE.findall(text.lower())
+        if not words:
+            return None
+
+        size = min(self.shingle_size, len(words))
+        signature_size = self.signature_size
+        minimums: List[Optional[int]] = [None] * signature_size
+        for i in range(len(words) - size + 1):
+            shingle = " ".join(words[i : i + size]).encode("utf-8")
+            hash = int.from_bytes(
+                hashlib.blake2b(
+                    shingle, digest_size=self.HASH_SIZE, key=self._key
+                ).digest(),
+                "little",
+            )
+            value, position = divmod(hash, signature_size)
+            minimum = minimums[position]
+            if minimum is None or value < minimum:
+                minimums[position] = value
+
+        signature = []
+        for position, minimum in enumerate(minimums):
+            distance = 0
+            while minimum is None:
+                distance += 1
+                minimum = minimums[(position + distance) % signature_size]
+            signature.append((distance << (8 * self.HASH_SIZE)) | minimum)
+        return tuple(signature)
+
+
+class Deduplicator:
+    """Near-duplicate detection of documents with MinHash and LSH.
+
+    Signatures are split into bands indexed in SQLite, so only documents
+    sharing a band with a new document are compared with it. A document is
+    a near-duplicate if the estimated Jaccard similarity with a previously
+    added document reaches the threshold. Documents are added under a key
+    identifying their source object, so a document changed since a previous
+    sync replaces its own signature instead of matching it.
+
+    Without a path, signatures are kept in memory for the lifetime of the
+    instance. Otherwise they are persisted on `commit`.
+    """
+
+    def __init__(
+        self,
+        hasher: MinHasher,
+        threshold: float,
+        path: Optional[str] = None,
+    ):
+        """Initialize the deduplicator, creating the index if it does not exist.
+
+        Args:
+            hasher: Component computing document signatures
+            threshold: Minimal estimated Jaccard similarity of near-duplicates
+            path: Path of the SQLite database persisting the signatures
+        """
+        self.hasher = hasher
+        self.threshold = threshold
+        self.num_bands, self.band_size = self._get_band_layout(
+            hasher.signature_size, threshold
+        )
+        self.path = path
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path or ":memory:", check_same_thread=False
+        )
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (
+                key TEXT PRIMARY KEY,
+                signature BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                key TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS bands_bucket ON bands (band, bucket);
+            CREATE INDEX IF NOT EXISTS bands_key ON bands (key);
+            """
+        )
+        self._connection.commit()
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: DatasourceConfiguration
+    ) -> Optional["Deduplicator"]:
+        """Create the deduplicator configured for a datasource.
+
+        Args:
+            configuration: Configuration of the datasource
+
+        Returns:
+            Optional[Deduplicator]: The deduplicator or None if
+            deduplication is disabled
+        """
+        if configuration.deduplication_threshold is None:
+            return None
+        return cls(
+            hasher=MinHasher(
+                signature_size=configuration.deduplication_signature_size,
+                shingle_size=configuration.deduplication_shingle_size,
+            ),
+            threshold=configuration.deduplication_threshold,
+            path=configuration.deduplication_index_path,
+        )
+
+    def find_duplicate(
+        self,
+        key: str,
+        signature: Optional[Tuple[int, ...]],
+        candidates: Optional[Set[str]] = None,
+    ) -> Optional[str]:
+        """Find a near-duplicate of a document, adding the document if none is found.
+
+        Args:
+            key: Key of the document
+            signature: Signature computed by the hasher
+            candidates: Keys of the documents the near-duplicate is looked
+                up among, all indexed documents if None
+
+        Returns:
+            Optional[str]: Key of the near-duplicate or None if the document
+            is not a near-duplicate and was added
+        """
+        if signature is None:
+            return None
+
+        buckets = self._get_buckets(signature)
+        with self._lock:
+            duplicate_key = self._find_similar(
+                key, signature, buckets, candidates
+            )
+            if duplicate_key is not None:
+                self._remove(key)
+                return duplicate_key
+
+            self._remove(key)
+            self._connection.execute(
+                "INSERT INTO signatures (key, signature) " "VALUES (?, ?)",
+                (key, array("Q", signature).tobytes()),
+            )
+            self._connection.executemany(
+                "INSERT INTO bands (band, bucket, key) VALUES (?, ?, ?)",
+                [(band, bucket, key) for band, bucket in enumerate(buckets)],
+            )
+            return None
+
+    def remove(self, keys: List[str]) -> None:
+        """Remove the signatures of documents, e.g. of deleted source objects.
+
+        Args:
+            keys: Keys of the documents
+        """
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+    def get_keys(self, prefix: str) -> List[str]:
+        """Get the keys of the indexed documents starting with a prefix.
+
+        Args:
+            prefix: Prefix of the keys, e.g. the name of a datasource
+
+        Returns:
+            List[str]: Keys of the documents
+        """
+        with self._lock:
+            return [
+                key
+                for (key,) in self._connection.execute(
+                    "SELECT key FROM signatures WHERE substr(key, 1, ?) = ? "
+                    "ORDER BY key",
+                    (len(prefix), prefix),
+                )
+            ]
+
+    def commit(self) -> None:
+        """Persist all signatures added since the last commit."""
+        with self._lock:
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the index, discarding uncommitted signatures."""
+        self._connection.close()
+
+    def _remove(self, key: str) -> None:
+        """Remove the signature of a document.
+
+        Args:
+            key: Key of the document
+        """
+        self._connection.execute("DELETE FROM signatures WHERE key = ?", (key,))
+        self._connection.execute("DELETE FROM bands WHERE key = ?", (key,))
+
+    def _find_similar(
+        self,
+        key: str,
+        signature: Tuple[int, ...],
+        buckets: List[int],
+        allowed_candidates: Optional[Set[str]] = None,
+    ) -> Optional[str]:
+        """Find the most similar document among documents sharing a band.
+
+        Args:
+            key: Key of the document, excluded from the candidates
+            signature: Signature of the document
+            buckets: Bucket of each band of the signature
+            allowed_candidates: Keys the candidates are restricted to, all
+                indexed documents if None
+
+        Returns:
+            Optional[str]: Key of the most similar document reaching the
+            threshold or None
+        """
+        candidates = set()
+        for band, bucket in enumerate(buckets):
+            candidates.update(
+                candidate
+                for (candidate,) in self._connection.execute(
+                    "SELECT key FROM bands WHERE band = ? AND bucket = ?",
+                    (band, bucket),
+                )
+            )
+        candidates.discard(key)
+        if allowed_candidates is not None:
+            candidates &= allowed_candidates
+
+        best_key, best_similarity = None, self.threshold
+        for candidate in sorted(candidates):
+            (blob,) = self._connection.execute(
+                "SELECT signature FROM signatures WHERE key = ?", (candidate,)
+            ).fetchone()
+            similarity = self._get_similarity(signature, array("Q", blob))
+            if similarity >= best_similarity:
+                best_key, best_similarity = candidate, similarity
+        return best_key
+
+    def _get_buckets(self, signature: Tuple[int, ...]) -> List[int]:
+        """Hash each band of a signature into a bucket.
+
+        Args:
+            signature: Signature to split into bands
+
+        Returns:
+            List[int]: CRC-32 of each band, stable across processes
+        """
+        values = array("Q", signature)
+        band_length = self.band_size * values.itemsize
+        data = values.tobytes()
+        return [
+            zlib.crc32(data[start : start + band_length])
+            for start in range(0, len(data), band_length)
+        ]
+
+    @staticmethod
+    def _get_similarity(
+        signature: Tuple[int, ...], other_signature: array
+    ) -> float:
+        """Estimate the Jaccard similarity of two documents.
+
+        Args:
+            signature: Signature of the first document
+            other_signature: Signature of the second document
+
+        Returns:
+            float: Fraction of equal signature positions
+        """
+        equal = sum(a == b for a, b in zip(signature, other_signature))
+        return equal / len(signature)
+
+    @staticmethod
+    def _get_band_layout(
+        signature_size: int, threshold: float
+    ) -> Tuple[int, int]:
+        """Choose the number and size of bands for a threshold.
+
+        Documents with Jaccard similarity `s` share a band with probability
+        `1 - (1 - s^r)^b` for `b` bands of `r` rows, rising steeply around
+        `(1/b)^(1/r)`, which is chosen as close as possible to the threshold.
+
+        Args:
+            signature_size: Signature length
+            threshold: Minimal estimated Jaccard similarity of near-duplicates
+
+        Returns:
+            Tuple[int, int]: Number of bands and rows per band
+        """
+        layouts = [
+            (signature_size // rows, rows)
+            for rows in range(1, signature_size + 1)
+            if signature_size % rows == 0
+        ]
+        return min(
+            layouts,
+            key=lambda layout: abs(
+                (1 / layout[0]) ** (1 / layout[1]) - threshold
+            ),
+        )
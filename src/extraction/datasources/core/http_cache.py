@@ -0,0 +1,425 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, NamedTuple, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from core.logger import LoggerConfiguration
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceConfiguration,
+    HttpCacheMode,
+)
+
+
+class CachedResponse(NamedTuple):
+    """HTTP response stored in the cache with decoded content."""
+
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+
+
+class HttpCache:
+    """On-disk cache of HTTP responses shared by datasource clients.
+
+    Responses are keyed by method, URL with normalized query parameters and
+    request body, and stored as one JSON file per key. Only successful
+    responses are recorded. In record mode, requests for recorded responses
+    carrying an `ETag` or `Last-Modified` header are sent conditionally, and
+    a `304 Not Modified` answer is served from the cache. In replay mode, no
+    requests are sent and a miss is answered with `504 Gateway Timeout`, as
+    for `Cache-Control: only-if-cached` requests.
+    """
+
+    NOT_MODIFIED_STATUS_CODE = 304
+    MISS_STATUS_CODE = 504
+    # Content is stored decoded, so headers describing its encoding are dropped
+    EXCLUDED_HEADERS = {
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+    }
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(self, path: str, mode: HttpCacheMode):
+        """Initialize the cache.
+
+        Args:
+            path: Directory storing the cached responses
+            mode: Whether responses are recorded or replayed
+        """
+        self.path = path
+        self.mode = mode
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: DatasourceConfiguration
+    ) -> Optional["HttpCache"]:
+        """Create the cache configured for a datasource.
+
+        Args:
+            configuration: Configuration of the datasource
+
+        Returns:
+            Optional[HttpCache]: The cache or None if caching is off
+        """
+        if configuration.http_cache_mode == HttpCacheMode.OFF:
+            return None
+        return cls(
+            path=configuration.http_cache_path,
+            mode=configuration.http_cache_mode,
+        )
+
+    @staticmethod
+    def get_key(
+        method: str, url: str, body: Optional[Union[str, bytes]] = None
+    ) -> str:
+        """Compute the cache key of a request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Request body
+
+        Returns:
+            str: SHA-256 hash identifying the request
+        """
+        scheme, netloc, path, query, _ = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+        normalized_url = urlunsplit((scheme, netloc.lower(), path, query, ""))
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        sha256 = hashlib.sha256()
+        sha256.update(method.upper().encode("utf-8"))
+        sha256.update(b"\n")
+        sha256.update(normalized_url.encode("utf-8"))
+        sha256.update(b"\n")
+        sha256.update(body or b"")
+        return sha256.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a recorded response.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            Optional[CachedResponse]: The response or None on a miss
+        """
+        try:
+            with open(self._get_file_path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return CachedResponse(
+                status_code=data["status_code"],
+                headers=data["headers"],
+                content=base64.b64decode(data["content"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+    ) -> None:
+        """Record a response if it is successful.
+
+        Args:
+            key: Cache key of the request
+            status_code: Status code of the response
+            headers: Headers of the response
+            content: Decoded content of the response
+        """
+        if not 200 <= status_code < 300:
+            return
+
+        file_path = self._get_file_path(key)
+        directory = os.path.dirname(file_path)
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            "status_code": status_code,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in self.EXCLUDED_HEADERS
+            },
+            "content": base64.b64encode(content).decode("ascii"),
+        }
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(data, f)
+        os.replace(f.name, file_path)
+
+    def get_validation_headers(
+        self, cached_response: Optional[CachedResponse]
+    ) -> Dict[str, str]:
+        """Get headers turning a request into a conditional request.
+
+        Args:
+            cached_response: Recorded response of the request
+
+        Returns:
+            Dict[str, str]: `If-None-Match` and `If-Modified-Since` headers
+            for the validators of the recorded response
+        """
+        if cached_response is None:
+            return {}
+
+        headers = {
+            name.lower(): value
+            for name, value in cached_response.headers.items()
+        }
+        validation_headers = {}
+        if "etag" in headers:
+            validation_headers["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            validation_headers["If-Modified-Since"] = headers["last-modified"]
+        return validation_headers
+
+    def get_miss_response(self, method: str, url: str) -> CachedResponse:
+        """Get the response answering a request not found in replay mode.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+
+        Returns:
+            CachedResponse: `504 Gateway Timeout` response
+        """
+        self.logger.warning(f"No recorded response for {method} {url}.")
+        return CachedResponse(
+            status_code=self.MISS_STATUS_CODE, headers={}, content=b""
+        )
+
+    def _get_file_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f"{key}.json")
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """Requests transport adapter serving responses through an `HttpCache`."""
+
+    def __init__(self, cache: HttpCache, **kwargs):
+        """Initialize the adapter.
+
+        Args:
+            cache: Cache of responses
+            **kwargs: Arguments of `HTTPAdapter`
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        """Send a request or serve its response from the cache.
+
+        Args:
+            request: Prepared request
+            **kwargs: Arguments of `HTTPAdapter.send`
+
+        Returns:
+            requests.Response: Response of the request
+        """
+        key = self.cache.get_key(request.method, request.url, request.body)
+        cached_response = self.cache.get(key)
+        if self.cache.mode == HttpCacheMode.REPLAY:
+            return self._build_cached_response(
+                request,
+                cached_response
+                or self.cache.get_miss_response(request.method, request.url),
+            )
+
+        request.headers.update(
+            self.cache.get_validation_headers(cached_response)
+        )
+        response = super().send(request, **kwargs)
+        if (
+            cached_response is not None
+            and response.status_code == HttpCache.NOT_MODIFIED_STATUS_CODE
+        ):
+            response.close()
+            return self._build_cached_response(request, cached_response)
+
+        self.cache.put(
+            key, response.status_code, dict(response.headers), response.content
+        )
+        return response
+
+    @staticmethod
+    def _build_cached_response(
+        request: requests.PreparedRequest, cached_response: CachedResponse
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = cached_response.status_code
+        response.headers = CaseInsensitiveDict(cached_response.headers)
+        response._content = cached_response.content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+
+class CachingTransport(httpx.BaseTransport):
+    """HTTPX transport serving responses through an `HttpCache`."""
+
+    def __init__(
+        self,
+        cache: HttpCache,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            cache: Cache of responses
+            transport: Underlying transport sending the requests
+        """
+        self.cache = cache
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request or serve its response from the cache.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            httpx.Response: Response of the request
+        """
+        key = self.cache.get_key(
+            request.method, str(request.url), request.read()
+        )
+        cached_response = self.cache.get(key)
+        if self.cache.mode == HttpCacheMode.REPLAY:
+            return _build_httpx_response(
+                request,
+                cached_response
+                or self.cache.get_miss_response(
+                    request.method, str(request.url)
+                ),
+            )
+
+        request.headers.update(
+            self.cache.get_validation_headers(cached_response)
+        )
+        response = self.transport.handle_request(request)
+        if (
+            cached_response is not None
+            and response.status_code == HttpCache.NOT_MODIFIED_STATUS_CODE
+        ):
+            response.close()
+            return _build_httpx_response(request, cached_response)
+
+        content = response.read()
+        response.close()
+        self.cache.put(
+            key, response.status_code, dict(response.headers), content
+        )
+        return _build_httpx_response(
+            request,
+            CachedResponse(
+                response.status_code, dict(response.headers), content
+            ),
+        )
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Asynchronous HTTPX transport serving responses through an `HttpCache`."""
+
+    def __init__(
+        self,
+        cache: HttpCache,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            cache: Cache of responses
+            transport: Underlying transport sending the requests
+        """
+        self.cache = cache
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        """Send a request or serve its response from the cache.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            httpx.Response: Response of the request
+        """
+        key = self.cache.get_key(
+            request.method, str(request.url), await request.aread()
+        )
+        cached_response = self.cache.get(key)
+        if self.cache.mode == HttpCacheMode.REPLAY:
+            return _build_httpx_response(
+                request,
+                cached_response
+                or self.cache.get_miss_response(
+                    request.method, str(request.url)
+                ),
+            )
+
+        request.headers.update(
+            self.cache.get_validation_headers(cached_response)
+        )
+        response = await self.transport.handle_async_request(request)
+        if (
+            cached_response is not None
+            and response.status_code == HttpCache.NOT_MODIFIED_STATUS_CODE
+        ):
+            await response.aclose()
+            return _build_httpx_response(request, cached_response)
+
+        content = await response.aread()
+        await response.aclose()
+        self.cache.put(
+            key, response.status_code, dict(response.headers), content
+        )
+        return _build_httpx_response(
+            request,
+            CachedResponse(
+                response.status_code, dict(response.headers), content
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _build_httpx_response(
+    request: httpx.Request, cached_response: CachedResponse
+) -> httpx.Response:
+    headers = {
+        name: value
+        for name, value in cached_response.headers.items()
+        if name.lower() not in HttpCache.EXCLUDED_HEADERS
+    }
+    return httpx.Response(
+        status_code=cached_response.status_code,
+        headers=headers,
+        content=cached_response.content,
+        request=request,
+    )
@@ -0,0 +1,698 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.logger import LoggerConfiguration
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceConfiguration,
+)
+from extraction.datasources.core.http_cache import (
+    AsyncCachingTransport,
+    CachingHTTPAdapter,
+    CachingTransport,
+    HttpCache,
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host considered down."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Number of seconds to wait, None if the header is
+        missing or invalid
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Connection errors, timeouts and responses with a transient status are
+    retried with exponential backoff and full jitter, so that clients
+    failing at the same time do not retry in lockstep. A `Retry-After`
+    header sent by the server replaces the backoff, and the request is not
+    retried if the server asks to wait longer than the maximal backoff.
+    Requests with non-idempotent methods are only retried if the server
+    rejected them with `429 Too Many Requests`.
+    """
+
+    RATE_LIMITED_STATUS_CODE = 429
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+    )
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_retries: Maximum number of retries of a request
+            backoff_base: Maximal delay in seconds before the first retry,
+                doubled for every further retry
+            backoff_max: Upper bound of the delay in seconds
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def get_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """Get the delay before retrying a failed request.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries of the request so far
+            status_code: Status code of the response, None if no response
+                was received
+            retry_after: `Retry-After` header of the response
+
+        Returns:
+            Optional[float]: Delay in seconds, None if the request is not
+            retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        if status_code is not None:
+            if status_code not in self.RETRY_STATUS_CODES:
+                return None
+            if (
+                method.upper() not in self.IDEMPOTENT_METHODS
+                and status_code != self.RATE_LIMITED_STATUS_CODE
+            ):
+                return None
+        elif method.upper() not in self.IDEMPOTENT_METHODS:
+            return None
+
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return delay if delay <= self.backoff_max else None
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
+
+    @staticmethod
+    def is_failure(status_code: Optional[int]) -> bool:
+        """Check whether a request outcome indicates that its host is down.
+
+        Args:
+            status_code: Status code of the response, None if no response
+                was received
+
+        Returns:
+            bool: True for connection errors, timeouts and server errors
+        """
+        return status_code is None or status_code >= 500
+
+
+class CircuitBreaker:
+    """Circuit breaker of a single host.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests fail immediately with `CircuitOpenError` instead of waiting for
+    timeouts. Once `reset_timeout` has passed, a single trial request is let
+    through, closing the circuit if it succeeds and opening it again
+    otherwise.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """Initialize the closed circuit breaker.
+
+        Args:
+            failure_threshold: Number of consecutive failures opening the
+                circuit
+            reset_timeout: Number of seconds before a trial request is let
+                through an open circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently refused or limited to a trial."""
+        return self._opened_at is not None
+
+    def before_request(self, host: str) -> None:
+        """Let a request through or refuse it.
+
+        Args:
+            host: Host of the request, used in the error message
+
+        Raises:
+            CircuitOpenError: If the circuit is open and no trial request
+                can be sent
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed >= self.reset_timeout and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return
+        raise CircuitOpenError(
+            f"Circuit for {host} is open after {self._failures} consecutive "
+            "failures."
+        )
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_progress or (
+                self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._trial_in_progress = False
+
+
+class CircuitBreakers:
+    """Circuit breakers of all hosts contacted through a transport."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """Initialize the breakers.
+
+        Args:
+            failure_threshold: Number of consecutive failures opening the
+                circuit of a host
+            reset_timeout: Number of seconds before a trial request is let
+                through an open circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Get the circuit breaker of a host.
+
+        Args:
+            host: Host name
+
+        Returns:
+            CircuitBreaker: The breaker, created closed on first use
+        """
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+                self._breakers[host] = breaker
+            return breaker
+
+
+class RetryingHTTPAdapter(HTTPAdapter):
+    """Requests transport adapter retrying failed requests.
+
+    Requests without an explicit timeout are sent with the default one.
+    """
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(
+        self,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        """Initialize the adapter.
+
+        Args:
+            retry_policy: Policy of retries, None to never retry
+            circuit_breakers: Breakers per host, None to disable them
+            timeout: Default timeout in seconds
+            **kwargs: Arguments of `HTTPAdapter`
+        """
+        super().__init__(**kwargs)
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.circuit_breakers = circuit_breakers
+        self.timeout = timeout
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        """Send a request, retrying it according to the policy.
+
+        Args:
+            request: Prepared request
+            **kwargs: Arguments of `HTTPAdapter.send`
+
+        Returns:
+            requests.Response: Response of the last attempt
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+        """
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        host = requests.utils.urlparse(request.url).hostname or ""
+        breaker = (
+            self.circuit_breakers.get(host) if self.circuit_breakers else None
+        )
+
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(host)
+            try:
+                response = super().send(request, **kwargs)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                _record(breaker, None)
+                delay = self.retry_policy.get_delay(request.method, attempt)
+                if delay is None:
+                    raise
+                _log_retry(self.logger, request.method, request.url, e, delay)
+            else:
+                _record(breaker, response.status_code)
+                delay = self.retry_policy.get_delay(
+                    request.method,
+                    attempt,
+                    response.status_code,
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                _log_retry(
+                    self.logger,
+                    request.method,
+                    request.url,
+                    response.status_code,
+                    delay,
+                )
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+
+class CachingRetryingHTTPAdapter(CachingHTTPAdapter, RetryingHTTPAdapter):
+    """Requests transport adapter retrying requests not served from the cache."""
+
+
+class RetryingTransport(httpx.BaseTransport):
+    """HTTPX transport retrying failed requests."""
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            retry_policy: Policy of retries
+            circuit_breakers: Breakers per host, None to disable them
+            transport: Underlying transport sending the requests
+        """
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying it according to the policy.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            httpx.Response: Response of the last attempt
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+        """
+        breaker = (
+            self.circuit_breakers.get(request.url.host)
+            if self.circuit_breakers
+            else None
+        )
+
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(request.url.host)
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                _record(breaker, None)
+                delay = self.retry_policy.get_delay(request.method, attempt)
+                if delay is None:
+                    raise
+                _log_retry(self.logger, request.method, request.url, e, delay)
+            else:
+                _record(breaker, response.status_code)
+                delay = self.retry_policy.get_delay(
+                    request.method,
+                    attempt,
+                    response.status_code,
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                _log_retry(
+                    self.logger,
+                    request.method,
+                    request.url,
+                    response.status_code,
+                    delay,
+                )
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryingTransport(httpx.AsyncBaseTransport):
+    """Asynchronous HTTPX transport retrying failed requests."""
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            retry_policy: Policy of retries
+            circuit_breakers: Breakers per host, None to disable them
+            transport: Underlying transport sending the requests
+        """
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        """Send a request, retrying it according to the policy.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            httpx.Response: Response of the last attempt
+
+        Raises:
+            CircuitOpenError: If the circuit of the host is open
+        """
+        breaker = (
+            self.circuit_breakers.get(request.url.host)
+            if self.circuit_breakers
+            else None
+        )
+
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(request.url.host)
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                _record(breaker, None)
+                delay = self.retry_policy.get_delay(request.method, attempt)
+                if delay is None:
+                    raise
+                _log_retry(self.logger, request.method, request.url, e, delay)
+            else:
+                _record(breaker, response.status_code)
+                delay = self.retry_policy.get_delay(
+                    request.method,
+                    attempt,
+                    response.status_code,
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                _log_retry(
+                    self.logger,
+                    request.method,
+                    request.url,
+                    response.status_code,
+                    delay,
+                )
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HttpTransport:
+    """Shared HTTP transport of datasource clients.
+
+    Creates requests sessions and HTTPX clients with keep-alive connection
+    pools per host, a default timeout, retries with jittered exponential
+    backoff and circuit breakers per host. Sessions and clients created by
+    the same transport share its circuit breakers. Responses go through the
+    HTTP cache if one is given, so cached responses are neither retried nor
+    counted by the circuit breakers.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections_per_host: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        http_cache: Optional[HttpCache] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            timeout: Timeout in seconds for connecting and reading
+            max_connections_per_host: Default size of the connection pool of
+                each host
+            retry_policy: Policy of retries, defaults to 3 retries
+            circuit_breakers: Breakers per host, None to disable them
+            http_cache: Cache recording or replaying responses
+        """
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers
+        self.http_cache = http_cache
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: DatasourceConfiguration
+    ) -> "HttpTransport":
+        """Create the transport configured for a datasource.
+
+        Args:
+            configuration: Configuration of the datasource
+
+        Returns:
+            HttpTransport: The transport
+        """
+        return cls(
+            timeout=configuration.http_timeout,
+            max_connections_per_host=configuration.http_max_connections_per_host,
+            retry_policy=RetryPolicy(
+                max_retries=configuration.http_max_retries,
+                backoff_base=configuration.http_backoff_base,
+                backoff_max=configuration.http_backoff_max,
+            ),
+            circuit_breakers=(
+                CircuitBreakers(
+                    failure_threshold=configuration.http_circuit_breaker_threshold,
+                    reset_timeout=configuration.http_circuit_breaker_reset_timeout,
+                )
+                if configuration.http_circuit_breaker_threshold is not None
+                else None
+            ),
+            http_cache=HttpCache.from_configuration(configuration),
+        )
+
+    def create_adapter(
+        self, max_connections_per_host: Optional[int] = None
+    ) -> HTTPAdapter:
+        """Create a requests transport adapter.
+
+        Args:
+            max_connections_per_host: Size of the connection pool of each
+                host, defaults to the size of the transport
+
+        Returns:
+            HTTPAdapter: The adapter
+        """
+        pool_size = max_connections_per_host or self.max_connections_per_host
+        kwargs = dict(
+            retry_policy=self.retry_policy,
+            circuit_breakers=self.circuit_breakers,
+            timeout=self.timeout,
+            pool_maxsize=pool_size,
+        )
+        if self.http_cache is None:
+            return RetryingHTTPAdapter(**kwargs)
+        return CachingRetryingHTTPAdapter(self.http_cache, **kwargs)
+
+    def create_session(
+        self, max_connections_per_host: Optional[int] = None
+    ) -> requests.Session:
+        """Create a requests session for all HTTP and HTTPS hosts.
+
+        Args:
+            max_connections_per_host: Size of the connection pool of each
+                host, defaults to the size of the transport
+
+        Returns:
+            requests.Session: The session
+        """
+        session = requests.Session()
+        adapter = self.create_adapter(max_connections_per_host)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def create_client(
+        self, max_connections_per_host: Optional[int] = None
+    ) -> httpx.Client:
+        """Create an HTTPX client.
+
+        Args:
+            max_connections_per_host: Size of the connection pool of each
+                host, defaults to the size of the transport
+
+        Returns:
+            httpx.Client: The client
+        """
+        transport = RetryingTransport(
+            self.retry_policy,
+            self.circuit_breakers,
+            httpx.HTTPTransport(
+                limits=self._get_limits(max_connections_per_host)
+            ),
+        )
+        if self.http_cache is not None:
+            transport = CachingTransport(self.http_cache, transport)
+        return httpx.Client(transport=transport, timeout=self._get_timeout())
+
+    def create_async_client(
+        self, max_connections_per_host: Optional[int] = None
+    ) -> httpx.AsyncClient:
+        """Create an asynchronous HTTPX client.
+
+        Args:
+            max_connections_per_host: Size of the connection pool of each
+                host, defaults to the size of the transport
+
+        Returns:
+            httpx.AsyncClient: The client, to be used as an async context
+            manager
+        """
+        transport = AsyncRetryingTransport(
+            self.retry_policy,
+            self.circuit_breakers,
+            httpx.AsyncHTTPTransport(
+                limits=self._get_limits(max_connections_per_host)
+            ),
+        )
+        if self.http_cache is not None:
+            transport = AsyncCachingTransport(self.http_cache, transport)
+        return httpx.AsyncClient(
+            transport=transport, timeout=self._get_timeout()
+        )
+
+    def _get_limits(
+        self, max_connections_per_host: Optional[int]
+    ) -> httpx.Limits:
+        """Get the pool limits of an HTTPX client.
+
+        HTTPX keeps connections per host but limits them in total, which
+        matches per-host pools for clients of a single API.
+        """
+        pool_size = max_connections_per_host or self.max_connections_per_host
+        return httpx.Limits(
+            max_connections=pool_size, max_keepalive_connections=pool_size
+        )
+
+    def _get_timeout(self) -> httpx.Timeout:
+        """Get the timeout of an HTTPX client.
+
+        Requests wait for a free connection without timing out, so the pool
+        bounds the requests in flight.
+        """
+        return httpx.Timeout(self.timeout, pool=None)
+
+
+def _record(breaker: Optional[CircuitBreaker], status_code: Optional[int]):
+    if breaker is None:
+        return
+    if RetryPolicy.is_failure(status_code):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def _log_retry(
+    logger: logging.Logger,
+    method: str,
+    url: object,
+    reason: object,
+    delay: float,
+) -> None:
+    logger.warning(
+        f"{method} {url} failed ({reason}), retrying in {delay:.2f}s."
+    )
@@ -1,20 +1,43 @@
+import hashlib
+import json
+import uuid
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Generic
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
+from core.logger import LoggerConfiguration
 from extraction.bootstrap.configuration.configuration import (
     ExtractionConfiguration,
 )
+from extraction.datasources.core.checkpoint import CheckpointTracker
 from extraction.datasources.core.cleaner import (
     BaseCleaner,
     BasicMarkdownCleaner,
 )
+from extraction.datasources.core.deduplication import Deduplicator
 from extraction.datasources.core.document import DocType
 from extraction.datasources.core.parser import BaseParser, BasicMarkdownParser
+from extraction.datasources.core.processing import (
+    DocumentPipeline,
+    KeyedFunction,
+    ProcessedObject,
+    ProcessingStage,
+)
 from extraction.datasources.core.reader import BaseReader
 from extraction.datasources.core.splitter import (
     BaseSplitter,
     BasicMarkdownSplitter,
 )
+from extraction.datasources.core.sync_state import SyncStateStore
 
 
 class BaseDatasourceManager(ABC, Generic[DocType]):
@@ -34,6 +57,8 @@ class BaseDatasourceManager(ABC, Generic[DocType]):
         parser: BaseParser = BasicMarkdownParser(),
         cleaner: BaseCleaner = BasicMarkdownCleaner(),
         splitter: BaseSplitter = BasicMarkdownSplitter(),
+        processing_stage: Optional[ProcessingStage] = None,
+        deduplicator: Optional[Deduplicator] = None,
     ):
         """Initialize datasource manager.
 
@@ -42,34 +67,64 @@ class BaseDatasourceManager(ABC, Generic[DocType]):
             reader: Content extraction component
             cleaner: Content cleaning component
             splitter: Content splitting component
+            processing_stage: Pool parsing, cleaning and splitting objects
+                off the event loop, objects are processed inline if None
+            deduplicator: Component dropping near-duplicate documents
+                before they are split, documents are kept if None
         """
         self.configuration = configuration
         self.reader = reader
         self.parser = parser
         self.cleaner = cleaner
         self.splitter = splitter
+        self.processing_stage = processing_stage
+        self.deduplicator = deduplicator
+        self.deleted_document_ids: List[str] = []
+        self.deduplication_keys: Optional[Set[str]] = None
 
     @abstractmethod
     async def full_refresh_sync(
-        self,
+        self, checkpoint: Optional[CheckpointTracker] = None
     ) -> AsyncIterator[DocType]:
         """Extract and process all content from the datasource.
 
+        Args:
+            checkpoint: Progress of the datasource in a checkpointed run,
+                used to resume an interrupted run and record the progress
+
         Returns:
             An async iterator yielding processed document chunks of type DocType
         """
         pass
 
     @abstractmethod
-    def incremental_sync(self):
+    async def incremental_sync(
+        self, sync_state: SyncStateStore, source: str
+    ) -> AsyncIterator[DocType]:
         """Process only new or changed content from the datasource.
 
         This method should handle differential updates to avoid
         reprocessing all content when only portions have changed.
-        Implementations should update the vector storage accordingly.
+        After the iteration, `deleted_document_ids` holds the IDs of
+        previously synced documents that have to be removed downstream.
+
+        Args:
+            sync_state: Store with the state of previous syncs
+            source: Key of the datasource in the sync state store
+
+        Returns:
+            An async iterator yielding new or changed document chunks of type DocType
         """
         pass
 
+    def commit_sync_state(self) -> None:
+        """Persist the state of the last incremental sync kept by the reader.
+
+        Called once the synced documents are persisted and the sync state
+        store is committed.
+        """
+        self.reader.commit_sync_state()
+
 
 class BasicDatasourceManager(BaseDatasourceManager, Generic[DocType]):
     """Standard implementation of datasource content processing pipeline.
@@ -79,37 +134,474 @@ class BasicDatasourceManager(BaseDatasourceManager, Generic[DocType]):
     in a sequential pipeline to prepare them for embedding and storage.
     """
 
+    logger = LoggerConfiguration.get_logger(__name__)
+
     async def full_refresh_sync(
-        self,
+        self, checkpoint: Optional[CheckpointTracker] = None
     ) -> AsyncIterator[DocType]:
         """Process all content from the datasource from scratch.
 
         Executes the complete pipeline:
         1. Reads source objects asynchronously
-        2. Parses each object into a document
+        2. Parses each object into a document, off the event loop if the
+           parser has an executor
         3. Cleans the content
-        4. Splits into appropriate chunks
+        4. Drops near-duplicates of previous documents if configured
+        5. Splits into appropriate chunks
+
+        With a processing stage, steps 2 to 5 run in its pool for several
+        objects at once while further objects are read. Only the lookup of
+        near-duplicates runs on the event loop, as it shares the index.
+
+        Documents are only compared with documents kept by the same full
+        refresh, so signatures of objects deleted from the source do not
+        drop their near-duplicates. Once all objects were read, signatures
+        of objects not read anymore are removed from the index.
+
+        With a checkpoint, the reader resumes from its cursor and objects
+        processed before an interruption are skipped. Documents then get IDs
+        derived from their object and content, so documents persisted before
+        the interruption keep their IDs when their object is processed again.
+
+        Args:
+            checkpoint: Progress of the datasource in a checkpointed run
 
         Returns:
             An async iterator yielding processed document chunks of type DocType
         """
-        objects = self.reader.read_all_async()
-        async for object in objects:
-            md_document = self.parser.parse(object)
+        if checkpoint is not None:
+            self.reader.resume(
+                checkpoint.cursor, checkpoint.processed_object_ids
+            )
+        self.deduplication_keys = set()
+        objects = self._read_objects(checkpoint)
+        if self.processing_stage is not None:
+
+            async def read_identified_objects() -> AsyncIterator[Any]:
+                async for token, object in objects:
+                    yield (token, self.reader.get_object_id(object)), object
+
+            async for key, processed_object in self._process_objects(
+                read_identified_objects()
+            ):
+                token, object_id = key
+                split_documents = []
+                if processed_object.document and not self._is_duplicate(
+                    processed_object.document,
+                    object_id,
+                    processed_object.signature,
+                ):
+                    split_documents = processed_object.split_documents
+                for split_document in self._track_documents(
+                    split_documents,
+                    processed_object.document,
+                    checkpoint,
+                    token,
+                ):
+                    yield split_document
+            self._commit_deduplicator()
+            return
+
+        async for token, object in objects:
+            md_document = await self.parser.parse_async(object)
+            cleaned_document = self.cleaner.clean(md_document)
+            split_documents = []
+            if cleaned_document and not self._is_duplicate(
+                cleaned_document, self.reader.get_object_id(object)
+            ):
+                split_documents = self.splitter.split(cleaned_document)
+            for split_document in self._track_documents(
+                split_documents, cleaned_document, checkpoint, token
+            ):
+                yield split_document
+        self._commit_deduplicator()
+
+    async def incremental_sync(
+        self, sync_state: SyncStateStore, source: str
+    ) -> AsyncIterator[DocType]:
+        """Process only new or changed content since the last sync.
+
+        Objects whose fingerprint matches the recorded one are skipped,
+        before parsing if the reader provides a fingerprint and after
+        cleaning otherwise. Changed objects are split into documents with
+        IDs derived from the object and its fingerprint, so they never
+        collide with the documents of the previous version, which are
+        added to `deleted_document_ids` together with documents of objects
+        deleted from the source. Signatures of deleted objects are removed
+        from the index of the deduplicator. Near-duplicates are not
+        recorded, so they are checked again by the next sync and kept once
+        their original is deleted. Readers receive the cursor recorded by the
+        previous sync, so they can read changed objects only, and provide
+        the cursor recorded for the next one.
+
+        With a processing stage, changed objects are parsed, cleaned and
+        split in its pool like in `full_refresh_sync`. Objects skipped by
+        the processing, e.g. failed conversions, keep their documents and
+        are processed again by the next sync.
+
+        The sync state is updated but not committed, which is left to the
+        caller once the documents are persisted.
+
+        Args:
+            sync_state: Store with the state of previous syncs
+            source: Key of the datasource in the sync state store
+
+        Returns:
+            An async iterator yielding new or changed document chunks of type DocType
+        """
+        self.deleted_document_ids = []
+        self.deduplication_keys = None
+        run = sync_state.start_run(source)
+        started_at = datetime.now(timezone.utc).isoformat()
+        self.reader.set_sync_cursor(sync_state.get_cursor(source))
+
+        async def read_changed_objects() -> AsyncIterator[Any]:
+            async for object in self.reader.read_all_async():
+                object_id = self.reader.get_object_id(object)
+                fingerprint = self.reader.get_object_fingerprint(object)
+                synced_object = (
+                    sync_state.get_object(source, object_id)
+                    if object_id
+                    else None
+                )
+                if (
+                    synced_object is not None
+                    and fingerprint is not None
+                    and synced_object.fingerprint == fingerprint
+                ):
+                    sync_state.touch_object(source, object_id, run)
+                    continue
+                if object_id:
+                    unprocessed_object_ids.add(object_id)
+                yield (object_id, fingerprint, synced_object), object
+
+        unprocessed_object_ids = set()
+        async for key, processed_object in self._process_objects(
+            read_changed_objects()
+        ):
+            object_id, fingerprint, synced_object = key
+            unprocessed_object_ids.discard(object_id)
+            cleaned_document = processed_object.document
+            fingerprint = fingerprint or self._get_document_fingerprint(
+                cleaned_document or processed_object.parsed_document
+            )
+            object_id = object_id or self._get_document_object_id(
+                cleaned_document or processed_object.parsed_document,
+                fingerprint,
+            )
+            synced_object = synced_object or sync_state.get_object(
+                source, object_id
+            )
+            if (
+                synced_object is not None
+                and synced_object.fingerprint == fingerprint
+            ):
+                sync_state.touch_object(source, object_id, run)
+                continue
+
+            if synced_object is not None:
+                self.deleted_document_ids.extend(synced_object.document_ids)
+            if cleaned_document and self._is_duplicate(
+                cleaned_document, object_id, processed_object.signature
+            ):
+                sync_state.remove_object(source, object_id)
+                continue
+
+            document_ids = []
+            if cleaned_document:
+                split_documents = (
+                    processed_object.split_documents
+                    if self.processing_stage is not None
+                    else self.splitter.split(cleaned_document)
+                )
+                self._set_document_ids(
+                    split_documents, source, object_id, fingerprint
+                )
+                for split_document in split_documents:
+                    document_ids.append(split_document.id_)
+                    yield split_document
+
+            sync_state.put_object(
+                source, object_id, fingerprint, document_ids, run
+            )
+
+        for object_id in unprocessed_object_ids:
+            sync_state.touch_object(source, object_id, run)
+
+        complete_listing = (
+            self.reader.lists_all_objects()
+            and self.configuration.export_limit is None
+        )
+        if complete_listing:
+            if self.deduplicator is not None:
+                self.deduplicator.remove(
+                    [
+                        self._get_deduplication_key(object_id)
+                        for object_id in sync_state.get_unseen_object_ids(
+                            source, run
+                        )
+                    ]
+                )
+            self.deleted_document_ids.extend(
+                sync_state.remove_unseen_objects(source, run)
+            )
+        sync_state.set_cursor(
+            source, self.reader.get_sync_cursor() or started_at
+        )
+        self._commit_deduplicator()
+
+    async def _process_objects(
+        self, keyed_objects: AsyncIterator[Tuple[Any, Any]]
+    ) -> AsyncIterator[Tuple[Any, ProcessedObject]]:
+        """Parse and clean keyed source objects.
+
+        With a processing stage, objects are also split and signed for the
+        deduplicator in its pool. Otherwise they are parsed and cleaned
+        inline, leaving splitting to the caller, so near-duplicates are
+        dropped before being split.
+
+        Args:
+            keyed_objects: Keys identifying the objects for the caller, and
+                objects yielded by the reader
+
+        Returns:
+            AsyncIterator[Tuple[Any, ProcessedObject]]: Keys and processed
+            objects, in the order of the objects if the stage is ordered
+        """
+        if self.processing_stage is not None:
+            async for key, processed_object in self.processing_stage.map(
+                KeyedFunction(self._create_pipeline().process), keyed_objects
+            ):
+                yield key, processed_object
+            return
+
+        async for key, object in keyed_objects:
+            md_document = await self.parser.parse_async(object)
             cleaned_document = self.cleaner.clean(md_document)
             if not cleaned_document:
+                yield key, ProcessedObject(
+                    None, None, [], parsed_document=md_document
+                )
                 continue
+            yield key, ProcessedObject(cleaned_document, None, [])
 
-            for split_document in self.splitter.split(cleaned_document):
-                yield split_document
+    def _create_pipeline(self) -> DocumentPipeline:
+        """Create the pipeline run by the processing stage.
 
-    def incremental_sync(self):
-        """Process only new or changed content since the last sync.
+        Returns:
+            DocumentPipeline: Pipeline with the components of the manager
+        """
+        return DocumentPipeline(
+            self.parser,
+            self.cleaner,
+            self.splitter,
+            hasher=self.deduplicator.hasher if self.deduplicator else None,
+        )
+
+    async def _read_objects(
+        self, checkpoint: Optional[CheckpointTracker]
+    ) -> AsyncIterator[Tuple[Optional[int], Any]]:
+        """Read source objects together with their checkpoint tokens.
+
+        Objects processed before an interruption are skipped.
+
+        Args:
+            checkpoint: Progress of the datasource in a checkpointed run
+
+        Returns:
+            AsyncIterator[Tuple[Optional[int], Any]]: Token completing the
+            object in the checkpoint, None without checkpoint, and object
+        """
+        async for object in self.reader.read_all_async():
+            if checkpoint is None:
+                yield None, object
+                continue
+
+            object_id = self.reader.get_object_id(object)
+            cursor = self.reader.get_checkpoint()
+            if checkpoint.is_processed(object_id):
+                if self.deduplication_keys is not None:
+                    self.deduplication_keys.add(
+                        self._get_deduplication_key(object_id)
+                    )
+                checkpoint.complete(checkpoint.start(None, cursor))
+                continue
+            yield checkpoint.start(object_id, cursor), object
+
+    def _track_documents(
+        self,
+        split_documents: List[DocType],
+        document: Optional[DocType],
+        checkpoint: Optional[CheckpointTracker],
+        token: Optional[int],
+    ) -> Iterator[DocType]:
+        """Yield the documents of an object, tracking its progress.
+
+        The object is completed before its last document is yielded, so a
+        checkpoint saved once the documents received by the consumer are
+        persisted covers the object.
 
-        Should be implemented by subclasses to provide efficient
-        updates when only a portion of the datasource has changed.
+        Args:
+            split_documents: Documents split from the object
+            document: Cleaned document of the object
+            checkpoint: Progress of the datasource in a checkpointed run
+            token: Token returned by the checkpoint for the object
+
+        Returns:
+            Iterator[DocType]: The split documents
+        """
+        if checkpoint is None:
+            yield from split_documents
+            return
+
+        if split_documents:
+            fingerprint = self._get_document_fingerprint(document)
+            object_id = checkpoint.get_object_id(
+                token
+            ) or self._get_document_object_id(document, fingerprint)
+            self._set_document_ids(
+                split_documents, checkpoint.source, object_id, fingerprint
+            )
+        yield from split_documents[:-1]
+        checkpoint.complete(token)
+        yield from split_documents[-1:]
+
+    @staticmethod
+    def _set_document_ids(
+        split_documents: List[DocType],
+        source: str,
+        object_id: str,
+        fingerprint: str,
+    ) -> None:
+        """Derive the IDs of split documents from their object and content.
+
+        Args:
+            split_documents: Documents split from the object
+            source: Key of the datasource
+            object_id: ID of the object
+            fingerprint: Fingerprint of the object content
+        """
+        for i, split_document in enumerate(split_documents):
+            split_document.id_ = str(
+                uuid.uuid5(
+                    uuid.NAMESPACE_URL,
+                    f"{source}/{object_id}/{fingerprint}/{i}",
+                )
+            )
+
+    def _is_duplicate(
+        self,
+        document: Any,
+        object_id: Optional[str],
+        signature: Optional[Tuple[int, ...]] = None,
+    ) -> bool:
+        """Check whether a cleaned document is a near-duplicate.
+
+        Documents which are not near-duplicates are added to the index of
+        the deduplicator, so later copies of them are detected. During a
+        full refresh, only documents kept by it are considered.
+
+        Args:
+            document: Cleaned document
+            object_id: ID of the source object of the document, None if the
+                reader cannot identify it
+            signature: Signature of the document, computed if None
 
-        Raises:
-            NotImplementedError: This feature is not yet implemented
+        Returns:
+            bool: True if the document has to be dropped
+        """
+        if self.deduplicator is None:
+            return False
+
+        if signature is None:
+            signature = self.deduplicator.hasher.get_signature(document.text)
+        key = self._get_deduplication_key(
+            object_id or self._get_document_fingerprint(document)
+        )
+        duplicate_key = self.deduplicator.find_duplicate(
+            key, signature, self.deduplication_keys
+        )
+        if duplicate_key is None:
+            if self.deduplication_keys is not None:
+                self.deduplication_keys.add(key)
+            return False
+
+        self.logger.info(
+            f"Dropping document {key}, near-duplicate of {duplicate_key}."
+        )
+        return True
+
+    def _commit_deduplicator(self) -> None:
+        """Persist the signatures of the documents kept during the sync.
+
+        After a full refresh that read all objects, the signatures of
+        documents not kept by it are removed first, as their objects were
+        deleted from the source or are near-duplicates now.
+        """
+        if self.deduplicator is None:
+            return
+
+        if (
+            self.deduplication_keys is not None
+            and self.reader.lists_all_objects()
+            and self.configuration.export_limit is None
+        ):
+            self.deduplicator.remove(
+                [
+                    key
+                    for key in self.deduplicator.get_keys(
+                        self._get_deduplication_key("")
+                    )
+                    if key not in self.deduplication_keys
+                ]
+            )
+        self.deduplication_keys = None
+        self.deduplicator.commit()
+
+    def _get_deduplication_key(self, object_id: str) -> str:
+        """Identify the document of a source object in the index of the deduplicator.
+
+        Documents are keyed by their object rather than their URL, as
+        several objects may share a URL, e.g. the speeches of a protocol.
+
+        Args:
+            object_id: ID of the source object, or the fingerprint of its
+                document if the reader cannot identify it
+
+        Returns:
+            str: Datasource and object ID
+        """
+        return f"{self.configuration.name.value}/{object_id}"
+
+    @staticmethod
+    def _get_document_fingerprint(document: Any) -> str:
+        """Compute the fingerprint of a parsed document.
+
+        Args:
+            document: Parsed document
+
+        Returns:
+            str: SHA-256 hash of the document text and metadata
+        """
+        content = json.dumps(
+            {"text": document.text, "metadata": document.metadata},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_document_object_id(document: Any, fingerprint: str) -> str:
+        """Identify the source object of a document not identified by the reader.
+
+        Falls back to the content fingerprint, so a changed object without
+        URL is synced as a new object replacing a deleted one.
+
+        Args:
+            document: Parsed document
+            fingerprint: Fingerprint of the document
+
+        Returns:
+            str: URL of the document or its fingerprint
         """
-        raise NotImplementedError("Currently unsupported feature.")
+        return document.metadata.get("url") or fingerprint
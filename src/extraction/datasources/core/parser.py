@@ -1,5 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Generic
+from concurrent.futures import Executor
+from typing import Any, Generic, Optional
 
 from llama_index.core import Document
 
@@ -12,8 +14,14 @@ class BaseParser(ABC, Generic[DocType]):
 
     Defines the interface for parsing content into documents
     of specified type (DocType).
+
+    Attributes:
+        executor: Executor used by `parse_async` to offload parsing from the
+            event loop; parsing runs inline if None
     """
 
+    executor: Optional[Executor] = None
+
     @abstractmethod
     def parse(self, content: str) -> DocType:
         """
@@ -27,6 +35,25 @@ class BaseParser(ABC, Generic[DocType]):
         """
         pass
 
+    async def parse_async(self, content: Any) -> DocType:
+        """
+        Parse content without blocking the event loop.
+
+        Runs `parse` in the parser's executor, or inline if no executor
+        is configured.
+
+        Args:
+            content: Raw content to be parsed
+
+        Returns:
+            Parsed document of type DocType
+        """
+        if self.executor is None:
+            return self.parse(content)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.parse, content)
+
 
 class BasicMarkdownParser(BaseParser[Document]):
     """
@@ -0,0 +1,306 @@
+import asyncio
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceConfiguration,
+    ProcessingExecutorType,
+)
+from extraction.datasources.core.cleaner import BaseCleaner
+from extraction.datasources.core.deduplication import MinHasher
+from extraction.datasources.core.document import DocType
+from extraction.datasources.core.parser import BaseParser
+from extraction.datasources.core.splitter import BaseSplitter
+
+_worker_pipeline: Optional[Callable[[Any], Any]] = None
+
+
+def _initialize_worker(pipeline: Callable[[Any], Any]) -> None:
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _run_worker_pipeline(item: Any) -> Any:
+    return _worker_pipeline(item)
+
+
+class ProcessedObject(NamedTuple):
+    """Result of processing a source object with `DocumentPipeline.process`."""
+
+    document: Optional[Any]
+    signature: Optional[Tuple[int, ...]]
+    split_documents: List[Any]
+    parsed_document: Optional[Any] = None
+
+
+class DocumentPipeline(Generic[DocType]):
+    """Synchronous parse, clean and split steps applied to a source object.
+
+    Instances are sent to worker processes once per worker, so the parser,
+    cleaner and splitter have to be picklable to be used with a process pool.
+    """
+
+    def __init__(
+        self,
+        parser: BaseParser,
+        cleaner: BaseCleaner,
+        splitter: BaseSplitter,
+        hasher: Optional[MinHasher] = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            parser: Content parsing component
+            cleaner: Content cleaning component
+            splitter: Content splitting component
+            hasher: Component computing signatures of cleaned documents
+                for near-duplicate detection
+        """
+        self.parser = parser
+        self.cleaner = cleaner
+        self.splitter = splitter
+        self.hasher = hasher
+
+    def __call__(self, object: Any) -> List[DocType]:
+        """Turn a source object into document chunks.
+
+        Args:
+            object: Object yielded by the reader
+
+        Returns:
+            List[DocType]: Document chunks, empty if the document was
+            dropped by the cleaner
+        """
+        return self.process(object).split_documents
+
+    def process(self, object: Any) -> ProcessedObject:
+        """Turn a source object into document chunks and a signature.
+
+        The signature is computed from the cleaned document if the pipeline
+        has a hasher, so near-duplicates can be detected and their chunks
+        dropped by the caller.
+
+        Args:
+            object: Object yielded by the reader
+
+        Returns:
+            ProcessedObject: Cleaned document, its signature and its chunks,
+            or the parsed document if the cleaner dropped it
+        """
+        document = self.parser.parse(object)
+        cleaned_document = self.cleaner.clean(document)
+        if not cleaned_document:
+            return ProcessedObject(None, None, [], parsed_document=document)
+
+        signature = (
+            self.hasher.get_signature(cleaned_document.text)
+            if self.hasher is not None
+            else None
+        )
+        return ProcessedObject(
+            cleaned_document, signature, self.splitter.split(cleaned_document)
+        )
+
+
+class KeyedFunction:
+    """Picklable function applied to the item of a key-item pair.
+
+    Keeps track of which item a result belongs to when results are yielded
+    out of order by a `ProcessingStage`.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]):
+        """Initialize the function.
+
+        Args:
+            func: Function applied to the items
+        """
+        self.func = func
+
+    def __call__(self, keyed_item: Tuple[Any, Any]) -> Tuple[Any, Any]:
+        """Apply the function to the item.
+
+        Args:
+            keyed_item: Key and item
+
+        Returns:
+            Tuple[Any, Any]: Key and result of the function
+        """
+        key, item = keyed_item
+        return key, self.func(item)
+
+
+class ProcessingStage:
+    """Executor stage running CPU-bound work off the event loop.
+
+    Items of an async iterator are processed in a thread or process pool
+    while further items are read, keeping at most `max_in_flight` items
+    submitted but not yet yielded. Results are yielded in input order or,
+    if `ordered` is False, as soon as they are completed.
+    """
+
+    def __init__(
+        self,
+        executor_type: ProcessingExecutorType,
+        max_workers: int,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+    ):
+        """Initialize the stage.
+
+        Args:
+            executor_type: Whether to process items in threads or processes
+            max_workers: Number of worker threads or processes
+            max_in_flight: Maximum number of items submitted but not yet
+                yielded, defaults to twice the number of workers
+            ordered: Whether to yield results in input order
+        """
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or 2 * max_workers
+        self.ordered = ordered
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: DatasourceConfiguration
+    ) -> Optional["ProcessingStage"]:
+        """Create the stage configured for a datasource.
+
+        Args:
+            configuration: Configuration of the datasource
+
+        Returns:
+            Optional[ProcessingStage]: The stage or None if processing is
+            configured to run inline with a single worker
+        """
+        if configuration.processing_max_workers <= 1:
+            return None
+        return cls(
+            executor_type=configuration.processing_executor,
+            max_workers=configuration.processing_max_workers,
+            max_in_flight=configuration.processing_max_in_flight,
+            ordered=configuration.processing_ordered,
+        )
+
+    async def map(
+        self, func: Callable[[Any], Any], items: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        """Apply a function to items in the pool.
+
+        Exceptions raised by the function are raised when its result would
+        be yielded.
+
+        Args:
+            func: Function to apply, picklable for a process pool
+            items: Async iterator of items to process
+
+        Returns:
+            AsyncIterator[Any]: Results of the function
+        """
+        executor, submit_func = self._create_executor(func)
+        in_flight: Deque[asyncio.Future] = deque()
+        next_item: Optional[asyncio.Future] = None
+        items_exhausted = False
+
+        try:
+            while True:
+                if (
+                    next_item is None
+                    and not items_exhausted
+                    and len(in_flight) < self.max_in_flight
+                ):
+                    next_item = asyncio.ensure_future(items.__anext__())
+
+                waiting = set(in_flight)
+                if next_item is not None:
+                    waiting.add(next_item)
+                if not waiting:
+                    return
+
+                done, _ = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_item in done:
+                    try:
+                        item = next_item.result()
+                        in_flight.append(
+                            asyncio.wrap_future(
+                                executor.submit(submit_func, item)
+                            )
+                        )
+                    except StopAsyncIteration:
+                        items_exhausted = True
+                    next_item = None
+
+                for future in self._pop_completed(in_flight):
+                    yield future.result()
+        finally:
+            if next_item is not None:
+                next_item.cancel()
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pop_completed(
+        self, in_flight: Deque[asyncio.Future]
+    ) -> List[asyncio.Future]:
+        """Remove futures whose results can be yielded.
+
+        Args:
+            in_flight: Submitted futures in input order
+
+        Returns:
+            List[asyncio.Future]: Completed futures in yield order
+        """
+        if self.ordered:
+            completed = []
+            while in_flight and in_flight[0].done():
+                completed.append(in_flight.popleft())
+            return completed
+
+        completed = [future for future in in_flight if future.done()]
+        for future in completed:
+            in_flight.remove(future)
+        return completed
+
+    def _create_executor(
+        self, func: Callable[[Any], Any]
+    ) -> tuple[Executor, Callable[[Any], Any]]:
+        """Create the pool and the function submitted to it.
+
+        Process workers receive the function once at startup instead of
+        with every item.
+
+        Args:
+            func: Function to apply
+
+        Returns:
+            tuple[Executor, Callable[[Any], Any]]: The pool and the function
+            to submit per item
+        """
+        if self.executor_type == ProcessingExecutorType.PROCESS:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(func,),
+            )
+            return executor, _run_worker_pipeline
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="document-processing",
+        )
+        return executor, func
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Set
 
 
 class BaseReader(ABC):
@@ -29,6 +29,113 @@ class BaseReader(ABC):
         """
         pass
 
+    def get_object_id(self, object: Any) -> Optional[str]:
+        """Get the ID identifying a source object across syncs.
+
+        Used by incremental syncs to match objects with their recorded state.
+        Readers that cannot identify their objects return None, in which case
+        the URL or content of the parsed document is used instead.
+
+        Args:
+            object: Object yielded by the reader
+
+        Returns:
+            Optional[str]: ID of the object or None if unknown
+        """
+        return None
+
+    def get_object_fingerprint(self, object: Any) -> Optional[str]:
+        """Get a cheap fingerprint of a source object's content.
+
+        Used by incremental syncs to skip parsing of unchanged objects, e.g.
+        based on modification times or version numbers. Readers that cannot
+        provide one return None, in which case the parsed document is hashed.
+
+        Args:
+            object: Object yielded by the reader
+
+        Returns:
+            Optional[str]: Fingerprint of the object or None if unknown
+        """
+        return None
+
+    def lists_all_objects(self) -> bool:
+        """Check whether `read_all_async` yields every object of the source.
+
+        Objects of a complete listing that were synced before but are no
+        longer yielded are treated as deleted by incremental syncs.
+
+        Returns:
+            bool: True if the reader yields all objects, False if it may skip some
+        """
+        return True
+
+    def get_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Get the position of the reader after the last yielded object.
+
+        Used by checkpointed runs to resume an interrupted read. The cursor
+        has to be JSON serializable. Readers that cannot resume return None,
+        in which case all objects are read again and the ones processed
+        before the interruption are skipped.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cursor of the reader or None
+        """
+        return None
+
+    def resume(
+        self,
+        cursor: Optional[Dict[str, Any]],
+        processed_object_ids: Set[str],
+    ) -> None:
+        """Prepare the next read to continue an interrupted one.
+
+        Readers may skip the objects up to the cursor or the objects
+        processed before the interruption, which are skipped by the manager
+        otherwise. The default implementation reads all objects again.
+
+        Args:
+            cursor: Cursor returned by `get_checkpoint` before the interruption
+            processed_object_ids: IDs of the objects processed before the
+                interruption
+        """
+        pass
+
+    def get_sync_cursor(self) -> Optional[str]:
+        """Get the position of the source after the last read.
+
+        Used by incremental syncs to record where the next sync starts.
+        Readers that cannot read changes only return None, in which case
+        the start time of the sync is recorded.
+
+        Returns:
+            Optional[str]: Opaque cursor of the source or None
+        """
+        return None
+
+    def set_sync_cursor(self, cursor: Optional[str]) -> None:
+        """Prepare the next read to yield only objects changed since a sync.
+
+        Called by incremental syncs before reading. Readers may skip objects
+        unchanged since the cursor, which are otherwise skipped by the
+        manager after comparing fingerprints. The default implementation
+        reads all objects.
+
+        Args:
+            cursor: Cursor recorded by the previous sync, None if the source
+                was never synced
+        """
+        pass
+
+    def commit_sync_state(self) -> None:
+        """Persist state kept by the reader about the last incremental read.
+
+        Called once the documents of the last incremental sync are persisted
+        and its sync state is committed. The default implementation keeps no
+        state.
+        """
+        pass
+
     @staticmethod
     def _limit_reached(yield_count: int, limit: Optional[int]) -> bool:
         """Check if the object retrieval limit has been reached.
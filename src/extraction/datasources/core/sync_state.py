@@ -0,0 +1,219 @@
+import json
+import os
+import sqlite3
+from typing import List, NamedTuple, Optional
+
+from core.logger import LoggerConfiguration
+
+
+class SyncedObject(NamedTuple):
+    """State of a source object recorded by a previous sync."""
+
+    fingerprint: str
+    document_ids: List[str]
+
+
+class SyncStateStore:
+    """Persistent state of incremental syncs backed by SQLite.
+
+    Records a cursor per source and, per source object, the fingerprint of its
+    content together with the IDs of the documents produced from it. Each sync
+    of a source is a run: objects seen during the run are marked with its ID,
+    so objects missing from a complete listing can be identified as deleted.
+
+    Changes are written in a single transaction that becomes visible only
+    after `commit`, which should be called once the synced documents are
+    persisted downstream.
+    """
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(self, path: str):
+        """Initialize the store, creating the database if it does not exist.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS cursors (
+                source TEXT PRIMARY KEY,
+                cursor TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS objects (
+                source TEXT NOT NULL,
+                object_id TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                document_ids TEXT NOT NULL,
+                run INTEGER NOT NULL,
+                PRIMARY KEY (source, object_id)
+            );
+            """
+        )
+        self._connection.commit()
+
+    def get_cursor(self, source: str) -> Optional[str]:
+        """Get the cursor recorded for a source.
+
+        Args:
+            source: Key of the source
+
+        Returns:
+            Optional[str]: The cursor or None if the source was never synced
+        """
+        row = self._connection.execute(
+            "SELECT cursor FROM cursors WHERE source = ?", (source,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_cursor(self, source: str, cursor: str) -> None:
+        """Record the cursor of a source.
+
+        Args:
+            source: Key of the source
+            cursor: Opaque position of the source after the sync
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO cursors (source, cursor) VALUES (?, ?)",
+            (source, cursor),
+        )
+
+    def start_run(self, source: str) -> int:
+        """Start a sync run of a source.
+
+        Args:
+            source: Key of the source
+
+        Returns:
+            int: ID of the run, greater than the ID of any previous run
+        """
+        row = self._connection.execute(
+            "SELECT MAX(run) FROM objects WHERE source = ?", (source,)
+        ).fetchone()
+        return (row[0] or 0) + 1
+
+    def get_object(self, source: str, object_id: str) -> Optional[SyncedObject]:
+        """Get the recorded state of a source object.
+
+        Args:
+            source: Key of the source
+            object_id: ID of the object within the source
+
+        Returns:
+            Optional[SyncedObject]: The state or None if the object is unknown
+        """
+        row = self._connection.execute(
+            "SELECT fingerprint, document_ids FROM objects "
+            "WHERE source = ? AND object_id = ?",
+            (source, object_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return SyncedObject(fingerprint=row[0], document_ids=json.loads(row[1]))
+
+    def put_object(
+        self,
+        source: str,
+        object_id: str,
+        fingerprint: str,
+        document_ids: List[str],
+        run: int,
+    ) -> None:
+        """Record the state of a source object seen during a run.
+
+        Args:
+            source: Key of the source
+            object_id: ID of the object within the source
+            fingerprint: Fingerprint of the object content
+            document_ids: IDs of the documents produced from the object
+            run: ID of the current run
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO objects "
+            "(source, object_id, fingerprint, document_ids, run) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (source, object_id, fingerprint, json.dumps(document_ids), run),
+        )
+
+    def touch_object(self, source: str, object_id: str, run: int) -> None:
+        """Mark an unchanged source object as seen during a run.
+
+        Args:
+            source: Key of the source
+            object_id: ID of the object within the source
+            run: ID of the current run
+        """
+        self._connection.execute(
+            "UPDATE objects SET run = ? WHERE source = ? AND object_id = ?",
+            (run, source, object_id),
+        )
+
+    def remove_object(self, source: str, object_id: str) -> None:
+        """Forget a source object, so it is processed again by the next run.
+
+        Args:
+            source: Key of the source
+            object_id: ID of the object within the source
+        """
+        self._connection.execute(
+            "DELETE FROM objects WHERE source = ? AND object_id = ?",
+            (source, object_id),
+        )
+
+    def get_unseen_object_ids(self, source: str, run: int) -> List[str]:
+        """Get the IDs of objects not seen during a run.
+
+        Args:
+            source: Key of the source
+            run: ID of the current run
+
+        Returns:
+            List[str]: IDs of the objects removed by `remove_unseen_objects`
+        """
+        rows = self._connection.execute(
+            "SELECT object_id FROM objects WHERE source = ? AND run < ?",
+            (source, run),
+        ).fetchall()
+        return [object_id for (object_id,) in rows]
+
+    def remove_unseen_objects(self, source: str, run: int) -> List[str]:
+        """Remove objects not seen during a run, i.e. deleted from the source.
+
+        Must only be called after a complete listing of the source.
+
+        Args:
+            source: Key of the source
+            run: ID of the current run
+
+        Returns:
+            List[str]: IDs of the documents produced from the removed objects
+        """
+        rows = self._connection.execute(
+            "SELECT document_ids FROM objects WHERE source = ? AND run < ?",
+            (source, run),
+        ).fetchall()
+        self._connection.execute(
+            "DELETE FROM objects WHERE source = ? AND run < ?", (source, run)
+        )
+        return [
+            document_id for (row,) in rows for document_id in json.loads(row)
+        ]
+
+    def commit(self) -> None:
+        """Persist all changes since the last commit."""
+        self._connection.commit()
+        self.logger.debug(f"Committed sync state to {self.path}")
+
+    def rollback(self) -> None:
+        """Discard all changes since the last commit."""
+        self._connection.rollback()
+
+    def close(self) -> None:
+        """Close the database connection, discarding uncommitted changes."""
+        self._connection.close()
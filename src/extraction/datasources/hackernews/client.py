@@ -1,14 +1,27 @@
-from typing import Type, Dict, List, Any, Iterator, Optional
+import asyncio
+from typing import Type, Dict, List, Any, AsyncIterator, Iterator, NamedTuple, Optional
 
-from apiclient import APIClient, retry_request
+import httpx
+from apiclient import APIClient
 from core.logger import LoggerConfiguration
 from pydantic import BaseModel, ValidationError
 
 from core import SingletonFactory
+from extraction.datasources.core.http_transport import HttpTransport
 from extraction.datasources.hackernews.configuration import (
     HackerNewsDatasourceConfiguration,
 )
 
+class CommentItem(BaseModel):
+    id: int
+    by: Optional[str] = None
+    text: Optional[str] = None
+    time: Optional[int] = None
+    kids: List[int] = []
+    deleted: bool = False
+    dead: bool = False
+    replies: List["CommentItem"] = []
+
 class StoryItem(BaseModel):
     id: int
     title: str
@@ -16,8 +29,15 @@ class StoryItem(BaseModel):
     score: int
     by: str
     time: int
-    #descendants: Optional[int] = 0
-    #kids: Optional[List[int]] = []
+    descendants: Optional[int] = None
+    kids: List[int] = []
+    comments: List[CommentItem] = []
+
+class StoryChanges(NamedTuple):
+    """Stories changed since a previous read of the top stories."""
+
+    max_item_id: int
+    story_ids: List[int]
 
 class HackerNewsClient(APIClient):
     """
@@ -26,6 +46,31 @@ class HackerNewsClient(APIClient):
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
     logger = LoggerConfiguration.get_logger(__name__)
 
+    def __init__(
+        self,
+        max_concurrent_requests: int = 16,
+        http_transport: Optional[HttpTransport] = None,
+        comment_depth: int = 0,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the Hacker News client.
+
+        Args:
+            max_concurrent_requests: Maximum number of item requests in flight
+                when fetching asynchronously
+            http_transport: Transport creating the HTTP sessions, defaults
+                to one with retries and without cache
+            comment_depth: Levels of comments fetched with each story when
+                fetching asynchronously, 0 to fetch no comments
+        """
+        super().__init__(**kwargs)
+        self.max_concurrent_requests = max_concurrent_requests
+        self.http_transport = http_transport or HttpTransport()
+        self.comment_depth = comment_depth
+
+        self.set_session(self.http_transport.create_session())
+
     def safe_get(self, path: str) -> Optional[Any]:
         url = f"{self.BASE_URL}/{path.lstrip('/')}"
         """
@@ -72,7 +117,6 @@ class HackerNewsClient(APIClient):
             return {}
         return item
     
-    @retry_request
     def get_top_stories_with_details(self) -> Iterator[StoryItem]:
         top_ids = self.get_top_stories()
         for story_id in top_ids:
@@ -84,6 +128,303 @@ class HackerNewsClient(APIClient):
                 except ValidationError as e:
                     self.logger.warning(f"Failed to validate story {story_id}: {e}")
 
+    async def get_top_stories_with_details_async(
+        self, limit: Optional[int] = None
+    ) -> AsyncIterator[StoryItem]:
+        """
+        Asynchronously fetch top stories with bounded concurrency.
+
+        Item requests share a single keep-alive connection pool and at most
+        `max_concurrent_requests` of them are in flight at any time. Stories
+        are yielded in completion order, so the ranking of `topstories.json`
+        is not preserved.
+
+        Args:
+            limit: Maximum number of stories to yield (None for unlimited)
+
+        Returns:
+            AsyncIterator[StoryItem]: Validated stories as they are fetched
+        """
+        async with self._create_async_session() as session:
+            top_ids = await self._safe_get_async(session, "topstories.json")
+            if top_ids is None:
+                self.logger.warning("Failed to fetch top stories.")
+                return
+
+            async for story in self._get_stories_async(session, top_ids, limit):
+                yield story
+
+    async def get_stories_with_details_async(
+        self, story_ids: List[int], limit: Optional[int] = None
+    ) -> AsyncIterator[StoryItem]:
+        """
+        Asynchronously fetch the given stories with bounded concurrency.
+
+        Args:
+            story_ids: IDs of the stories to fetch
+            limit: Maximum number of stories to yield (None for unlimited)
+
+        Returns:
+            AsyncIterator[StoryItem]: Validated stories in completion order
+        """
+        async with self._create_async_session() as session:
+            async for story in self._get_stories_async(session, story_ids, limit):
+                yield story
+
+    async def get_changed_top_stories_async(
+        self, since_item_id: Optional[int] = None
+    ) -> Optional[StoryChanges]:
+        """
+        Find the top stories that are new or changed since a previous read.
+
+        Item IDs are assigned in increasing order, so top stories with an ID
+        above the largest item ID at the previous read are new. Older top
+        stories are only considered changed if they are listed in
+        `updates.json`, which covers recent changes only, so the changes of
+        older stories are missed if reads are too far apart. Costs three
+        requests regardless of the number of top stories.
+
+        Args:
+            since_item_id: Largest item ID at the previous read, None to
+                consider all top stories new
+
+        Returns:
+            Optional[StoryChanges]: Current largest item ID and IDs of the
+            changed top stories in ranking order, None if the listings could
+            not be fetched, including `updates.json` when changes since a
+            previous read are requested
+        """
+        async with self._create_async_session() as session:
+            max_item_id, top_ids, updates = await asyncio.gather(
+                self._safe_get_async(session, "maxitem.json"),
+                self._safe_get_async(session, "topstories.json"),
+                self._safe_get_async(session, "updates.json"),
+            )
+
+        if max_item_id is None or top_ids is None:
+            self.logger.warning("Failed to fetch story changes.")
+            return None
+        if since_item_id is None:
+            return StoryChanges(max_item_id, top_ids)
+        if updates is None:
+            self.logger.warning("Failed to fetch updated items.")
+            return None
+
+        updated_ids = set(updates.get("items", []))
+        return StoryChanges(
+            max_item_id,
+            [
+                story_id
+                for story_id in top_ids
+                if story_id > since_item_id or story_id in updated_ids
+            ],
+        )
+
+    async def _get_stories_async(
+        self,
+        session: httpx.AsyncClient,
+        story_ids: List[int],
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[StoryItem]:
+        """
+        Fetch and validate stories using a sliding window of requests.
+
+        New requests are only scheduled while the limit can still be missed,
+        and outstanding requests are cancelled once it is reached.
+
+        Args:
+            session: Shared asynchronous HTTP session
+            story_ids: IDs of the stories to fetch
+            limit: Maximum number of stories to yield (None for unlimited)
+
+        Returns:
+            AsyncIterator[StoryItem]: Validated stories in completion order
+        """
+        remaining_ids = iter(story_ids)
+        pending = set()
+        yield_counter = 0
+
+        def schedule_next() -> bool:
+            story_id = next(remaining_ids, None)
+            if story_id is None:
+                return False
+            pending.add(
+                asyncio.ensure_future(self._get_story_async(session, story_id))
+            )
+            return True
+
+        try:
+            while len(pending) < self.max_concurrent_requests and schedule_next():
+                pass
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    story = task.result()
+                    if story is None:
+                        continue
+                    if limit is not None and yield_counter >= limit:
+                        return
+                    yield_counter += 1
+                    yield story
+
+                if limit is not None and yield_counter >= limit:
+                    return
+
+                while (
+                    len(pending) < self.max_concurrent_requests
+                    and schedule_next()
+                ):
+                    pass
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _get_story_async(
+        self, session: httpx.AsyncClient, story_id: int
+    ) -> Optional[StoryItem]:
+        """
+        Fetch and validate a single story.
+
+        Args:
+            session: Shared asynchronous HTTP session
+            story_id: ID of the story to fetch
+
+        Returns:
+            Optional[StoryItem]: Validated story or None if fetching or validation failed
+        """
+        self.logger.debug(f"Processing story {story_id}")
+        story_data = await self._safe_get_async(session, f"item/{story_id}.json")
+        if not story_data:
+            self.logger.warning(f"Failed to fetch item with ID {story_id}.")
+            return None
+
+        try:
+            story = StoryItem.model_validate(story_data)
+        except ValidationError as e:
+            self.logger.warning(f"Failed to validate story {story_id}: {e}")
+            return None
+
+        if self.comment_depth > 0 and story.kids:
+            story.comments = await self._get_comments_async(
+                session, story.kids, depth=1
+            )
+        return story
+
+    async def _get_comments_async(
+        self, session: httpx.AsyncClient, comment_ids: List[int], depth: int
+    ) -> List[CommentItem]:
+        """
+        Fetch comments and their replies up to `comment_depth` concurrently.
+
+        At most `max_concurrent_requests` comments of a level are fetched at
+        a time, a comment keeping its slot while its replies are fetched.
+
+        Args:
+            session: Shared asynchronous HTTP session
+            comment_ids: IDs of the comments to fetch
+            depth: Level of the comments, 1 for replies to the story
+
+        Returns:
+            List[CommentItem]: Comments in their original order, without
+            deleted, dead or invalid ones
+        """
+        slots = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def get_comment(comment_id: int) -> Optional[CommentItem]:
+            async with slots:
+                return await self._get_comment_async(
+                    session, comment_id, depth
+                )
+
+        comments = await asyncio.gather(
+            *(get_comment(comment_id) for comment_id in comment_ids)
+        )
+        return [comment for comment in comments if comment is not None]
+
+    async def _get_comment_async(
+        self, session: httpx.AsyncClient, comment_id: int, depth: int
+    ) -> Optional[CommentItem]:
+        """
+        Fetch and validate a single comment and its replies.
+
+        Args:
+            session: Shared asynchronous HTTP session
+            comment_id: ID of the comment to fetch
+            depth: Level of the comment, 1 for replies to the story
+
+        Returns:
+            Optional[CommentItem]: Validated comment or None if fetching or
+            validation failed or the comment is deleted
+        """
+        comment_data = await self._safe_get_async(
+            session, f"item/{comment_id}.json"
+        )
+        if not comment_data:
+            self.logger.warning(f"Failed to fetch item with ID {comment_id}.")
+            return None
+
+        try:
+            comment = CommentItem.model_validate(comment_data)
+        except ValidationError as e:
+            self.logger.warning(f"Failed to validate comment {comment_id}: {e}")
+            return None
+
+        if comment.deleted or comment.dead:
+            return None
+        if depth < self.comment_depth and comment.kids:
+            comment.replies = await self._get_comments_async(
+                session, comment.kids, depth + 1
+            )
+        return comment
+
+    async def _safe_get_async(
+        self, session: httpx.AsyncClient, path: str
+    ) -> Optional[Any]:
+        """
+        Asynchronous counterpart of `safe_get`.
+
+        Args:
+            session: Shared asynchronous HTTP session
+            path: endpoint path under BASE_URL
+
+        Returns:
+            List[int] or Dict[str, Any], None if the request failed
+        """
+        url = f"{self.BASE_URL}/{path.lstrip('/')}"
+        try:
+            resp = await session.get(url)
+            resp.raise_for_status()
+            result = resp.json()
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"HTTP error for {url}: {e}")
+            return None
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch data for {url}: {e}")
+            return None
+
+        if result is None:
+            self.logger.debug(f"No result found for {url}")
+            return None
+
+        return result
+
+    def _create_async_session(self) -> httpx.AsyncClient:
+        """
+        Create an asynchronous HTTP session with a keep-alive pool sized to
+        the configured concurrency. Requests wait for a free connection
+        without timing out, so the pool bounds the requests in flight.
+
+        Returns:
+            httpx.AsyncClient: Session to be used as an async context manager
+        """
+        return self.http_transport.create_async_client(
+            self.max_concurrent_requests
+        )
+
 class HackerNewsClientFactory(SingletonFactory):
     """
     Factory for creating and managing Hacker News client instances.
@@ -107,4 +448,8 @@ class HackerNewsClientFactory(SingletonFactory):
         Returns:
             A configured Hacker News client instance ready for API interactions.
         """
-        return HackerNewsClient()
+        return HackerNewsClient(
+            max_concurrent_requests=configuration.max_concurrent_requests,
+            http_transport=HttpTransport.from_configuration(configuration),
+            comment_depth=configuration.comment_depth,
+        )
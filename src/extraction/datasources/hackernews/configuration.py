@@ -13,4 +13,13 @@ class HackerNewsDatasourceConfiguration(DatasourceConfiguration):
         ...,
         description="Identifier specifying this configuration is for the Hacker News datasource",
     )
+    max_concurrent_requests: int = Field(
+        16,
+        description="Maximum number of item requests sent to the Hacker News API concurrently",
+    )
+    comment_depth: int = Field(
+        0,
+        ge=0,
+        description="Levels of comments fetched with each story, 0 to fetch no comments",
+    )
 
@@ -1,8 +1,10 @@
-from typing import Type
+from typing import List, Type
+
+from markdownify import markdownify as md
 
 from core.base_factory import Factory
 from core.logger import LoggerConfiguration
-from extraction.datasources.hackernews.client import StoryItem
+from extraction.datasources.hackernews.client import CommentItem, StoryItem
 from extraction.datasources.hackernews.configuration import (
     HackerNewsDatasourceConfiguration,
 )
@@ -18,6 +20,9 @@ class HackerNewsDatasourceParser(BaseParser[HackerNewsDocument]):
         """
         Parse content into a HackerNewsDocument object.
 
+        Comments fetched with the story are appended to its title as a
+        nested markdown list.
+
         Args:
             content: Raw response dict to be parsed
 
@@ -25,7 +30,31 @@ class HackerNewsDatasourceParser(BaseParser[HackerNewsDocument]):
             Parsed document of type HackerNewsDocument
         """
         metadata = self._extract_metadata(story)
-        return HackerNewsDocument(text=story.title, metadata=metadata)
+        text = story.title
+        if story.comments:
+            text += "\n\n" + "\n".join(self._render_comments(story.comments))
+        return HackerNewsDocument(text=text, metadata=metadata)
+
+    def _render_comments(
+        self, comments: List[CommentItem], indent: str = ""
+    ) -> List[str]:
+        """
+        Render comments and their replies as markdown list items.
+
+        Args:
+            comments: Comments to render
+            indent: Indentation of the list items
+
+        Returns:
+            Lines of the rendered comments
+        """
+        lines = []
+        for comment in comments:
+            text = md(comment.text or "").strip().splitlines() or [""]
+            lines.append(f"{indent}- {comment.by}: {text[0]}")
+            lines.extend(f"{indent}  {line}" if line else "" for line in text[1:])
+            lines.extend(self._render_comments(comment.replies, indent + "  "))
+        return lines
     
     def _extract_metadata(self, story: StoryItem) -> dict:
         """
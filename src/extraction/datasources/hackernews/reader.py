@@ -1,11 +1,13 @@
+import json
 import logging
-from typing import AsyncIterator
+from typing import AsyncIterator, List, Optional
 
 from core import Factory
 from core.logger import LoggerConfiguration
 from extraction.datasources.hackernews.client import (
     HackerNewsClient,
     HackerNewsClientFactory,
+    StoryItem,
 )
 from extraction.datasources.hackernews.configuration import (
     HackerNewsDatasourceConfiguration,
@@ -36,6 +38,12 @@ class HackerNewsDatasourceReader(BaseReader):
         self.export_limit = configuration.export_limit
         self.client = client
         self.logger = logger
+        self.incremental = False
+        self.sync_cursor: Optional[str] = None
+        self.since_item_id: Optional[int] = None
+        self.max_item_id: Optional[int] = None
+        self.retry_item_ids: List[int] = []
+        self.failed_item_ids: List[int] = []
 
     async def read_all_async(
         self,
@@ -43,6 +51,8 @@ class HackerNewsDatasourceReader(BaseReader):
         """Asynchronously fetch top stories from Hacker News.
 
         Yields each stories as a dictionary containing its content and metadata.
+        In incremental syncs, only top stories new or changed since the
+        previous sync are fetched.
 
         Returns:
             AsyncIterator[dict]: An async iterator of page dictionaries containing
@@ -51,10 +61,15 @@ class HackerNewsDatasourceReader(BaseReader):
         self.logger.info(
             f"Reading stories from Hacker News with limit {self.export_limit}"
         )
-        stories_iterator = self.client.get_top_stories_with_details()
+        if self.incremental:
+            stories_iterator = self._read_changed_stories_async()
+        else:
+            stories_iterator = self.client.get_top_stories_with_details_async(
+                limit=self.export_limit
+            )
         yield_counter = 0
 
-        for story in stories_iterator:
+        async for story in stories_iterator:
             if self._limit_reached(yield_counter, self.export_limit):
                 return
 
@@ -64,6 +79,112 @@ class HackerNewsDatasourceReader(BaseReader):
             yield_counter += 1
             yield story
 
+    async def _read_changed_stories_async(self) -> AsyncIterator[StoryItem]:
+        """Fetch the top stories new or changed since the previous sync.
+
+        Stories that failed to be fetched by the previous sync are fetched
+        again. The largest item ID is only advanced once all changed stories
+        were read within the export limit, so stories left out are fetched by
+        the next sync, and stories that failed to be fetched are kept in the
+        cursor to be retried.
+
+        Returns:
+            AsyncIterator[StoryItem]: Changed stories in completion order
+        """
+        changes = await self.client.get_changed_top_stories_async(
+            self.since_item_id
+        )
+        if changes is None:
+            return
+
+        changed_ids = set(changes.story_ids)
+        story_ids = changes.story_ids + [
+            story_id
+            for story_id in self.retry_item_ids
+            if story_id not in changed_ids
+        ]
+        self.logger.info(
+            f"Found {len(story_ids)} new or changed Hacker News stories "
+            f"since item {self.since_item_id}."
+        )
+
+        fetched_ids = set()
+        async for story in self.client.get_stories_with_details_async(
+            story_ids, limit=self.export_limit
+        ):
+            fetched_ids.add(story.id)
+            yield story
+
+        if self.export_limit is None or len(story_ids) <= self.export_limit:
+            self.max_item_id = changes.max_item_id
+            self.failed_item_ids = [
+                story_id for story_id in story_ids if story_id not in fetched_ids
+            ]
+            if self.failed_item_ids:
+                self.logger.warning(
+                    f"Failed to fetch {len(self.failed_item_ids)} Hacker News "
+                    "stories, retrying them in the next sync."
+                )
+
+    def get_object_id(self, story: StoryItem) -> str:
+        """Identify a Hacker News story by its ID.
+
+        Args:
+            story: Hacker News story
+
+        Returns:
+            str: ID of the story
+        """
+        return str(story.id)
+
+    def lists_all_objects(self) -> bool:
+        """Check whether all stories are yielded.
+
+        Returns:
+            bool: False, since stories dropping out of the top stories are
+            not deleted
+        """
+        return False
+
+    def get_sync_cursor(self) -> Optional[str]:
+        """Get the largest item ID at the start of the last complete read.
+
+        Returns:
+            Optional[str]: JSON cursor with the item ID and the IDs of the
+            stories that failed to be fetched, the cursor of the
+            previous sync if the read was incomplete, None outside of
+            incremental syncs
+        """
+        if not self.incremental:
+            return None
+        if self.max_item_id is None:
+            return self.sync_cursor
+        cursor = {"max_item_id": self.max_item_id}
+        if self.failed_item_ids:
+            cursor["retry_item_ids"] = self.failed_item_ids
+        return json.dumps(cursor)
+
+    def set_sync_cursor(self, cursor: Optional[str]) -> None:
+        """Read only top stories new or changed since a previous sync.
+
+        Args:
+            cursor: Cursor returned by `get_sync_cursor`, all top stories
+                are read if it is None or was recorded by another reader
+        """
+        self.incremental = True
+        self.sync_cursor = cursor
+        self.max_item_id = None
+        self.failed_item_ids = []
+        try:
+            parsed_cursor = json.loads(cursor)
+            self.since_item_id = int(parsed_cursor["max_item_id"])
+            self.retry_item_ids = [
+                int(story_id)
+                for story_id in parsed_cursor.get("retry_item_ids", [])
+            ]
+        except (TypeError, ValueError, KeyError, AttributeError):
+            self.since_item_id = None
+            self.retry_item_ids = []
 
 
 class HackerNewsDatasourceReaderFactory(Factory):
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 from bs4 import BeautifulSoup
 from markdownify import markdownify as md
@@ -77,10 +78,11 @@ class NotionDatasourceCleaner(BasicMarkdownCleaner[NotionDocument]):
     def _parse_html_in_markdown(md_text: str) -> str:
         """Process HTML elements within markdown content.
 
-        Performs two main cleaning operations:
+        Scans the text once, handling every HTML token where it is found:
         1. Removes HTML comments completely
-        2. Converts HTML tags to markdown format
-        3. Removes elements that don't contain alphanumeric characters
+        2. Removes tags that have no textual markdown representation
+        3. Converts the remaining tags, such as images, to markdown format
+           and removes them if they don't contain alphanumeric characters
 
         Args:
             md_text: Text containing markdown and HTML
@@ -90,20 +92,60 @@ class NotionDatasourceCleaner(BasicMarkdownCleaner[NotionDocument]):
 
         Note:
             Uses BeautifulSoup for HTML parsing and markdownify for HTML-to-markdown conversion
+            only for tags that can be converted to text
         """
+        return _HTML_TOKEN_RE.sub(_replace_html_token, md_text)
 
-        def replace_html(match):
-            html_content = match.group(0)
-            soup = BeautifulSoup(html_content, "html.parser")
-            markdown = md(str(soup))
 
-            if not re.search(r"[a-zA-Z0-9]", markdown):
-                return ""
-            return markdown
+# Matches, in order of precedence, an HTML comment, a tag and any other
+# text enclosed in angle brackets
+_HTML_TOKEN_RE = re.compile(
+    r"<!--.*?-->|<(/?)([a-zA-Z][^\s/<>]*)[^<>]*>|<[^>]*>", re.DOTALL
+)
+# Tags whose markdown representation is built from their attributes
+_CONVERTIBLE_TAGS = frozenset({"img", "video"})
+_ALPHANUMERIC_RE = re.compile(r"[a-zA-Z0-9]")
+
+
+def _replace_html_token(match: re.Match) -> str:
+    """Get the replacement of an HTML token matched in markdown text.
+
+    Args:
+        match: Match of `_HTML_TOKEN_RE`
+
+    Returns:
+        str: Markdown replacing the token
+    """
+    html_content = match.group(0)
+    if html_content.startswith("<!--") and html_content.endswith("-->"):
+        return ""
+    is_closing_tag, tag_name = match.group(1, 2)
+    if tag_name is not None and (
+        is_closing_tag or tag_name.lower() not in _CONVERTIBLE_TAGS
+    ):
+        return ""
+    return _convert_html(html_content)
+
+
+@lru_cache(maxsize=4096)
+def _convert_html(html_content: str) -> str:
+    """Convert an HTML fragment to markdown.
+
+    Exported databases repeat the same fragments, so conversions are cached.
+
+    Args:
+        html_content: HTML fragment to convert
+
+    Returns:
+        str: Markdown of the fragment or an empty string if it doesn't
+        contain alphanumeric characters
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+    markdown = md(str(soup))
 
-        md_text = re.sub(r"<!--.*?-->", "", md_text, flags=re.DOTALL)
-        html_block_re = re.compile(r"<.*?>", re.DOTALL)
-        return re.sub(html_block_re, replace_html, md_text)
+    if not _ALPHANUMERIC_RE.search(markdown):
+        return ""
+    return markdown
 
 
 class NotionDatasourceCleanerFactory(Factory):
@@ -3,6 +3,7 @@ from typing import Type
 from notion_client import Client
 
 from core.base_factory import SingletonFactory
+from extraction.datasources.core.http_transport import HttpTransport
 from extraction.datasources.notion.configuration import (
     NotionDatasourceConfiguration,
 )
@@ -32,7 +33,9 @@ class NotionClientFactory(SingletonFactory):
         """Create a new instance of the Notion API client.
 
         This method extracts the API token from the provided configuration's
-        secrets and uses it to authenticate a new Notion client.
+        secrets and uses it to authenticate a new Notion client. Failed
+        requests are retried by the shared HTTP transport and responses go
+        through the HTTP cache if one is configured.
 
         Args:
             configuration: Configuration object containing Notion API credentials
@@ -41,4 +44,9 @@ class NotionClientFactory(SingletonFactory):
         Returns:
             A configured Notion API client instance ready for making API calls.
         """
-        return Client(auth=configuration.secrets.api_token.get_secret_value())
+        return Client(
+            auth=configuration.secrets.api_token.get_secret_value(),
+            client=HttpTransport.from_configuration(
+                configuration
+            ).create_client(),
+        )
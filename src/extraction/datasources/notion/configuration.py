@@ -31,7 +31,15 @@ class NotionDatasourceConfiguration(DatasourceConfiguration):
     )
     export_batch_size: int = Field(
         3,
-        description="Maximum number of pages to export concurrently; controls throughput vs. rate limit compliance",
+        description="Number of pages or databases exported per chunk, whose documents are yielded once the chunk is exported; API concurrency is set by max_concurrent_requests",
+    )
+    requests_per_second: float = Field(
+        3.0,
+        description="Sustained rate of Notion API requests shared by all export calls; lowered temporarily when the API responds with Retry-After",
+    )
+    max_concurrent_requests: int = Field(
+        3,
+        description="Maximum number of Notion API requests in flight during export",
     )
     secrets: Secrets = Field(
         None,
@@ -3,7 +3,8 @@ import logging
 import traceback
 from typing import List, Optional
 
-from notion_client import APIResponseError
+import httpx
+from notion_client import APIResponseError, AsyncClient
 from notion_client.helpers import async_collect_paginated_api
 from notion_exporter import NotionExporter as NotionExporterCore
 from notion_exporter.block_converter import BlockConverter
@@ -22,10 +23,18 @@ from tenacity import (
 
 from core.base_factory import SingletonFactory
 from core.logger import LoggerConfiguration
+from extraction.datasources.core.http_cache import (
+    AsyncCachingTransport,
+    HttpCache,
+)
 from extraction.datasources.notion.configuration import (
     NotionDatasourceConfiguration,
 )
 from extraction.datasources.notion.document import NotionDocument
+from extraction.datasources.notion.rate_limiter import (
+    AsyncTokenBucket,
+    RateLimitedTransport,
+)
 
 retry_decorator = retry(
     retry=(
@@ -149,6 +158,9 @@ class _NotionExporterCore(NotionExporterCore):
         export_child_pages: bool = False,
         extract_page_metadata: bool = False,
         exclude_title_containing: Optional[str] = None,
+        requests_per_second: float = 3.0,
+        max_concurrent_requests: int = 3,
+        http_cache: Optional[HttpCache] = None,
         logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
     ):
         super().__init__(
@@ -157,6 +169,21 @@ class _NotionExporterCore(NotionExporterCore):
             extract_page_metadata=extract_page_metadata,
             exclude_title_containing=exclude_title_containing,
         )
+        # Custom modification ---
+        # Route all async API calls through a shared rate limiter,
+        # behind the HTTP cache so that replayed responses are not limited
+        self.rate_limiter = AsyncTokenBucket(rate=requests_per_second)
+        transport = RateLimitedTransport(
+            bucket=self.rate_limiter,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        if http_cache is not None:
+            transport = AsyncCachingTransport(http_cache, transport)
+        self.notion = AsyncClient(
+            auth=notion_token,
+            client=httpx.AsyncClient(transport=transport),
+        )
+        # --- Custom modification
         self.property_converter = _PropertyConverter(self)
         self.block_converter = _BlockConverter()
         self.logger = logger
@@ -544,16 +571,25 @@ class NotionExporter:
     def __init__(
         self,
         api_token: str,
+        requests_per_second: float = 3.0,
+        max_concurrent_requests: int = 3,
+        http_cache: Optional[HttpCache] = None,
     ):
         """Initialize Notion exporter.
 
         Args:
             api_token: Authentication token for Notion API
+            requests_per_second: Sustained request rate shared by all API calls
+            max_concurrent_requests: Maximum number of API requests in flight
+            http_cache: Cache recording or replaying API responses
         """
         self.notion_exporter = _NotionExporterCore(
             notion_token=api_token,
             export_child_pages=False,
             extract_page_metadata=True,
+            requests_per_second=requests_per_second,
+            max_concurrent_requests=max_concurrent_requests,
+            http_cache=http_cache,
         )
 
     async def run(
@@ -612,5 +648,8 @@ class NotionExporterFactory(SingletonFactory):
             Configured NotionExporter instance
         """
         return NotionExporter(
-            configuration.secrets.api_token.get_secret_value()
+            api_token=configuration.secrets.api_token.get_secret_value(),
+            requests_per_second=configuration.requests_per_second,
+            max_concurrent_requests=configuration.max_concurrent_requests,
+            http_cache=HttpCache.from_configuration(configuration),
         )
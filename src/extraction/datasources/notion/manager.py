@@ -1,7 +1,9 @@
-from typing import AsyncIterator
+from typing import Optional
 
 from core.base_factory import Factory
-from extraction.datasources.core.manager import BaseDatasourceManager
+from extraction.datasources.core.deduplication import Deduplicator
+from extraction.datasources.core.manager import BasicDatasourceManager
+from extraction.datasources.core.processing import ProcessingStage
 from extraction.datasources.notion.cleaner import (
     NotionDatasourceCleaner,
     NotionDatasourceCleanerFactory,
@@ -20,11 +22,12 @@ from extraction.datasources.notion.reader import (
 )
 
 
-class NotionDatasourceManager(BaseDatasourceManager[NotionDocument]):
+class NotionDatasourceManager(BasicDatasourceManager[NotionDocument]):
     """Manager for handling Notion datasource extraction and processing.
 
     This class coordinates the reading, parsing, and cleaning of Notion content
     to produce structured NotionDocument objects ready for further processing.
+    Notion documents are not split.
     """
 
     def __init__(
@@ -33,6 +36,8 @@ class NotionDatasourceManager(BaseDatasourceManager[NotionDocument]):
         reader: NotionDatasourceReader,
         parser: NotionDatasourceParser,
         cleaner: NotionDatasourceCleaner,
+        processing_stage: Optional[ProcessingStage] = None,
+        deduplicator: Optional[Deduplicator] = None,
     ):
         """Initialize the Notion datasource manager.
 
@@ -41,35 +46,17 @@ class NotionDatasourceManager(BaseDatasourceManager[NotionDocument]):
             reader: Component responsible for fetching data from Notion
             parser: Component responsible for parsing Notion data
             cleaner: Component responsible for cleaning parsed Notion documents
+            processing_stage: Pool parsing and cleaning Notion objects
+            deduplicator: Component dropping near-duplicate documents
         """
-        self.configuration = configuration
-        self.reader = reader
-        self.parser = parser
-        self.cleaner = cleaner
-
-    def incremental_sync(self):
-        """
-        Not implemented.
-        """
-        raise NotImplementedError("Currently unsupported feature.")
-
-    async def full_refresh_sync(
-        self,
-    ) -> AsyncIterator[NotionDocument]:
-        """Perform a full refresh of all documents from the Notion datasource.
-
-        This method reads all objects from the Notion datasource, parses them
-        into documents, cleans them, and yields the cleaned documents.
-
-        Returns:
-            An async iterator of cleaned NotionDocument objects
-        """
-        objects = await self.reader.read_all_async()
-        for object in objects:
-            document = self.parser.parse(object)
-            cleaned_document = self.cleaner.clean(document)
-            if cleaned_document:
-                yield cleaned_document
+        super().__init__(
+            configuration=configuration,
+            reader=reader,
+            parser=parser,
+            cleaner=cleaner,
+            processing_stage=processing_stage,
+            deduplicator=deduplicator,
+        )
 
 
 class NotionDatasourceManagerFactory(Factory):
@@ -109,4 +96,6 @@ class NotionDatasourceManagerFactory(Factory):
             reader=reader,
             parser=parser,
             cleaner=cleaner,
+            processing_stage=ProcessingStage.from_configuration(configuration),
+            deduplicator=Deduplicator.from_configuration(configuration),
         )
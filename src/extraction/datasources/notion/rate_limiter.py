@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import httpx
+
+from core.logger import LoggerConfiguration
+from extraction.datasources.core.http_transport import parse_retry_after
+
+
+class AsyncTokenBucket:
+    """Asynchronous token bucket shared by all requests of an exporter.
+
+    Tokens are refilled at `rate` per second up to `capacity`. The rate adapts
+    to the API: a rate-limited response pauses the bucket for the duration
+    requested by the server and halves the rate, while each successful request
+    raises it again until the configured rate is reached.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+    ):
+        """Initialize the token bucket.
+
+        Args:
+            rate: Maximum number of tokens granted per second
+            capacity: Maximum number of tokens that can be accumulated,
+                defaults to one second worth of tokens
+            min_rate: Lower bound for the adapted rate, defaults to a tenth
+                of the configured rate
+        """
+        if rate <= 0:
+            raise ValueError("Rate of the token bucket must be positive.")
+
+        self.max_rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it.
+
+        Waiters are served in arrival order.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Additively recover the rate after a successful request."""
+        if self.rate < self.max_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        """Pause the bucket and halve the rate after a rate-limited request.
+
+        Args:
+            retry_after: Number of seconds requested by the server
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0
+        self._paused_until = max(self._paused_until, now + retry_after)
+        self.rate = max(self.min_rate, self.rate / 2)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - max(self._updated_at, self._paused_until))
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """HTTPX transport enforcing a shared rate and in-flight limit.
+
+    Every request acquires a token from the bucket and a slot of the in-flight
+    semaphore before it is sent. Responses with status 429 are retried after
+    the delay from their `Retry-After` header, so that rate limiting does not
+    surface as failed exports.
+    """
+
+    RATE_LIMITED_STATUS_CODE = 429
+
+    def __init__(
+        self,
+        bucket: AsyncTokenBucket,
+        max_concurrent_requests: int,
+        max_retries: int = 5,
+        default_retry_after: float = 1.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ):
+        """Initialize the transport.
+
+        Args:
+            bucket: Token bucket shared by all requests
+            max_concurrent_requests: Maximum number of requests in flight
+            max_retries: Maximum number of retries of a rate-limited request
+            default_retry_after: Delay in seconds used when the server does
+                not send a valid `Retry-After` header
+            transport: Underlying transport sending the requests
+            logger: Logger instance for logging messages
+        """
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+        self.transport = transport or httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_concurrent_requests,
+                max_keepalive_connections=max_concurrent_requests,
+            )
+        )
+        self.logger = logger
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        """Send the request within the rate and in-flight limits.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            httpx.Response: The first response that is not rate-limited, or
+            the last rate-limited response once retries are exhausted
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            async with self._semaphore:
+                response = await self.transport.handle_async_request(request)
+
+            if response.status_code != self.RATE_LIMITED_STATUS_CODE:
+                self.bucket.on_success()
+                return response
+
+            retry_after = self._get_retry_after(response)
+            self.bucket.on_rate_limited(retry_after)
+            if attempt == self.max_retries:
+                return response
+
+            self.logger.warning(
+                f"Rate limited by {request.url.host}, retrying in {retry_after}s "
+                f"at {self.bucket.rate:.2f} requests/s."
+            )
+            await response.aclose()
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def _get_retry_after(self, response: httpx.Response) -> float:
+        """Parse the `Retry-After` header of a response.
+
+        Args:
+            response: Rate-limited response
+
+        Returns:
+            float: Number of seconds to wait before retrying
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.default_retry_after
+        return retry_after
@@ -1,8 +1,19 @@
+import asyncio
 import logging
+import math
 from enum import Enum
-from typing import Any, Callable, List, Tuple
+from itertools import count
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from more_itertools import chunked
 from notion_client import Client
 
 from core.base_factory import Factory
@@ -34,9 +45,14 @@ class NotionDatasourceReader(BaseReader):
     """Reader for extracting documents from Notion workspace.
 
     Implements document extraction from Notion pages and databases with
-    support for batched async operations and export limits.
+    support for batched async operations and export limits. The cursor of the
+    reader holds the collected database and page IDs, so a resumed read
+    exports the objects not processed yet without listing them again.
     """
 
+    # Maximum number of results per page accepted by the Notion API
+    MAX_PAGE_SIZE = 100
+
     def __init__(
         self,
         configuration: NotionDatasourceConfiguration,
@@ -59,15 +75,115 @@ class NotionDatasourceReader(BaseReader):
         self.exporter = exporter
         self.home_page_database_id = configuration.home_page_database_id
         self.logger = logger
+        self.collected_ids: Optional[Dict[str, List[str]]] = None
+        self.resumed_ids: Optional[Dict[str, List[str]]] = None
+        self.processed_object_ids: Set[str] = set()
+        self.listing_failed = False
+
+    async def read_all_async(self) -> AsyncIterator[NotionDocument]:
+        """Asynchronously stream documents from Notion.
+
+        Collects database and page IDs, then exports them in chunks of
+        `export_batch_size`, yielding the documents of each chunk as soon as
+        it is exported. Databases are exported before pages. Chunks are cut
+        down to the number of documents still missing to reach the export
+        limit, and no further chunks are exported once it is reached. When
+        resumed, the
+        IDs collected before the interruption are used and the objects
+        processed before it are not exported again. IDs are collected in a
+        worker thread, as the synchronous Notion client blocks while it
+        waits for responses and retries.
 
-    async def read_all_async(self) -> List[NotionDocument]:
-        """Asynchronously retrieve all documents from Notion.
+        Returns:
+            AsyncIterator[NotionDocument]: An async iterator of exported documents
+        """
+        self.collected_ids = self.resumed_ids or await asyncio.to_thread(
+            self._collect_ids
+        )
+        self.resumed_ids = None
+        self.listing_failed = False
+        database_ids = self._get_unprocessed_ids(
+            self.collected_ids["database_ids"]
+        )
+        page_ids = self._get_unprocessed_ids(self.collected_ids["page_ids"])
+        self.processed_object_ids = set()
+
+        yield_counter = 0
+        for objects_type, object_ids in [
+            (NotionObjectType.DATABASE, database_ids),
+            (NotionObjectType.PAGE, page_ids),
+        ]:
+            async for document in self._export_documents(
+                object_ids,
+                objects_type,
+                limit=self._get_remaining_limit(yield_counter),
+            ):
+                if BaseReader._limit_reached(yield_counter, self.export_limit):
+                    return
+
+                yield_counter += 1
+                yield document
+
+    def get_object_id(self, document: dict) -> str:
+        """Identify an exported Notion page or database by its ID.
 
-        Fetches pages and databases in batches, respecting export limits
-        and batch sizes.
+        Args:
+            document: Exported Notion object
 
         Returns:
-            List[NotionDocument]: Collection of processed documents
+            str: ID of the page or database
+        """
+        return document["metadata"]["page_id"]
+
+    def get_object_fingerprint(self, document: dict) -> str:
+        """Fingerprint an exported Notion object by the time of its last edit.
+
+        Args:
+            document: Exported Notion object
+
+        Returns:
+            str: Timestamp of the last edit of the page or database
+        """
+        return document["metadata"]["last_edited_time"]
+
+    def lists_all_objects(self) -> bool:
+        """Check whether all collected objects were exported by the last read.
+
+        Returns:
+            bool: False if a chunk of objects failed to export
+        """
+        return not self.listing_failed
+
+    def get_checkpoint(self) -> Optional[Dict[str, List[str]]]:
+        """Get the database and page IDs collected for the current read.
+
+        Returns:
+            Optional[Dict[str, List[str]]]: Collected database and page IDs
+        """
+        return self.collected_ids
+
+    def resume(
+        self,
+        cursor: Optional[Dict[str, List[str]]],
+        processed_object_ids: Set[str],
+    ) -> None:
+        """Export the collected objects not processed before an interruption.
+
+        Args:
+            cursor: Database and page IDs collected before the interruption
+            processed_object_ids: IDs of the objects processed before the
+                interruption
+        """
+        self.resumed_ids = cursor
+        self.processed_object_ids = {
+            self._normalize_id(object_id) for object_id in processed_object_ids
+        }
+
+    def _collect_ids(self) -> Dict[str, List[str]]:
+        """Collect the IDs of the databases and pages to export.
+
+        Returns:
+            Dict[str, List[str]]: Sorted database and page IDs
         """
         if self.home_page_database_id is None:
             database_ids = []
@@ -88,99 +204,113 @@ class NotionDatasourceReader(BaseReader):
             )
         )
 
-        # Process IDs
         database_ids = set(database_ids)
         database_ids.discard(self.home_page_database_id)
-        page_ids = set(page_ids)
+        return {
+            "database_ids": sorted(database_ids),
+            "page_ids": sorted(set(page_ids)),
+        }
 
-        # Batch and export
-        chunked_database_ids = list(
-            chunked(database_ids, self.export_batch_size)
-        )
-        chunked_page_ids = list(chunked(page_ids, self.export_batch_size))
+    def _get_unprocessed_ids(self, object_ids: List[str]) -> List[str]:
+        """Drop the IDs of objects processed before an interruption.
 
-        databases, databases_failed = await self._export_documents(
-            chunked_database_ids, NotionObjectType.DATABASE
-        )
-        pages, pages_failed = await self._export_documents(
-            chunked_page_ids, NotionObjectType.PAGE
-        )
+        Args:
+            object_ids: IDs of collected objects
 
-        # Log failures
-        if databases_failed:
-            self.logger.warning(
-                f"Failed to export {len(databases_failed)} databases: {databases_failed}"
-            )
-        if pages_failed:
-            self.logger.warning(
-                f"Failed to export {len(pages_failed)} pages: {pages_failed}"
-            )
+        Returns:
+            List[str]: IDs of the objects to export
+        """
+        return [
+            object_id
+            for object_id in object_ids
+            if self._normalize_id(object_id) not in self.processed_object_ids
+        ]
 
-        # Apply limit if needed
-        objects = databases + pages
-        return (
-            objects
-            if self.export_limit is None
-            else objects[: self.export_limit]
-        )
+    @staticmethod
+    def _normalize_id(object_id: str) -> str:
+        """Normalize a Notion ID, which may be given with or without dashes.
+
+        Args:
+            object_id: Notion ID
+
+        Returns:
+            str: ID without dashes
+        """
+        return object_id.replace("-", "")
 
     async def _export_documents(
-        self, chunked_ids: List[List[str]], objects_type: NotionObjectType
-    ) -> Tuple[List[NotionDocument], List[str]]:
+        self,
+        object_ids: List[str],
+        objects_type: NotionObjectType,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[NotionDocument]:
         """Export Notion documents in batches with progress tracking.
 
-        Processes batches of Notion object IDs, exporting them through the exporter
-        component. Handles errors gracefully by tracking failed exports and
-        continuing with the next batch.
+        Exports the objects in chunks of `export_batch_size` IDs through the
+        exporter component, yielding the documents of each chunk once it is
+        exported. A chunk never holds more IDs than documents are missing to
+        reach the limit, so objects whose documents would be dropped are not
+        exported. Handles errors gracefully by tracking failed exports and
+        continuing with the next chunk.
 
         Args:
-            chunked_ids: List of ID batches, where each batch is a list of IDs
-                         to be processed together
+            object_ids: IDs of the objects to export
             objects_type: Type of Notion objects to export (PAGE or DATABASE)
+            limit: Maximum number of documents to yield, None for unlimited
 
         Returns:
-            Tuple containing:
-                - List of successfully exported NotionDocument objects
-                - List of IDs that failed during export
-
-        Raises:
-            ValueError: If objects_type is not a valid NotionObjectType
+            AsyncIterator[NotionDocument]: Successfully exported documents
         """
-        all_objects = []
         failed_exports = []
-        number_of_chunks = len(chunked_ids)
-
-        for i, chunk_ids in enumerate(chunked_ids):
-            self.logger.info(
-                f"[{i}/{number_of_chunks}] Reading chunk of Notion {objects_type.name}s."
-            )
-            try:
-                objects = await self.exporter.run(
-                    page_ids=(
-                        chunk_ids
-                        if objects_type == NotionObjectType.PAGE
-                        else None
-                    ),
-                    database_ids=(
-                        chunk_ids
-                        if objects_type == NotionObjectType.DATABASE
-                        else None
-                    ),
+        number_of_chunks = math.ceil(len(object_ids) / self.export_batch_size)
+        yield_counter = 0
+        start = 0
+
+        try:
+            for i in count():
+                chunk_size = self.export_batch_size
+                if limit is not None:
+                    chunk_size = min(chunk_size, limit - yield_counter)
+                if chunk_size <= 0 or start >= len(object_ids):
+                    return
+
+                chunk_ids = object_ids[start : start + chunk_size]
+                start += chunk_size
+                self.logger.info(
+                    f"[{i}/{number_of_chunks}] Reading chunk of Notion {objects_type.name}s."
                 )
-                all_objects.extend(objects)
-                self.logger.debug(f"Added {len(objects)} {objects_type.name}s")
-            except Exception as e:
-                self.logger.error(
-                    f"Export failed for {objects_type.name}: {chunk_ids}. {e}"
+                try:
+                    objects = await self.exporter.run(
+                        page_ids=(
+                            chunk_ids
+                            if objects_type == NotionObjectType.PAGE
+                            else None
+                        ),
+                        database_ids=(
+                            chunk_ids
+                            if objects_type == NotionObjectType.DATABASE
+                            else None
+                        ),
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Export failed for {objects_type.name}: {chunk_ids}. {e}"
+                    )
+                    failed_exports.extend(chunk_ids)
+                    self.listing_failed = True
+                    continue
+
+                self.logger.debug(
+                    f"Exported {len(objects)} {objects_type.name}s"
+                )
+                for object in objects:
+                    yield_counter += 1
+                    yield object
+        finally:
+            if failed_exports:
+                self.logger.warning(
+                    f"Failed to export {len(failed_exports)} {objects_type.name}s: {failed_exports}"
                 )
-                failed_exports.extend(chunk_ids)
-
-        if failed_exports:
-            self.logger.warning(
-                f"Failed to export {len(failed_exports)} {objects_type.name}s"
-            )
-
-        return all_objects, failed_exports
 
     def _get_ids_from_home_page(self) -> Tuple[List[str], List[str]]:
         """Extract database and page IDs from home page database.
@@ -254,6 +384,21 @@ class NotionDatasourceReader(BaseReader):
 
         return object_ids
 
+    def _get_remaining_limit(self, yield_count: int) -> Optional[int]:
+        """Calculate the number of documents still to be yielded.
+
+        Args:
+            yield_count: Number of documents yielded so far
+
+        Returns:
+            Optional[int]: Remaining limit (None if no limit configured)
+        """
+        return (
+            self.export_limit - yield_count
+            if self.export_limit is not None
+            else None
+        )
+
     def _get_current_limit(
         self, database_ids: List[str], page_ids: List[str]
     ) -> int:
@@ -281,6 +426,10 @@ class NotionDatasourceReader(BaseReader):
     ) -> List[Any]:
         """Collect all results from paginated Notion API endpoint.
 
+        Each page requests at most the number of results still missing to
+        reach the limit, and no further pages are requested once it is
+        reached.
+
         Args:
             function: API function to call
             limit: Maximum number of results to collect
@@ -293,11 +442,17 @@ class NotionDatasourceReader(BaseReader):
         result = []
 
         while True:
-            response = function(**kwargs, start_cursor=next_cursor)
-            result.extend(response.get("results"))
-
             if NotionDatasourceReader._limit_reached(result, limit):
                 return result[:limit]
+
+            page_size = NotionDatasourceReader.MAX_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - len(result))
+            response = function(
+                **kwargs, start_cursor=next_cursor, page_size=page_size
+            )
+            result.extend(response.get("results"))
+
             if not NotionDatasourceReader._has_more_pages(response):
                 return result[:limit] if limit else result
 
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import List, Literal, Optional
 
 from pydantic import Field
 
@@ -21,3 +21,26 @@ class PDFDatasourceConfiguration(DatasourceConfiguration):
     base_path: str = Field(
         ..., description="Base path to the directory containing PDF files"
     )
+    include_patterns: List[str] = Field(
+        ["*.pdf"],
+        description="Glob patterns of files to extract, matched against the file name and the path relative to the base path",
+    )
+    exclude_patterns: List[str] = Field(
+        [],
+        description="Glob patterns of files and directories to skip, matched against the name and the path relative to the base path",
+    )
+    recursive: bool = Field(
+        True, description="Whether to scan subdirectories of the base path"
+    )
+    manifest_path: Optional[str] = Field(
+        None,
+        description="Path of the JSON manifest caching the content hash of extracted files by size and modification time; if set, incremental syncs fingerprint files by their content, so touched but otherwise unchanged files are not converted again",
+    )
+    parser_max_workers: int = Field(
+        1,
+        description="Number of worker processes converting PDF files in parallel; 1 converts files one by one in the extraction process",
+    )
+    parser_timeout: Optional[float] = Field(
+        None,
+        description="Maximum number of seconds a single PDF conversion may take before the file is skipped; only applies when parser_max_workers is greater than 1",
+    )
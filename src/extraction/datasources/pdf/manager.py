@@ -1,10 +1,153 @@
-from typing import Type
+from typing import Any, AsyncIterator, Optional, Tuple, Type
 
 from core import Factory
+from extraction.datasources.core.checkpoint import CheckpointTracker
+from extraction.datasources.core.deduplication import Deduplicator
 from extraction.datasources.core.manager import BasicDatasourceManager
+from extraction.datasources.core.processing import (
+    ProcessedObject,
+    ProcessingStage,
+)
 from extraction.datasources.pdf.configuration import PDFDatasourceConfiguration
-from extraction.datasources.pdf.parser import PDFDatasourceParserFactory
-from extraction.datasources.pdf.reader import PDFDatasourceReaderFactory
+from extraction.datasources.pdf.document import PDFDocument
+from extraction.datasources.pdf.parser import (
+    PDFDatasourceParser,
+    PDFDatasourceParserFactory,
+    convert_pdf_to_markdown,
+    initialize_worker_parser,
+)
+from extraction.datasources.pdf.pool import PDFConversionPool
+from extraction.datasources.pdf.reader import (
+    PDFDatasourceReader,
+    PDFDatasourceReaderFactory,
+)
+
+
+class PDFDatasourceManager(BasicDatasourceManager[PDFDocument]):
+    """Manager for PDF datasource extraction.
+
+    Converts PDF files in a process pool when one is configured, in full
+    refreshes and incremental syncs, yielding documents in completion order.
+    Without a pool, files are processed like in the basic manager.
+    """
+
+    def __init__(
+        self,
+        configuration: PDFDatasourceConfiguration,
+        reader: PDFDatasourceReader,
+        parser: PDFDatasourceParser,
+        conversion_pool: Optional[PDFConversionPool] = None,
+        processing_stage: Optional[ProcessingStage] = None,
+        deduplicator: Optional[Deduplicator] = None,
+    ):
+        """Initialize the PDF datasource manager.
+
+        Args:
+            configuration: Configuration for the PDF datasource
+            reader: Component yielding paths of PDF files
+            parser: Component building documents from PDF files
+            conversion_pool: Process pool converting PDF files to markdown
+            processing_stage: Pool converting PDF files if no conversion
+                pool is configured
+            deduplicator: Component dropping near-duplicate documents
+        """
+        super().__init__(
+            configuration=configuration,
+            reader=reader,
+            parser=parser,
+            processing_stage=(
+                processing_stage if conversion_pool is None else None
+            ),
+            deduplicator=deduplicator,
+        )
+        self.conversion_pool = conversion_pool
+
+    async def full_refresh_sync(
+        self, checkpoint: Optional[CheckpointTracker] = None
+    ) -> AsyncIterator[PDFDocument]:
+        """Process all PDF files from the datasource.
+
+        Args:
+            checkpoint: Progress of the datasource in a checkpointed run
+
+        Returns:
+            An async iterator yielding processed documents
+        """
+        if self.conversion_pool is None:
+            async for document in super().full_refresh_sync(checkpoint):
+                yield document
+            return
+
+        self.deduplication_keys = set()
+        tokens = {}
+
+        async def read_file_paths() -> AsyncIterator[str]:
+            async for token, file_path in self._read_objects(checkpoint):
+                tokens[file_path] = token
+                yield file_path
+
+        async for file_path, markdown in self.conversion_pool.convert_all(
+            read_file_paths()
+        ):
+            md_document = self.parser.parse_markdown(file_path, markdown)
+            cleaned_document = self.cleaner.clean(md_document)
+            split_documents = []
+            if cleaned_document and not self._is_duplicate(
+                cleaned_document, self.reader.get_object_id(file_path)
+            ):
+                split_documents = self.splitter.split(cleaned_document)
+            for split_document in self._track_documents(
+                split_documents,
+                cleaned_document,
+                checkpoint,
+                tokens.pop(file_path),
+            ):
+                yield split_document
+        self._commit_deduplicator()
+
+    async def _process_objects(
+        self, keyed_objects: AsyncIterator[Tuple[Any, str]]
+    ) -> AsyncIterator[Tuple[Any, ProcessedObject]]:
+        """Convert keyed PDF files in the process pool and clean them.
+
+        Files that fail to convert or exceed the timeout are skipped. Without
+        a pool, files are processed like in the basic manager.
+
+        Args:
+            keyed_objects: Keys identifying the files for the caller, and
+                paths of the files
+
+        Returns:
+            AsyncIterator[Tuple[Any, ProcessedObject]]: Keys and processed
+            files in completion order
+        """
+        if self.conversion_pool is None:
+            async for key, processed_object in super()._process_objects(
+                keyed_objects
+            ):
+                yield key, processed_object
+            return
+
+        keys = {}
+
+        async def read_file_paths() -> AsyncIterator[str]:
+            async for key, file_path in keyed_objects:
+                keys[file_path] = key
+                yield file_path
+
+        async for file_path, markdown in self.conversion_pool.convert_all(
+            read_file_paths()
+        ):
+            md_document = self.parser.parse_markdown(file_path, markdown)
+            cleaned_document = self.cleaner.clean(md_document)
+            if not cleaned_document:
+                yield keys.pop(file_path), ProcessedObject(
+                    None, None, [], parsed_document=md_document
+                )
+                continue
+            yield keys.pop(file_path), ProcessedObject(
+                cleaned_document, None, []
+            )
 
 
 class PDFDatasourceManagerFactory(Factory):
@@ -21,23 +164,37 @@ class PDFDatasourceManagerFactory(Factory):
     @classmethod
     def _create_instance(
         cls, configuration: PDFDatasourceConfiguration
-    ) -> BasicDatasourceManager:
+    ) -> PDFDatasourceManager:
         """Create an instance of the PDF datasource manager.
 
-        This method constructs a BasicDatasourceManager by creating the appropriate
-        reader and parser based on the provided configuration.
+        This method constructs a PDFDatasourceManager by creating the appropriate
+        reader and parser based on the provided configuration. A process pool is
+        added if more than one parser worker is configured.
 
         Args:
             configuration: Configuration specifying how to set up the PDF datasource
                           manager, reader, and parser.
 
         Returns:
-            A configured BasicDatasourceManager instance for handling PDF documents.
+            A configured PDFDatasourceManager instance for handling PDF documents.
         """
         reader = PDFDatasourceReaderFactory.create(configuration)
         parser = PDFDatasourceParserFactory.create(configuration)
-        return BasicDatasourceManager(
+        conversion_pool = (
+            PDFConversionPool(
+                convert_func=convert_pdf_to_markdown,
+                max_workers=configuration.parser_max_workers,
+                timeout=configuration.parser_timeout,
+                worker_initializer=initialize_worker_parser,
+            )
+            if configuration.parser_max_workers > 1
+            else None
+        )
+        return PDFDatasourceManager(
             configuration=configuration,
             reader=reader,
             parser=parser,
+            conversion_pool=conversion_pool,
+            processing_stage=ProcessingStage.from_configuration(configuration),
+            deduplicator=Deduplicator.from_configuration(configuration),
         )
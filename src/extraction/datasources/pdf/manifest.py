@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Set
+
+from core.logger import LoggerConfiguration
+
+
+class FileManifest:
+    """Persistent record of files processed by previous runs.
+
+    Stores size, modification time and SHA-256 content hash per file path.
+    The recorded hash is reused while the size and modification time match
+    the manifest. Only if either differs is the content hashed again, so
+    touched but otherwise identical files keep their hash.
+    """
+
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    logger = LoggerConfiguration.get_logger(__name__)
+
+    def __init__(self, path: str):
+        """Initialize the manifest.
+
+        Args:
+            path: Path of the JSON file storing the manifest
+        """
+        self.path = path
+        self._entries: Dict[str, dict] = self._load()
+        self._seen: Set[str] = set()
+
+    def get_content_hash(
+        self, file_path: str, stat: os.stat_result
+    ) -> Optional[str]:
+        """Get the content hash of a file, hashing it only if it changed.
+
+        Records the current state of the file as seen in this run.
+
+        Args:
+            file_path: Path of the file
+            stat: Result of `stat` for the file
+
+        Returns:
+            Optional[str]: SHA-256 hash of the content or None if the file
+            cannot be read
+        """
+        self._seen.add(file_path)
+        entry = self._entries.get(file_path)
+        if (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime"] == stat.st_mtime_ns
+        ):
+            return entry["sha256"]
+
+        content_hash = self._hash(file_path)
+        self._entries[file_path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": content_hash,
+        }
+        return content_hash
+
+    def save(self, prune: bool = False) -> None:
+        """Persist the manifest.
+
+        Args:
+            prune: Whether to drop entries of files not seen in this run,
+                which should only be done after a complete scan
+        """
+        if prune:
+            self._entries = {
+                file_path: entry
+                for file_path, entry in self._entries.items()
+                if file_path in self._seen
+            }
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
+
+    def _hash(self, file_path: str) -> Optional[str]:
+        sha256 = hashlib.sha256()
+        try:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+        except OSError as e:
+            self.logger.warning(f"Failed to hash '{file_path}': {e}")
+            return None
+        return sha256.hexdigest()
+
+    def _load(self) -> Dict[str, dict]:
+        if not os.path.isfile(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to load manifest {self.path}: {e}")
+            return {}
+
+        if not isinstance(entries, dict):
+            self.logger.warning(f"Ignoring malformed manifest {self.path}")
+            return {}
+
+        return entries
@@ -1,5 +1,5 @@
 import os
-from typing import Type
+from typing import Optional, Type
 
 from llama_index.core.readers.file.base import default_file_metadata_func
 from markitdown import MarkItDown
@@ -9,6 +9,34 @@ from extraction.datasources.core.parser import BaseParser
 from extraction.datasources.pdf.configuration import PDFDatasourceConfiguration
 from extraction.datasources.pdf.document import PDFDocument
 
+_worker_parser: Optional[MarkItDown] = None
+
+
+def initialize_worker_parser() -> None:
+    """
+    Create the MarkItDown instance of a worker process.
+
+    MarkItDown instances cannot be pickled, so each worker process creates
+    and reuses its own instance.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = MarkItDown()
+
+
+def convert_pdf_to_markdown(file_path: str) -> str:
+    """
+    Convert a PDF file to markdown inside a worker process.
+
+    Args:
+        file_path: Path to the PDF file
+
+    Returns:
+        Markdown content of the PDF file
+    """
+    initialize_worker_parser()
+    return _worker_parser.convert(file_path, file_extension=".pdf").text_content
+
 
 class PDFDatasourceParser(BaseParser[PDFDocument]):
     """
@@ -39,6 +67,19 @@ class PDFDatasourceParser(BaseParser[PDFDocument]):
         markdown = self.parser.convert(
             file_path, file_extension=".pdf"
         ).text_content
+        return self.parse_markdown(file_path, markdown)
+
+    def parse_markdown(self, file_path: str, markdown: str) -> PDFDocument:
+        """
+        Builds a document from a PDF file already converted to markdown.
+
+        Args:
+            file_path: Path to the PDF file
+            markdown: Markdown content of the PDF file
+
+        Returns:
+            PDFDocument object containing the content and metadata
+        """
         metadata = self._extract_metadata(file_path)
         return PDFDocument(text=markdown, metadata=metadata)
 
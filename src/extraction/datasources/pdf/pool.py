@@ -0,0 +1,261 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import BrokenBarrierError
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+
+from core.logger import LoggerConfiguration
+
+_startup_barrier = None
+
+
+def _initialize_worker(
+    startup_barrier, worker_initializer: Optional[Callable[[], None]]
+) -> None:
+    global _startup_barrier
+    _startup_barrier = startup_barrier
+    if worker_initializer is not None:
+        worker_initializer()
+
+
+def _wait_for_workers(timeout: float) -> None:
+    try:
+        _startup_barrier.wait(timeout)
+    except BrokenBarrierError:
+        pass
+
+
+class _Conversion:
+    """State of a single file conversion."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.started_at = 0.0
+        self.attempts = 1
+
+
+class PDFConversionPool:
+    """Process pool converting PDF files to markdown in parallel.
+
+    Worker processes are started and initialized before any file is submitted
+    and at most `max_workers` conversions are kept in flight, so every submitted
+    file starts immediately and the per-file timeout measures conversion time only.
+    A conversion exceeding the timeout cannot be interrupted inside its worker,
+    therefore the whole pool is restarted and the other in-flight files are
+    resubmitted.
+    """
+
+    MAX_ATTEMPTS = 2
+    STARTUP_TIMEOUT = 300.0
+
+    def __init__(
+        self,
+        convert_func: Callable[[str], str],
+        max_workers: int,
+        timeout: Optional[float] = None,
+        worker_initializer: Optional[Callable[[], None]] = None,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ):
+        """Initialize the conversion pool.
+
+        Args:
+            convert_func: Picklable module-level function converting a file
+                path to markdown inside a worker process
+            max_workers: Number of worker processes
+            timeout: Maximum number of seconds a single conversion may take,
+                None to wait indefinitely
+            worker_initializer: Picklable module-level function run once in
+                every worker process before it accepts files
+            logger: Logger instance for logging messages
+        """
+        self.convert_func = convert_func
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.worker_initializer = worker_initializer
+        self.logger = logger
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def convert_all(
+        self, file_paths: AsyncIterator[str]
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Convert files in worker processes and yield them as they complete.
+
+        Files that fail to convert, exceed the timeout or repeatedly crash
+        their worker are logged and skipped.
+
+        Args:
+            file_paths: Async iterator of paths of the files to convert
+
+        Returns:
+            AsyncIterator[Tuple[str, str]]: Pairs of file path and markdown in
+            completion order
+        """
+        loop = asyncio.get_running_loop()
+        in_flight: Dict[asyncio.Future, _Conversion] = {}
+        file_paths_exhausted = False
+
+        try:
+            await self._start()
+            while True:
+                while (
+                    not file_paths_exhausted
+                    and len(in_flight) < self.max_workers
+                ):
+                    try:
+                        file_path = await file_paths.__anext__()
+                    except StopAsyncIteration:
+                        file_paths_exhausted = True
+                        break
+                    self._submit(_Conversion(file_path), in_flight, loop)
+
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(
+                    in_flight.keys(),
+                    timeout=self._get_wait_timeout(in_flight, loop),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    self._drop_timed_out(in_flight, loop)
+                    await self._restart(in_flight, loop)
+                    continue
+
+                pool_broken = False
+                for future in done:
+                    conversion = in_flight.pop(future)
+                    try:
+                        markdown = future.result()
+                    except BrokenProcessPool:
+                        pool_broken = True
+                        self._retry_or_skip(conversion, in_flight, loop)
+                        continue
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to convert '{conversion.file_path}': {e}"
+                        )
+                        continue
+
+                    yield conversion.file_path, markdown
+
+                if pool_broken:
+                    await self._restart(in_flight, loop)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            self.close()
+
+    def close(self) -> None:
+        """Terminate the worker processes."""
+        if self._executor is None:
+            return
+        self._terminate_processes()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _submit(
+        self,
+        conversion: "_Conversion",
+        in_flight: Dict[asyncio.Future, "_Conversion"],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        future = self._executor.submit(self.convert_func, conversion.file_path)
+        conversion.started_at = loop.time()
+        in_flight[asyncio.wrap_future(future, loop=loop)] = conversion
+
+    def _retry_or_skip(
+        self,
+        conversion: "_Conversion",
+        in_flight: Dict[asyncio.Future, "_Conversion"],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Keep a conversion interrupted by a crashed worker for resubmission.
+
+        It is not known which in-flight file crashed the worker, so each of
+        them gets one more attempt before it is skipped.
+        """
+        conversion.attempts += 1
+        if conversion.attempts > self.MAX_ATTEMPTS:
+            self.logger.error(
+                f"Worker process crashed while converting '{conversion.file_path}', skipping."
+            )
+            return
+
+        self.logger.warning(
+            f"Worker process crashed while converting '{conversion.file_path}', retrying."
+        )
+        in_flight[loop.create_future()] = conversion
+
+    def _get_wait_timeout(
+        self,
+        in_flight: Dict[asyncio.Future, "_Conversion"],
+        loop: asyncio.AbstractEventLoop,
+    ) -> Optional[float]:
+        if self.timeout is None:
+            return None
+        oldest_start = min(c.started_at for c in in_flight.values())
+        return max(0.0, oldest_start + self.timeout - loop.time())
+
+    def _drop_timed_out(
+        self,
+        in_flight: Dict[asyncio.Future, "_Conversion"],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        now = loop.time()
+        for future, conversion in list(in_flight.items()):
+            if now - conversion.started_at >= self.timeout:
+                self.logger.error(
+                    f"Converting '{conversion.file_path}' exceeded {self.timeout}s, skipping."
+                )
+                del in_flight[future]
+                future.cancel()
+
+    async def _restart(
+        self,
+        in_flight: Dict[asyncio.Future, "_Conversion"],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Replace the worker processes and resubmit in-flight conversions."""
+        self.close()
+        conversions = list(in_flight.values())
+        for future in in_flight:
+            future.cancel()
+        in_flight.clear()
+
+        await self._start()
+        for conversion in conversions:
+            self._submit(conversion, in_flight, loop)
+
+    async def _start(self) -> None:
+        """Start the worker processes and wait until all are initialized.
+
+        Spawned workers do not inherit locks held by threads of the parent.
+        Every worker has to pass the startup barrier, so each one is blocked
+        by exactly one startup task until all of them are running.
+        """
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(
+                context.Barrier(self.max_workers),
+                self.worker_initializer,
+            ),
+        )
+        startup_tasks = [
+            asyncio.wrap_future(
+                self._executor.submit(_wait_for_workers, self.STARTUP_TIMEOUT)
+            )
+            for _ in range(self.max_workers)
+        ]
+        await asyncio.gather(*startup_tasks)
+
+    def _terminate_processes(self) -> None:
+        processes = getattr(self._executor, "_processes", None) or {}
+        for process in list(processes.values()):
+            if process.is_alive():
+                process.terminate()
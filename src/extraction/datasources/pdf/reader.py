@@ -1,11 +1,14 @@
+import asyncio
+import fnmatch
 import logging
 import os
-from typing import AsyncIterator, Type
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Type
 
 from core import Factory
 from core.logger import LoggerConfiguration
 from extraction.datasources.core.reader import BaseReader
 from extraction.datasources.pdf.configuration import PDFDatasourceConfiguration
+from extraction.datasources.pdf.manifest import FileManifest
 
 
 class PDFDatasourceReader(BaseReader):
@@ -24,13 +27,26 @@ class PDFDatasourceReader(BaseReader):
         super().__init__()
         self.export_limit = configuration.export_limit
         self.base_path = configuration.base_path
+        self.include_patterns = configuration.include_patterns
+        self.exclude_patterns = configuration.exclude_patterns
+        self.recursive = configuration.recursive
+        self.manifest_path = configuration.manifest_path
         self.logger = logger
+        self.scan_failed = False
+        self.hash_contents = False
+        self.manifest: Optional[FileManifest] = None
+        self.manifest_prunable = False
+        self.content_hashes: Dict[str, Optional[str]] = {}
 
     async def read_all_async(self) -> AsyncIterator[str]:
         """Asynchronously yield PDF file paths from the configured directory.
 
-        Retrieves a list of PDF files from the base path, applies any configured
-        export limit, and yields each file path individually.
+        Walks the base path, recursively if configured, and yields paths of
+        files matching the include patterns and none of the exclude patterns
+        as they are found. If a manifest is configured, incremental reads
+        look up the content hash of each file in it, hashing only files whose
+        size or modification time changed. The manifest is only saved by
+        `commit_sync_state`.
 
         Returns:
             AsyncIterator[str]: An asynchronous iterator of PDF file paths
@@ -38,23 +54,161 @@ class PDFDatasourceReader(BaseReader):
         self.logger.info(
             f"Reading PDF files from '{self.base_path}' with limit {self.export_limit}"
         )
-
-        pdf_files = [
-            f for f in os.listdir(self.base_path) if f.endswith(".pdf")
-        ]
-        files_to_load = (
-            pdf_files
-            if self.export_limit is None
-            else pdf_files[: self.export_limit]
+        self.manifest = (
+            FileManifest(self.manifest_path)
+            if self.manifest_path and self.hash_contents
+            else None
         )
+        self.manifest_prunable = False
+        self.content_hashes = {}
+        self.scan_failed = False
+        yield_counter = 0
+        limit_reached = False
+
+        try:
+            for entry in self._walk(self.base_path):
+                if self._limit_reached(yield_counter, self.export_limit):
+                    limit_reached = True
+                    break
+
+                if self.manifest:
+                    self.content_hashes[entry.path] = await asyncio.to_thread(
+                        self.manifest.get_content_hash, entry.path, entry.stat()
+                    )
+
+                self.logger.info(
+                    f"[{yield_counter}/{self.export_limit}] Reading PDF file '{entry.name}'"
+                )
+                yield_counter += 1
+                yield entry.path
+
+            self.manifest_prunable = not limit_reached and not self.scan_failed
+        finally:
+            self.hash_contents = False
+
+    def get_object_id(self, file_path: str) -> str:
+        """Identify a PDF file by its path relative to the base path.
+
+        Args:
+            file_path: Path of the PDF file
+
+        Returns:
+            str: Relative path of the file
+        """
+        return os.path.relpath(file_path, self.base_path).replace(os.sep, "/")
+
+    def get_object_fingerprint(self, file_path: str) -> Optional[str]:
+        """Fingerprint a PDF file by its content hash or its size and modification time.
+
+        The content hash is used if it was looked up in the manifest by the
+        current read, so touched but otherwise unchanged files keep their
+        fingerprint.
+
+        Args:
+            file_path: Path of the PDF file
+
+        Returns:
+            Optional[str]: Fingerprint of the file or None if it cannot be accessed
+        """
+        content_hash = self.content_hashes.get(file_path)
+        if content_hash is not None:
+            return f"sha256:{content_hash}"
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def lists_all_objects(self) -> bool:
+        """Check whether all PDF files are yielded.
+
+        Returns:
+            bool: False if a directory could not be scanned by the last read
+        """
+        return not self.scan_failed
+
+    def set_sync_cursor(self, cursor: Optional[str]) -> None:
+        """Fingerprint files by their content hash in the next read.
+
+        Full refreshes never call this method, so they do not hash files.
 
-        for i, file_name in enumerate(files_to_load):
-            self.logger.info(
-                f"[{i}/{self.export_limit}] Reading PDF file '{file_name}'"
-            )
-            file_path = os.path.join(self.base_path, file_name)
-            if os.path.isfile(file_path):
-                yield file_path
+        Args:
+            cursor: Cursor recorded by the previous sync, unused as changes
+                are detected with the fingerprints of the files
+        """
+        self.hash_contents = True
+
+    def commit_sync_state(self) -> None:
+        """Save the manifest updated by the last incremental read.
+
+        Entries of files no longer found are dropped if the read scanned
+        every directory.
+        """
+        if self.manifest is None:
+            return
+
+        self.manifest.save(prune=self.manifest_prunable)
+        self.manifest = None
+
+    def _walk(self, directory: str) -> Iterator[os.DirEntry]:
+        """Stream matching files below a directory.
+
+        Directories are scanned one at a time with `os.scandir`, in name
+        order, and directories matching an exclude pattern are not entered.
+        Directories that cannot be scanned are skipped and recorded in
+        `scan_failed`.
+
+        Args:
+            directory: Directory to walk
+
+        Returns:
+            Iterator[os.DirEntry]: Entries of matching files
+        """
+        try:
+            with os.scandir(directory) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError as e:
+            self.logger.warning(f"Failed to scan directory '{directory}': {e}")
+            self.scan_failed = True
+            return
+
+        for entry in entries:
+            relative_path = os.path.relpath(entry.path, self.base_path)
+            if self._matches(relative_path, entry.name, self.exclude_patterns):
+                continue
+
+            if entry.is_dir():
+                if self.recursive:
+                    yield from self._walk(entry.path)
+            elif entry.is_file() and self._matches(
+                relative_path, entry.name, self.include_patterns
+            ):
+                yield entry
+
+    @staticmethod
+    def _matches(
+        relative_path: str, name: str, patterns: Optional[List[str]]
+    ) -> bool:
+        """Check whether a path matches any of the glob patterns.
+
+        Patterns are matched against the path relative to the base path
+        and against the bare name.
+
+        Args:
+            relative_path: Path relative to the base path
+            name: Name of the file or directory
+            patterns: Glob patterns
+
+        Returns:
+            bool: True if any pattern matches
+        """
+        relative_path = relative_path.replace(os.sep, "/")
+        return any(
+            fnmatch.fnmatch(relative_path, pattern)
+            or fnmatch.fnmatch(name, pattern)
+            for pattern in patterns or []
+        )
 
 
 class PDFDatasourceReaderFactory(Factory):
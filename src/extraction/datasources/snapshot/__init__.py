@@ -0,0 +1,29 @@
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceConfigurationRegistry,
+    DatasourceName,
+)
+from extraction.datasources.registry import DatasourceManagerRegistry
+from extraction.datasources.snapshot.configuration import (
+    SnapshotDatasourceConfiguration,
+)
+from extraction.datasources.snapshot.manager import (
+    SnapshotDatasourceManagerFactory,
+)
+
+
+def register() -> None:
+    """
+    Registers snapshot datasource components with the system.
+
+    This function performs two registrations:
+    1. Registers the snapshot datasource manager factory with the DatasourceManagerRegistry
+    2. Registers the snapshot datasource configuration with the DatasourceConfigurationRegistry
+
+    Both registrations use DatasourceName.SNAPSHOT as the identifier.
+    """
+    DatasourceManagerRegistry.register(
+        DatasourceName.SNAPSHOT, SnapshotDatasourceManagerFactory
+    )
+    DatasourceConfigurationRegistry.register(
+        DatasourceName.SNAPSHOT, SnapshotDatasourceConfiguration
+    )
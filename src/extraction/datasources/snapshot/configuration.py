@@ -0,0 +1,24 @@
+from typing import Literal
+
+from pydantic import Field
+
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceConfiguration,
+    DatasourceName,
+)
+
+
+class SnapshotDatasourceConfiguration(DatasourceConfiguration):
+    """Configuration for the snapshot data source.
+
+    Streams back the documents written by an extraction-only run, so
+    documents can be embedded again without crawling their sources.
+    """
+
+    name: Literal[DatasourceName.SNAPSHOT] = Field(
+        ..., description="The name of the data source."
+    )
+    path: str = Field(
+        ...,
+        description="Path of the gzip-compressed JSON Lines snapshot written by `extract.py`",
+    )
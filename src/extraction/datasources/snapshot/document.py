@@ -0,0 +1,54 @@
+from typing import Any, Dict
+
+from extraction.datasources.core.document import BaseDocument
+
+
+class SnapshotDocument(BaseDocument):
+    """Document restored from an extraction snapshot.
+
+    Keeps the ID and the metadata keys excluded from embedding and LLM
+    contexts of the original document, so it is embedded like the original.
+    """
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "SnapshotDocument":
+        """Restore a document from its snapshot record.
+
+        Args:
+            record: Record written by `to_record`
+
+        Returns:
+            SnapshotDocument: The restored document
+        """
+        document = cls(
+            text=record["text"],
+            metadata=record["metadata"],
+            attachments=record["attachments"],
+        )
+        document.id_ = record["id"]
+        document.excluded_embed_metadata_keys = record[
+            "excluded_embed_metadata_keys"
+        ]
+        document.excluded_llm_metadata_keys = record[
+            "excluded_llm_metadata_keys"
+        ]
+        return document
+
+    @staticmethod
+    def to_record(document: BaseDocument) -> Dict[str, Any]:
+        """Turn a document into its snapshot record.
+
+        Args:
+            document: Document yielded by a datasource manager
+
+        Returns:
+            Dict[str, Any]: JSON serializable record of the document
+        """
+        return {
+            "id": document.id_,
+            "text": document.text,
+            "metadata": document.metadata,
+            "attachments": getattr(document, "attachments", None) or {},
+            "excluded_embed_metadata_keys": document.excluded_embed_metadata_keys,
+            "excluded_llm_metadata_keys": document.excluded_llm_metadata_keys,
+        }
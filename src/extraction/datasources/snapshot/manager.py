@@ -0,0 +1,48 @@
+from typing import Type
+
+from core import Factory
+from extraction.datasources.core.deduplication import Deduplicator
+from extraction.datasources.core.manager import BasicDatasourceManager
+from extraction.datasources.core.processing import ProcessingStage
+from extraction.datasources.snapshot.configuration import (
+    SnapshotDatasourceConfiguration,
+)
+from extraction.datasources.snapshot.parser import (
+    SnapshotDatasourceParserFactory,
+)
+from extraction.datasources.snapshot.reader import (
+    SnapshotDatasourceReaderFactory,
+)
+
+
+class SnapshotDatasourceManagerFactory(Factory):
+    """Factory for creating snapshot datasource managers.
+
+    Documents of a snapshot are already cleaned and split, so the manager
+    only drops empty documents and does not split them further.
+
+    Attributes:
+        _configuration_class: Type of configuration object
+    """
+
+    _configuration_class: Type = SnapshotDatasourceConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: SnapshotDatasourceConfiguration
+    ) -> BasicDatasourceManager:
+        """Create an instance of the snapshot datasource manager.
+
+        Args:
+            configuration: Configuration of the snapshot datasource
+
+        Returns:
+            BasicDatasourceManager: Manager streaming the snapshot documents
+        """
+        return BasicDatasourceManager(
+            configuration=configuration,
+            reader=SnapshotDatasourceReaderFactory.create(configuration),
+            parser=SnapshotDatasourceParserFactory.create(configuration),
+            processing_stage=ProcessingStage.from_configuration(configuration),
+            deduplicator=Deduplicator.from_configuration(configuration),
+        )
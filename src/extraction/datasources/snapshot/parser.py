@@ -0,0 +1,43 @@
+from typing import Any, Dict, Type
+
+from core import Factory
+from extraction.datasources.core.parser import BaseParser
+from extraction.datasources.snapshot.configuration import (
+    SnapshotDatasourceConfiguration,
+)
+from extraction.datasources.snapshot.document import SnapshotDocument
+
+
+class SnapshotDatasourceParser(BaseParser[SnapshotDocument]):
+    """Parser restoring documents from snapshot records."""
+
+    def parse(self, record: Dict[str, Any]) -> SnapshotDocument:
+        """Restore the document of a snapshot record.
+
+        Args:
+            record: Record read from the snapshot
+
+        Returns:
+            SnapshotDocument: The restored document
+        """
+        return SnapshotDocument.from_record(record)
+
+
+class SnapshotDatasourceParserFactory(Factory):
+    """Factory for creating snapshot parser instances."""
+
+    _configuration_class: Type = SnapshotDatasourceConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: SnapshotDatasourceConfiguration
+    ) -> SnapshotDatasourceParser:
+        """Creates a snapshot parser instance.
+
+        Args:
+            configuration: Configuration of the snapshot datasource
+
+        Returns:
+            SnapshotDatasourceParser: Parser instance
+        """
+        return SnapshotDatasourceParser()
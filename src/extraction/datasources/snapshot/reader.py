@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+import json
+import logging
+import mmap
+import os
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator
+
+from core import Factory
+from core.logger import LoggerConfiguration
+from extraction.datasources.core.reader import BaseReader
+from extraction.datasources.snapshot.configuration import (
+    SnapshotDatasourceConfiguration,
+)
+
+
+class SnapshotDatasourceReader(BaseReader):
+    """Reader streaming document records from an extraction snapshot.
+
+    The snapshot file is memory-mapped and decompressed line by line, so
+    records are read without buffering the file in memory. Records are
+    decoded in batches in a worker thread to keep the event loop free.
+    """
+
+    BATCH_SIZE = 1024
+
+    def __init__(
+        self,
+        configuration: SnapshotDatasourceConfiguration,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ):
+        """Initialize the snapshot reader.
+
+        Args:
+            configuration: Settings with the snapshot path and export limit
+            logger: Logger instance for recording operation information
+        """
+        super().__init__()
+        self.path = configuration.path
+        self.export_limit = configuration.export_limit
+        self.logger = logger
+
+    async def read_all_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """Asynchronously stream the document records of the snapshot.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: Records in the order they were written
+        """
+        self.logger.info(
+            f"Reading documents from snapshot {self.path} with limit {self.export_limit}"
+        )
+        records = self._read_records()
+        yield_counter = 0
+        try:
+            while True:
+                batch = await asyncio.to_thread(
+                    list, islice(records, self.BATCH_SIZE)
+                )
+                if not batch:
+                    return
+
+                for record in batch:
+                    if self._limit_reached(yield_counter, self.export_limit):
+                        return
+
+                    yield_counter += 1
+                    yield record
+        finally:
+            records.close()
+
+    def get_object_id(self, record: Dict[str, Any]) -> str:
+        """Identify a snapshot record by the ID of its document.
+
+        Args:
+            record: Snapshot record
+
+        Returns:
+            str: ID of the document
+        """
+        return record["id"]
+
+    def _read_records(self) -> Iterator[Dict[str, Any]]:
+        """Decode the records of the memory-mapped snapshot.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Records of the snapshot
+        """
+        if os.path.getsize(self.path) == 0:
+            return
+
+        with (
+            open(self.path, "rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file,
+            gzip.GzipFile(fileobj=mapped_file) as lines,
+        ):
+            for line in lines:
+                yield json.loads(line)
+
+
+class SnapshotDatasourceReaderFactory(Factory):
+    """Factory for creating snapshot reader instances."""
+
+    _configuration_class = SnapshotDatasourceConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: SnapshotDatasourceConfiguration
+    ) -> SnapshotDatasourceReader:
+        """Creates a snapshot reader instance.
+
+        Args:
+            configuration: Snapshot path and export limit settings
+
+        Returns:
+            SnapshotDatasourceReader: Configured reader instance
+        """
+        return SnapshotDatasourceReader(configuration=configuration)
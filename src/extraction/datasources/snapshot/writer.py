@@ -0,0 +1,72 @@
+import gzip
+import json
+import os
+from types import TracebackType
+from typing import IO, Optional, Type
+
+from extraction.datasources.core.document import BaseDocument
+from extraction.datasources.snapshot.document import SnapshotDocument
+
+
+class SnapshotWriter:
+    """Writer of extraction snapshots.
+
+    Documents are written as gzip-compressed JSON Lines, one record per
+    document. The snapshot is written to a temporary file that replaces the
+    previous snapshot only once the writer is closed without error, so an
+    interrupted extraction leaves the previous snapshot intact.
+    """
+
+    def __init__(self, path: str, compresslevel: int = 6):
+        """Initialize the writer.
+
+        Args:
+            path: Path of the snapshot file
+            compresslevel: Gzip compression level from 1 (fastest) to 9
+        """
+        self.path = path
+        self.compresslevel = compresslevel
+        self.document_count = 0
+        self._temporary_path = f"{path}.tmp"
+        self._file: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> "SnapshotWriter":
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(
+            self._temporary_path, "wb", compresslevel=self.compresslevel
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._file.close()
+        self._file = None
+        if exc_type is None:
+            os.replace(self._temporary_path, self.path)
+        else:
+            os.remove(self._temporary_path)
+
+    def write(self, document: BaseDocument) -> None:
+        """Append a document to the snapshot.
+
+        Metadata values that are not JSON serializable are written as
+        strings.
+
+        Args:
+            document: Document yielded by a datasource manager
+        """
+        line = json.dumps(
+            SnapshotDocument.to_record(document),
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        self._file.write(line.encode("utf-8"))
+        self._file.write(b"\n")
+        self.document_count += 1
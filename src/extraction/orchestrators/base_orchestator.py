@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, List
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+from extraction.datasources.core.checkpoint import (
+    CheckpointProgress,
+    CheckpointStore,
+    CheckpointTracker,
+)
 from extraction.datasources.core.document import BaseDocument
 from extraction.datasources.core.manager import BaseDatasourceManager
+from extraction.datasources.core.sync_state import SyncStateStore
 
 
 class BaseDatasourceOrchestrator(ABC):
@@ -23,6 +29,8 @@ class BaseDatasourceOrchestrator(ABC):
     def __init__(
         self,
         datasource_managers: List[BaseDatasourceManager],
+        sync_state: Optional[SyncStateStore] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ):
         """Initialize the orchestrator with datasource managers.
 
@@ -31,8 +39,18 @@ class BaseDatasourceOrchestrator(ABC):
                                  implement the BaseDatasourceManager interface.
                                  These managers handle the actual data extraction
                                  from specific datasource types.
+            sync_state: Store with the state of previous syncs, required
+                        for incremental syncs.
+            checkpoint_store: Store with the checkpoints of full refresh
+                        runs, checkpointing is disabled if None.
         """
         self.datasource_managers = datasource_managers
+        self.sync_state = sync_state
+        self.checkpoint_store = checkpoint_store
+        self.deleted_document_ids: List[str] = []
+        self._checkpoints: Dict[str, CheckpointTracker] = {}
+        self._consumed_progress: Dict[str, CheckpointProgress] = {}
+        self._saved_object_counts: Dict[str, int] = {}
 
     @abstractmethod
     async def full_refresh_sync(self) -> AsyncIterator[BaseDocument]:
@@ -43,6 +61,10 @@ class BaseDatasourceOrchestrator(ABC):
         refresh of all available content from the datasources, regardless
         of previous sync state.
 
+        With a checkpoint store, an interrupted run is resumed and the
+        progress of each datasource is recorded as documents are consumed,
+        to be saved with `save_checkpoint` once they are persisted.
+
         Returns:
             An asynchronous iterator yielding BaseDocument objects representing
             the extracted content from all datasources.
@@ -55,10 +77,101 @@ class BaseDatasourceOrchestrator(ABC):
 
         Extracts only new or modified content since the last sync operation.
         This method is designed for efficient regular updates without
-        re-processing unchanged content.
+        re-processing unchanged content. After the iteration,
+        `deleted_document_ids` holds the IDs of documents that were deleted
+        or replaced since the last sync. The sync state has to be committed
+        with `commit_sync_state` once the documents are persisted.
 
         Returns:
             An asynchronous iterator yielding BaseDocument objects representing
             newly added or modified content from all datasources.
         """
         pass
+
+    def commit_sync_state(self) -> None:
+        """Persist the sync state after the synced documents are persisted.
+
+        Until committed, the next incremental sync starts from the state of
+        the last committed sync again.
+        """
+        if self.sync_state is not None:
+            self.sync_state.commit()
+            for datasource_manager in self.datasource_managers:
+                datasource_manager.commit_sync_state()
+
+    def has_checkpoint(self) -> bool:
+        """Check whether a full refresh run is resumed.
+
+        Returns:
+            bool: True if an interrupted run left a checkpoint behind
+        """
+        return (
+            self.checkpoint_store is not None
+            and self.checkpoint_store.has_checkpoints()
+        )
+
+    def save_checkpoint(self) -> None:
+        """Persist the progress of the full refresh run.
+
+        Has to be called only once all documents consumed so far are
+        persisted, as an interrupted run resumes after them.
+        """
+        if self.checkpoint_store is None:
+            return
+
+        for source, progress in self._consumed_progress.items():
+            checkpoint = self._checkpoints[source]
+            saved_object_count = self._saved_object_counts.get(source, 0)
+            self.checkpoint_store.save(
+                source,
+                progress.cursor,
+                checkpoint.completed_object_ids[
+                    saved_object_count : progress.object_count
+                ],
+            )
+            self._saved_object_counts[source] = progress.object_count
+        self.checkpoint_store.commit()
+
+    def clear_checkpoint(self) -> None:
+        """Remove the checkpoint once the full refresh run is finished."""
+        if self.checkpoint_store is None:
+            return
+
+        self.checkpoint_store.clear()
+        self.checkpoint_store.commit()
+        self._checkpoints = {}
+        self._consumed_progress = {}
+        self._saved_object_counts = {}
+
+    async def _checkpointed_full_refresh_sync(
+        self, datasource_manager: BaseDatasourceManager, source: str
+    ) -> AsyncIterator[Tuple[BaseDocument, Optional[CheckpointProgress]]]:
+        """Run the full refresh of a datasource from its checkpoint.
+
+        Args:
+            datasource_manager: Manager of the datasource
+            source: Key of the datasource in the checkpoint store
+
+        Returns:
+            AsyncIterator[Tuple[BaseDocument, Optional[CheckpointProgress]]]:
+            Documents with the progress of the datasource once they are
+            yielded, None without checkpoint store
+        """
+        checkpoint = None
+        if self.checkpoint_store is not None:
+            checkpoint = CheckpointTracker(
+                source, self.checkpoint_store.load(source)
+            )
+            self._checkpoints[source] = checkpoint
+
+        async for document in datasource_manager.full_refresh_sync(checkpoint):
+            yield document, checkpoint.get_progress() if checkpoint else None
+
+    def _consume_progress(self, progress: Optional[CheckpointProgress]) -> None:
+        """Record the progress of a datasource once a document is consumed.
+
+        Args:
+            progress: Progress of the datasource yielded with the document
+        """
+        if progress is not None:
+            self._consumed_progress[progress.source] = progress
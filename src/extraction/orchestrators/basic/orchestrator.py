@@ -1,10 +1,15 @@
-from typing import AsyncIterator, Type
+from collections import Counter
+from typing import AsyncIterator, List, Optional, Type
 
 from core import Factory
 from extraction.bootstrap.configuration.configuration import (
     ExtractionConfiguration,
+    SyncMode,
 )
+from extraction.datasources.core.checkpoint import CheckpointStore
 from extraction.datasources.core.document import BaseDocument
+from extraction.datasources.core.manager import BaseDatasourceManager
+from extraction.datasources.core.sync_state import SyncStateStore
 from extraction.datasources.registry import DatasourceManagerRegistry
 from extraction.orchestrators.base_orchestator import BaseDatasourceOrchestrator
 
@@ -22,15 +27,62 @@ class BasicDatasourceOrchestrator(BaseDatasourceOrchestrator):
         Returns:
             AsyncIterator[BaseDocument]: Stream of documents extracted from all datasources
         """
-        for datasource_manager in self.datasource_managers:
-            async for document in datasource_manager.full_refresh_sync():
+        for datasource_manager, source in zip(
+            self.datasource_managers, self._get_sources()
+        ):
+            async for (
+                document,
+                progress,
+            ) in self._checkpointed_full_refresh_sync(
+                datasource_manager, source
+            ):
+                self._consume_progress(progress)
                 yield document
 
     async def incremental_sync(self) -> AsyncIterator[BaseDocument]:
+        """Extract and process new or changed content from all datasources.
+
+        Processes each configured datasource against the sync state and
+        collects the IDs of deleted or replaced documents.
+
+        Returns:
+            AsyncIterator[BaseDocument]: Stream of new or changed documents
+
+        Raises:
+            ValueError: If the orchestrator has no sync state store
         """
-        Not implemented yet.
+        if self.sync_state is None:
+            raise ValueError("Incremental sync requires a sync state store.")
+
+        self.deleted_document_ids = []
+        for datasource_manager, source in zip(
+            self.datasource_managers, self._get_sources()
+        ):
+            async for document in datasource_manager.incremental_sync(
+                self.sync_state, source
+            ):
+                yield document
+            self.deleted_document_ids.extend(
+                datasource_manager.deleted_document_ids
+            )
+
+    def _get_sources(self) -> List[str]:
+        """Get keys of the datasources in the sync state store.
+
+        Datasources are keyed by name in the sync state and checkpoint
+        stores. Further datasources of the same name
+        are suffixed with their position among them.
+
+        Returns:
+            List[str]: Keys of the datasources in order of their managers
         """
-        raise NotImplementedError("Incremental sync is not supported yet.")
+        counter = Counter()
+        sources = []
+        for datasource_manager in self.datasource_managers:
+            name = datasource_manager.configuration.name.value
+            sources.append(f"{name}_{counter[name]}" if counter[name] else name)
+            counter[name] += 1
+        return sources
 
 
 class BasicDatasourceOrchestratorFactory(Factory):
@@ -49,7 +101,9 @@ class BasicDatasourceOrchestratorFactory(Factory):
         """Creates a configured BasicDatasourceOrchestrator.
 
         Initializes datasource managers for each configured datasource
-        and creates an orchestrator instance with those managers.
+        and creates an orchestrator instance with those managers. The sync
+        state store is opened in incremental sync mode only, the checkpoint
+        store in full refresh mode only.
 
         Args:
             configuration: Settings for extraction process configuration
@@ -57,12 +111,60 @@ class BasicDatasourceOrchestratorFactory(Factory):
         Returns:
             BasicDatasourceOrchestrator: Configured orchestrator instance
         """
-        datasource_managers = [
+        return BasicDatasourceOrchestrator(
+            datasource_managers=cls._create_datasource_managers(configuration),
+            sync_state=cls._create_sync_state(configuration),
+            checkpoint_store=cls._create_checkpoint_store(configuration),
+        )
+
+    @staticmethod
+    def _create_datasource_managers(
+        configuration: ExtractionConfiguration,
+    ) -> List[BaseDatasourceManager]:
+        """Creates a datasource manager for each configured datasource.
+
+        Args:
+            configuration: Settings for extraction process configuration
+
+        Returns:
+            List[BaseDatasourceManager]: Managers in order of configuration
+        """
+        return [
             DatasourceManagerRegistry.get(datasource_configuration.name).create(
                 datasource_configuration
             )
             for datasource_configuration in configuration.extraction.datasources
         ]
-        return BasicDatasourceOrchestrator(
-            datasource_managers=datasource_managers
-        )
+
+    @staticmethod
+    def _create_sync_state(
+        configuration: ExtractionConfiguration,
+    ) -> Optional[SyncStateStore]:
+        """Opens the sync state store in incremental sync mode.
+
+        Args:
+            configuration: Settings for extraction process configuration
+
+        Returns:
+            Optional[SyncStateStore]: The store or None in full refresh mode
+        """
+        if configuration.extraction.sync_mode != SyncMode.INCREMENTAL:
+            return None
+        return SyncStateStore(configuration.extraction.sync_state_path)
+
+    @staticmethod
+    def _create_checkpoint_store(
+        configuration: ExtractionConfiguration,
+    ) -> Optional[CheckpointStore]:
+        """Opens the checkpoint store in full refresh mode.
+
+        Args:
+            configuration: Settings for extraction process configuration
+
+        Returns:
+            Optional[CheckpointStore]: The store or None in incremental sync
+            mode or if checkpointing is disabled
+        """
+        if configuration.extraction.sync_mode != SyncMode.FULL_REFRESH:
+            return None
+        return CheckpointStore.from_configuration(configuration)
@@ -0,0 +1,15 @@
+from extraction.bootstrap.configuration.configuration import OrchestratorName
+from extraction.orchestrators.concurrent.orchestrator import (
+    ConcurrentDatasourceOrchestratorFactory,
+)
+from extraction.orchestrators.registry import DatasourceOrchestratorRegistry
+
+
+def register() -> None:
+    """
+    Registers the ConcurrentDatasourceOrchestratorFactory in the DatasourceOrchestratorRegistry.
+    This function is called when the module is imported.
+    """
+    DatasourceOrchestratorRegistry.register(
+        OrchestratorName.CONCURRENT, ConcurrentDatasourceOrchestratorFactory
+    )
@@ -0,0 +1,223 @@
+import asyncio
+import logging
+from functools import partial
+from typing import Any, AsyncIterator, Callable, List, Optional, Type
+
+from core.logger import LoggerConfiguration
+from extraction.bootstrap.configuration.configuration import (
+    ExtractionConfiguration,
+)
+from extraction.datasources.core.checkpoint import CheckpointStore
+from extraction.datasources.core.document import BaseDocument
+from extraction.datasources.core.manager import BaseDatasourceManager
+from extraction.datasources.core.sync_state import SyncStateStore
+from extraction.orchestrators.basic.orchestrator import (
+    BasicDatasourceOrchestrator,
+    BasicDatasourceOrchestratorFactory,
+)
+
+_END_OF_STREAM = object()
+
+
+class _StreamFailure:
+    """Exception raised by a datasource stream, passed to the consumer."""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class ConcurrentDatasourceOrchestrator(BasicDatasourceOrchestrator):
+    """
+    Orchestrator processing all datasources concurrently.
+
+    Every datasource manager runs in its own task and buffers its documents
+    in a bounded queue, so a slow datasource does not hold up the others and
+    a fast one cannot run ahead of the consumer. The queues are merged
+    round-robin, taking at most one document per datasource in turn.
+    """
+
+    def __init__(
+        self,
+        datasource_managers: List[BaseDatasourceManager],
+        sync_state: Optional[SyncStateStore] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        max_concurrent_datasources: Optional[int] = None,
+        queue_size: int = 16,
+        logger: logging.Logger = LoggerConfiguration.get_logger(__name__),
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            datasource_managers: Managers of the datasources to process
+            sync_state: Store with the state of previous syncs, required
+                        for incremental syncs
+            checkpoint_store: Store with the checkpoints of full refresh
+                        runs, checkpointing is disabled if None
+            max_concurrent_datasources: Maximum number of datasources processed
+                        at the same time, all of them if None
+            queue_size: Maximum number of documents buffered per datasource
+            logger: Logger instance for logging messages
+        """
+        super().__init__(
+            datasource_managers=datasource_managers,
+            sync_state=sync_state,
+            checkpoint_store=checkpoint_store,
+        )
+        self.max_concurrent_datasources = max_concurrent_datasources
+        self.queue_size = queue_size
+        self.logger = logger
+
+    async def full_refresh_sync(self) -> AsyncIterator[BaseDocument]:
+        """Extract and process content from all datasources concurrently.
+
+        Documents are queued with the progress of their datasource, which
+        is recorded once they are consumed.
+
+        Returns:
+            AsyncIterator[BaseDocument]: Stream of documents extracted from all datasources
+        """
+        async for document, progress in self._merge(
+            [
+                partial(self._checkpointed_full_refresh_sync, manager, source)
+                for manager, source in zip(
+                    self.datasource_managers, self._get_sources()
+                )
+            ]
+        ):
+            self._consume_progress(progress)
+            yield document
+
+    async def incremental_sync(self) -> AsyncIterator[BaseDocument]:
+        """Extract and process new or changed content from all datasources concurrently.
+
+        Returns:
+            AsyncIterator[BaseDocument]: Stream of new or changed documents
+
+        Raises:
+            ValueError: If the orchestrator has no sync state store
+        """
+        if self.sync_state is None:
+            raise ValueError("Incremental sync requires a sync state store.")
+
+        self.deleted_document_ids = []
+        async for document in self._merge(
+            [
+                partial(manager.incremental_sync, self.sync_state, source)
+                for manager, source in zip(
+                    self.datasource_managers, self._get_sources()
+                )
+            ]
+        ):
+            yield document
+
+        for manager in self.datasource_managers:
+            self.deleted_document_ids.extend(manager.deleted_document_ids)
+
+    async def _merge(
+        self, streams: List[Callable[[], AsyncIterator[Any]]]
+    ) -> AsyncIterator[Any]:
+        """Run the datasource streams concurrently and merge them fairly.
+
+        If a stream fails, the remaining streams are cancelled and the
+        exception is raised.
+
+        Args:
+            streams: Functions creating the stream of each datasource
+
+        Returns:
+            AsyncIterator[Any]: Items of all streams, interleaved
+        """
+        if not streams:
+            return
+
+        semaphore = asyncio.Semaphore(
+            self.max_concurrent_datasources or len(streams)
+        )
+        item_available = asyncio.Event()
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in streams]
+        tasks = [
+            asyncio.create_task(
+                self._produce(stream, queue, semaphore, item_available)
+            )
+            for stream, queue in zip(streams, queues)
+        ]
+
+        try:
+            active_queues = list(queues)
+            while active_queues:
+                item_available.clear()
+                received = False
+                for queue in list(active_queues):
+                    if queue.empty():
+                        continue
+
+                    received = True
+                    item = queue.get_nowait()
+                    if item is _END_OF_STREAM:
+                        active_queues.remove(queue)
+                    elif isinstance(item, _StreamFailure):
+                        raise item.exception
+                    else:
+                        yield item
+
+                if not received:
+                    await item_available.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _produce(
+        self,
+        stream: Callable[[], AsyncIterator[Any]],
+        queue: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+        item_available: asyncio.Event,
+    ) -> None:
+        """Consume a datasource stream into its queue.
+
+        Args:
+            stream: Function creating the stream of the datasource
+            queue: Bounded queue of the datasource
+            semaphore: Semaphore limiting the number of concurrent datasources
+            item_available: Event set whenever an item is queued
+        """
+        async with semaphore:
+            try:
+                async for document in stream():
+                    await queue.put(document)
+                    item_available.set()
+                item = _END_OF_STREAM
+            except Exception as e:
+                item = _StreamFailure(e)
+
+        await queue.put(item)
+        item_available.set()
+
+
+class ConcurrentDatasourceOrchestratorFactory(
+    BasicDatasourceOrchestratorFactory
+):
+    """Factory for creating ConcurrentDatasourceOrchestrator instances."""
+
+    _configuration_class: Type = ExtractionConfiguration
+
+    @classmethod
+    def _create_instance(
+        cls, configuration: ExtractionConfiguration
+    ) -> ConcurrentDatasourceOrchestrator:
+        """Creates a configured ConcurrentDatasourceOrchestrator.
+
+        Args:
+            configuration: Settings for extraction process configuration
+
+        Returns:
+            ConcurrentDatasourceOrchestrator: Configured orchestrator instance
+        """
+        return ConcurrentDatasourceOrchestrator(
+            datasource_managers=cls._create_datasource_managers(configuration),
+            sync_state=cls._create_sync_state(configuration),
+            checkpoint_store=cls._create_checkpoint_store(configuration),
+            max_concurrent_datasources=configuration.extraction.max_concurrent_datasources,
+            queue_size=configuration.extraction.datasource_queue_size,
+        )
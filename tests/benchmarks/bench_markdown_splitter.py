@@ -0,0 +1,148 @@
+"""Benchmark of token accounting in the basic markdown splitter.
+
+Compares `BasicMarkdownSplitter` with the previous implementation, which
+tokenized nodes again after splitting them and tokenized the growing merged
+text on every merge, on a synthetic markdown document with many small
+sections. A regex tokenizer stands in for the embedding model tokenizer, so
+no model files are needed. Run from the repository root:
+
+    python tests/benchmarks/bench_markdown_splitter.py --sections 5000
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from typing import List
+
+from llama_index.core import Document
+from llama_index.core.schema import TextNode
+
+sys.path.append("./src")
+
+from embedding.splitters.basic_markdown.basic_markdown_splitter import (
+    BasicMarkdownSplitter,
+)
+
+TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+class CountingTokenizer:
+    """Regex tokenizer counting its calls and the characters it tokenized."""
+
+    def __init__(self):
+        self.calls = 0
+        self.characters = 0
+
+    def __call__(self, text: str) -> List[str]:
+        self.calls += 1
+        self.characters += len(text)
+        return TOKEN_RE.findall(text)
+
+
+class RetokenizingMarkdownSplitter(BasicMarkdownSplitter):
+    """Previous implementation tokenizing texts on every size check."""
+
+    def split(self, document: Document) -> List[TextNode]:
+        document_nodes = self.markdown_node_parser.get_nodes_from_documents(
+            [document]
+        )
+        document_nodes = self._split_big_nodes_retokenizing(document_nodes)
+        return self._merge_small_nodes_retokenizing(document_nodes)
+
+    def _split_big_nodes_retokenizing(
+        self, document_nodes: List[TextNode]
+    ) -> List[TextNode]:
+        new_document_nodes = []
+        for document_node in document_nodes:
+            document_node_size = len(self.tokenize_func(document_node.text))
+            if document_node_size > self.chunk_size_in_tokens:
+                new_document_nodes.extend(self._split_big_node(document_node))
+            else:
+                new_document_nodes.append(document_node)
+        return new_document_nodes
+
+    def _merge_small_nodes_retokenizing(
+        self, document_nodes: List[TextNode]
+    ) -> List[TextNode]:
+        new_document_nodes = []
+        current_node = document_nodes[0]
+        for node in document_nodes[1:]:
+            current_node_size = len(self.tokenize_func(current_node.text))
+            node_size = len(self.tokenize_func(node.text))
+            if current_node_size + node_size <= self.chunk_size_in_tokens:
+                current_node.text += node.text
+            else:
+                new_document_nodes.append(current_node)
+                current_node = node
+        new_document_nodes.append(current_node)
+        return new_document_nodes
+
+
+def build_document(sections: int) -> Document:
+    """Build a markdown document with many small sections.
+
+    Args:
+        sections: Number of sections
+
+    Returns:
+        Document: Document with a long section every 50 sections
+    """
+    parts = []
+    for i in range(sections):
+        sentences = 200 if i % 50 == 0 else 1 + i % 4
+        body = " ".join(
+            f"Sentence {j} of section {i} explains a detail."
+            for j in range(sentences)
+        )
+        parts.append(f"## Section {i}\n\n{body}\n")
+    return Document(id_="benchmark", text="\n".join(parts))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    document = build_document(args.sections)
+    implementations = {
+        "retokenizing": RetokenizingMarkdownSplitter,
+        "carried": BasicMarkdownSplitter,
+    }
+
+    print(
+        f"{args.sections} sections, {len(document.text) / 1e6:.2f} MB, "
+        f"chunk size {args.chunk_size} tokens"
+    )
+    for name, splitter_class in implementations.items():
+        tokenizer = CountingTokenizer()
+        splitter = splitter_class(
+            chunk_size_in_tokens=args.chunk_size,
+            chunk_overlap_in_tokens=0,
+            tokenize_func=tokenizer,
+        )
+        nodes = splitter.split(document)
+        calls, characters = tokenizer.calls, tokenizer.characters
+        # Time fresh splitters, so memoized counts do not carry over
+        seconds = min(
+            timeit.repeat(
+                lambda: splitter_class(
+                    chunk_size_in_tokens=args.chunk_size,
+                    chunk_overlap_in_tokens=0,
+                    tokenize_func=CountingTokenizer(),
+                ).split(document),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{name:>12}: {seconds:.3f} s, {len(nodes)} nodes, "
+            f"{calls} tokenizer calls, {characters / 1e6:.2f} M characters "
+            "tokenized"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark of cleaning HTML in exported Notion databases.
+
+Compares `NotionDatasourceCleaner._parse_html_in_markdown` with the previous
+implementation, which converted every matched tag separately, on a synthetic
+tag-heavy database export. Run from the repository root:
+
+    python tests/benchmarks/bench_notion_cleaner.py --rows 5000
+"""
+
+import argparse
+import re
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+sys.path.append("./src")
+
+from extraction.datasources.notion.cleaner import (
+    NotionDatasourceCleaner,
+    _convert_html,
+)
+
+
+def parse_html_in_markdown_per_tag(md_text: str) -> str:
+    """Previous implementation converting each tag with BeautifulSoup."""
+
+    def replace_html(match):
+        html_content = match.group(0)
+        soup = BeautifulSoup(html_content, "html.parser")
+        markdown = md(str(soup))
+
+        if not re.search(r"[a-zA-Z0-9]", markdown):
+            return ""
+        return markdown
+
+    md_text = re.sub(r"<!--.*?-->", "", md_text, flags=re.DOTALL)
+    html_block_re = re.compile(r"<.*?>", re.DOTALL)
+    return re.sub(html_block_re, replace_html, md_text)
+
+
+def build_database_export(rows: int) -> str:
+    """Build markdown of a database export with HTML in every cell.
+
+    Args:
+        rows: Number of database rows
+
+    Returns:
+        str: Markdown text of the export
+    """
+    lines = [
+        "# Tasks",
+        "<!-- exported database -->",
+        "| Name | Status | Owner | Attachment |",
+        "| --- | --- | --- | --- |",
+    ]
+    for i in range(rows):
+        lines.append(
+            f'| <span style="color:gray">Task {i}</span> '
+            f'| <mark class="status-{i % 3}">Open</mark><br/> '
+            f'| <a href="https://example.com/users/{i % 50}">User {i % 50}</a> '
+            f'| <img src="https://example.com/files/{i % 20}.png" '
+            f'alt="file {i % 20}"> <!-- row {i} --> |'
+        )
+    lines.append("<details><summary>Notes</summary><p>a < b</p></details>")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = build_database_export(args.rows)
+    implementations = {
+        "per-tag": parse_html_in_markdown_per_tag,
+        "single-pass": NotionDatasourceCleaner._parse_html_in_markdown,
+    }
+
+    expected = parse_html_in_markdown_per_tag(text)
+    assert (
+        NotionDatasourceCleaner._parse_html_in_markdown(text) == expected
+    ), "Implementations produce different output"
+
+    print(f"{args.rows} rows, {len(text) / 1e6:.2f} MB")
+    for name, implementation in implementations.items():
+        # Start every run without conversions cached by the previous one
+        seconds = min(
+            timeit.repeat(
+                lambda: implementation(text),
+                setup=_convert_html.cache_clear,
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(f"{name:>12}: {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
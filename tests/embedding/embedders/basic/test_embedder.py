@@ -14,6 +14,7 @@ from embedding.bootstrap.configuration.configuration import (
     EmbeddingConfiguration,
 )
 from embedding.embedders.basic.embedder import BasicEmbedder
+from embedding.embedders.core.cache import EmbeddingCache
 
 
 class Fixtures:
@@ -127,3 +128,61 @@ class TestEmbedder:
 
         # Assert
         manager.assertions.assert_nodes_embedded()
+
+    def test_given_skip_existing_nodes_when_embed_flush_then_stored_nodes_are_skipped(
+        self,
+    ) -> None:
+        # Arrange
+        manager = Manager(Arrangements(Fixtures().with_nodes().with_nodes()))
+        service = manager.get_service()
+        stored_node, new_node = manager.fixtures.nodes
+        stored_node.id_ = "stored"
+        new_node.id_ = "new"
+        service.vector_store.get_nodes = Mock(return_value=[stored_node])
+        service.embedding_model.get_text_embedding_batch.return_value = [
+            [0.1, 0.2, 0.3]
+        ]
+        service.skip_existing_nodes = True
+
+        # Act
+        service.embed(manager.fixtures.nodes)
+        service.embed_flush()
+
+        # Assert
+        service.vector_store.get_nodes.assert_called_once_with(
+            node_ids=["stored", "new"]
+        )
+        service.vector_store.add.assert_called_once_with([new_node])
+
+    def test_given_embedding_cache_when_embed_flush_then_only_cache_misses_are_embedded(
+        self,
+    ) -> None:
+        # Arrange
+        manager = Manager(Arrangements(Fixtures().with_nodes().with_nodes()))
+        service = manager.get_service()
+        cached_node, new_node = manager.fixtures.nodes
+        cached_node.get_content.return_value = "Cached node"
+        new_node.get_content.return_value = "New node"
+        service.embedding_cache = Mock(spec=EmbeddingCache)
+        service.embedding_cache.get_many.return_value = [[0.4, 0.5], None]
+        service.embedding_cache.hits = 1
+        service.embedding_cache.misses = 1
+        service.embedding_cache.evictions = 0
+        service.embedding_cache.hit_rate = 0.5
+        service.embedding_model.get_text_embedding_batch.return_value = [
+            [0.1, 0.2]
+        ]
+
+        # Act
+        service.embed(manager.fixtures.nodes)
+        service.embed_flush()
+
+        # Assert
+        service.embedding_model.get_text_embedding_batch.assert_called_once_with(
+            ["New node"]
+        )
+        service.embedding_cache.put_many.assert_called_once_with(
+            ["New node"], [[0.1, 0.2]]
+        )
+        assert cached_node.embedding == [0.4, 0.5]
+        assert new_node.embedding == [0.1, 0.2]
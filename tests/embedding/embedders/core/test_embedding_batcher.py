@@ -0,0 +1,72 @@
+import sys
+
+sys.path.append("./src")
+
+from llama_index.core.schema import TextNode
+
+from embedding.embedders.core.batcher import EmbeddingBatcher
+
+
+def count_tokens(texts):
+    return [len(text.split()) for text in texts]
+
+
+def create_nodes(*token_counts):
+    return [
+        TextNode(id_=str(i), text=" ".join(["token"] * token_count))
+        for i, token_count in enumerate(token_counts)
+    ]
+
+
+def get_token_counts(batches):
+    return [[len(node.text.split()) for node in batch] for batch in batches]
+
+
+def test_nodes_are_packed_by_tokens_and_count():
+    batcher = EmbeddingBatcher(
+        batch_size=3,
+        max_batch_size_in_tokens=10,
+        count_tokens_func=count_tokens,
+    )
+
+    batches = batcher.pack(create_nodes(4, 4, 4, 1, 1, 1, 1, 20, 2))
+
+    assert get_token_counts(batches) == [[4, 4], [4, 1, 1], [1, 1], [20], [2]]
+
+
+def test_last_batch_stays_pending_until_flush():
+    batcher = EmbeddingBatcher(
+        batch_size=3,
+        max_batch_size_in_tokens=10,
+        count_tokens_func=count_tokens,
+    )
+
+    first_batches = batcher.add(create_nodes(6, 3))
+    second_batches = batcher.add(create_nodes(1, 5))
+    last_batches = batcher.flush()
+
+    assert get_token_counts(first_batches) == []
+    assert get_token_counts(second_batches) == [[6, 3, 1]]
+    assert get_token_counts(last_batches) == [[5]]
+    assert batcher.flush() == []
+
+
+def test_nodes_are_sorted_by_length():
+    batcher = EmbeddingBatcher(
+        batch_size=2,
+        max_batch_size_in_tokens=100,
+        count_tokens_func=count_tokens,
+        sort_by_length=True,
+    )
+
+    batches = batcher.pack(create_nodes(9, 1, 8, 2))
+
+    assert get_token_counts(batches) == [[1, 2], [8, 9]]
+
+
+def test_batches_are_limited_by_count_without_token_limit():
+    batcher = EmbeddingBatcher(batch_size=2)
+
+    batches = batcher.pack(create_nodes(100, 100, 100))
+
+    assert get_token_counts(batches) == [[100, 100], [100]]
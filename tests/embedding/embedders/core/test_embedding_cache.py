@@ -0,0 +1,41 @@
+import sys
+
+sys.path.append("./src")
+
+from embedding.embedders.core.cache import EmbeddingCache
+
+
+def test_embeddings_are_persisted_per_model(tmp_path):
+    path = str(tmp_path / "cache" / "embeddings.sqlite")
+    cache = EmbeddingCache(path, provider="openai", model_name="small")
+    cache.put_many(["a", "b"], [[0.1, 0.2], [0.3, 0.4]])
+    cache.close()
+
+    cache = EmbeddingCache(path, provider="openai", model_name="small")
+    other_model_cache = EmbeddingCache(
+        path, provider="openai", model_name="large"
+    )
+
+    assert cache.get_many(["b", "c", "a"]) == [[0.3, 0.4], None, [0.1, 0.2]]
+    assert other_model_cache.get_many(["a"]) == [None]
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_rate == 2 / 3
+
+
+def test_least_recently_used_embeddings_are_evicted(tmp_path):
+    embedding_size = 2 * 8
+    cache = EmbeddingCache(
+        str(tmp_path / "embeddings.sqlite"),
+        provider="openai",
+        model_name="small",
+        max_size_in_bytes=2 * embedding_size,
+    )
+    cache.put_many(["a"], [[0.1, 0.2]])
+    cache.put_many(["b"], [[0.3, 0.4]])
+    cache.get_many(["a"])
+
+    cache.put_many(["c"], [[0.5, 0.6]])
+
+    assert cache.get_many(["a", "b", "c"]) == [[0.1, 0.2], None, [0.5, 0.6]]
+    assert cache.size_in_bytes == 2 * embedding_size
+    assert cache.evictions == 1
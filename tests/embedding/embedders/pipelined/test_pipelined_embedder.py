@@ -0,0 +1,109 @@
+import sys
+
+sys.path.append("./src")
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores.types import VectorStore
+
+from embedding.bootstrap.configuration.configuration import (
+    EmbeddingConfiguration,
+)
+from embedding.embedders.pipelined.embedder import PipelinedEmbedder
+
+
+def create_embedder(max_pending_writes: int = 2) -> PipelinedEmbedder:
+    configuration = Mock(spec=EmbeddingConfiguration)
+    configuration.embedding = Mock()
+    configuration.embedding.embedding_model = Mock()
+    configuration.embedding.embedding_model.batch_size = 2
+    embedding_model = Mock(spec=BaseEmbedding)
+    embedding_model.get_text_embedding_batch.side_effect = lambda texts: [
+        [0.1, 0.2] for _ in texts
+    ]
+    return PipelinedEmbedder(
+        configuration=configuration,
+        embedding_model=embedding_model,
+        vector_store=Mock(spec=VectorStore),
+        max_pending_writes=max_pending_writes,
+    )
+
+
+def create_nodes(count: int):
+    return [TextNode(id_=str(i), text=f"Node {i}") for i in range(count)]
+
+
+def test_next_batch_is_embedded_while_previous_batch_is_written():
+    embedder = create_embedder(max_pending_writes=2)
+    write_started = threading.Event()
+    release_writes = threading.Event()
+
+    def add(nodes):
+        write_started.set()
+        release_writes.wait(timeout=5)
+
+    embedder.vector_store.add.side_effect = add
+
+    embedder.embed(create_nodes(2))
+    assert write_started.wait(timeout=5)
+    embedder.embed(create_nodes(2))
+
+    assert embedder.embedding_model.get_text_embedding_batch.call_count == 2
+    release_writes.set()
+    embedder.embed_flush()
+    assert embedder.vector_store.add.call_count == 2
+    assert embedder.pending_writes == []
+
+
+def test_embedding_blocks_while_max_pending_writes_are_reached():
+    embedder = create_embedder(max_pending_writes=1)
+    release_writes = threading.Event()
+    embedder.vector_store.add.side_effect = lambda nodes: release_writes.wait(
+        timeout=5
+    )
+
+    embedder.embed(create_nodes(2))
+    second_batch = threading.Thread(
+        target=embedder.embed, args=(create_nodes(2),)
+    )
+    second_batch.start()
+    second_batch.join(timeout=0.2)
+
+    assert second_batch.is_alive()
+    assert embedder.embedding_model.get_text_embedding_batch.call_count == 2
+    release_writes.set()
+    second_batch.join(timeout=5)
+    embedder.embed_flush()
+    assert embedder.vector_store.add.call_count == 2
+
+
+def test_failed_write_is_raised_by_embed_flush():
+    embedder = create_embedder()
+    embedder.vector_store.add.side_effect = ConnectionError("Store down")
+
+    embedder.embed(create_nodes(3))
+
+    with pytest.raises(ConnectionError, match="Store down"):
+        embedder.embed_flush()
+
+
+def test_embed_flush_shuts_down_write_workers_until_next_write():
+    embedder = create_embedder()
+
+    embedder.embed(create_nodes(3))
+    embedder.embed_flush()
+    write_workers_after_flush = embedder.write_executor
+    embedder.embed(create_nodes(2))
+    embedder.embed_flush()
+
+    assert write_workers_after_flush is None
+    assert embedder.write_executor is None
+    assert embedder.vector_store.add.call_count == 3
+    assert not any(
+        thread.name.startswith("vector-store-writer")
+        for thread in threading.enumerate()
+    )
@@ -0,0 +1,77 @@
+import sys
+from typing import Optional
+
+sys.path.append("./src")
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from embedding.embedders.base_embedder import BaseEmbedder
+from embedding.orchestrators.basic.orchestrator import (
+    BasicEmbeddingOrchestrator,
+)
+from embedding.splitters.base_splitter import BaseSplitter
+from extraction.bootstrap.configuration.configuration import SyncMode
+from extraction.orchestrators.base_orchestator import BaseDatasourceOrchestrator
+
+
+async def documents():
+    for document in ["document 1", "document 2"]:
+        yield document
+
+
+def create_orchestrator(
+    sync_mode: SyncMode, checkpoint_interval: Optional[int] = None
+) -> BasicEmbeddingOrchestrator:
+    datasource_orchestrator = MagicMock(spec=BaseDatasourceOrchestrator)
+    datasource_orchestrator.full_refresh_sync = Mock(return_value=documents())
+    datasource_orchestrator.incremental_sync = Mock(return_value=documents())
+    datasource_orchestrator.deleted_document_ids = ["deleted"]
+    splitter = Mock(spec=BaseSplitter)
+    splitter.split.side_effect = lambda document: [document]
+    return BasicEmbeddingOrchestrator(
+        datasource_orchestrator=datasource_orchestrator,
+        splitter=splitter,
+        embedder=Mock(spec=BaseEmbedder),
+        sync_mode=sync_mode,
+        checkpoint_interval=checkpoint_interval,
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_embeds_all_documents():
+    orchestrator = create_orchestrator(SyncMode.FULL_REFRESH)
+
+    await orchestrator.embed()
+
+    assert orchestrator.embedder.embed.call_count == 2
+    orchestrator.embedder.embed_flush.assert_called_once()
+    orchestrator.embedder.delete.assert_not_called()
+    orchestrator.datasource_orchestrator.commit_sync_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_deletes_documents_and_commits_sync_state():
+    orchestrator = create_orchestrator(SyncMode.INCREMENTAL)
+
+    await orchestrator.embed()
+
+    assert orchestrator.embedder.embed.call_count == 2
+    orchestrator.embedder.delete.assert_called_once_with(["deleted"])
+    orchestrator.datasource_orchestrator.commit_sync_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_with_checkpoint_interval_saves_and_clears_checkpoints():
+    orchestrator = create_orchestrator(
+        SyncMode.FULL_REFRESH, checkpoint_interval=1
+    )
+    orchestrator.datasource_orchestrator.has_checkpoint.return_value = True
+
+    await orchestrator.embed()
+
+    assert orchestrator.embedder.skip_existing_nodes is True
+    assert orchestrator.embedder.embed_flush.call_count == 3
+    assert orchestrator.datasource_orchestrator.save_checkpoint.call_count == 2
+    orchestrator.datasource_orchestrator.clear_checkpoint.assert_called_once()
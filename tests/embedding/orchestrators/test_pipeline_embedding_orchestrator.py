@@ -0,0 +1,113 @@
+import sys
+from typing import List, Optional
+
+sys.path.append("./src")
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from embedding.embedders.base_embedder import BaseEmbedder
+from embedding.orchestrators.pipeline.orchestrator import (
+    PipelineEmbeddingOrchestrator,
+)
+from embedding.splitters.base_splitter import BaseSplitter
+from extraction.bootstrap.configuration.configuration import SyncMode
+from extraction.orchestrators.base_orchestator import BaseDatasourceOrchestrator
+
+
+async def documents(count: int):
+    for i in range(count):
+        yield f"document {i}"
+
+
+def create_orchestrator(
+    document_count: int,
+    sync_mode: SyncMode = SyncMode.FULL_REFRESH,
+    checkpoint_interval: Optional[int] = None,
+) -> PipelineEmbeddingOrchestrator:
+    datasource_orchestrator = MagicMock(spec=BaseDatasourceOrchestrator)
+    datasource_orchestrator.full_refresh_sync = Mock(
+        return_value=documents(document_count)
+    )
+    datasource_orchestrator.incremental_sync = Mock(
+        return_value=documents(document_count)
+    )
+    datasource_orchestrator.deleted_document_ids = ["deleted"]
+    datasource_orchestrator.has_checkpoint.return_value = False
+    splitter = Mock(spec=BaseSplitter)
+    splitter.split.side_effect = lambda document: [
+        f"{document} node {i}" for i in range(3)
+    ]
+    return PipelineEmbeddingOrchestrator(
+        datasource_orchestrator=datasource_orchestrator,
+        splitter=splitter,
+        embedder=Mock(spec=BaseEmbedder),
+        batch_size=2,
+        sync_mode=sync_mode,
+        checkpoint_interval=checkpoint_interval,
+        queue_size=2,
+        split_workers=2,
+        embed_workers=2,
+        stats_interval=None,
+    )
+
+
+def get_embedded_nodes(orchestrator: PipelineEmbeddingOrchestrator) -> List:
+    return [
+        node
+        for call in orchestrator.embedder.embed_batch.call_args_list
+        for node in call.args[0]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_embeds_all_nodes_in_batches():
+    orchestrator = create_orchestrator(5, SyncMode.INCREMENTAL)
+
+    await orchestrator.embed()
+
+    embedded_nodes = get_embedded_nodes(orchestrator)
+    assert sorted(embedded_nodes) == sorted(
+        f"document {i} node {j}" for i in range(5) for j in range(3)
+    )
+    assert all(
+        len(call.args[0]) <= 2
+        for call in orchestrator.embedder.embed_batch.call_args_list
+    )
+    orchestrator.embedder.delete.assert_called_once_with(["deleted"])
+    orchestrator.datasource_orchestrator.commit_sync_state.assert_called_once()
+    assert orchestrator.get_queue_depths() == {
+        "split": 0,
+        "batch": 0,
+        "embed": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_is_saved_after_fetched_documents_are_embedded():
+    orchestrator = create_orchestrator(5, checkpoint_interval=2)
+    embedded_node_counts = []
+    orchestrator.datasource_orchestrator.save_checkpoint.side_effect = (
+        lambda: embedded_node_counts.append(
+            len(get_embedded_nodes(orchestrator))
+        )
+    )
+
+    await orchestrator.embed()
+
+    assert embedded_node_counts == [6, 12]
+    assert len(get_embedded_nodes(orchestrator)) == 15
+    orchestrator.datasource_orchestrator.clear_checkpoint.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_embedding_error_stops_the_pipeline():
+    orchestrator = create_orchestrator(100)
+    orchestrator.embedder.embed_batch.side_effect = RuntimeError("Model down")
+
+    with pytest.raises(RuntimeError, match="Model down"):
+        await orchestrator.embed()
+
+    assert orchestrator.extracted_document_count < 100
+    orchestrator.embedder.embed_flush.assert_not_called()
@@ -0,0 +1,71 @@
+import sys
+
+sys.path.append("./src")
+
+from unittest.mock import Mock
+
+from llama_index.core import Document
+
+from embedding.splitters.basic_markdown.basic_markdown_splitter import (
+    BasicMarkdownSplitter,
+)
+
+
+def create_splitter(chunk_size_in_tokens: int) -> BasicMarkdownSplitter:
+    return BasicMarkdownSplitter(
+        chunk_size_in_tokens=chunk_size_in_tokens,
+        chunk_overlap_in_tokens=0,
+        tokenize_func=Mock(side_effect=str.split),
+    )
+
+
+def test_small_sections_are_merged_tokenizing_each_section_once():
+    splitter = create_splitter(chunk_size_in_tokens=20)
+    sections = [f"# Section {i}\n\nText of section {i}.\n" for i in range(30)]
+    document = Document(id_="document", text="\n".join(sections))
+
+    nodes = splitter.split(document)
+
+    assert splitter.tokenize_func.call_count == 30
+    assert "".join(node.text for node in nodes).count("Section") == 30
+    assert all(len(node.text.split()) <= 20 for node in nodes)
+    # Sections of 7 tokens are merged in pairs
+    assert len(nodes) == 15
+    assert [node.id_ for node in nodes] == [
+        node.id_ for node in create_splitter(20).split(document)
+    ]
+
+
+def test_big_sections_are_split_within_chunk_size():
+    splitter = create_splitter(chunk_size_in_tokens=50)
+    text = " ".join(f"Sentence number {i} is here." for i in range(100))
+    document = Document(id_="document", text=f"# Title\n\n{text}")
+
+    nodes = splitter.split(document)
+
+    assert len(nodes) > 1
+    assert all(len(node.text.split()) <= 50 for node in nodes)
+
+
+def test_token_counter_counts_texts_in_batches():
+    count_tokens = Mock(
+        side_effect=lambda texts: [len(text.split()) for text in texts]
+    )
+    splitter = BasicMarkdownSplitter(
+        chunk_size_in_tokens=20,
+        chunk_overlap_in_tokens=0,
+        tokenize_func=Mock(side_effect=str.split),
+        count_tokens_func=count_tokens,
+    )
+    sections = [f"# Section {i}\n\nText of section {i}.\n" for i in range(30)]
+    document = Document(id_="document", text="\n".join(sections))
+
+    nodes = splitter.split(document)
+
+    count_tokens.assert_called_once()
+    splitter.tokenize_func.assert_not_called()
+    assert len(nodes) == 15
+
+    splitter.split(document)
+
+    count_tokens.assert_called_once()
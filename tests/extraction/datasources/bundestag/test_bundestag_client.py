@@ -108,9 +108,9 @@ class Fixtures:
 
 
 class Arrangements:
-    def __init__(self, fixtures: Fixtures) -> None:
+    def __init__(self, fixtures: Fixtures, max_workers: int = 1) -> None:
         self.fixtures = fixtures
-        self.client = BundestagMineClient()
+        self.client = BundestagMineClient(max_workers=max_workers)
 
     def mock_safe_get(self) -> "Arrangements":
         def mock_safe_get_side_effect(path: str):
@@ -200,6 +200,15 @@ class Assertions:
         expected_ids = [s["id"] for s in expected_speeches]
         assert set(speech_ids) == set(expected_ids)
 
+    def assert_speaker_fetched_once_per_id(self):
+        speaker_calls = [
+            call.args[0]
+            for call in self.client.safe_get.call_args_list
+            if call.args[0].startswith("GetSpeakerById/")
+        ]
+        assert len(speaker_calls) == len(set(speaker_calls))
+        assert len(speaker_calls) == len(self.fixtures.speaker_data)
+
     def assert_all_speeches(self, speeches: Iterator[BundestagSpeech]):
         speeches_list = list(speeches)
 
@@ -323,3 +332,82 @@ class TestBundestagMineClient:
 
         all_speeches = list(all_speeches_iterator)
         assert all_speeches == []
+
+    def test_fetch_all_speeches_fetches_each_speaker_once(self):
+        # Arrange
+        fixtures = (
+            Fixtures()
+            .with_protocols()
+            .with_agenda_items()
+            .with_speeches()
+            .with_speaker_data()
+        )
+        manager = Manager(Arrangements(fixtures).mock_safe_get())
+        client = manager.get_client()
+
+        # Act
+        list(client.fetch_all_speeches())
+
+        # Assert
+        manager.assertions.assert_speaker_fetched_once_per_id()
+
+    def test_fetch_all_speeches_concurrently(self):
+        # Arrange
+        fixtures = (
+            Fixtures()
+            .with_protocols(count=5)
+            .with_agenda_items(items_per_protocol=3)
+            .with_speeches()
+            .with_speaker_data()
+        )
+        sequential_client = Manager(
+            Arrangements(fixtures).mock_safe_get()
+        ).get_client()
+        manager = Manager(Arrangements(fixtures, max_workers=4).mock_safe_get())
+        client = manager.get_client()
+
+        # Act
+        speeches = list(client.fetch_all_speeches())
+
+        # Assert
+        expected = list(sequential_client.fetch_all_speeches())
+        assert [s.id for s in speeches] == [s.id for s in expected]
+        manager.assertions.assert_all_speeches(speeches)
+        manager.assertions.assert_speaker_fetched_once_per_id()
+
+    @pytest.mark.parametrize("found", [True, False])
+    def test_fetch_all_speeches_from_start_agenda_item(self, found: bool):
+        # Arrange
+        fixtures = (
+            Fixtures()
+            .with_protocols()
+            .with_agenda_items()
+            .with_speeches()
+            .with_speaker_data()
+        )
+        manager = Manager(Arrangements(fixtures).mock_safe_get())
+        client = manager.get_client()
+        all_speeches = list(client.fetch_all_speeches())
+        start_speech = all_speeches[len(all_speeches) // 2]
+        start_agenda_item_id = (
+            start_speech.agendaItem.id if found else "unknown"
+        )
+
+        # Act
+        speeches = list(
+            client.fetch_all_speeches(
+                start_protocol_id=start_speech.protocol.id,
+                start_agenda_item_id=start_agenda_item_id,
+            )
+        )
+
+        # Assert
+        first_speech_index = next(
+            i
+            for i, speech in enumerate(all_speeches)
+            if speech.protocol.id == start_speech.protocol.id
+            and (not found or speech.agendaItem.id == start_agenda_item_id)
+        )
+        assert [s.id for s in speeches] == [
+            s.id for s in all_speeches[first_speech_index:]
+        ]
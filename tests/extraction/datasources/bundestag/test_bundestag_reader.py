@@ -1,4 +1,7 @@
+import asyncio
 import sys
+import threading
+import time
 from typing import Any, Dict, List
 from unittest.mock import Mock
 
@@ -46,6 +49,7 @@ class Arrangements:
         self.configuration = Mock(spec=BundestagMineDatasourceConfiguration)
         self.configuration.export_limit = self.fixtures.export_limit
         self.client = Mock(spec=BundestagMineClient)
+        self.closing_thread_names: List[str] = []
         self.service = BundestagMineDatasourceReader(
             configuration=self.configuration, client=self.client
         )
@@ -54,6 +58,22 @@ class Arrangements:
         self.client.fetch_all_speeches.return_value = self.fixtures.speeches
         return self
 
+    def on_client_fetch_all_speeches_blocking(
+        self, delay: float
+    ) -> "Arrangements":
+        def fetch_all_speeches(**kwargs):
+            try:
+                for speech in self.fixtures.speeches:
+                    time.sleep(delay)
+                    yield speech
+            finally:
+                self.closing_thread_names.append(
+                    threading.current_thread().name
+                )
+
+        self.client.fetch_all_speeches.side_effect = fetch_all_speeches
+        return self
+
 
 class Assertions:
     def __init__(self, arrangements: Arrangements):
@@ -133,3 +153,74 @@ class TestBundestagReader:
         manager.assertions.assert_client_called()
         manager.assertions.assert_speeches_count(speeches)
         manager.assertions.assert_speeches_content(speeches)
+
+    @pytest.mark.asyncio
+    async def test_read_all_async_does_not_block_event_loop(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_speeches(3)
+            ).on_client_fetch_all_speeches_blocking(0.1)
+        )
+        service = manager.get_service()
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+
+        # Act
+        speeches = [speech async for speech in service.read_all_async()]
+        ticker.cancel()
+
+        # Assert
+        manager.assertions.assert_speeches_content(speeches)
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_read_all_async_closes_speeches_off_event_loop(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_export_limit(1).with_speeches(3)
+            ).on_client_fetch_all_speeches_blocking(0)
+        )
+        service = manager.get_service()
+
+        # Act
+        speeches = [speech async for speech in service.read_all_async()]
+
+        # Assert
+        manager.assertions.assert_speeches_content(speeches)
+        assert len(manager.arrangements.closing_thread_names) == 1
+        assert (
+            manager.arrangements.closing_thread_names[0]
+            != threading.current_thread().name
+        )
+
+    @pytest.mark.asyncio
+    async def test_cancelled_read_closes_speeches_once_fetched(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_speeches(3)
+            ).on_client_fetch_all_speeches_blocking(0.2)
+        )
+        service = manager.get_service()
+
+        async def read_all() -> List[Dict[str, Any]]:
+            return [speech async for speech in service.read_all_async()]
+
+        # Act
+        read = asyncio.create_task(read_all())
+        await asyncio.sleep(0.1)
+        read.cancel()
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await read
+        assert len(manager.arrangements.closing_thread_names) == 1
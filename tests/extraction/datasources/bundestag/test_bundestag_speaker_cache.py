@@ -0,0 +1,95 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+sys.path.append("./src")
+
+from extraction.datasources.bundestag.client import Speaker
+from extraction.datasources.bundestag.speaker_cache import SpeakerCache
+
+
+def make_speaker(speaker_id: str) -> Speaker:
+    return Speaker(
+        id=speaker_id, firstName="John", lastName="Doe", party="Test Party"
+    )
+
+
+def test_get_or_fetch_caches_speaker():
+    cache = SpeakerCache(Speaker)
+    fetch = Mock(side_effect=make_speaker)
+
+    first = cache.get_or_fetch("speaker_1", fetch)
+    second = cache.get_or_fetch("speaker_1", fetch)
+
+    assert first == second == make_speaker("speaker_1")
+    fetch.assert_called_once_with("speaker_1")
+
+
+def test_get_or_fetch_caches_failed_lookups():
+    cache = SpeakerCache(Speaker)
+    fetch = Mock(return_value=None)
+
+    assert cache.get_or_fetch("speaker_1", fetch) is None
+    assert cache.get_or_fetch("speaker_1", fetch) is None
+    fetch.assert_called_once()
+
+
+def test_get_or_fetch_evicts_least_recently_used():
+    cache = SpeakerCache(Speaker, max_size=2)
+    fetch = Mock(side_effect=make_speaker)
+
+    cache.get_or_fetch("speaker_1", fetch)
+    cache.get_or_fetch("speaker_2", fetch)
+    cache.get_or_fetch("speaker_1", fetch)
+    cache.get_or_fetch("speaker_3", fetch)
+    cache.get_or_fetch("speaker_2", fetch)
+
+    assert [call.args[0] for call in fetch.call_args_list] == [
+        "speaker_1",
+        "speaker_2",
+        "speaker_3",
+        "speaker_2",
+    ]
+
+
+def test_get_or_fetch_coalesces_concurrent_lookups():
+    cache = SpeakerCache(Speaker)
+    calls = []
+    lock = threading.Lock()
+
+    def slow_fetch(speaker_id: str) -> Speaker:
+        with lock:
+            calls.append(speaker_id)
+        time.sleep(0.05)
+        return make_speaker(speaker_id)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: cache.get_or_fetch("speaker_1", slow_fetch), range(8)
+            )
+        )
+
+    assert calls == ["speaker_1"]
+    assert all(result == make_speaker("speaker_1") for result in results)
+
+
+def test_save_persists_speakers_between_instances(tmp_path):
+    path = str(tmp_path / "cache" / "speakers.json")
+    cache = SpeakerCache(Speaker, path=path)
+    cache.get_or_fetch("speaker_1", make_speaker)
+    cache.get_or_fetch("speaker_2", Mock(return_value=None))
+    cache.save()
+
+    fetch = Mock(side_effect=make_speaker)
+    reloaded = SpeakerCache(Speaker, path=path)
+
+    assert reloaded.get_or_fetch("speaker_1", fetch) == make_speaker(
+        "speaker_1"
+    )
+    assert reloaded.get_or_fetch("speaker_2", fetch) == make_speaker(
+        "speaker_2"
+    )
+    fetch.assert_called_once_with("speaker_2")
@@ -1,16 +1,31 @@
 import sys
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
 
 sys.path.append("./src")
 
-from markitdown import MarkItDown
+import pytest
+from markitdown.converters import HtmlConverter
 
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceName,
+    ProcessingExecutorType,
+)
 from extraction.datasources.confluence.configuration import (
     ConfluenceDatasourceConfiguration,
 )
 from extraction.datasources.confluence.document import ConfluenceDocument
-from extraction.datasources.confluence.parser import ConfluenceDatasourceParser
+from extraction.datasources.confluence.parser import (
+    ConfluenceDatasourceParser,
+    ConfluenceDatasourceParserFactory,
+)
 from extraction.datasources.confluence.reader import ConfluencePage
+from extraction.datasources.core.cleaner import BasicMarkdownCleaner
+from extraction.datasources.core.processing import (
+    DocumentPipeline,
+    ProcessingStage,
+)
+from extraction.datasources.core.splitter import BasicMarkdownSplitter
 
 
 class Fixtures:
@@ -64,7 +79,7 @@ class Arrangements:
     def __init__(self, fixtures: Fixtures) -> None:
         self.fixtures = fixtures
 
-        self.markdown_parser = Mock(spec=MarkItDown)
+        self.markdown_parser = Mock(spec=HtmlConverter)
 
         self.service = ConfluenceDatasourceParser(
             configuration=self.fixtures.configuration,
@@ -73,22 +88,14 @@ class Arrangements:
 
     def on_parser_convert_return_markdown(self) -> "Arrangements":
         mock_result = Mock()
-        mock_result.text_content = self.fixtures.markdown_content
-        self.markdown_parser.convert.return_value = mock_result
+        mock_result.markdown = self.fixtures.markdown_content
+        self.markdown_parser.convert_string.return_value = mock_result
         return self
 
-    def mock_tempfile(self) -> "Arrangements":
-        self.tempfile_patcher = patch("tempfile.NamedTemporaryFile")
-        self.mock_temp_file = self.tempfile_patcher.start()
-        mock_file = Mock()
-        mock_file.name = "temp_file.html"
-        self.mock_temp_file.return_value.__enter__.return_value = mock_file
+    def with_executor(self) -> "Arrangements":
+        self.service.executor = ThreadPoolExecutor(max_workers=1)
         return self
 
-    def stop_patches(self):
-        if hasattr(self, "tempfile_patcher"):
-            self.tempfile_patcher.stop()
-
 
 class Assertions:
     def __init__(self, arrangements: Arrangements) -> None:
@@ -143,13 +150,13 @@ class Assertions:
         return self
 
     def assert_markdown_parser_called(self) -> "Assertions":
-        self.arrangements.markdown_parser.convert.assert_called_once_with(
-            "temp_file.html", file_extension=".html"
+        self.arrangements.markdown_parser.convert_string.assert_called_once_with(
+            self.fixtures.html_content
         )
         return self
 
     def assert_markdown_parser_not_called(self) -> "Assertions":
-        self.arrangements.markdown_parser.convert.assert_not_called()
+        self.arrangements.markdown_parser.convert_string.assert_not_called()
         return self
 
 
@@ -165,6 +172,28 @@ class Manager:
 
 class TestConfluenceDatasourceParser:
     def test_parse_confluence_page_to_document(self):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures()
+                .with_base_url()
+                .with_configuration()
+                .with_confluence_page()
+                .with_markdown_content()
+            ).on_parser_convert_return_markdown()
+        )
+        service = manager.get_service()
+
+        # Act
+        document = service.parse(manager.fixtures.page)
+
+        # Assert
+        manager.assertions.assert_document_text(
+            document
+        ).assert_document_metadata(document).assert_markdown_parser_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_async_in_executor(self):
         # Arrange
         manager = Manager(
             Arrangements(
@@ -175,20 +204,35 @@ class TestConfluenceDatasourceParser:
                 .with_markdown_content()
             )
             .on_parser_convert_return_markdown()
-            .mock_tempfile()
+            .with_executor()
         )
         service = manager.get_service()
 
         # Act
-        document = service.parse(manager.fixtures.page)
+        document = await service.parse_async(manager.fixtures.page)
 
         # Assert
         manager.assertions.assert_document_text(
             document
         ).assert_document_metadata(document).assert_markdown_parser_called()
 
-        # Cleanup
-        manager.arrangements.stop_patches()
+    def test_parse_converts_html_in_memory(self):
+        # Arrange
+        fixtures = (
+            Fixtures()
+            .with_base_url()
+            .with_configuration()
+            .with_confluence_page()
+        )
+        service = ConfluenceDatasourceParser(
+            configuration=fixtures.configuration
+        )
+
+        # Act
+        document = service.parse(fixtures.page)
+
+        # Assert
+        assert document.text == "# Test Page\n\nThis is a test page"
 
     def test_parse_with_empty_content(self):
         # Arrange
@@ -224,3 +268,55 @@ class TestConfluenceDatasourceParser:
 
         # Assert
         manager.assertions.assert_metadata(metadata)
+
+    @pytest.mark.asyncio
+    async def test_parse_in_process_pool(self, tmp_path):
+        # Arrange
+        secrets_file = tmp_path / ".env"
+        secrets_file.write_text(
+            "RAG__DATASOURCES__CONFLUENCE__USERNAME=user\n"
+            "RAG__DATASOURCES__CONFLUENCE__PASSWORD=password\n"
+        )
+        configuration = ConfluenceDatasourceConfiguration.model_validate(
+            {"name": DatasourceName.CONFLUENCE},
+            context={"secrets_file": str(secrets_file)},
+        )
+        parser = ConfluenceDatasourceParserFactory.create(configuration)
+        pipeline = DocumentPipeline(
+            parser, BasicMarkdownCleaner(), BasicMarkdownSplitter()
+        )
+        stage = ProcessingStage(ProcessingExecutorType.PROCESS, max_workers=2)
+        pages = [
+            ConfluencePage.model_validate(
+                {
+                    "id": str(i),
+                    "title": f"Page {i}",
+                    "body": {"view": {"value": f"<h1>Page {i}</h1>"}},
+                    "history": {
+                        "createdDate": "2021-01-01T00:00:00",
+                        "lastUpdated": {"when": "2021-01-01T00:00:00"},
+                    },
+                    "_expandable": {"space": "/space/TEST"},
+                    "_links": {"webui": f"/pages/{i}"},
+                }
+            )
+            for i in range(3)
+        ]
+
+        async def read_pages():
+            for page in pages:
+                yield page
+
+        # Act
+        documents = [
+            split_documents
+            async for split_documents in stage.map(pipeline, read_pages())
+        ]
+
+        # Assert
+        assert parser.executor is not None
+        assert [document[0].text for document in documents] == [
+            "# Page 0",
+            "# Page 1",
+            "# Page 2",
+        ]
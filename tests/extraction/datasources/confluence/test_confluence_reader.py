@@ -8,6 +8,7 @@ from unittest.mock import Mock
 
 import pytest
 from atlassian import Confluence
+from requests import HTTPError
 
 from extraction.datasources.confluence.configuration import (
     ConfluenceDatasourceConfiguration,
@@ -34,8 +35,8 @@ class Fixtures:
         self.base_url = "https://confluence.com"
         return self
 
-    def with_spaces(self) -> "Fixtures":
-        self.spaces = ["space1", "space2"]
+    def with_spaces(self, number_of_spaces: int = 2) -> "Fixtures":
+        self.spaces = [f"space{i + 1}" for i in range(number_of_spaces)]
         return self
 
     def with_spaces_pages(self, number_of_pages_per_space) -> "Fixtures":
@@ -73,13 +74,17 @@ class Fixtures:
 
 class Arrangements:
 
-    def __init__(self, fixtures: Fixtures) -> None:
+    def __init__(
+        self, fixtures: Fixtures, max_workers: int = 2, page_size: int = 5
+    ) -> None:
         self.fixtures = fixtures
 
         self.configuration: ConfluenceDatasourceConfiguration = Mock(
             spec=ConfluenceDatasourceConfiguration
         )
         self.configuration.export_limit = self.fixtures.export_limit
+        self.configuration.max_workers = max_workers
+        self.configuration.page_size = page_size
         self.confluence_client: Confluence = Mock(spec=Confluence)
         self.service = ConfluenceDatasourceReader(
             configuration=self.configuration,
@@ -91,11 +96,21 @@ class Arrangements:
         return self
 
     def on_confluence_client_get_all_spaces(self) -> "Arrangements":
-        self.confluence_client.get_all_spaces.return_value = {
-            "results": [
-                {"key": space_name} for space_name in self.fixtures.spaces
-            ]
-        }
+        fixtures = self.fixtures
+
+        def mock_get_all_spaces(*args, **kwargs) -> dict:
+            start = kwargs["start"]
+            end = start + kwargs["limit"]
+            return {
+                "results": [
+                    {"key": space_name}
+                    for space_name in fixtures.spaces[start:end]
+                ]
+            }
+
+        self.confluence_client.get_all_spaces = Mock(
+            side_effect=mock_get_all_spaces
+        )
         return self
 
     def on_confluence_client_get_all_pages_from_space(self) -> "Arrangements":
@@ -104,7 +119,24 @@ class Arrangements:
         def mock_get_all_pages_from_space(*args, **kwargs) -> dict:
             space_pages = fixtures.spaces_pages[kwargs["space"]]
             start = kwargs["start"]
-            return space_pages[start:]
+            return space_pages[start : start + kwargs["limit"]]
+
+        self.confluence_client.get_all_pages_from_space = Mock(
+            side_effect=mock_get_all_pages_from_space
+        )
+        return self
+
+    def on_confluence_client_get_all_pages_from_space_failing(
+        self, space: str, start: int
+    ) -> "Arrangements":
+        get_all_pages_from_space = (
+            self.confluence_client.get_all_pages_from_space.side_effect
+        )
+
+        def mock_get_all_pages_from_space(*args, **kwargs) -> dict:
+            if kwargs["space"] == space and kwargs["start"] == start:
+                raise HTTPError("503 Service Unavailable")
+            return get_all_pages_from_space(*args, **kwargs)
 
         self.confluence_client.get_all_pages_from_space = Mock(
             side_effect=mock_get_all_pages_from_space
@@ -129,18 +161,34 @@ class Assertions:
         ]
 
         if self.fixtures.export_limit is not None:
-            assert len(confluence_pages) <= self.fixtures.export_limit
+            assert len(confluence_pages) == min(
+                self.fixtures.export_limit, len(all_available_pages)
+            )
         else:
             assert len(confluence_pages) == len(all_available_pages)
 
-        for i, actual_document in enumerate(confluence_pages):
-            expected_page = all_available_pages[i]
-            assert actual_document.id == expected_page["id"]
+        expected_pages = {page["id"]: page for page in all_available_pages}
+        assert len({page.id for page in confluence_pages}) == len(
+            confluence_pages
+        )
+        for actual_document in confluence_pages:
+            expected_page = expected_pages[actual_document.id]
             assert (
                 actual_document.body.view.value
                 == expected_page["body"]["view"]["value"]
             )
 
+    def assert_pages_of_each_space_in_order(
+        self, confluence_pages: List[ConfluencePage]
+    ) -> None:
+        for space, space_pages in self.fixtures.spaces_pages.items():
+            actual_ids = [
+                page.id
+                for page in confluence_pages
+                if page.expandable["space"] == f"/space/{space}"
+            ]
+            assert actual_ids == [page["id"] for page in space_pages]
+
 
 class Manager:
 
@@ -194,3 +242,67 @@ class TestConfluenceReader:
 
         # Assert
         manager.assertions.assert_confluence_pages(confluence_pages)
+
+    @pytest.mark.parametrize(
+        "max_workers,number_of_spaces",
+        [
+            (1, 3),
+            (4, 3),
+            (4, 12),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_reads_all_spaces_concurrently(
+        self, max_workers: int, number_of_spaces: int
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures()
+                .with_export_limit(None)
+                .with_base_url()
+                .with_spaces(number_of_spaces)
+                .with_spaces_pages(7),
+                max_workers=max_workers,
+                page_size=5,
+            )
+            .on_confluence_client_url()
+            .on_confluence_client_get_all_spaces()
+            .on_confluence_client_get_all_pages_from_space()
+        )
+        service = manager.get_service()
+
+        # Act
+        confluence_pages = [page async for page in service.read_all_async()]
+
+        # Assert
+        manager.assertions.assert_confluence_pages(confluence_pages)
+        manager.assertions.assert_pages_of_each_space_in_order(confluence_pages)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_makes_listing_incomplete(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures()
+                .with_export_limit(None)
+                .with_base_url()
+                .with_spaces()
+                .with_spaces_pages(8),
+                page_size=5,
+            )
+            .on_confluence_client_url()
+            .on_confluence_client_get_all_spaces()
+            .on_confluence_client_get_all_pages_from_space()
+            .on_confluence_client_get_all_pages_from_space_failing(
+                "space2", start=5
+            )
+        )
+        service = manager.get_service()
+
+        # Act
+        confluence_pages = [page async for page in service.read_all_async()]
+
+        # Assert
+        assert len(confluence_pages) == 13
+        assert not service.lists_all_objects()
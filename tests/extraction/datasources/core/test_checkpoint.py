@@ -0,0 +1,58 @@
+import sys
+
+sys.path.append("./src")
+
+from extraction.datasources.core.checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+    CheckpointTracker,
+)
+
+
+def test_store_persists_committed_checkpoints(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    store = CheckpointStore(path)
+    store.save("notion", {"page_ids": ["a", "b"]}, ["a"])
+    store.save("notion", {"page_ids": ["a", "b"]}, ["b"])
+    store.commit()
+    store.save("confluence", {"completed_spaces": []}, ["c"])
+    store.close()
+
+    store = CheckpointStore(path)
+
+    assert store.has_checkpoints()
+    assert store.load("notion") == Checkpoint(
+        {"page_ids": ["a", "b"]}, {"a", "b"}
+    )
+    assert store.load("confluence") == Checkpoint(None, set())
+
+
+def test_store_clear_removes_all_checkpoints(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+    store.save("notion", None, ["a"])
+    store.commit()
+
+    store.clear()
+    store.commit()
+
+    assert not store.has_checkpoints()
+    assert store.load("notion") == Checkpoint(None, set())
+
+
+def test_tracker_advances_cursor_over_completed_objects_in_read_order():
+    tracker = CheckpointTracker("source", Checkpoint({"offset": 0}, {"a"}))
+    first = tracker.start("b", {"offset": 1})
+    second = tracker.start(None, {"offset": 2})
+    third = tracker.start("d", {"offset": 3})
+
+    tracker.complete(third)
+    tracker.complete(second)
+    progress = tracker.get_progress()
+    tracker.complete(first)
+
+    assert tracker.is_processed("a")
+    assert not tracker.is_processed("b")
+    assert progress.cursor == {"offset": 0}
+    assert progress.object_count == 1
+    assert tracker.get_progress().cursor == {"offset": 3}
+    assert tracker.completed_object_ids == ["d", "b"]
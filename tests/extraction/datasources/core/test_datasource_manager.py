@@ -1,5 +1,6 @@
 import sys
-from typing import AsyncGenerator, List
+import threading
+from typing import AsyncGenerator, List, Optional
 from unittest.mock import Mock
 
 sys.path.append("./src")
@@ -11,8 +12,30 @@ from llama_index.core.schema import TextNode
 from embedding.bootstrap.configuration.configuration import (
     EmbeddingConfiguration,
 )
+from extraction.bootstrap.configuration.datasources import (
+    DatasourceName,
+    ProcessingExecutorType,
+)
+from extraction.datasources.core.checkpoint import (
+    Checkpoint,
+    CheckpointTracker,
+)
+from extraction.datasources.core.deduplication import Deduplicator, MinHasher
 from extraction.datasources.core.manager import BasicDatasourceManager
+from extraction.datasources.core.parser import BaseParser, BasicMarkdownParser
+from extraction.datasources.core.processing import ProcessingStage
 from extraction.datasources.core.reader import BaseReader
+from extraction.datasources.core.sync_state import SyncStateStore
+
+
+class ThreadRecordingParser(BasicMarkdownParser):
+
+    def __init__(self):
+        self.thread_names: List[str] = []
+
+    def parse(self, markdown: str) -> Document:
+        self.thread_names.append(threading.current_thread().name)
+        return super().parse(markdown)
 
 
 class Fixtures:
@@ -39,7 +62,16 @@ class Arrangements:
         self.configuration: EmbeddingConfiguration = Mock(
             spec=EmbeddingConfiguration
         )
+        self.configuration.name = DatasourceName.PDF
+        self.configuration.export_limit = None
         self.reader: BaseReader = Mock(spec=BaseReader)
+        self.reader.get_object_id.side_effect = lambda object: object.replace(
+            " changed", ""
+        )
+        self.reader.get_object_fingerprint.return_value = None
+        self.reader.lists_all_objects.return_value = True
+        self.reader.get_checkpoint.return_value = None
+        self.reader.get_sync_cursor.return_value = None
         self.service = BasicDatasourceManager(
             configuration=self.configuration,
             reader=self.reader,
@@ -53,6 +85,30 @@ class Arrangements:
         self.reader.read_all_async = mock_read_all_async
         return self
 
+    def with_processing_stage(self) -> "Arrangements":
+        self.service.processing_stage = ProcessingStage(
+            ProcessingExecutorType.THREAD, max_workers=2
+        )
+        return self
+
+    def with_deduplicator(self, path: Optional[str] = None) -> "Arrangements":
+        self.service.deduplicator = Deduplicator(
+            MinHasher(), threshold=0.8, path=path
+        )
+        return self
+
+    def with_raw_data(self, raw_data: List[str]) -> "Arrangements":
+        self.fixtures.raw_data = raw_data
+        return self
+
+    def with_shared_url(self, url: str) -> "Arrangements":
+        async def parse_async(object: str) -> Document:
+            return Document(text=object, metadata={"url": url})
+
+        self.service.parser = Mock(spec=BaseParser)
+        self.service.parser.parse_async = parse_async
+        return self
+
 
 class Assertions:
 
@@ -66,6 +122,15 @@ class Assertions:
             assert isinstance(document, Document)
         return self
 
+    async def assert_synced_texts(
+        self,
+        document_generator: AsyncGenerator[Document, None],
+        expected_texts: List[str],
+    ) -> List[Document]:
+        documents = [document async for document in document_generator]
+        assert [document.text for document in documents] == expected_texts
+        return documents
+
 
 class Manager:
 
@@ -99,3 +164,319 @@ class TestDatasourceManager:
         await manager.assertions.assert_documents_are_extracted(
             documents_generator
         )
+
+    @pytest.mark.asyncio
+    async def test_given_processing_stage_when_full_refresh_sync_then_documents_are_extracted_in_order(
+        self,
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(Fixtures().with_raw_data())
+            .on_read_all_async_return_documents()
+            .with_processing_stage()
+        )
+        service = manager.get_service()
+
+        # Act
+        documents_generator = service.full_refresh_sync()
+
+        # Assert
+        await manager.assertions.assert_synced_texts(
+            documents_generator, manager.fixtures.raw_data
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("with_processing_stage", [False, True])
+    async def test_given_near_duplicates_when_full_refresh_sync_then_duplicates_are_dropped(
+        self, with_processing_stage: bool
+    ) -> None:
+        # Arrange
+        text = " ".join(
+            f"Paragraph {i} of the original document." for i in range(50)
+        )
+        arrangements = (
+            Arrangements(Fixtures())
+            .with_raw_data([text, text + " Republished.", "Another document"])
+            .on_read_all_async_return_documents()
+            .with_deduplicator()
+        )
+        if with_processing_stage:
+            arrangements.with_processing_stage()
+        manager = Manager(arrangements)
+        service = manager.get_service()
+
+        # Act
+        documents_generator = service.full_refresh_sync()
+
+        # Assert
+        await manager.assertions.assert_synced_texts(
+            documents_generator, [text, "Another document"]
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("with_processing_stage", [False, True])
+    async def test_given_deleted_original_when_full_refresh_sync_then_near_duplicate_is_kept(
+        self, tmp_path, with_processing_stage: bool
+    ) -> None:
+        # Arrange
+        text = " ".join(
+            f"Paragraph {i} of the original document." for i in range(50)
+        )
+        copy = text + " Republished."
+        index_path = str(tmp_path / "deduplication.sqlite")
+        arrangements = (
+            Arrangements(Fixtures())
+            .with_raw_data([text, copy])
+            .on_read_all_async_return_documents()
+            .with_deduplicator(index_path)
+        )
+        if with_processing_stage:
+            arrangements.with_processing_stage()
+        manager = Manager(arrangements)
+        service = manager.get_service()
+        await manager.assertions.assert_synced_texts(
+            service.full_refresh_sync(), [text]
+        )
+        service.deduplicator.close()
+        arrangements.with_deduplicator(index_path)
+        arrangements.with_raw_data([copy])
+
+        # Act
+        documents_generator = service.full_refresh_sync()
+
+        # Assert
+        await manager.assertions.assert_synced_texts(
+            documents_generator, [copy]
+        )
+        assert service.deduplicator.get_keys("pdf/") == [f"pdf/{copy}"]
+
+    @pytest.mark.asyncio
+    async def test_given_processing_stage_when_incremental_sync_then_objects_are_parsed_in_its_pool(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(Fixtures().with_raw_data())
+            .on_read_all_async_return_documents()
+            .with_processing_stage()
+        )
+        service = manager.get_service()
+        service.parser = ThreadRecordingParser()
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+
+        # Act
+        documents_generator = service.incremental_sync(sync_state, "source")
+
+        # Assert
+        await manager.assertions.assert_synced_texts(
+            documents_generator, manager.fixtures.raw_data
+        )
+        assert len(service.parser.thread_names) == 2
+        assert all(
+            thread_name.startswith("document-processing")
+            for thread_name in service.parser.thread_names
+        )
+
+    @pytest.mark.asyncio
+    async def test_given_listing_failing_partway_when_incremental_sync_then_unseen_objects_are_kept(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        arrangements = Arrangements(
+            Fixtures().with_raw_data()
+        ).on_read_all_async_return_documents()
+        manager = Manager(arrangements)
+        service = manager.get_service()
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+        await manager.assertions.assert_synced_texts(
+            service.incremental_sync(sync_state, "source"),
+            manager.fixtures.raw_data,
+        )
+        sync_state.commit()
+        arrangements.with_raw_data(["Raw markdown text"])
+        service.reader.lists_all_objects.return_value = False
+
+        # Act
+        documents_generator = service.incremental_sync(sync_state, "source")
+
+        # Assert
+        await manager.assertions.assert_synced_texts(documents_generator, [])
+        assert service.deleted_document_ids == []
+        assert sync_state.get_object("source", "Raw markdown text 2")
+
+    @pytest.mark.asyncio
+    async def test_given_identical_objects_sharing_url_when_incremental_sync_then_later_copies_are_dropped(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        text = " ".join(
+            f"Paragraph {i} of the original speech." for i in range(50)
+        )
+        manager = Manager(
+            Arrangements(Fixtures())
+            .with_raw_data([text, text])
+            .on_read_all_async_return_documents()
+            .with_deduplicator()
+            .with_shared_url("https://example.com/protocol.pdf")
+        )
+        service = manager.get_service()
+        service.reader.get_object_id.side_effect = ["speech-1", "speech-2"]
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+
+        # Act
+        documents_generator = service.incremental_sync(sync_state, "source")
+
+        # Assert
+        await manager.assertions.assert_synced_texts(
+            documents_generator, [text]
+        )
+        assert (
+            service.deduplicator.find_duplicate(
+                "pdf/speech-3", service.deduplicator.hasher.get_signature(text)
+            )
+            == "pdf/speech-1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_given_deleted_original_when_incremental_sync_then_near_duplicate_is_kept(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        text = " ".join(
+            f"Paragraph {i} of the original document." for i in range(50)
+        )
+        copy = text + " Republished."
+        arrangements = (
+            Arrangements(Fixtures())
+            .with_raw_data([text, copy])
+            .on_read_all_async_return_documents()
+            .with_deduplicator()
+        )
+        manager = Manager(arrangements)
+        service = manager.get_service()
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+        original_documents = await manager.assertions.assert_synced_texts(
+            service.incremental_sync(sync_state, "source"), [text]
+        )
+        sync_state.commit()
+        arrangements.with_raw_data([copy])
+        await manager.assertions.assert_synced_texts(
+            service.incremental_sync(sync_state, "source"), []
+        )
+        sync_state.commit()
+        assert service.deleted_document_ids == [
+            document.id_ for document in original_documents
+        ]
+
+        # Act
+        documents_generator = service.incremental_sync(sync_state, "source")
+
+        # Assert
+        await manager.assertions.assert_synced_texts(
+            documents_generator, [copy]
+        )
+        assert sync_state.get_object("source", text) is None
+        assert sync_state.get_object("source", copy) is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("with_processing_stage", [False, True])
+    async def test_given_checkpoint_when_full_refresh_sync_then_processed_objects_are_skipped(
+        self, with_processing_stage: bool
+    ) -> None:
+        # Arrange
+        arrangements = (
+            Arrangements(Fixtures())
+            .with_raw_data(["First", "Second", "Third"])
+            .on_read_all_async_return_documents()
+        )
+        if with_processing_stage:
+            arrangements.with_processing_stage()
+        manager = Manager(arrangements)
+        service = manager.get_service()
+        checkpoint = CheckpointTracker(
+            "source", Checkpoint(cursor=None, object_ids={"Second"})
+        )
+        first_run_checkpoint = CheckpointTracker(
+            "source", Checkpoint(cursor=None, object_ids=set())
+        )
+        first_run_documents = [
+            document
+            async for document in service.full_refresh_sync(
+                first_run_checkpoint
+            )
+        ]
+
+        # Act
+        documents_generator = service.full_refresh_sync(checkpoint)
+
+        # Assert
+        documents = await manager.assertions.assert_synced_texts(
+            documents_generator, ["First", "Third"]
+        )
+        service.reader.resume.assert_called_with(None, {"Second"})
+        assert checkpoint.completed_object_ids == ["First", "Third"]
+        assert checkpoint.get_progress().object_count == 2
+        assert [document.id_ for document in documents] == [
+            first_run_documents[0].id_,
+            first_run_documents[2].id_,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_given_unchanged_data_when_incremental_sync_then_nothing_is_extracted(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_raw_data()
+            ).on_read_all_async_return_documents()
+        )
+        service = manager.get_service()
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+        await manager.assertions.assert_synced_texts(
+            service.incremental_sync(sync_state, "source"),
+            manager.fixtures.raw_data,
+        )
+        sync_state.commit()
+
+        # Act
+        documents_generator = service.incremental_sync(sync_state, "source")
+
+        # Assert
+        await manager.assertions.assert_synced_texts(documents_generator, [])
+        assert service.deleted_document_ids == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("with_processing_stage", [False, True])
+    async def test_given_changed_data_when_incremental_sync_then_changes_are_extracted(
+        self, tmp_path, with_processing_stage: bool
+    ) -> None:
+        # Arrange
+        arrangements = Arrangements(
+            Fixtures().with_raw_data()
+        ).on_read_all_async_return_documents()
+        if with_processing_stage:
+            arrangements.with_processing_stage()
+        manager = Manager(arrangements)
+        service = manager.get_service()
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+        initial_documents = await manager.assertions.assert_synced_texts(
+            service.incremental_sync(sync_state, "source"),
+            ["Raw markdown text", "Raw markdown text 2"],
+        )
+        sync_state.commit()
+        arrangements.with_raw_data(["Raw markdown text changed", "New text"])
+
+        # Act
+        documents_generator = service.incremental_sync(sync_state, "source")
+
+        # Assert
+        changed_documents = await manager.assertions.assert_synced_texts(
+            documents_generator, ["Raw markdown text changed", "New text"]
+        )
+        assert sorted(service.deleted_document_ids) == sorted(
+            document.id_ for document in initial_documents
+        )
+        assert not {document.id_ for document in changed_documents} & {
+            document.id_ for document in initial_documents
+        }
@@ -0,0 +1,92 @@
+import sys
+
+sys.path.append("./src")
+
+from extraction.datasources.core.deduplication import Deduplicator, MinHasher
+
+TEXT = " ".join(
+    f"Sentence number {i} of a speech given in the parliament."
+    for i in range(100)
+)
+
+
+def test_signature_is_deterministic_and_estimates_similarity():
+    hasher = MinHasher(signature_size=256)
+    signature = hasher.get_signature(TEXT)
+    similar_signature = hasher.get_signature(TEXT.replace("99", "hundred"))
+    other_signature = hasher.get_signature("A completely different text.")
+
+    assert MinHasher(signature_size=256).get_signature(TEXT) == signature
+    assert len(signature) == 256
+    assert Deduplicator._get_similarity(signature, similar_signature) > 0.9
+    assert Deduplicator._get_similarity(signature, other_signature) < 0.1
+    assert hasher.get_signature(" \n ") is None
+
+
+def test_find_duplicate_returns_key_of_near_duplicate():
+    hasher = MinHasher()
+    deduplicator = Deduplicator(hasher, threshold=0.8)
+
+    assert deduplicator.find_duplicate("a", hasher.get_signature(TEXT)) is None
+    assert (
+        deduplicator.find_duplicate("b", hasher.get_signature(TEXT + " End."))
+        == "a"
+    )
+    assert (
+        deduplicator.find_duplicate("c", hasher.get_signature("Other text"))
+        is None
+    )
+
+
+def test_changed_document_replaces_its_own_signature(tmp_path):
+    path = str(tmp_path / "deduplication.sqlite")
+    hasher = MinHasher()
+    deduplicator = Deduplicator(hasher, threshold=0.8, path=path)
+    deduplicator.find_duplicate("a", hasher.get_signature(TEXT))
+    deduplicator.commit()
+    deduplicator.close()
+
+    deduplicator = Deduplicator(hasher, threshold=0.8, path=path)
+
+    assert deduplicator.find_duplicate("a", hasher.get_signature(TEXT)) is None
+    assert (
+        deduplicator.find_duplicate("b", hasher.get_signature(TEXT + " End."))
+        == "a"
+    )
+    assert (
+        deduplicator.find_duplicate(
+            "a", hasher.get_signature("Rewritten document")
+        )
+        is None
+    )
+    assert (
+        deduplicator.find_duplicate("b", hasher.get_signature(TEXT + " End."))
+        is None
+    )
+
+
+def test_removed_document_is_no_longer_a_near_duplicate():
+    hasher = MinHasher()
+    deduplicator = Deduplicator(hasher, threshold=0.8)
+    deduplicator.find_duplicate("a", hasher.get_signature(TEXT))
+
+    deduplicator.remove(["a"])
+
+    assert (
+        deduplicator.find_duplicate("b", hasher.get_signature(TEXT + " End."))
+        is None
+    )
+
+
+def test_near_duplicates_are_only_looked_up_among_candidates():
+    hasher = MinHasher()
+    deduplicator = Deduplicator(hasher, threshold=0.8)
+    deduplicator.find_duplicate("pdf/a", hasher.get_signature(TEXT))
+
+    duplicate_key = deduplicator.find_duplicate(
+        "pdf/b", hasher.get_signature(TEXT + " End."), candidates=set()
+    )
+
+    assert duplicate_key is None
+    assert deduplicator.get_keys("pdf/") == ["pdf/a", "pdf/b"]
+    assert deduplicator.get_keys("notion/") == []
@@ -0,0 +1,153 @@
+import sys
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.append("./src")
+
+from extraction.bootstrap.configuration.datasources import HttpCacheMode
+from extraction.datasources.core.http_cache import (
+    AsyncCachingTransport,
+    CachingHTTPAdapter,
+    CachingTransport,
+    HttpCache,
+)
+
+
+class Server:
+    """Fake server counting requests and honouring `If-None-Match`."""
+
+    def __init__(self, etag: str = None):
+        self.etag = etag
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        headers = {"ETag": self.etag} if self.etag else {}
+        return httpx.Response(
+            200, headers=headers, json={"url": str(request.url)}
+        )
+
+
+def test_get_key_normalizes_query_parameters():
+    assert HttpCache.get_key(
+        "get", "https://Example.com/items?b=2&a=1"
+    ) == HttpCache.get_key("GET", "https://example.com/items?a=1&b=2")
+    assert HttpCache.get_key(
+        "POST", "https://example.com/query", b'{"a": 1}'
+    ) != HttpCache.get_key("POST", "https://example.com/query", b'{"a": 2}')
+
+
+def test_record_then_replay_serves_recorded_response(tmp_path):
+    server = Server()
+    url = "https://example.com/items?id=1"
+    with httpx.Client(
+        transport=CachingTransport(
+            HttpCache(str(tmp_path), HttpCacheMode.RECORD),
+            httpx.MockTransport(server.handle),
+        )
+    ) as client:
+        recorded = client.get(url)
+
+    with httpx.Client(
+        transport=CachingTransport(
+            HttpCache(str(tmp_path), HttpCacheMode.REPLAY),
+            httpx.MockTransport(server.handle),
+        )
+    ) as client:
+        replayed = client.get(url)
+        missing = client.get("https://example.com/items?id=2")
+
+    assert len(server.requests) == 1
+    assert replayed.status_code == 200
+    assert replayed.json() == recorded.json()
+    assert missing.status_code == HttpCache.MISS_STATUS_CODE
+
+
+def test_record_revalidates_response_with_etag(tmp_path):
+    server = Server(etag='"v1"')
+    transport = CachingTransport(
+        HttpCache(str(tmp_path), HttpCacheMode.RECORD),
+        httpx.MockTransport(server.handle),
+    )
+    url = "https://example.com/items"
+
+    with httpx.Client(transport=transport) as client:
+        first = client.get(url)
+        second = client.get(url)
+
+    assert "If-None-Match" not in server.requests[0].headers
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+
+def test_failed_responses_are_not_recorded(tmp_path):
+    cache = HttpCache(str(tmp_path), HttpCacheMode.RECORD)
+    key = cache.get_key("GET", "https://example.com/items")
+
+    cache.put(key, 500, {}, b"error")
+
+    assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_async_transport_records_and_replays(tmp_path):
+    server = Server()
+    url = "https://example.com/items"
+
+    async with httpx.AsyncClient(
+        transport=AsyncCachingTransport(
+            HttpCache(str(tmp_path), HttpCacheMode.RECORD),
+            httpx.MockTransport(server.handle),
+        )
+    ) as client:
+        recorded = await client.get(url)
+
+    async with httpx.AsyncClient(
+        transport=AsyncCachingTransport(
+            HttpCache(str(tmp_path), HttpCacheMode.REPLAY),
+            httpx.MockTransport(server.handle),
+        )
+    ) as client:
+        replayed = await client.get(url)
+
+    assert len(server.requests) == 1
+    assert replayed.json() == recorded.json()
+
+
+def test_requests_adapter_records_and_replays(tmp_path, monkeypatch):
+    def send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": 1}'
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    network = Mock(side_effect=send)
+    monkeypatch.setattr(HTTPAdapter, "send", network)
+    url = "https://example.com/items"
+
+    record_session = requests.Session()
+    record_session.mount(
+        "https://",
+        CachingHTTPAdapter(HttpCache(str(tmp_path), HttpCacheMode.RECORD)),
+    )
+    recorded = record_session.get(url)
+    replay_session = requests.Session()
+    replay_session.mount(
+        "https://",
+        CachingHTTPAdapter(HttpCache(str(tmp_path), HttpCacheMode.REPLAY)),
+    )
+    replayed = replay_session.get(url)
+
+    assert network.call_count == 1
+    assert replayed.status_code == 200
+    assert replayed.json() == recorded.json() == {"id": 1}
@@ -0,0 +1,161 @@
+import io
+import sys
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.append("./src")
+
+from extraction.datasources.core.http_transport import (
+    AsyncRetryingTransport,
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitOpenError,
+    HttpTransport,
+    RetryPolicy,
+)
+
+
+class FakeServer:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.mark.parametrize(
+    "method, attempt, status_code, retry_after, expected_retry",
+    [
+        ("GET", 0, None, None, True),
+        ("GET", 0, 503, None, True),
+        ("GET", 0, 404, None, False),
+        ("GET", 3, 503, None, False),
+        ("POST", 0, 503, None, False),
+        ("POST", 0, 429, "2", True),
+        ("GET", 0, 429, "120", False),
+    ],
+)
+def test_retry_policy_decides_retries(
+    method, attempt, status_code, retry_after, expected_retry
+):
+    policy = RetryPolicy(max_retries=3, backoff_base=0.5, backoff_max=60.0)
+
+    delay = policy.get_delay(method, attempt, status_code, retry_after)
+
+    assert (delay is not None) == expected_retry
+    if expected_retry and retry_after is not None:
+        assert delay == float(retry_after)
+    elif expected_retry:
+        assert 0 <= delay <= 0.5
+
+
+def test_retry_policy_backoff_is_jittered_and_bounded():
+    policy = RetryPolicy(max_retries=10, backoff_base=1.0, backoff_max=4.0)
+
+    delays = [policy.get_delay("GET", 5) for _ in range(100)]
+
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_circuit_breaker_opens_and_lets_trial_request_through(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        "extraction.datasources.core.http_transport.time.monotonic",
+        lambda: now[0],
+    )
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.before_request("example.com")
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("example.com")
+
+    now[0] = 10.0
+    breaker.before_request("example.com")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("example.com")
+    breaker.record_success()
+    breaker.before_request("example.com")
+
+    assert not breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_async_transport_retries_transient_failures():
+    server = FakeServer(
+        [
+            httpx.ConnectError("Connection refused"),
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"id": 1}),
+        ]
+    )
+    transport = AsyncRetryingTransport(
+        RetryPolicy(max_retries=3, backoff_base=0.0),
+        CircuitBreakers(failure_threshold=5, reset_timeout=30.0),
+        httpx.MockTransport(server),
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://example.com/item")
+
+    assert response.json() == {"id": 1}
+    assert len(server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_transport_fails_fast_once_circuit_is_open():
+    server = FakeServer(
+        [
+            httpx.Response(500),
+            httpx.Response(500),
+            httpx.ConnectError("Connection refused"),
+        ]
+    )
+    transport = AsyncRetryingTransport(
+        RetryPolicy(max_retries=0),
+        CircuitBreakers(failure_threshold=2, reset_timeout=30.0),
+        httpx.MockTransport(server),
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(2):
+            assert (await client.get("https://example.com/")).status_code == 500
+        with pytest.raises(CircuitOpenError):
+            await client.get("https://example.com/")
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://other.example.com/")
+
+    assert len(server.requests) == 3
+
+
+def test_session_retries_with_default_timeout(monkeypatch):
+    def send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 502 if network.call_count == 1 else 200
+        response.raw = io.BytesIO(b"")
+        response.url = request.url
+        response.request = request
+        return response
+
+    network = Mock(side_effect=send)
+    monkeypatch.setattr(HTTPAdapter, "send", network)
+    session = HttpTransport(
+        timeout=5.0, retry_policy=RetryPolicy(backoff_base=0.0)
+    ).create_session()
+
+    response = session.get("https://example.com/items")
+
+    assert response.status_code == 200
+    assert network.call_count == 2
+    assert network.call_args.kwargs["timeout"] == 5.0
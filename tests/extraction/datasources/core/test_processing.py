@@ -0,0 +1,129 @@
+import asyncio
+import sys
+import threading
+import time
+from typing import AsyncIterator, List
+
+import pytest
+
+sys.path.append("./src")
+
+from llama_index.core import Document
+
+from extraction.bootstrap.configuration.datasources import (
+    ProcessingExecutorType,
+)
+from extraction.datasources.core.cleaner import BasicMarkdownCleaner
+from extraction.datasources.core.parser import BasicMarkdownParser
+from extraction.datasources.core.processing import (
+    DocumentPipeline,
+    ProcessingStage,
+)
+from extraction.datasources.core.splitter import BasicMarkdownSplitter
+
+
+async def iterate(items: List) -> AsyncIterator:
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def collect(iterator: AsyncIterator) -> List:
+    return [item async for item in iterator]
+
+
+def sleep_and_return(delay: float) -> float:
+    time.sleep(delay)
+    return delay
+
+
+@pytest.mark.asyncio
+async def test_map_preserves_input_order():
+    stage = ProcessingStage(ProcessingExecutorType.THREAD, max_workers=4)
+    delays = [0.05, 0.01, 0.03, 0.0, 0.02]
+
+    results = await collect(stage.map(sleep_and_return, iterate(delays)))
+
+    assert results == delays
+
+
+@pytest.mark.asyncio
+async def test_map_yields_in_completion_order_if_unordered():
+    stage = ProcessingStage(
+        ProcessingExecutorType.THREAD, max_workers=3, ordered=False
+    )
+    delays = [0.2, 0.1, 0.0]
+
+    results = await collect(stage.map(sleep_and_return, iterate(delays)))
+
+    assert results == [0.0, 0.1, 0.2]
+
+
+@pytest.mark.asyncio
+async def test_map_processes_items_in_parallel():
+    stage = ProcessingStage(ProcessingExecutorType.THREAD, max_workers=4)
+
+    start = time.monotonic()
+    await collect(stage.map(sleep_and_return, iterate([0.1] * 8)))
+
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_map_bounds_items_in_flight():
+    stage = ProcessingStage(
+        ProcessingExecutorType.THREAD, max_workers=2, max_in_flight=3
+    )
+    lock = threading.Lock()
+    submitted = []
+
+    async def items() -> AsyncIterator[int]:
+        for i in range(10):
+            with lock:
+                submitted.append(i)
+            yield i
+
+    def process(item: int) -> int:
+        time.sleep(0.01)
+        return item
+
+    results = []
+    async for result in stage.map(process, items()):
+        assert len(submitted) - len(results) <= 3
+        results.append(result)
+
+    assert results == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_map_raises_processing_error():
+    stage = ProcessingStage(ProcessingExecutorType.THREAD, max_workers=2)
+
+    def process(item: int) -> int:
+        if item == 2:
+            raise ValueError("Invalid item")
+        return item
+
+    with pytest.raises(ValueError, match="Invalid item"):
+        await collect(stage.map(process, iterate([0, 1, 2, 3])))
+
+
+@pytest.mark.asyncio
+async def test_map_in_process_pool():
+    stage = ProcessingStage(ProcessingExecutorType.PROCESS, max_workers=2)
+
+    results = await collect(stage.map(abs, iterate([-1, -2, 3])))
+
+    assert results == [1, 2, 3]
+
+
+def test_document_pipeline_parses_cleans_and_splits():
+    pipeline = DocumentPipeline(
+        BasicMarkdownParser(), BasicMarkdownCleaner(), BasicMarkdownSplitter()
+    )
+
+    documents = pipeline("# Title\n\nContent")
+
+    assert len(documents) == 1
+    assert isinstance(documents[0], Document)
+    assert "Content" in documents[0].text
@@ -0,0 +1,54 @@
+import sys
+
+sys.path.append("./src")
+
+from extraction.datasources.core.sync_state import SyncedObject, SyncStateStore
+
+
+def test_put_object_is_returned_by_get_object(tmp_path):
+    store = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+    run = store.start_run("pdf")
+
+    store.put_object("pdf", "a.pdf", "fingerprint", ["doc_1", "doc_2"], run)
+
+    assert store.get_object("pdf", "a.pdf") == SyncedObject(
+        fingerprint="fingerprint", document_ids=["doc_1", "doc_2"]
+    )
+    assert store.get_object("pdf", "b.pdf") is None
+    assert store.get_object("notion", "a.pdf") is None
+
+
+def test_remove_unseen_objects_returns_their_document_ids(tmp_path):
+    store = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+    run = store.start_run("pdf")
+    store.put_object("pdf", "a.pdf", "a", ["doc_a"], run)
+    store.put_object("pdf", "b.pdf", "b", ["doc_b"], run)
+    store.put_object("notion", "page", "c", ["doc_c"], run)
+
+    next_run = store.start_run("pdf")
+    store.touch_object("pdf", "a.pdf", next_run)
+    unseen_object_ids = store.get_unseen_object_ids("pdf", next_run)
+    deleted_document_ids = store.remove_unseen_objects("pdf", next_run)
+
+    assert next_run > run
+    assert unseen_object_ids == ["b.pdf"]
+    assert deleted_document_ids == ["doc_b"]
+    assert store.get_object("pdf", "b.pdf") is None
+    assert store.get_object("pdf", "a.pdf") is not None
+    assert store.get_object("notion", "page") is not None
+
+
+def test_changes_are_persisted_on_commit_only(tmp_path):
+    path = str(tmp_path / "sync_state.sqlite")
+    store = SyncStateStore(path)
+    store.set_cursor("pdf", "cursor_1")
+    store.commit()
+    store.set_cursor("pdf", "cursor_2")
+    store.put_object("pdf", "a.pdf", "a", ["doc_a"], store.start_run("pdf"))
+    store.close()
+
+    store = SyncStateStore(path)
+
+    assert store.get_cursor("pdf") == "cursor_1"
+    assert store.get_cursor("notion") is None
+    assert store.get_object("pdf", "a.pdf") is None
@@ -0,0 +1,161 @@
+import asyncio
+import sys
+
+import httpx
+import pytest
+
+sys.path.append("./src")
+
+from extraction.datasources.hackernews.client import (
+    HackerNewsClient,
+    StoryChanges,
+)
+
+STORY = {
+    "id": 1,
+    "title": "Story",
+    "url": None,
+    "score": 1,
+    "by": "alice",
+    "time": 1700000000,
+}
+
+
+def create_client(items: dict, comment_depth: int = 0) -> HackerNewsClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.split("/v0/", 1)[1]
+        return httpx.Response(200, json=items.get(path))
+
+    client = HackerNewsClient(comment_depth=comment_depth)
+    client._create_async_session = lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "since_item_id, expected_story_ids",
+    [(None, [30, 25, 10, 5]), (20, [30, 25, 5])],
+)
+async def test_get_changed_top_stories(since_item_id, expected_story_ids):
+    client = create_client(
+        {
+            "maxitem.json": 40,
+            "topstories.json": [30, 25, 10, 5],
+            "updates.json": {"items": [5, 8, 35], "profiles": []},
+        }
+    )
+
+    changes = await client.get_changed_top_stories_async(since_item_id)
+
+    assert changes == StoryChanges(40, expected_story_ids)
+
+
+@pytest.mark.asyncio
+async def test_get_changed_top_stories_fails_without_updates():
+    client = create_client(
+        {"maxitem.json": 40, "topstories.json": [30, 25, 10, 5]}
+    )
+
+    changes = await client.get_changed_top_stories_async(20)
+
+    assert changes is None
+
+
+@pytest.mark.asyncio
+async def test_get_stories_fetches_comments_up_to_depth():
+    client = create_client(
+        {
+            "item/1.json": {**STORY, "kids": [2, 3]},
+            "item/2.json": {"id": 2, "by": "bob", "text": "A", "kids": [4]},
+            "item/3.json": {"id": 3, "deleted": True},
+            "item/4.json": {"id": 4, "by": "carol", "text": "B", "kids": [5]},
+            "item/5.json": {"id": 5, "by": "dave", "text": "C"},
+        },
+        comment_depth=2,
+    )
+
+    stories = [
+        story async for story in client.get_stories_with_details_async([1])
+    ]
+
+    assert len(stories) == 1
+    (comment,) = stories[0].comments
+    assert comment.id == 2
+    assert [reply.id for reply in comment.replies] == [4]
+    assert comment.replies[0].replies == []
+
+
+@pytest.mark.asyncio
+async def test_get_stories_bounds_concurrent_comment_requests():
+    comment_ids = list(range(2, 22))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        item_id = int(request.url.path.rsplit("/", 1)[1].split(".")[0])
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if item_id == 1:
+            return httpx.Response(200, json={**STORY, "kids": comment_ids})
+        return httpx.Response(
+            200, json={"id": item_id, "by": "bob", "text": "Comment"}
+        )
+
+    client = HackerNewsClient(max_concurrent_requests=3, comment_depth=1)
+    client._create_async_session = lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    stories = [
+        story async for story in client.get_stories_with_details_async([1])
+    ]
+
+    assert [comment.id for comment in stories[0].comments] == comment_ids
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_get_stories_skips_invalid_json():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("item/1.json"):
+            return httpx.Response(200, content=b"<html>Bad gateway</html>")
+        return httpx.Response(200, json={**STORY, "id": 2})
+
+    client = HackerNewsClient()
+    client._create_async_session = lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    stories = [
+        story async for story in client.get_stories_with_details_async([1, 2])
+    ]
+
+    assert [story.id for story in stories] == [2]
+
+
+@pytest.mark.asyncio
+async def test_get_stories_awaits_cancelled_requests_once_limit_is_reached():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        story_id = int(request.url.path.split("/")[-1].split(".")[0])
+        await asyncio.sleep(0 if story_id == 1 else 10)
+        return httpx.Response(200, json={**STORY, "id": story_id})
+
+    client = HackerNewsClient(max_concurrent_requests=4)
+    client._create_async_session = lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    stories = [
+        story
+        async for story in client.get_stories_with_details_async(
+            [1, 2, 3, 4], limit=1
+        )
+    ]
+
+    assert [story.id for story in stories] == [1]
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -12,6 +12,8 @@ from extraction.datasources.core.manager import BasicDatasourceManager
 
 def test_create_instance_returns_manager():
     mock_conf = MagicMock()
+    mock_conf.processing_max_workers = 1
+    mock_conf.deduplication_threshold = None
 
     with patch(
         "extraction.datasources.hackernews.manager.HackerNewsDatasourceReaderFactory"
@@ -37,3 +39,5 @@ def test_create_instance_returns_manager():
         assert manager.reader == fake_reader
         assert manager.parser == fake_parser
         assert manager.configuration == mock_conf
+        assert manager.processing_stage is None
+        assert manager.deduplicator is None
@@ -8,7 +8,7 @@ from extraction.datasources.hackernews.parser import (
     HackerNewsDatasourceParser,
     HackerNewsDatasourceParserFactory,
 )
-from extraction.datasources.hackernews.client import StoryItem
+from extraction.datasources.hackernews.client import CommentItem, StoryItem
 from extraction.datasources.hackernews.document import HackerNewsDocument
 
 
@@ -59,3 +59,30 @@ def test_factory_creates_parser_instance():
 
     assert isinstance(parser, HackerNewsDatasourceParser)
 
+
+
+def test_parse_appends_comment_tree(story_item):
+    story_item.comments = [
+        CommentItem(
+            id=1,
+            by="alice",
+            text="First <i>comment</i><p>Second paragraph",
+            time=1700000001,
+            replies=[
+                CommentItem(id=2, by="carol", text="Reply", time=1700000002)
+            ],
+        ),
+        CommentItem(id=3, by="dave", text="Another", time=1700000003),
+    ]
+    parser = HackerNewsDatasourceParser()
+
+    document = parser.parse(story_item)
+
+    assert document.text == (
+        "A sample story\n\n"
+        "- alice: First *comment*\n"
+        "\n"
+        "  Second paragraph\n"
+        "  - carol: Reply\n"
+        "- dave: Another"
+    )
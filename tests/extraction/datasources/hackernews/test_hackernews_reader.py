@@ -1,7 +1,8 @@
 import sys
 import pytest
 import asyncio
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 sys.path.append("./src")
 
@@ -9,6 +10,7 @@ from extraction.datasources.hackernews.reader import (
     HackerNewsDatasourceReader,
     HackerNewsDatasourceReaderFactory,
 )
+from extraction.datasources.hackernews.client import StoryChanges
 
 
 @pytest.fixture
@@ -23,6 +25,14 @@ def mock_client():
     return MagicMock()
 
 
+def async_stories(stories):
+    async def generator(limit=None):
+        for story in stories:
+            yield story
+
+    return generator
+
+
 @pytest.mark.asyncio
 async def test_reader_initialization(mock_configuration, mock_client):
     reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
@@ -35,10 +45,12 @@ async def test_reader_initialization(mock_configuration, mock_client):
 @pytest.mark.asyncio
 async def test_read_all_async_yields_stories(mock_configuration, mock_client, caplog):
     # Fake stories returned by the client
-    mock_client.get_top_stories_with_details.return_value = [
-        {"id": 1, "title": "Story 1"},
-        {"id": 2, "title": "Story 2"},
-    ]
+    mock_client.get_top_stories_with_details_async.side_effect = async_stories(
+        [
+            {"id": 1, "title": "Story 1"},
+            {"id": 2, "title": "Story 2"},
+        ]
+    )
 
     reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
 
@@ -57,10 +69,12 @@ async def test_read_all_async_yields_stories(mock_configuration, mock_client, ca
 @pytest.mark.asyncio
 async def test_read_all_async_respects_export_limit(mock_configuration, mock_client):
     mock_configuration.export_limit = 1
-    mock_client.get_top_stories_with_details.return_value = [
-        {"id": 1, "title": "Story 1"},
-        {"id": 2, "title": "Story 2"},
-    ]
+    mock_client.get_top_stories_with_details_async.side_effect = async_stories(
+        [
+            {"id": 1, "title": "Story 1"},
+            {"id": 2, "title": "Story 2"},
+        ]
+    )
 
     reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
 
@@ -85,3 +99,99 @@ def test_factory_creates_reader(mock_configuration):
         assert reader.client == fake_client
         mock_factory.create.assert_called_once_with(mock_configuration)
 
+
+@pytest.mark.asyncio
+async def test_read_all_async_passes_limit_to_client(mock_configuration, mock_client):
+    mock_client.get_top_stories_with_details_async.side_effect = async_stories([])
+
+    reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
+
+    async for _ in reader.read_all_async():
+        pass
+
+    mock_client.get_top_stories_with_details_async.assert_called_once_with(
+        limit=mock_configuration.export_limit
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor, export_limit, expected_since_item_id, expected_cursor",
+    [
+        (None, None, None, '{"max_item_id": 500}'),
+        ('{"max_item_id": 400}', None, 400, '{"max_item_id": 500}'),
+        ("2024-01-01T00:00:00+00:00", None, None, '{"max_item_id": 500}'),
+        ('{"max_item_id": 400}', 1, 400, '{"max_item_id": 400}'),
+    ],
+)
+async def test_incremental_read_fetches_changed_stories(
+    mock_configuration,
+    mock_client,
+    cursor,
+    export_limit,
+    expected_since_item_id,
+    expected_cursor,
+):
+    mock_configuration.export_limit = export_limit
+    mock_client.get_changed_top_stories_async = AsyncMock(
+        return_value=StoryChanges(500, [450, 300])
+    )
+    changed_stories = [SimpleNamespace(id=450), SimpleNamespace(id=300)]
+    stories = async_stories(changed_stories)
+    mock_client.get_stories_with_details_async.side_effect = (
+        lambda story_ids, limit=None: stories(limit)
+    )
+
+    reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
+    reader.set_sync_cursor(cursor)
+
+    results = [story async for story in reader.read_all_async()]
+
+    assert results == changed_stories[:export_limit]
+    assert reader.get_sync_cursor() == expected_cursor
+    mock_client.get_changed_top_stories_async.assert_called_once_with(
+        expected_since_item_id
+    )
+    mock_client.get_stories_with_details_async.assert_called_once_with(
+        [450, 300], limit=export_limit
+    )
+    mock_client.get_top_stories_with_details_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_incremental_read_retries_stories_that_failed_to_be_fetched(
+    mock_configuration, mock_client
+):
+    mock_configuration.export_limit = None
+    mock_client.get_changed_top_stories_async = AsyncMock(
+        side_effect=[StoryChanges(500, [450, 300]), StoryChanges(600, [550])]
+    )
+    fetched_stories = [
+        async_stories([SimpleNamespace(id=450)]),
+        async_stories([SimpleNamespace(id=550), SimpleNamespace(id=300)]),
+    ]
+    mock_client.get_stories_with_details_async.side_effect = (
+        lambda story_ids, limit=None: fetched_stories.pop(0)(limit)
+    )
+
+    reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
+    reader.set_sync_cursor('{"max_item_id": 400}')
+    [story async for story in reader.read_all_async()]
+    cursor = reader.get_sync_cursor()
+
+    assert cursor == '{"max_item_id": 500, "retry_item_ids": [300]}'
+
+    reader.set_sync_cursor(cursor)
+    results = [story async for story in reader.read_all_async()]
+
+    assert [story.id for story in results] == [550, 300]
+    assert reader.get_sync_cursor() == '{"max_item_id": 600}'
+    mock_client.get_stories_with_details_async.assert_called_with(
+        [550, 300], limit=None
+    )
+
+
+def test_sync_cursor_is_none_outside_of_incremental_syncs(mock_configuration, mock_client):
+    reader = HackerNewsDatasourceReader(configuration=mock_configuration, client=mock_client)
+
+    assert reader.get_sync_cursor() is None
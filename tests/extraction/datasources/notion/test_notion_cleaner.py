@@ -78,6 +78,36 @@ class Fixtures:
 
         return self
 
+    def with_multiline_comment_and_image_document(self) -> "Fixtures":
+        self.notion_document = NotionDocument(
+            text=textwrap.dedent(
+                """
+                | Name | Cover |
+                | --- | --- |
+                | <span>Row</span> | <img src="cover.png" alt="Cover"> |
+                <!-- Comment spanning
+                multiple lines -->
+                Where a < b and c > d
+            """
+            ),
+            metadata={"type": "database"},
+        )
+
+        self.notion_cleaned_document = NotionDocument(
+            text=textwrap.dedent(
+                """
+                | Name | Cover |
+                | --- | --- |
+                | Row | ![Cover](cover.png) |
+
+                Where a < b and c > d
+            """
+            ),
+            metadata={"type": "database"},
+        )
+
+        return self
+
     def with_empty_document(self) -> "Fixtures":
         self.notion_document = NotionDocument(
             text=" \n   \t\n\t ", metadata={"type": "page"}
@@ -155,6 +185,23 @@ class TestNotionDatasourceCleaner:
         # Assert
         manager.assertions.assert_cleaned_document(cleaned_document)
 
+    def test_given_document_with_images_and_comments_when_clean_then_images_are_converted(
+        self,
+    ):
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures().with_multiline_comment_and_image_document(),
+            ),
+        )
+        service = manager.get_service()
+
+        # Act
+        cleaned_document = service.clean(manager.fixtures.notion_document)
+
+        # Assert
+        manager.assertions.assert_cleaned_document(cleaned_document)
+
     def test_given_empty_document_when_clean_then_document_is_not_cleaned(
         self,
     ):
@@ -0,0 +1,138 @@
+import sys
+
+sys.path.append("./src")
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from extraction.datasources.notion.rate_limiter import (
+    AsyncTokenBucket,
+    RateLimitedTransport,
+)
+
+
+class Arrangements:
+
+    def __init__(self, rate: float = 1000.0, max_concurrent_requests: int = 2):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.responses = []
+        self.bucket = AsyncTokenBucket(rate=rate)
+        self.transport = RateLimitedTransport(
+            bucket=self.bucket,
+            max_concurrent_requests=max_concurrent_requests,
+            transport=httpx.MockTransport(self._handle),
+        )
+
+    def with_responses(self, *responses: httpx.Response) -> "Arrangements":
+        self.responses = list(responses)
+        return self
+
+    def get_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=self.transport, base_url="https://api.notion.com"
+        )
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if self.responses:
+            return self.responses.pop(0)
+        return httpx.Response(200, json={})
+
+
+class TestAsyncTokenBucket:
+
+    @pytest.mark.asyncio
+    async def test_acquire_respects_rate(self) -> None:
+        # Arrange
+        bucket = AsyncTokenBucket(rate=50, capacity=1)
+
+        # Act
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_pauses_and_recovers(self) -> None:
+        # Arrange
+        bucket = AsyncTokenBucket(rate=100)
+
+        # Act
+        bucket.on_rate_limited(retry_after=0.05)
+        reduced_rate = bucket.rate
+        start = time.monotonic()
+        await bucket.acquire()
+        elapsed = time.monotonic() - start
+        for _ in range(10):
+            bucket.on_success()
+
+        # Assert
+        assert reduced_rate == 50
+        assert elapsed >= 0.04
+        assert bucket.rate == 100
+
+
+class TestRateLimitedTransport:
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_request(self) -> None:
+        # Arrange
+        arrangements = Arrangements().with_responses(
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"object": "page"}),
+        )
+
+        # Act
+        async with arrangements.get_client() as client:
+            response = await client.get("/v1/pages/1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"object": "page"}
+        assert len(arrangements.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_returns_rate_limited_response_when_retries_exhausted(
+        self,
+    ) -> None:
+        # Arrange
+        arrangements = Arrangements().with_responses(
+            *[httpx.Response(429, headers={"Retry-After": "0"})] * 10
+        )
+        arrangements.transport.max_retries = 2
+
+        # Act
+        async with arrangements.get_client() as client:
+            response = await client.get("/v1/pages/1")
+
+        # Assert
+        assert response.status_code == 429
+        assert len(arrangements.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_limits_requests_in_flight(self) -> None:
+        # Arrange
+        arrangements = Arrangements(max_concurrent_requests=2)
+
+        # Act
+        async with arrangements.get_client() as client:
+            await asyncio.gather(
+                *[client.get(f"/v1/pages/{i}") for i in range(8)]
+            )
+
+        # Assert
+        assert len(arrangements.requests) == 8
+        assert arrangements.max_in_flight == 2
@@ -1,4 +1,6 @@
+import asyncio
 import sys
+import time
 
 sys.path.append("./src")
 
@@ -112,6 +114,16 @@ class Arrangements:
         self.notion_client.search = Mock(side_effect=mock_search)
         return self
 
+    def on_notion_client_search_block(self, seconds: float) -> "Arrangements":
+        search = self.notion_client.search.side_effect
+
+        def mock_search(**kwargs):
+            time.sleep(seconds)
+            return search(**kwargs)
+
+        self.notion_client.search = Mock(side_effect=mock_search)
+        return self
+
     def on_exporter_run_return_documents(self) -> "Arrangements":
         def mock_run(
             page_ids: List[str] = None, database_ids: List[str] = None
@@ -141,7 +153,7 @@ class Assertions:
         documents: List[NotionDocument],
         expected_number_of_documents: int,
     ) -> None:
-        assert len(documents) <= expected_number_of_documents
+        assert len(documents) == expected_number_of_documents
         for document in documents:
             assert document in self.fixtures.documents
         return self
@@ -201,10 +213,178 @@ class TestNotionDatasourceReader:
         service = manager.get_service()
 
         # Act
-        all_documents = await service.read_all_async()
+        all_documents = [
+            document async for document in service.read_all_async()
+        ]
 
         # Assert
         manager.assertions.assert_documents_number(
             documents=all_documents,
             expected_number_of_documents=expected_number_of_documents,
         )
+
+    @pytest.mark.asyncio
+    async def test_streams_documents_per_chunk(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                fixtures=Fixtures()
+                .with_export_limit(3)
+                .with_export_batch_size(2)
+                .with_home_page_database_id()
+                .with_database_home_ids(0)
+                .with_page_home_ids(6)
+                .with_database_api_ids(0)
+                .with_page_api_ids(0)
+            )
+            .on_get_ids_from_home_page_return_ids()
+            .on_notion_client_search_return_ids()
+            .on_exporter_run_return_documents()
+        )
+        service = manager.get_service()
+        exporter = manager.arrangements.exporter
+
+        # Act
+        documents = service.read_all_async()
+        first_document = await documents.__anext__()
+        exports_before_first_document = exporter.run.await_count
+        remaining_documents = [document async for document in documents]
+
+        # Assert
+        assert exports_before_first_document == 1
+        assert first_document in manager.fixtures.documents
+        assert len(remaining_documents) == 2
+        assert exporter.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exports_only_objects_within_export_limit(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                fixtures=Fixtures()
+                .with_export_limit(3)
+                .with_export_batch_size(2)
+                .with_home_page_database_id()
+                .with_database_home_ids(0)
+                .with_page_home_ids(6)
+                .with_database_api_ids(0)
+                .with_page_api_ids(0)
+            )
+            .on_get_ids_from_home_page_return_ids()
+            .on_notion_client_search_return_ids()
+            .on_exporter_run_return_documents()
+        )
+        service = manager.get_service()
+        exporter = manager.arrangements.exporter
+
+        # Act
+        documents = [document async for document in service.read_all_async()]
+
+        # Assert
+        assert len(documents) == 3
+        assert [
+            len(call.kwargs["page_ids"])
+            for call in exporter.run.await_args_list
+        ] == [2, 1]
+
+    @pytest.mark.parametrize(
+        "limit,expected_page_sizes,expected_number_of_results",
+        [(150, [100, 50], 150), (None, [100, 100, 100], 250), (0, [], 0)],
+    )
+    def test_collect_paginated_api_requests_only_missing_results(
+        self,
+        limit: int,
+        expected_page_sizes: List[int],
+        expected_number_of_results: int,
+    ) -> None:
+        # Arrange
+        results = [{"id": str(i)} for i in range(250)]
+
+        def function(start_cursor: str = None, page_size: int = 100):
+            start = int(start_cursor or 0)
+            end = start + page_size
+            return {
+                "results": results[start:end],
+                "has_more": end < len(results),
+                "next_cursor": str(end),
+            }
+
+        api_function = Mock(side_effect=function)
+
+        # Act
+        collected = NotionDatasourceReader._collect_paginated_api(
+            api_function, limit
+        )
+
+        # Assert
+        assert len(collected) == expected_number_of_results
+        assert [
+            call.kwargs["page_size"] for call in api_function.call_args_list
+        ] == expected_page_sizes
+
+    @pytest.mark.asyncio
+    async def test_failed_export_makes_listing_incomplete(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                fixtures=Fixtures()
+                .with_export_limit(None)
+                .with_export_batch_size(2)
+                .with_home_page_database_id()
+                .with_database_home_ids(0)
+                .with_page_home_ids(6)
+                .with_database_api_ids(0)
+                .with_page_api_ids(0)
+            )
+            .on_get_ids_from_home_page_return_ids()
+            .on_notion_client_search_return_ids()
+            .on_exporter_run_return_documents()
+        )
+        service = manager.get_service()
+        export = manager.arrangements.exporter.run.side_effect
+        manager.arrangements.exporter.run.side_effect = [
+            export(page_ids=["1", "2"]),
+            RuntimeError("Export failed"),
+            export(page_ids=["5", "6"]),
+        ]
+
+        # Act
+        documents = [document async for document in service.read_all_async()]
+
+        # Assert
+        assert len(documents) == 4
+        assert not service.lists_all_objects()
+
+    @pytest.mark.asyncio
+    async def test_collecting_ids_does_not_block_event_loop(self) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                fixtures=Fixtures()
+                .with_export_limit(None)
+                .with_export_batch_size(2)
+                .with_database_api_ids(1)
+                .with_page_api_ids(1)
+            )
+            .on_notion_client_search_return_ids()
+            .on_notion_client_search_block(0.1)
+            .on_exporter_run_return_documents()
+        )
+        service = manager.get_service()
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+
+        # Act
+        documents = [document async for document in service.read_all_async()]
+        ticker.cancel()
+
+        # Assert
+        assert len(documents) == 2
+        assert ticks >= 10
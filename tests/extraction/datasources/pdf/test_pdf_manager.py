@@ -0,0 +1,116 @@
+import sys
+
+sys.path.append("./src")
+
+import os
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+from llama_index.core import Document
+
+from extraction.bootstrap.configuration.datasources import DatasourceName
+from extraction.datasources.core.sync_state import SyncStateStore
+from extraction.datasources.pdf.configuration import PDFDatasourceConfiguration
+from extraction.datasources.pdf.manager import PDFDatasourceManager
+from extraction.datasources.pdf.parser import PDFDatasourceParser
+from extraction.datasources.pdf.pool import PDFConversionPool
+from extraction.datasources.pdf.reader import PDFDatasourceReader
+
+
+def convert(file_path: str) -> str:
+    with open(file_path) as f:
+        content = f.read()
+    if content.startswith("broken"):
+        raise ValueError("Broken PDF")
+    return f"Converted {content}"
+
+
+class Fixtures:
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+
+    def with_pdf_file(self, file_name: str, content: str) -> "Fixtures":
+        os.makedirs(self.base_path, exist_ok=True)
+        with open(os.path.join(self.base_path, file_name), "w") as f:
+            f.write(content)
+        return self
+
+
+class Arrangements:
+    def __init__(self, fixtures: Fixtures):
+        self.fixtures = fixtures
+        self.configuration = Mock(spec=PDFDatasourceConfiguration)
+        self.configuration.name = DatasourceName.PDF
+        self.configuration.export_limit = None
+        self.configuration.base_path = fixtures.base_path
+        self.configuration.include_patterns = ["*.pdf"]
+        self.configuration.exclude_patterns = []
+        self.configuration.recursive = True
+        self.configuration.manifest_path = None
+        self.parser = Mock(spec=PDFDatasourceParser)
+        self.parser.parse_markdown.side_effect = (
+            lambda file_path, markdown: Document(text=markdown)
+        )
+        self.service = PDFDatasourceManager(
+            configuration=self.configuration,
+            reader=PDFDatasourceReader(configuration=self.configuration),
+            parser=self.parser,
+            conversion_pool=PDFConversionPool(
+                convert_func=convert, max_workers=2
+            ),
+        )
+
+
+class Manager:
+    def __init__(self, arrangements: Arrangements):
+        self.fixtures = arrangements.fixtures
+        self.arrangements = arrangements
+
+    def get_service(self) -> PDFDatasourceManager:
+        return self.arrangements.service
+
+    async def sync_changes(self, sync_state: SyncStateStore) -> List[str]:
+        texts = sorted(
+            [
+                document.text
+                async for document in self.get_service().incremental_sync(
+                    sync_state, "pdf"
+                )
+            ]
+        )
+        sync_state.commit()
+        return texts
+
+
+class TestPDFDatasourceManager:
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_converts_changed_files_in_pool(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(str(tmp_path / "pdfs"))
+                .with_pdf_file("a.pdf", "first")
+                .with_pdf_file("b.pdf", "second")
+            )
+        )
+        sync_state = SyncStateStore(str(tmp_path / "sync_state.sqlite"))
+        first_run = await manager.sync_changes(sync_state)
+        manager.fixtures.with_pdf_file("b.pdf", "broken now")
+
+        # Act
+        failed_run = await manager.sync_changes(sync_state)
+        failed_run_deleted_ids = manager.get_service().deleted_document_ids
+        manager.fixtures.with_pdf_file("b.pdf", "fixed")
+        fixed_run = await manager.sync_changes(sync_state)
+
+        # Assert
+        assert first_run == ["Converted first", "Converted second"]
+        assert failed_run == []
+        assert failed_run_deleted_ids == []
+        assert fixed_run == ["Converted fixed"]
+        assert len(manager.get_service().deleted_document_ids) == 1
+        manager.arrangements.parser.parse_async.assert_not_called()
@@ -0,0 +1,69 @@
+import sys
+
+sys.path.append("./src")
+
+import os
+import time
+from typing import AsyncIterator, List
+
+import pytest
+
+from extraction.datasources.pdf.pool import PDFConversionPool
+
+
+def convert(file_path: str) -> str:
+    name = os.path.basename(file_path)
+    if name.startswith("slow"):
+        time.sleep(0.5)
+    if name.startswith("hang"):
+        time.sleep(60)
+    if name.startswith("broken"):
+        raise ValueError("Broken PDF")
+    if name.startswith("crash"):
+        os._exit(1)
+    return f"# {name}"
+
+
+async def to_async_iterator(items: List[str]) -> AsyncIterator[str]:
+    for item in items:
+        yield item
+
+
+class TestPDFConversionPool:
+
+    @pytest.mark.asyncio
+    async def test_converts_in_completion_order(self) -> None:
+        # Arrange
+        pool = PDFConversionPool(convert_func=convert, max_workers=2)
+        file_paths = ["slow.pdf", "a.pdf", "b.pdf"]
+
+        # Act
+        results = [
+            result
+            async for result in pool.convert_all(to_async_iterator(file_paths))
+        ]
+
+        # Assert
+        assert sorted(results) == sorted(
+            (file_path, f"# {file_path}") for file_path in file_paths
+        )
+        assert results[-1] == ("slow.pdf", "# slow.pdf")
+
+    @pytest.mark.asyncio
+    async def test_skips_failed_timed_out_and_crashing_files(self) -> None:
+        # Arrange
+        pool = PDFConversionPool(convert_func=convert, max_workers=2, timeout=2)
+        file_paths = ["hang.pdf", "broken.pdf", "crash.pdf", "a.pdf", "b.pdf"]
+
+        # Act
+        start = time.monotonic()
+        results = [
+            result
+            async for result in pool.convert_all(to_async_iterator(file_paths))
+        ]
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert sorted(results) == [("a.pdf", "# a.pdf"), ("b.pdf", "# b.pdf")]
+        assert elapsed < 30
+        assert pool._executor is None
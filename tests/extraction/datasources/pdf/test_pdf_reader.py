@@ -1,7 +1,7 @@
 import os
 import sys
-from typing import List
-from unittest.mock import Mock, patch
+from typing import Dict, List
+from unittest.mock import Mock
 
 import pytest
 
@@ -13,33 +13,55 @@ from extraction.datasources.pdf.reader import PDFDatasourceReader
 
 
 class Fixtures:
-    def __init__(self):
+    def __init__(self, base_path: str):
         self.export_limit: int = None
-        self.base_path: str = None
+        self.base_path: str = base_path
         self.file_names: List[str] = []
         self.pdf_file_names: List[str] = []
+        self.include_patterns: List[str] = ["*.pdf"]
+        self.exclude_patterns: List[str] = []
+        self.recursive: bool = True
+        self.manifest_path: str = None
 
     def with_export_limit(self, export_limit: int) -> "Fixtures":
         self.export_limit = export_limit
         return self
 
-    def with_base_path(self) -> "Fixtures":
-        self.base_path = "/fake/path"
-        return self
-
-    def with_pdf_files(self, number_of_files: int) -> "Fixtures":
+    def with_pdf_files(
+        self, number_of_files: int, directory: str = ""
+    ) -> "Fixtures":
         for i in range(number_of_files):
-            file_name = f"document_{i}.pdf"
-            self.file_names.append(file_name)
+            file_name = os.path.join(directory, f"document_{i}.pdf")
+            self._create_file(file_name)
             self.pdf_file_names.append(file_name)
         return self
 
     def with_non_pdf_files(self, number_of_files: int) -> "Fixtures":
         for i in range(number_of_files):
-            file_name = f"document_{i}.txt"
-            self.file_names.append(file_name)
+            self._create_file(f"document_{i}.txt")
         return self
 
+    def with_exclude_patterns(self, *patterns: str) -> "Fixtures":
+        self.exclude_patterns = list(patterns)
+        return self
+
+    def with_non_recursive_scan(self) -> "Fixtures":
+        self.recursive = False
+        return self
+
+    def with_manifest(self) -> "Fixtures":
+        self.manifest_path = os.path.join(
+            os.path.dirname(self.base_path), "manifest.json"
+        )
+        return self
+
+    def _create_file(self, file_name: str, content: str = "content") -> None:
+        file_path = os.path.join(self.base_path, file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(f"{file_name} {content}")
+        self.file_names.append(file_name)
+
 
 class Arrangements:
     def __init__(self, fixtures: Fixtures):
@@ -47,43 +69,57 @@ class Arrangements:
         self.configuration = Mock(spec=PDFDatasourceConfiguration)
         self.configuration.export_limit = self.fixtures.export_limit
         self.configuration.base_path = self.fixtures.base_path
-        self.service = PDFDatasourceReader(configuration=self.configuration)
-
-    def on_os_listdir(self) -> "Arrangements":
-        self.listdir_patcher = patch(
-            "os.listdir", return_value=self.fixtures.file_names
-        )
-        self.mock_listdir = self.listdir_patcher.start()
-        return self
+        self.configuration.include_patterns = self.fixtures.include_patterns
+        self.configuration.exclude_patterns = self.fixtures.exclude_patterns
+        self.configuration.recursive = self.fixtures.recursive
+        self.configuration.manifest_path = self.fixtures.manifest_path
 
-    def on_pdf_document_creation(self) -> "Arrangements":
-        def isfile_side_effect(path):
-            return path.endswith(".pdf")
-
-        self.isfile_patcher = patch(
-            "os.path.isfile", side_effect=isfile_side_effect
-        )
-
-        self.mock_isfile = self.isfile_patcher.start()
+    def get_service(self) -> PDFDatasourceReader:
+        return PDFDatasourceReader(configuration=self.configuration)
 
+    def on_file_modified(self, file_name: str, content: str) -> "Arrangements":
+        file_path = os.path.join(self.fixtures.base_path, file_name)
+        with open(file_path, "w") as f:
+            f.write(content)
         return self
 
-    def stop_patches(self):
-        self.listdir_patcher.stop()
-        self.isfile_patcher.stop()
+    def on_file_touched(self, file_name: str) -> "Arrangements":
+        file_path = os.path.join(self.fixtures.base_path, file_name)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        return self
 
 
 class Assertions:
     def __init__(self, arrangements: Arrangements):
         self.fixtures = arrangements.fixtures
-        self.service = arrangements.service
 
-    def assert_pdfs(self, pdf_file_paths: List[str]) -> "Assertions":
-        for expected_file_name, actual_file_path in zip(
-            self.fixtures.pdf_file_names, pdf_file_paths
-        ):
-            assert actual_file_path.endswith(expected_file_name)
+    def assert_pdfs(
+        self,
+        pdf_file_paths: List[str],
+        expected_file_names: List[str] = None,
+    ) -> "Assertions":
+        expected_file_names = (
+            self.fixtures.pdf_file_names
+            if expected_file_names is None
+            else expected_file_names
+        )
+        expected_file_paths = {
+            os.path.join(self.fixtures.base_path, file_name)
+            for file_name in expected_file_names
+        }
+        expected_number_of_files = (
+            len(expected_file_paths)
+            if self.fixtures.export_limit is None
+            else min(self.fixtures.export_limit, len(expected_file_paths))
+        )
+
+        assert len(pdf_file_paths) == expected_number_of_files
+        assert len(set(pdf_file_paths)) == len(pdf_file_paths)
+        for actual_file_path in pdf_file_paths:
+            assert actual_file_path in expected_file_paths
             assert os.path.isfile(actual_file_path)
+        return self
 
 
 class Manager:
@@ -93,7 +129,36 @@ class Manager:
         self.assertions = Assertions(arrangements=arrangements)
 
     def get_service(self) -> PDFDatasourceReader:
-        return self.arrangements.service
+        return self.arrangements.get_service()
+
+    async def read_all(self) -> List[str]:
+        return [
+            pdf_file_path
+            async for pdf_file_path in self.get_service().read_all_async()
+        ]
+
+    async def read_changes(self, commit: bool = True) -> List[str]:
+        service = self.get_service()
+        service.set_sync_cursor(None)
+        pdf_file_paths = [
+            pdf_file_path async for pdf_file_path in service.read_all_async()
+        ]
+        if commit:
+            service.commit_sync_state()
+        return pdf_file_paths
+
+    async def read_fingerprints(self) -> Dict[str, str]:
+        service = self.get_service()
+        service.set_sync_cursor(None)
+        fingerprints = {
+            service.get_object_id(pdf_file_path): (
+                service.get_object_fingerprint(pdf_file_path)
+            )
+            async for pdf_file_path in service.read_all_async()
+        }
+        assert service.lists_all_objects()
+        service.commit_sync_state()
+        return fingerprints
 
 
 class TestPdfReader:
@@ -111,26 +176,172 @@ class TestPdfReader:
     )
     @pytest.mark.asyncio
     async def test(
-        self, export_limit: int, number_of_pdfs: int, number_of_non_pdfs: int
+        self,
+        tmp_path,
+        export_limit: int,
+        number_of_pdfs: int,
+        number_of_non_pdfs: int,
     ) -> None:
         # Arrange
         manager = Manager(
             Arrangements(
-                Fixtures()
+                Fixtures(str(tmp_path / "pdfs"))
                 .with_export_limit(export_limit)
-                .with_base_path()
                 .with_non_pdf_files(number_of_non_pdfs)
                 .with_pdf_files(number_of_pdfs)
             )
-            .on_os_listdir()
-            .on_pdf_document_creation()
         )
-        service = manager.get_service()
 
         # Act
-        pdf_file_paths = []
-        async for pdf_file_path in service.read_all_async():
-            pdf_file_paths.append(pdf_file_path)
+        pdf_file_paths = await manager.read_all()
 
         # Assert
         manager.assertions.assert_pdfs(pdf_file_paths)
+
+    @pytest.mark.asyncio
+    async def test_scans_subdirectories(self, tmp_path) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(str(tmp_path / "pdfs"))
+                .with_pdf_files(2)
+                .with_pdf_files(2, directory="reports/2024")
+                .with_pdf_files(2, directory="archive")
+                .with_exclude_patterns("archive")
+            )
+        )
+
+        # Act
+        pdf_file_paths = await manager.read_all()
+
+        # Assert
+        manager.assertions.assert_pdfs(
+            pdf_file_paths,
+            expected_file_names=[
+                file_name
+                for file_name in manager.fixtures.pdf_file_names
+                if not file_name.startswith("archive")
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_skips_subdirectories_if_not_recursive(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(str(tmp_path / "pdfs"))
+                .with_pdf_files(2)
+                .with_pdf_files(2, directory="reports")
+                .with_non_recursive_scan()
+            )
+        )
+
+        # Act
+        pdf_file_paths = await manager.read_all()
+
+        # Assert
+        manager.assertions.assert_pdfs(
+            pdf_file_paths,
+            expected_file_names=["document_0.pdf", "document_1.pdf"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_manifest_keeps_fingerprints_of_unchanged_files(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(str(tmp_path / "pdfs"))
+                .with_pdf_files(3)
+                .with_pdf_files(1, directory="reports")
+                .with_manifest()
+            )
+        )
+        first_run = await manager.read_fingerprints()
+
+        manager.arrangements.on_file_touched("document_0.pdf").on_file_modified(
+            os.path.join("reports", "document_0.pdf"), "new content"
+        )
+
+        # Act
+        second_run = await manager.read_fingerprints()
+
+        # Assert
+        assert sorted(first_run) == sorted(
+            file_name.replace(os.sep, "/")
+            for file_name in manager.fixtures.pdf_file_names
+        )
+        assert sorted(second_run) == sorted(first_run)
+        assert {
+            object_id
+            for object_id in first_run
+            if first_run[object_id] != second_run[object_id]
+        } == {"reports/document_0.pdf"}
+
+    @pytest.mark.asyncio
+    async def test_failed_scan_makes_listing_incomplete(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(str(tmp_path / "pdfs"))
+                .with_pdf_files(2)
+                .with_pdf_files(2, directory="reports")
+            )
+        )
+        service = manager.get_service()
+        scandir = os.scandir
+        unreadable_directory = os.path.join(
+            manager.fixtures.base_path, "reports"
+        )
+
+        def failing_scandir(path):
+            if path == unreadable_directory:
+                raise PermissionError(f"Permission denied: '{path}'")
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+
+        # Act
+        pdf_file_paths = [path async for path in service.read_all_async()]
+
+        # Assert
+        manager.assertions.assert_pdfs(
+            pdf_file_paths,
+            expected_file_names=["document_0.pdf", "document_1.pdf"],
+        )
+        assert not service.lists_all_objects()
+
+    @pytest.mark.asyncio
+    async def test_manifest_is_saved_only_by_committed_syncs(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        manager = Manager(
+            Arrangements(
+                Fixtures(str(tmp_path / "pdfs"))
+                .with_pdf_files(3)
+                .with_manifest()
+            )
+        )
+
+        # Act
+        failed_run = await manager.read_changes(commit=False)
+        saved_after_failed_run = os.path.isfile(manager.fixtures.manifest_path)
+        full_refresh = await manager.read_all()
+        saved_after_full_refresh = os.path.isfile(
+            manager.fixtures.manifest_path
+        )
+        committed_run = await manager.read_changes()
+
+        # Assert
+        manager.assertions.assert_pdfs(failed_run)
+        manager.assertions.assert_pdfs(full_refresh)
+        manager.assertions.assert_pdfs(committed_run)
+        assert not saved_after_failed_run
+        assert not saved_after_full_refresh
+        assert os.path.isfile(manager.fixtures.manifest_path)
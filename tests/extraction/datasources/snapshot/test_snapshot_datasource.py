@@ -0,0 +1,97 @@
+import sys
+from typing import List
+from unittest.mock import Mock
+
+sys.path.append("./src")
+
+import pytest
+
+from extraction.bootstrap.configuration.datasources import DatasourceName
+from extraction.datasources.core.document import BaseDocument
+from extraction.datasources.snapshot.configuration import (
+    SnapshotDatasourceConfiguration,
+)
+from extraction.datasources.snapshot.document import SnapshotDocument
+from extraction.datasources.snapshot.manager import (
+    SnapshotDatasourceManagerFactory,
+)
+from extraction.datasources.snapshot.reader import SnapshotDatasourceReader
+from extraction.datasources.snapshot.writer import SnapshotWriter
+
+
+def create_documents(count: int) -> List[BaseDocument]:
+    return [
+        BaseDocument(
+            text=f"Content of document {i} ü",
+            metadata={"title": f"Document {i}", "url": f"https://example/{i}"},
+            attachments={"{image}": "image description"},
+        )
+        for i in range(count)
+    ]
+
+
+def create_configuration(
+    path: str, export_limit: int = None
+) -> SnapshotDatasourceConfiguration:
+    configuration = Mock(spec=SnapshotDatasourceConfiguration)
+    configuration.name = DatasourceName.SNAPSHOT
+    configuration.path = path
+    configuration.export_limit = export_limit
+    configuration.processing_max_workers = 1
+    configuration.deduplication_threshold = None
+    return configuration
+
+
+@pytest.mark.asyncio
+async def test_snapshot_documents_are_restored(tmp_path):
+    path = str(tmp_path / "snapshot.jsonl.gz")
+    documents = create_documents(2500)
+    with SnapshotWriter(path) as writer:
+        for document in documents:
+            writer.write(document)
+    manager = SnapshotDatasourceManagerFactory.create(
+        create_configuration(path)
+    )
+
+    restored_documents = [
+        document async for document in manager.full_refresh_sync()
+    ]
+
+    assert writer.document_count == len(documents)
+    assert all(
+        isinstance(document, SnapshotDocument)
+        for document in restored_documents
+    )
+    assert [SnapshotDocument.to_record(d) for d in restored_documents] == [
+        SnapshotDocument.to_record(d) for d in documents
+    ]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reader_respects_export_limit(tmp_path):
+    path = str(tmp_path / "snapshot.jsonl.gz")
+    with SnapshotWriter(path) as writer:
+        for document in create_documents(5):
+            writer.write(document)
+    reader = SnapshotDatasourceReader(create_configuration(path, 3))
+
+    records = [record async for record in reader.read_all_async()]
+
+    assert [record["metadata"]["title"] for record in records] == [
+        "Document 0",
+        "Document 1",
+        "Document 2",
+    ]
+
+
+def test_failed_write_keeps_previous_snapshot(tmp_path):
+    path = str(tmp_path / "snapshot.jsonl.gz")
+    with SnapshotWriter(path) as writer:
+        writer.write(create_documents(1)[0])
+
+    with pytest.raises(RuntimeError):
+        with SnapshotWriter(path) as writer:
+            writer.write(create_documents(1)[0])
+            raise RuntimeError("Extraction failed")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["snapshot.jsonl.gz"]
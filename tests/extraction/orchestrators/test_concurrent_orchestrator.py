@@ -0,0 +1,163 @@
+import asyncio
+import sys
+import time
+from typing import AsyncIterator, List
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.append("./src")
+
+from extraction.datasources.core.checkpoint import (
+    Checkpoint,
+    CheckpointStore,
+)
+from extraction.datasources.core.manager import BaseDatasourceManager
+from extraction.orchestrators.concurrent.orchestrator import (
+    ConcurrentDatasourceOrchestrator,
+)
+
+
+def create_manager(
+    name: str, documents: List[str], delay: float = 0.0, fail: bool = False
+) -> BaseDatasourceManager:
+    manager = Mock(spec=BaseDatasourceManager)
+    manager.configuration = Mock()
+    manager.configuration.name.value = name
+    manager.deleted_document_ids = [f"{name}_deleted"]
+    manager.running = False
+
+    async def stream(*args) -> AsyncIterator[str]:
+        manager.running = True
+        checkpoint = args[0] if len(args) == 1 else None
+        try:
+            for document in documents:
+                await asyncio.sleep(delay)
+                if checkpoint is not None:
+                    checkpoint.complete(
+                        checkpoint.start(document, {"last": document})
+                    )
+                yield document
+            if fail:
+                raise RuntimeError(f"{name} failed")
+        finally:
+            manager.running = False
+
+    manager.full_refresh_sync = stream
+    manager.incremental_sync = stream
+    return manager
+
+
+async def collect(iterator: AsyncIterator[str]) -> List[str]:
+    return [document async for document in iterator]
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_sync_merges_datasources_fairly():
+    orchestrator = ConcurrentDatasourceOrchestrator(
+        datasource_managers=[
+            create_manager("a", ["a1", "a2", "a3"]),
+            create_manager("b", ["b1"]),
+            create_manager("c", ["c1", "c2"]),
+        ]
+    )
+
+    documents = await collect(orchestrator.full_refresh_sync())
+
+    assert documents == ["a1", "b1", "c1", "a2", "c2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_sync_runs_datasources_concurrently():
+    managers = [
+        create_manager(name, [f"{name}{i}" for i in range(5)], delay=0.05)
+        for name in ["a", "b", "c", "d"]
+    ]
+    orchestrator = ConcurrentDatasourceOrchestrator(
+        datasource_managers=managers
+    )
+
+    start = time.monotonic()
+    documents = await collect(orchestrator.full_refresh_sync())
+    elapsed = time.monotonic() - start
+
+    assert len(documents) == 20
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_sync_limits_concurrent_datasources():
+    managers = [
+        create_manager(name, [f"{name}{i}" for i in range(3)], delay=0.01)
+        for name in ["a", "b", "c"]
+    ]
+    orchestrator = ConcurrentDatasourceOrchestrator(
+        datasource_managers=managers, max_concurrent_datasources=1
+    )
+
+    documents = []
+    async for document in orchestrator.full_refresh_sync():
+        assert sum(manager.running for manager in managers) <= 1
+        documents.append(document)
+
+    assert sorted(documents) == sorted(
+        f"{name}{i}" for name in ["a", "b", "c"] for i in range(3)
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_sync_raises_datasource_failure():
+    slow_manager = create_manager("a", ["a1"] * 100, delay=0.01)
+    orchestrator = ConcurrentDatasourceOrchestrator(
+        datasource_managers=[slow_manager, create_manager("b", [], fail=True)]
+    )
+
+    with pytest.raises(RuntimeError, match="b failed"):
+        await collect(orchestrator.full_refresh_sync())
+
+    await asyncio.sleep(0)
+    assert not slow_manager.running
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_sync_checkpoints_consumed_documents(tmp_path):
+    checkpoint_store = CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+    orchestrator = ConcurrentDatasourceOrchestrator(
+        datasource_managers=[
+            create_manager("a", ["a1", "a2", "a3"]),
+            create_manager("b", ["b1"]),
+        ],
+        checkpoint_store=checkpoint_store,
+        queue_size=4,
+    )
+
+    documents = orchestrator.full_refresh_sync()
+    assert [await documents.__anext__() for _ in range(3)] == ["a1", "b1", "a2"]
+    await asyncio.sleep(0.01)
+    orchestrator.save_checkpoint()
+    await documents.aclose()
+
+    assert orchestrator.has_checkpoint()
+    assert checkpoint_store.load("a") == Checkpoint(
+        {"last": "a2"}, {"a1", "a2"}
+    )
+    assert checkpoint_store.load("b") == Checkpoint({"last": "b1"}, {"b1"})
+
+    orchestrator.clear_checkpoint()
+    assert not orchestrator.has_checkpoint()
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_collects_deleted_document_ids():
+    orchestrator = ConcurrentDatasourceOrchestrator(
+        datasource_managers=[
+            create_manager("a", ["a1"]),
+            create_manager("a", ["a2"]),
+        ],
+        sync_state=Mock(),
+    )
+
+    documents = await collect(orchestrator.incremental_sync())
+
+    assert documents == ["a1", "a2"]
+    assert orchestrator.deleted_document_ids == ["a_deleted", "a_deleted"]